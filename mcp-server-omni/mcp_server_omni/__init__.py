@@ -5,6 +5,7 @@ __author__ = "Andrey Ivanov"
 __license__ = "MPL-2.0"
 
 from .access_control import AccessControlError, AccessController, ModelPermissions
+from .async_connection import AsyncOmniConnection
 from .config import OmniConfig, load_config
 from .omni_connection import OmniConnection, OmniConnectionError, create_connection
 from .server import OmniMCPServer
@@ -16,6 +17,7 @@ __all__ = [
     "OmniConnection",
     "OmniConnectionError",
     "create_connection",
+    "AsyncOmniConnection",
     "AccessController",
     "AccessControlError",
     "ModelPermissions",
@@ -50,6 +50,7 @@ Optional environment variables:
   OMNI_MCP_TRANSPORT     Transport type: stdio or streamable-http (default: stdio)
   OMNI_MCP_HOST          Server host for HTTP transports (default: localhost)
   OMNI_MCP_PORT          Server port for HTTP transports (default: 8000)
+  OMNI_MCP_METRICS_ENABLED Serve Prometheus metrics at /metrics over HTTP (default: false)
 
 For more information, visit: https://github.com/ivnvxd/mcp-server-omni""",
     )
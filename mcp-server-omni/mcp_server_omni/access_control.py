@@ -4,15 +4,17 @@ This module provides integration with the Omni MCP module's access control
 system via REST API endpoints.
 """
 
+import http.client
 import json
 import logging
-import urllib.error
-import urllib.request
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from .config import OmniConfig
+from .performance import Cache, HTTPConnectionPool, PooledTransport, SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -46,41 +48,61 @@ class ModelPermissions:
         return operation_map.get(operation, False)
 
 
-@dataclass
-class CacheEntry:
-    """Cache entry for permission data."""
-
-    data: Any
-    timestamp: datetime
-
-    def is_expired(self, ttl_seconds: int) -> bool:
-        """Check if cache entry is expired."""
-        return datetime.now() - self.timestamp > timedelta(seconds=ttl_seconds)
-
-
 class AccessController:
     """Controls access to Omni models via MCP module REST API."""
 
     # Cache TTL in seconds
     CACHE_TTL = 300  # 5 minutes
 
+    # Seconds an expired entry is still served while it is refreshed in the background
+    STALE_TTL = 60
+
+    # Maximum concurrent requests when loading permissions for many models
+    PREFETCH_CONCURRENCY = 8
+
     # MCP REST API endpoints
     MODELS_ENDPOINT = "/mcp/models"
     MODEL_ACCESS_ENDPOINT = "/mcp/models/{model}/access"
 
-    def __init__(self, config: OmniConfig, cache_ttl: int = CACHE_TTL):
+    def __init__(
+        self,
+        config: OmniConfig,
+        cache_ttl: int = CACHE_TTL,
+        prefetch_concurrency: int = PREFETCH_CONCURRENCY,
+        stale_ttl: int = STALE_TTL,
+    ):
         """Initialize access controller.
 
         Args:
             config: OmniConfig with connection details and API key
             cache_ttl: Cache time-to-live in seconds
+            prefetch_concurrency: Maximum concurrent requests in get_permissions()
+            stale_ttl: Seconds an expired entry is served while being refreshed
+                (0 to always refetch synchronously)
         """
         self.config = config
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, CacheEntry] = {}
+        self.prefetch_concurrency = prefetch_concurrency
+        self.stale_ttl = stale_ttl
+        self._cache = Cache(max_size=1000, max_memory_mb=5)
+        # Concurrent lookups of the same uncached key share one request
+        self._single_flight = SingleFlight()
+        # Background refreshes of stale entries and get_permissions() fan-out
+        # (created on first use, shut down by close())
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
         # Parse base URL
         self.base_url = config.url.rstrip("/")
+        parsed = urlparse(self.base_url)
+        self._host = parsed.netloc
+        self._path_prefix = parsed.path
+
+        # Keep-alive connections to the MCP REST API, shared across threads
+        self._http_pool = HTTPConnectionPool(
+            scheme=parsed.scheme, max_size=max(prefetch_concurrency, 1)
+        )
 
         # Validate API key is available
         if not config.api_key:
@@ -103,64 +125,161 @@ class AccessController:
         Raises:
             AccessControlError: If request fails
         """
-        url = f"{self.base_url}{endpoint}"
+        try:
+            logger.debug(f"Making request to {self.base_url}{endpoint}")
+            status, reason, body = self._fetch(endpoint, timeout)
+        except (OSError, http.client.HTTPException) as e:
+            raise AccessControlError(f"Connection error: {e}") from e
+        except Exception as e:
+            raise AccessControlError(f"Request failed: {e}") from e
 
-        # Create request with API key header
-        req = urllib.request.Request(url)
-        req.add_header("X-API-Key", self.config.api_key)
-        req.add_header("Accept", "application/json")
+        if status == 401:
+            raise AccessControlError("Invalid API key for access control")
+        elif status == 403:
+            raise AccessControlError("Access denied to MCP endpoints")
+        elif status == 404:
+            raise AccessControlError(f"Endpoint not found: {endpoint}")
+        elif status != 200:
+            raise AccessControlError(f"HTTP error {status}: {reason}")
 
         try:
-            logger.debug(f"Making request to {url}")
+            data = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise AccessControlError(f"Invalid JSON response: {e}") from e
 
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                data = json.loads(response.read().decode("utf-8"))
+        try:
+            # Check for API response success
+            if not data.get("success", False):
+                error_msg = data.get("error", {}).get("message", "Unknown error")
+                raise AccessControlError(f"API error: {error_msg}")
+        except AccessControlError:
+            raise
+        except Exception as e:
+            # Bodies that are not the expected JSON object (e.g. a list)
+            raise AccessControlError(f"Request failed: {e}") from e
 
-                # Check for API response success
-                if not data.get("success", False):
-                    error_msg = data.get("error", {}).get("message", "Unknown error")
-                    raise AccessControlError(f"API error: {error_msg}")
+        return data
 
-                return data
+    def _fetch(self, endpoint: str, timeout: float) -> Tuple[int, str, bytes]:
+        """Send a GET request over a pooled keep-alive connection.
 
-        except urllib.error.HTTPError as e:
-            if e.code == 401:
-                raise AccessControlError("Invalid API key for access control") from e
-            elif e.code == 403:
-                raise AccessControlError("Access denied to MCP endpoints") from e
-            elif e.code == 404:
-                raise AccessControlError(f"Endpoint not found: {endpoint}") from e
+        Args:
+            endpoint: API endpoint path
+            timeout: Socket timeout in seconds
+
+        Returns:
+            Tuple of (status, reason, body)
+        """
+        headers = {"X-API-Key": self.config.api_key, "Accept": "application/json"}
+        # Like PooledTransport, retry once when a reused connection turns out
+        # to have been closed by the server
+        for attempt in (0, 1):
+            conn, reused = self._http_pool.checkout(self._host, timeout)
+            try:
+                conn.request("GET", f"{self._path_prefix}{endpoint}", headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except PooledTransport.STALE_CONNECTION_ERRORS:
+                self._http_pool.discard(self._host, conn)
+                if attempt or not reused:
+                    raise
+                continue
+            except BaseException:
+                self._http_pool.discard(self._host, conn)
+                raise
+
+            if response.will_close:
+                self._http_pool.discard(self._host, conn)
             else:
-                raise AccessControlError(f"HTTP error {e.code}: {e.reason}") from e
-        except urllib.error.URLError as e:
-            raise AccessControlError(f"Connection error: {e.reason}") from e
-        except json.JSONDecodeError as e:
-            raise AccessControlError(f"Invalid JSON response: {e}") from e
-        except Exception as e:
-            raise AccessControlError(f"Request failed: {e}") from e
+                self._http_pool.checkin(self._host, conn)
+            return response.status, response.reason, body
 
     def _get_from_cache(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
-        if key in self._cache:
-            entry = self._cache[key]
-            if not entry.is_expired(self.cache_ttl):
-                logger.debug(f"Cache hit for {key}")
-                return entry.data
-            else:
-                logger.debug(f"Cache expired for {key}")
-                del self._cache[key]
-        return None
+        return self._cache.get(key)
 
     def _set_cache(self, key: str, data: Any) -> None:
-        """Set value in cache."""
-        self._cache[key] = CacheEntry(data=data, timestamp=datetime.now())
-        logger.debug(f"Cached {key}")
+        """Set value in cache; a TTL of zero disables caching."""
+        if self.cache_ttl > 0:
+            self._cache.put(key, data, ttl_seconds=self.cache_ttl, stale_seconds=self.stale_ttl)
+            logger.debug(f"Cached {key}")
+
+    def _get_or_load(self, key: str, load: Callable[[], Any]) -> Any:
+        """Return a cached value, loading it at most once across concurrent callers.
+
+        Expired values are returned during their stale grace window while a
+        single background refresh replaces them.
+        """
+        cached, refresh = self._cache.get_or_stale(key)
+        if cached is not None:
+            if refresh:
+                self._refresh_in_background(key, load)
+            return cached
+
+        def load_once():
+            # A caller that missed the cache just as another load finished
+            # finds the fresh value here instead of requesting it again
+            cached = self._cache.peek(key)
+            if cached is not None:
+                return cached
+            value = load()
+            self._set_cache(key, value)
+            return value
+
+        return self._single_flight.do(key, load_once)
+
+    def _refresh_in_background(self, key: str, load: Callable[[], Any]) -> None:
+        """Reload a stale cache entry on the refresh executor."""
+
+        def refresh():
+            try:
+                self._set_cache(key, self._single_flight.do(key, load))
+                logger.debug(f"Refreshed {key}")
+            except Exception as e:
+                # Keep serving the stale value; the next read retries
+                self._cache.cancel_refresh(key)
+                logger.warning(f"Failed to refresh {key}: {e}")
+
+        with self._executor_lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="omni-access-refresh"
+                )
+            self._refresh_executor.submit(refresh)
 
     def clear_cache(self) -> None:
         """Clear all cached data."""
         self._cache.clear()
         logger.info("Cleared access control cache")
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache, connection and request coalescing statistics."""
+        return {
+            "cache": self._cache.get_stats(),
+            "http": self._http_pool.get_stats(),
+            "single_flight": self._single_flight.get_stats(),
+        }
+
+    def close(self) -> None:
+        """Stop background refreshes and close idle connections to the MCP REST API."""
+        with self._executor_lock:
+            executors = (self._refresh_executor, self._prefetch_executor)
+            self._refresh_executor = self._prefetch_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self._http_pool.clear()
+
+    def _get_prefetch_executor(self) -> ThreadPoolExecutor:
+        """Get the executor that fetches permissions for get_permissions()."""
+        with self._executor_lock:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.prefetch_concurrency),
+                    thread_name_prefix="omni-access",
+                )
+            return self._prefetch_executor
+
     def get_enabled_models(self) -> List[Dict[str, str]]:
         """Get list of all MCP-enabled models.
 
@@ -170,20 +289,13 @@ class AccessController:
         Raises:
             AccessControlError: If request fails
         """
-        cache_key = "enabled_models"
-
-        # Check cache
-        cached = self._get_from_cache(cache_key)
-        if cached is not None:
-            return cached
+        return self._get_or_load("enabled_models", self._load_enabled_models)
 
-        # Make request
+    def _load_enabled_models(self) -> List[Dict[str, str]]:
+        """Request the list of MCP-enabled models."""
         response = self._make_request(self.MODELS_ENDPOINT)
         models = response.get("data", {}).get("models", [])
 
-        # Cache result
-        self._set_cache(cache_key, models)
-
         logger.info(f"Retrieved {len(models)} enabled models")
         return models
 
@@ -215,14 +327,12 @@ class AccessController:
         Raises:
             AccessControlError: If request fails
         """
-        cache_key = f"permissions_{model}"
-
-        # Check cache
-        cached = self._get_from_cache(cache_key)
-        if cached is not None:
-            return cached
+        return self._get_or_load(
+            f"permissions_{model}", lambda: self._load_model_permissions(model)
+        )
 
-        # Make request
+    def _load_model_permissions(self, model: str) -> ModelPermissions:
+        """Request the permissions for a model."""
         endpoint = self.MODEL_ACCESS_ENDPOINT.format(model=model)
         response = self._make_request(endpoint)
         data = response.get("data", {})
@@ -237,12 +347,47 @@ class AccessController:
             can_unlink=data.get("operations", {}).get("unlink", False),
         )
 
-        # Cache result
-        self._set_cache(cache_key, permissions)
-
         logger.debug(f"Retrieved permissions for {model}: {permissions}")
         return permissions
 
+    def get_permissions(self, models: Iterable[str]) -> Dict[str, ModelPermissions]:
+        """Get permissions for many models at once.
+
+        The MCP module has no batch access endpoint, so uncached models are
+        fetched concurrently with at most ``prefetch_concurrency`` requests in
+        flight, and every result is cached.
+
+        Args:
+            models: Omni model names
+
+        Returns:
+            Dict mapping model names to their permissions, in the given order;
+            models whose permissions could not be loaded are left out
+        """
+        models = list(dict.fromkeys(models))
+        loaded: Dict[str, ModelPermissions] = {}
+        missing = []
+        for model in models:
+            cached = self._get_from_cache(f"permissions_{model}")
+            if cached is not None:
+                loaded[model] = cached
+            else:
+                missing.append(model)
+
+        if missing:
+            executor = self._get_prefetch_executor()
+            futures = {
+                model: executor.submit(self.get_model_permissions, model) for model in missing
+            }
+            for model, future in futures.items():
+                try:
+                    loaded[model] = future.result()
+                except AccessControlError as e:
+                    logger.warning(f"Failed to get permissions for {model}: {e}")
+            logger.info(f"Loaded permissions for {len(missing)} models")
+
+        return {model: loaded[model] for model in models if model in loaded}
+
     def check_operation_allowed(self, model: str, operation: str) -> Tuple[bool, Optional[str]]:
         """Check if an operation is allowed on a model.
 
@@ -308,19 +453,10 @@ class AccessController:
         Returns:
             Dict mapping model names to their permissions
         """
-        permissions = {}
-
         try:
             enabled_models = self.get_enabled_models()
-
-            for model_info in enabled_models:
-                model = model_info["model"]
-                try:
-                    permissions[model] = self.get_model_permissions(model)
-                except AccessControlError as e:
-                    logger.warning(f"Failed to get permissions for {model}: {e}")
-
         except AccessControlError as e:
             logger.error(f"Failed to get all permissions: {e}")
+            return {}
 
-        return permissions
+        return self.get_permissions(model_info["model"] for model_info in enabled_models)
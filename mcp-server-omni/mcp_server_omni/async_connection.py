@@ -0,0 +1,927 @@
+"""Asyncio-native XML-RPC client for Omni.
+
+This module talks XML-RPC over non-blocking sockets instead of running
+blocking ``xmlrpc.client.ServerProxy`` calls on worker threads:
+- AsyncHTTPConnectionPool keeps persistent HTTP/1.1 connections per host,
+  each carrying one request at a time
+- AsyncXMLRPCClient marshals calls exactly like ServerProxy
+- AsyncOmniConnection exposes the OmniConnection model API as coroutines
+"""
+
+import asyncio
+import gzip
+import json
+import socket
+import ssl
+import xmlrpc.client
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
+
+from .config import OmniConfig
+from .error_sanitizer import ErrorSanitizer
+from .logging_config import LazyRepr, get_logger
+from .omni_connection import OmniConnection, OmniConnectionError, server_version_key
+from .performance import PerformanceManager, clone_result, last_response_bytes
+from .tracing import tracer
+
+logger = get_logger(__name__)
+
+
+class ConnectionDroppedError(ConnectionError):
+    """Raised when the server closes a connection before answering a request."""
+
+
+class HTTPResponse:
+    """A fully read HTTP response."""
+
+    __slots__ = ("status", "reason", "headers", "body", "will_close")
+
+    def __init__(
+        self, status: int, reason: str, headers: Dict[str, str], body: bytes, will_close: bool
+    ):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.will_close = will_close
+
+
+class _PooledStream:
+    """One keep-alive connection and the request in flight on it."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, now: float):
+        self.reader = reader
+        self.writer = writer
+        self.in_flight = 0
+        self.requests = 0
+        self.last_used = now
+        self.closed = False
+
+    def is_alive(self) -> bool:
+        """Check that the server has not closed the connection."""
+        return not (self.closed or self.reader.at_eof() or self.writer.is_closing())
+
+    def close(self):
+        self.closed = True
+        try:
+            self.writer.close()
+        except RuntimeError:
+            # The event loop that owns the transport is already closed
+            pass
+
+
+class AsyncHTTPConnectionPool:
+    """Pool of persistent HTTP/1.1 connections.
+
+    A connection carries one request at a time: it is checked out, the
+    request is written and its response read in full, and only then is it
+    handed to the next request. A request that fails part-way discards the
+    connection, so a response can never be read by the wrong request.
+    HTTP pipelining is not supported.
+
+    A pool belongs to one event loop; if it is used from another loop its
+    connections are dropped and reopened.
+    """
+
+    def __init__(
+        self,
+        scheme: str = "http",
+        max_size: int = 10,
+        idle_timeout: float = 60.0,
+        timeout: float = 30.0,
+    ):
+        """Initialize async connection pool.
+
+        Args:
+            scheme: 'http' or 'https'
+            max_size: Maximum number of open connections per host
+            idle_timeout: Seconds an idle connection is kept before closing
+            timeout: Timeout in seconds for connecting and for each request
+        """
+        self.scheme = scheme
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._streams: Dict[str, List[_PooledStream]] = defaultdict(list)
+        self._opening: Dict[str, int] = defaultdict(int)
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._stats = {
+            "handshakes": 0,
+            "reuses": 0,
+            "requests": 0,
+            "waits": 0,
+            "closed_idle": 0,
+            "closed_dead": 0,
+            "discarded": 0,
+        }
+
+    async def request(
+        self,
+        host: str,
+        method: str,
+        path: str,
+        body: bytes = b"",
+        headers: Optional[List[Tuple[str, str]]] = None,
+    ) -> HTTPResponse:
+        """Send an HTTP request over a pooled connection.
+
+        Args:
+            host: Host (and optional port)
+            method: HTTP method
+            path: Request path
+            body: Request body
+            headers: Extra request headers
+
+        Returns:
+            The fully read response
+
+        Raises:
+            socket.timeout: If the request does not complete within the timeout
+            ConnectionError: If the connection fails
+        """
+        self._stats["requests"] += 1
+        payload = self._build_request(host, method, path, body, headers or [])
+
+        # Like the stdlib transport, retry once when a reused connection
+        # turns out to have been closed by the server
+        for attempt in (0, 1):
+            stream, reused = await self._checkout(host)
+            try:
+                response = await asyncio.wait_for(
+                    self._exchange(stream, payload), timeout=self.timeout
+                )
+            except ConnectionDroppedError:
+                self._discard(host, stream)
+                if attempt or not reused:
+                    raise
+                continue
+            except asyncio.TimeoutError:
+                self._discard(host, stream)
+                raise socket.timeout(f"Request to {host}{path} timed out") from None
+            except BaseException:
+                self._discard(host, stream)
+                raise
+            self._checkin(host, stream, response.will_close)
+            return response
+
+    def _build_request(
+        self, host: str, method: str, path: str, body: bytes, headers: List[Tuple[str, str]]
+    ) -> bytes:
+        """Serialize an HTTP/1.1 request."""
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {host}"]
+        lines.extend(f"{name}: {value}" for name, value in headers)
+        lines.append(f"Content-Length: {len(body)}")
+        head = "\r\n".join(lines) + "\r\n\r\n"
+        return head.encode("latin-1") + body
+
+    async def _exchange(self, stream: _PooledStream, payload: bytes) -> HTTPResponse:
+        """Write a request and read its response."""
+        try:
+            stream.writer.write(payload)
+            await stream.writer.drain()
+            return await self._read_response(stream.reader)
+        except (
+            ConnectionDroppedError,
+            ConnectionResetError,
+            BrokenPipeError,
+            asyncio.IncompleteReadError,
+        ) as e:
+            raise ConnectionDroppedError(str(e) or "Connection closed by server") from e
+
+    async def _read_response(self, reader: asyncio.StreamReader) -> HTTPResponse:
+        """Read one HTTP response from a stream."""
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionDroppedError("Connection closed before response")
+
+        parts = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ConnectionError(f"Invalid HTTP status line: {status_line!r}")
+        version = parts[0]
+        status = int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ""
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        will_close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self._read_chunked(reader)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            will_close = True
+
+        return HTTPResponse(status, reason, headers, body, will_close)
+
+    async def _read_chunked(self, reader: asyncio.StreamReader) -> bytes:
+        """Read a chunked transfer-encoded body."""
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Skip trailers
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    def _bind_loop(self):
+        """Drop connections and waiters created on a different event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        for streams in self._streams.values():
+            for stream in streams:
+                stream.closed = True
+        self._streams.clear()
+        self._opening.clear()
+        self._waiters.clear()
+        self._loop = loop
+
+    async def _checkout(self, host: str) -> Tuple[_PooledStream, bool]:
+        """Get an idle connection, opening one if allowed."""
+        self._bind_loop()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+
+        while True:
+            stream = self._select_stream(host, loop.time())
+            if stream is not None:
+                self._stats["reuses"] += 1
+                stream.in_flight += 1
+                stream.requests += 1
+                return stream, True
+
+            if len(self._streams[host]) + self._opening[host] < self.max_size:
+                break
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise socket.timeout(f"Timed out waiting for a pooled connection to {host}")
+            self._stats["waits"] += 1
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+
+        self._opening[host] += 1
+        try:
+            stream = await self._open(host, loop.time())
+        except BaseException:
+            # The slot is free again; let a waiting task use it
+            self._notify()
+            raise
+        finally:
+            self._opening[host] -= 1
+        self._stats["handshakes"] += 1
+        stream.in_flight = 1
+        stream.requests = 1
+        self._streams[host].append(stream)
+        logger.debug(f"Opened new async HTTP connection to {host}")
+        return stream, False
+
+    def _select_stream(self, host: str, now: float) -> Optional[_PooledStream]:
+        """Pick a live connection with no request in flight."""
+        for stream in list(self._streams[host]):
+            if stream.in_flight:
+                continue
+            if now - stream.last_used > self.idle_timeout:
+                self._remove(host, stream, "closed_idle")
+            elif not stream.is_alive():
+                self._remove(host, stream, "closed_dead")
+            else:
+                return stream
+        return None
+
+    async def _open(self, host: str, now: float) -> _PooledStream:
+        """Open a new connection to a host."""
+        hostname, _, port = host.rpartition(":")
+        if not hostname or not port.isdigit():
+            hostname, port = host, "443" if self.scheme == "https" else "80"
+
+        ssl_context = None
+        if self.scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            ssl_context = self._ssl_context
+
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(hostname.strip("[]"), int(port), ssl=ssl_context),
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError:
+            raise socket.timeout(f"Connection to {host} timed out") from None
+        return _PooledStream(reader, writer, now)
+
+    def _checkin(self, host: str, stream: _PooledStream, will_close: bool):
+        """Release a request slot on a connection."""
+        stream.in_flight -= 1
+        stream.last_used = asyncio.get_running_loop().time()
+        if will_close:
+            self._remove(host, stream, "discarded")
+        self._notify()
+
+    def _discard(self, host: str, stream: _PooledStream):
+        """Close a connection whose state is no longer trustworthy."""
+        stream.in_flight -= 1
+        if not stream.closed:
+            self._remove(host, stream, "discarded")
+        self._notify()
+
+    def _remove(self, host: str, stream: _PooledStream, reason: str):
+        """Close a connection and drop it from the pool."""
+        stream.close()
+        if stream in self._streams[host]:
+            self._streams[host].remove(stream)
+            self._stats[reason] += 1
+
+    def _notify(self):
+        """Wake up one task waiting for a connection."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get async connection pool statistics."""
+        stats = self._stats.copy()
+        streams = [stream for streams in self._streams.values() for stream in streams]
+        stats["open_connections"] = len(streams)
+        stats["in_flight_requests"] = sum(stream.in_flight for stream in streams)
+        return stats
+
+    def clear(self):
+        """Close all connections."""
+        for host, streams in list(self._streams.items()):
+            for stream in list(streams):
+                self._remove(host, stream, "closed_idle")
+
+
+class AsyncXMLRPCClient:
+    """XML-RPC client that marshals calls exactly like ServerProxy."""
+
+    def __init__(self, base_url: str, pool: AsyncHTTPConnectionPool):
+        """Initialize client.
+
+        Args:
+            base_url: Server base URL (scheme, host and optional path prefix)
+            pool: Connection pool to send requests through
+        """
+        parsed = urlparse(base_url)
+        self.host = parsed.netloc
+        self.path_prefix = parsed.path.rstrip("/")
+        self.pool = pool
+        self.user_agent = xmlrpc.client.Transport.user_agent
+
+    @staticmethod
+    def marshal(method: str, params: Tuple[Any, ...]) -> bytes:
+        """Encode a call the same way ServerProxy does."""
+        return xmlrpc.client.dumps(params, method, encoding="utf-8", allow_none=True).encode(
+            "utf-8", "xmlcharrefreplace"
+        )
+
+    async def call(self, endpoint: str, method: str, *params) -> Any:
+        """Call a remote method.
+
+        Args:
+            endpoint: Endpoint path (e.g., '/mcp/xmlrpc/object')
+            method: Remote method name
+            *params: Method parameters
+
+        Returns:
+            The unmarshalled result
+
+        Raises:
+            xmlrpc.client.Fault: If the server returns a fault
+            xmlrpc.client.ProtocolError: If the server returns an HTTP error
+        """
+        path = f"{self.path_prefix}{endpoint}"
+        with tracer.child_span("xmlrpc.serialize"):
+            payload = self.marshal(method, params)
+        with tracer.child_span("xmlrpc.network", request_bytes=len(payload)):
+            response = await self.pool.request(
+                self.host,
+                "POST",
+                path,
+                payload,
+                [
+                    ("User-Agent", self.user_agent),
+                    ("Content-Type", "text/xml"),
+                    ("Accept-Encoding", "gzip"),
+                ],
+            )
+        if response.status != 200:
+            raise xmlrpc.client.ProtocolError(
+                self.host + path, response.status, response.reason, response.headers
+            )
+
+        with tracer.child_span("xmlrpc.parse") as span:
+            body = response.body
+            if response.headers.get("content-encoding", "") == "gzip":
+                body = gzip.decompress(body)
+            last_response_bytes.set(len(body))
+            if span is not None:
+                span.set_attribute("response_bytes", len(body))
+
+            parser, unmarshaller = xmlrpc.client.getparser()
+            parser.feed(body)
+            parser.close()
+            result = unmarshaller.close()
+        return result[0] if len(result) == 1 else result
+
+    async def get_json(self, path: str, headers: List[Tuple[str, str]]) -> Tuple[int, Any]:
+        """GET a JSON document.
+
+        Returns:
+            Tuple of (status, decoded body or None)
+        """
+        response = await self.pool.request(
+            self.host, "GET", f"{self.path_prefix}{path}", b"", headers
+        )
+        try:
+            return response.status, json.loads(response.body.decode("utf-8"))
+        except ValueError:
+            return response.status, None
+
+
+class AsyncOmniConnection:
+    """Asyncio-native connection to Omni with the OmniConnection model API.
+
+    Shares record and field caches with OmniConnection through the
+    performance manager, so both can be used side by side.
+    """
+
+    def __init__(
+        self,
+        config: OmniConfig,
+        timeout: int = OmniConnection.DEFAULT_TIMEOUT,
+        performance_manager: Optional[PerformanceManager] = None,
+        max_connections: int = 10,
+    ):
+        """Initialize async connection.
+
+        Args:
+            config: OmniConfig object with connection parameters
+            timeout: Request timeout in seconds
+            performance_manager: Optional performance manager for caching
+            max_connections: Maximum open connections to the server
+        """
+        self.config = config
+        self.timeout = timeout
+        self._performance_manager = performance_manager or PerformanceManager(config)
+        self._pool = AsyncHTTPConnectionPool(
+            scheme=urlparse(config.url).scheme,
+            max_size=max_connections,
+            timeout=timeout,
+        )
+        self._client = AsyncXMLRPCClient(config.url, self._pool)
+
+        self._connected = False
+        self._uid: Optional[int] = None
+        self._database: Optional[str] = None
+        self._authenticated = False
+        self._auth_method: Optional[str] = None
+        self._server_version: Optional[str] = None
+        # Strong references to fire-and-forget refresh tasks
+        self._background_tasks: Set["asyncio.Task[None]"] = set()
+
+    @classmethod
+    def from_connection(cls, connection: OmniConnection, **kwargs) -> "AsyncOmniConnection":
+        """Create an async connection that reuses an authenticated OmniConnection session.
+
+        Args:
+            connection: Connected and authenticated OmniConnection
+            **kwargs: Extra arguments for the constructor (max_connections)
+
+        Returns:
+            AsyncOmniConnection sharing the session and performance manager
+        """
+        async_conn = cls(
+            connection.config,
+            timeout=connection.timeout,
+            performance_manager=connection.performance_manager,
+            **kwargs,
+        )
+        async_conn._connected = connection.is_connected
+        async_conn._uid = connection.uid
+        async_conn._database = connection.database
+        async_conn._auth_method = connection.auth_method
+        async_conn._authenticated = connection.is_authenticated()
+        async_conn._server_version = connection._server_version
+        return async_conn
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if currently connected."""
+        return self._connected
+
+    def is_authenticated(self) -> bool:
+        """Check if currently authenticated."""
+        return self._authenticated
+
+    @property
+    def uid(self) -> Optional[int]:
+        """Get authenticated user ID."""
+        return self._uid
+
+    @property
+    def database(self) -> Optional[str]:
+        """Get authenticated database name."""
+        return self._database
+
+    @property
+    def performance_manager(self) -> PerformanceManager:
+        """Get the performance manager instance."""
+        return self._performance_manager
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics."""
+        return self._pool.get_stats()
+
+    async def connect(self) -> None:
+        """Check that the Omni server is reachable.
+
+        Raises:
+            OmniConnectionError: If the server cannot be reached
+        """
+        if self._connected:
+            return
+        try:
+            version = await self._client.call(OmniConnection.MCP_COMMON_ENDPOINT, "version")
+            logger.debug(f"Server version: {version}")
+            self._server_version = server_version_key(version)
+        except socket.timeout:
+            raise OmniConnectionError(f"Connection timeout after {self.timeout} seconds") from None
+        except Exception as e:
+            raise OmniConnectionError(f"Connection failed: {e}") from e
+        self._connected = True
+
+    def disconnect(self) -> None:
+        """Close pooled connections."""
+        self._pool.clear()
+        self._connected = False
+
+    async def authenticate(self, database: Optional[str] = None) -> None:
+        """Authenticate with Omni, trying the API key first.
+
+        Args:
+            database: Database name. Defaults to the configured database, or
+                the only / 'omni' database on the server.
+
+        Raises:
+            OmniConnectionError: If authentication fails
+        """
+        if not self._connected:
+            raise OmniConnectionError("Not connected to Omni")
+
+        db_name = database or self.config.database or await self._select_database()
+
+        if self.config.uses_api_key and await self._authenticate_api_key(db_name):
+            return
+        if self.config.uses_credentials and await self._authenticate_password(db_name):
+            return
+
+        raise OmniConnectionError("Authentication failed. Please check your credentials.")
+
+    async def _select_database(self) -> str:
+        """Pick a database the same way OmniConnection.auto_select_database does."""
+        try:
+            databases = await self._client.call(OmniConnection.MCP_DB_ENDPOINT, "list")
+        except Exception as e:
+            raise OmniConnectionError(
+                "Database auto-selection failed. Database listing may be restricted. "
+                "Please specify OMNI_DB in your configuration."
+            ) from e
+
+        if len(databases) == 1:
+            return databases[0]
+        if "omni" in databases:
+            return "omni"
+        raise OmniConnectionError(
+            f"Cannot auto-select database. Found {len(databases)} databases. "
+            "Please specify OMNI_DB in configuration."
+        )
+
+    async def _authenticate_api_key(self, database: str) -> bool:
+        """Validate the API key against the MCP auth endpoint."""
+        try:
+            status, data = await self._client.get_json(
+                "/mcp/auth/validate", [("X-API-Key", self.config.api_key)]
+            )
+        except Exception as e:
+            raise OmniConnectionError(f"Failed to validate API key: {e}") from e
+
+        if status in (401, 429):
+            logger.warning(f"API key validation rejected with HTTP {status}")
+            return False
+        if status != 200:
+            raise OmniConnectionError(f"Failed to validate API key: HTTP {status}")
+
+        if data and data.get("success") and data.get("data", {}).get("valid"):
+            self._set_session(data["data"].get("user_id"), database, "api_key")
+            return True
+        return False
+
+    async def _authenticate_password(self, database: str) -> bool:
+        """Authenticate with username and password."""
+        try:
+            uid = await self._client.call(
+                OmniConnection.MCP_COMMON_ENDPOINT,
+                "authenticate",
+                database,
+                self.config.username,
+                self.config.password,
+                {},
+            )
+        except xmlrpc.client.Fault as e:
+            logger.warning(f"Authentication fault: {e}")
+            return False
+        except Exception as e:
+            raise OmniConnectionError(f"Failed to authenticate: {e}") from e
+
+        if uid:
+            self._set_session(uid, database, "password")
+            return True
+        return False
+
+    def _set_session(self, uid: int, database: str, auth_method: str):
+        self._uid = uid
+        self._database = database
+        self._auth_method = auth_method
+        self._authenticated = True
+        self._performance_manager.set_metadata_scope(database, self._server_version)
+        logger.info(f"Async connection authenticated ({auth_method}) for user ID {uid}")
+
+    async def execute_kw(
+        self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        """Execute an operation on an Omni model with keyword arguments.
+
+        Sends the same execute_kw payload as OmniConnection.execute_kw, and
+        like it lets identical in-flight read-only calls share one request.
+
+        Raises:
+            OmniConnectionError: If not authenticated or execution fails
+        """
+        if not self._authenticated:
+            raise OmniConnectionError("Not authenticated. Call authenticate() first.")
+
+        key = self._performance_manager.request_key(
+            self._database, self._uid, model, method, args, kwargs
+        )
+        if key is None:
+            return await self._execute_kw(model, method, args, kwargs)
+
+        async def call():
+            result = await self._execute_kw(model, method, args, kwargs)
+            return result, last_response_bytes.get()
+
+        flight = self._performance_manager.async_read_flight
+        (result, response_bytes), shared = await flight.do_shared(key, call)
+        # The call ran in its own task, so its response size is copied back here
+        last_response_bytes.set(response_bytes)
+        return clone_result(result) if shared else result
+
+    async def _execute_kw(
+        self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        """Send one execute_kw call to the object endpoint."""
+        password_or_token = (
+            self.config.api_key if self._auth_method == "api_key" else self.config.password
+        )
+
+        last_response_bytes.set(None)
+        try:
+            logger.debug(
+                "Executing %s on %s with args=%s, kwargs=%s",
+                method,
+                model,
+                LazyRepr(args),
+                LazyRepr(kwargs),
+            )
+            with tracer.child_span("xmlrpc.execute_kw", model=model, method=method):
+                return await self._client.call(
+                    OmniConnection.MCP_OBJECT_ENDPOINT,
+                    "execute_kw",
+                    self._database,
+                    self._uid,
+                    password_or_token,
+                    model,
+                    method,
+                    args,
+                    kwargs,
+                )
+        except xmlrpc.client.Fault as e:
+            logger.error(f"XML-RPC fault during {method} on {model}: {e}")
+            sanitized_message = ErrorSanitizer.sanitize_xmlrpc_fault(e.faultString)
+            raise OmniConnectionError(f"Operation failed: {sanitized_message}") from e
+        except socket.timeout:
+            logger.error(f"Timeout during {method} on {model}")
+            raise OmniConnectionError(f"Operation timeout after {self.timeout} seconds") from None
+        except Exception as e:
+            logger.error(f"Error during {method} on {model}: {e}")
+            sanitized_message = ErrorSanitizer.sanitize_message(str(e))
+            raise OmniConnectionError(f"Operation failed: {sanitized_message}") from e
+
+    async def search(self, model: str, domain: List[Union[str, List[Any]]], **kwargs) -> List[int]:
+        """Search for records matching a domain."""
+        return await self._cached_query(model, "search", [domain], kwargs)
+
+    async def read(
+        self, model: str, ids: List[int], fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Read records by IDs, fetching only fields that are not cached."""
+        cached, missing_ids, fetch_fields = self._performance_manager.plan_record_read(
+            model, ids, fields
+        )
+        new_records = []
+        response_bytes = None
+        if missing_ids:
+            kwargs = {"fields": fetch_fields} if fetch_fields else {}
+            with self._performance_manager.monitor.track_operation(f"read_{model}"):
+                new_records = await self.execute_kw(model, "read", [missing_ids], kwargs)
+                response_bytes = last_response_bytes.get()
+
+        return self._performance_manager.merge_record_read(
+            model, ids, fields, cached, new_records, fetch_fields, response_bytes
+        )
+
+    async def search_read(
+        self,
+        model: str,
+        domain: List[Union[str, List[Any]]],
+        fields: Optional[List[str]] = None,
+        *,
+        cache: bool = True,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Search for records and read their data in one operation.
+
+        With ``cache=False`` the record and query caches are neither read
+        nor filled.
+        """
+        if fields:
+            kwargs["fields"] = fields
+
+        if not cache:
+            with self._performance_manager.monitor.track_operation(f"search_read_{model}"):
+                return await self.execute_kw(model, "search_read", [domain], kwargs)
+
+        cached = self._performance_manager.get_cached_query(model, "search_read", [domain], kwargs)
+        if cached is not None:
+            return cached
+
+        generation = self._performance_manager.query_generation(model)
+        with self._performance_manager.monitor.track_operation(f"search_read_{model}"):
+            records = await self.execute_kw(model, "search_read", [domain], kwargs)
+            response_bytes = last_response_bytes.get()
+
+        self._performance_manager.cache_records(model, records, fields, response_bytes)
+        self._performance_manager.cache_query(
+            model, "search_read", [domain], kwargs, records, generation, response_bytes
+        )
+        return records
+
+    async def fields_get(
+        self, model: str, attributes: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get field definitions for a model, using the shared field cache.
+
+        The on-disk field store is read and written on a worker thread.
+        """
+        if not attributes:
+            manager = self._performance_manager
+            cached_fields = manager.get_cached_fields(
+                model, revalidate=self._schedule_fields_revalidation, load_persisted=False
+            )
+            if cached_fields is None and manager.persists_fields:
+                if await asyncio.to_thread(manager.load_persisted_fields, model) is not None:
+                    cached_fields = manager.get_cached_fields(
+                        model, revalidate=self._schedule_fields_revalidation, load_persisted=False
+                    )
+            if cached_fields:
+                return cached_fields
+
+        kwargs = {"attributes": attributes} if attributes else {}
+        with self._performance_manager.monitor.track_operation(f"fields_get_{model}"):
+            fields = await self.execute_kw(model, "fields_get", [], kwargs)
+            response_bytes = last_response_bytes.get()
+
+        if not attributes:
+            await self._cache_fields(model, fields, response_bytes)
+        return fields
+
+    async def _cache_fields(
+        self, model: str, fields: Dict[str, Any], size_bytes: Optional[int]
+    ) -> None:
+        """Cache field definitions, writing the on-disk store on a worker thread."""
+        manager = self._performance_manager
+        manager.cache_fields(model, fields, size_bytes, persist=False)
+        if manager.persists_fields:
+            await asyncio.to_thread(manager.persist_fields, model, fields)
+
+    def _schedule_fields_revalidation(self, model: str) -> None:
+        """Refresh cached field definitions for a model in a background task."""
+        task = asyncio.ensure_future(self._revalidate_fields(model))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _revalidate_fields(self, model: str) -> None:
+        """Re-read field definitions from the server and update both caches."""
+        try:
+            fields = await self.execute_kw(model, "fields_get", [], {})
+            await self._cache_fields(model, fields, last_response_bytes.get())
+        except Exception as e:
+            self._performance_manager.cancel_fields_refresh(model)
+            logger.warning(f"Failed to revalidate field definitions for {model}: {e}")
+
+    async def search_count(self, model: str, domain: List[Union[str, List[Any]]]) -> int:
+        """Count records matching a domain."""
+        return await self._cached_query(model, "search_count", [domain], {})
+
+    async def _cached_query(
+        self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        """Run a search-type call through the optional query cache."""
+        cached = self._performance_manager.get_cached_query(model, method, args, kwargs)
+        if cached is not None:
+            return cached
+        generation = self._performance_manager.query_generation(model)
+        result = await self.execute_kw(model, method, args, kwargs)
+        self._performance_manager.cache_query(
+            model, method, args, kwargs, result, generation, last_response_bytes.get()
+        )
+        return result
+
+    async def read_group(
+        self,
+        model: str,
+        domain: List[Union[str, List[Any]]],
+        fields: List[str],
+        groupby: List[str],
+        offset: int = 0,
+        limit: Optional[int] = None,
+        orderby: Optional[str] = None,
+        lazy: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Aggregate records server-side, grouped by one or more fields."""
+        kwargs: Dict[str, Any] = {"lazy": lazy}
+        if offset:
+            kwargs["offset"] = offset
+        if limit is not None:
+            kwargs["limit"] = limit
+        if orderby:
+            kwargs["orderby"] = orderby
+
+        with self._performance_manager.monitor.track_operation(f"read_group_{model}"):
+            return await self.execute_kw(model, "read_group", [domain, fields, groupby], kwargs)
+
+    async def create(self, model: str, values: Dict[str, Any]) -> int:
+        """Create a new record."""
+        with self._performance_manager.monitor.track_operation(f"create_{model}"):
+            record_id = await self.execute_kw(model, "create", [values], {})
+        self._performance_manager.invalidate_record_cache(model)
+        logger.info(f"Created {model} record with ID {record_id}")
+        return record_id
+
+    async def create_many(self, model: str, values_list: List[Dict[str, Any]]) -> List[int]:
+        """Create several records with a single create call."""
+        with self._performance_manager.monitor.track_operation(f"create_{model}"):
+            record_ids = await self.execute_kw(model, "create", [values_list], {})
+        self._performance_manager.invalidate_record_cache(model)
+        logger.info(f"Created {len(record_ids)} {model} record(s)")
+        return record_ids
+
+    async def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> bool:
+        """Update existing records."""
+        with self._performance_manager.monitor.track_operation(f"write_{model}"):
+            result = await self.execute_kw(model, "write", [ids, values], {})
+        self._performance_manager.invalidate_records(model, ids)
+        logger.info(f"Updated {len(ids)} {model} record(s)")
+        return result
+
+    async def unlink(self, model: str, ids: List[int]) -> bool:
+        """Delete records."""
+        with self._performance_manager.monitor.track_operation(f"unlink_{model}"):
+            result = await self.execute_kw(model, "unlink", [ids], {})
+        self._performance_manager.invalidate_records(model, ids)
+        logger.info(f"Deleted {len(ids)} {model} record(s)")
+        return result
@@ -30,11 +30,18 @@ class OmniConfig:
     default_limit: int = 10
     max_limit: int = 100
     max_smart_fields: int = 15
+    max_workers: int = 8
+    async_client: bool = False
+    fields_cache_dir: Optional[str] = None
+    query_cache_ttl: int = 0
+    trace_file: Optional[str] = None
+    trace_endpoint: Optional[str] = None
 
     # MCP transport configuration
     transport: Literal["stdio", "streamable-http"] = "stdio"
     host: str = "localhost"
     port: int = 8000
+    metrics_enabled: bool = False
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -66,6 +73,12 @@ class OmniConfig:
         if self.default_limit > self.max_limit:
             raise ValueError("OMNI_MCP_DEFAULT_LIMIT cannot exceed OMNI_MCP_MAX_LIMIT")
 
+        if self.max_workers <= 0:
+            raise ValueError("OMNI_MCP_MAX_WORKERS must be positive")
+
+        if self.query_cache_ttl < 0:
+            raise ValueError("OMNI_MCP_QUERY_CACHE_TTL cannot be negative")
+
         # Validate log level
         valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         if self.log_level.upper() not in valid_log_levels:
@@ -152,6 +165,18 @@ def load_config(env_file: Optional[Path] = None) -> OmniConfig:
         except ValueError:
             raise ValueError(f"{key} must be a valid integer") from None
 
+    # Helper function to get bool with default
+    def get_bool_env(key: str, default: bool) -> bool:
+        value = os.getenv(key)
+        if value is None:
+            return default
+        value = value.strip().lower()
+        if value in ("1", "true", "yes", "on"):
+            return True
+        if value in ("0", "false", "no", "off", ""):
+            return False
+        raise ValueError(f"{key} must be a boolean (true/false)")
+
     # Create configuration
     config = OmniConfig(
         url=os.getenv("OMNI_URL", "").strip(),
@@ -163,9 +188,16 @@ def load_config(env_file: Optional[Path] = None) -> OmniConfig:
         default_limit=get_int_env("OMNI_MCP_DEFAULT_LIMIT", 10),
         max_limit=get_int_env("OMNI_MCP_MAX_LIMIT", 100),
         max_smart_fields=get_int_env("OMNI_MCP_MAX_SMART_FIELDS", 15),
+        max_workers=get_int_env("OMNI_MCP_MAX_WORKERS", 8),
+        async_client=get_bool_env("OMNI_MCP_ASYNC_CLIENT", False),
+        fields_cache_dir=os.getenv("OMNI_MCP_FIELDS_CACHE_DIR", "").strip() or None,
+        query_cache_ttl=get_int_env("OMNI_MCP_QUERY_CACHE_TTL", 0),
+        trace_file=os.getenv("OMNI_MCP_TRACE_FILE", "").strip() or None,
+        trace_endpoint=os.getenv("OMNI_MCP_TRACE_ENDPOINT", "").strip() or None,
         transport=os.getenv("OMNI_MCP_TRANSPORT", "stdio").strip(),
         host=os.getenv("OMNI_MCP_HOST", "localhost").strip(),
         port=get_int_env("OMNI_MCP_PORT", 8000),
+        metrics_enabled=get_bool_env("OMNI_MCP_METRICS_ENABLED", False),
     )
 
     return config
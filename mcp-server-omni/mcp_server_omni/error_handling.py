@@ -14,7 +14,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from mcp.types import ErrorData
 
@@ -64,14 +64,24 @@ class ErrorMetrics:
     total_errors: int = 0
     errors_by_category: Dict[ErrorCategory, int] = field(default_factory=dict)
     errors_by_severity: Dict[ErrorSeverity, int] = field(default_factory=dict)
+    # (category, model, operation) -> count; model/operation are "" when unknown
+    errors_by_operation: Dict[Tuple[ErrorCategory, str, str], int] = field(default_factory=dict)
     last_error_time: Optional[datetime] = None
     error_rate_per_minute: float = 0.0
 
-    def record_error(self, category: ErrorCategory, severity: ErrorSeverity):
+    def record_error(
+        self,
+        category: ErrorCategory,
+        severity: ErrorSeverity,
+        model: Optional[str] = None,
+        operation: Optional[str] = None,
+    ):
         """Record an error occurrence."""
         self.total_errors += 1
         self.errors_by_category[category] = self.errors_by_category.get(category, 0) + 1
         self.errors_by_severity[severity] = self.errors_by_severity.get(severity, 0) + 1
+        key = (category, model or "", operation or "")
+        self.errors_by_operation[key] = self.errors_by_operation.get(key, 0) + 1
         self.last_error_time = datetime.now()
 
 
@@ -292,7 +302,12 @@ class ErrorHandler:
             mcp_error = self._convert_to_mcp_error(error, context)
 
         # Record metrics
-        self.metrics.record_error(mcp_error.category, mcp_error.severity)
+        self.metrics.record_error(
+            mcp_error.category,
+            mcp_error.severity,
+            mcp_error.context.model,
+            mcp_error.context.operation,
+        )
 
         # Add to history
         self._add_to_history(mcp_error)
@@ -0,0 +1,164 @@
+"""Chunked record export for large result sets.
+
+Exports walk a domain with keyset pagination (``id > last_id`` ordered by
+id) instead of offsets, so every chunk is an index range scan on the server
+and records inserted or deleted mid-export never shift later pages. The next
+chunk is fetched while the current one is being serialized, and only those
+two chunks are held in memory at a time.
+"""
+
+import asyncio
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from .omni_connection import OmniConnection
+
+# Supported export output formats
+EXPORT_FORMATS = ("ndjson", "csv")
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 2000
+
+# Records returned by a single export call or resource read
+MAX_EXPORT_RECORDS = 10000
+
+
+async def iter_record_chunks(
+    connection: OmniConnection,
+    model: str,
+    domain: List[Union[str, List[Any]]],
+    fields: Optional[List[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    after_id: int = 0,
+    max_records: Optional[int] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield matching records in id order, one chunk at a time.
+
+    The request for the next chunk is issued before the current chunk is
+    yielded, so fetching overlaps with whatever the consumer does with it.
+
+    Args:
+        connection: Omni connection used for search_read calls
+        model: The Omni model name
+        domain: Omni domain filter
+        fields: Fields to read; "id" is always added
+        chunk_size: Records per search_read call
+        after_id: Only export records with an id greater than this
+        max_records: Stop after this many records (None for no limit)
+
+    Yields:
+        Non-empty lists of records
+    """
+    if fields is not None and "id" not in fields:
+        fields = ["id"] + list(fields)
+    remaining = max_records
+
+    def fetch(last_id: int) -> "asyncio.Task[List[Dict[str, Any]]]":
+        limit = chunk_size if remaining is None else min(chunk_size, remaining)
+        return asyncio.ensure_future(
+            connection.asearch_read(
+                model,
+                list(domain) + [["id", ">", last_id]],
+                fields,
+                limit=limit,
+                order="id asc",
+                # One-off bulk reads would only evict interactive entries
+                cache=False,
+            )
+        )
+
+    pending = fetch(after_id)
+    try:
+        while pending is not None:
+            requested = chunk_size if remaining is None else min(chunk_size, remaining)
+            records = await pending
+            pending = None
+            if not records:
+                return
+
+            if remaining is not None:
+                remaining -= len(records)
+            # A short chunk is the last one; otherwise prefetch the next
+            if len(records) >= requested and (remaining is None or remaining > 0):
+                pending = fetch(records[-1]["id"])
+                # Let the request start before the consumer serializes this chunk
+                await asyncio.sleep(0)
+
+            yield records
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _csv_cell(value: Any) -> Any:
+    """Convert an Omni field value to a CSV cell."""
+    if value is None or value is False:
+        # Omni returns False for empty non-boolean fields
+        return ""
+    if value is True:
+        return "true"
+    if isinstance(value, (list, tuple)):
+        # many2one fields are [id, display_name]
+        if len(value) == 2 and isinstance(value[0], int) and isinstance(value[1], str):
+            return value[1]
+        return json.dumps(value, default=str)
+    if isinstance(value, dict):
+        return json.dumps(value, default=str)
+    return value
+
+
+class ExportWriter:
+    """Serialize record chunks to NDJSON or CSV text.
+
+    CSV columns are fixed by the first chunk (or the requested fields), and
+    the header row is emitted with the first chunk only.
+    """
+
+    def __init__(self, fmt: str = "ndjson", fields: Optional[List[str]] = None):
+        """Initialize writer.
+
+        Args:
+            fmt: Output format, one of EXPORT_FORMATS
+            fields: Column order for CSV output
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Invalid export format '{fmt}'. Must be one of: {', '.join(EXPORT_FORMATS)}"
+            )
+        self.format = fmt
+        self.columns = ["id"] + [f for f in fields if f != "id"] if fields else None
+        self._header_written = False
+
+    @property
+    def media_type(self) -> str:
+        """MIME type of the output."""
+        return "application/x-ndjson" if self.format == "ndjson" else "text/csv"
+
+    def write(self, records: List[Dict[str, Any]]) -> str:
+        """Serialize one chunk of records.
+
+        Args:
+            records: Records to serialize
+
+        Returns:
+            Text for the chunk (newline terminated)
+        """
+        if self.format == "ndjson":
+            dumps = json.dumps
+            return "".join(dumps(record, default=str) + "\n" for record in records)
+
+        if self.columns is None:
+            self.columns = list(records[0]) if records else []
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if not self._header_written:
+            writer.writerow(self.columns)
+            self._header_written = True
+        columns = self.columns
+        writer.writerows([_csv_cell(record.get(c)) for c in columns] for record in records)
+        return buffer.getvalue()
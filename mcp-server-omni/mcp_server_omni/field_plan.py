@@ -0,0 +1,360 @@
+"""Precompiled per-model field plans.
+
+A field plan is derived once from a model's ``fields_get`` result and holds
+everything request handlers need to know about the model's fields: the
+ranked smart-default fields, the datetime fields and the fields that are
+safe to read through resources. Handlers
+then only do set lookups per request instead of re-scoring every field.
+
+It also provides the batch datetime normalizer applied to whole result sets.
+"""
+
+from datetime import datetime
+from typing import Any, Collection, Dict, FrozenSet, List, Optional
+
+# Fields always included in smart defaults
+ESSENTIAL_FIELDS = ("id", "name", "display_name", "active")
+
+# System/technical fields excluded from smart defaults
+EXCLUDED_PREFIXES = ("_", "message_", "activity_", "website_message_")
+EXCLUDED_FIELDS = frozenset(
+    {
+        "write_date",
+        "create_date",
+        "write_uid",
+        "create_uid",
+        "__last_update",
+        "access_token",
+        "access_warning",
+        "access_url",
+    }
+)
+
+# Heavy field types never included in smart defaults
+LARGE_FIELD_TYPES = frozenset({"binary", "image", "html"})
+
+# Field types that commonly cause XML-RPC serialization issues in resources
+# (html fields often contain Markup objects)
+UNSAFE_FIELD_TYPES = frozenset({"binary", "serialized", "html"})
+
+# Common datetime field names in Omni
+DATETIME_FIELD_NAMES = frozenset(
+    {
+        "create_date",
+        "write_date",
+        "date",
+        "datetime",
+        "date_start",
+        "date_end",
+        "date_from",
+        "date_to",
+        "date_order",
+        "date_invoice",
+        "date_due",
+        "last_update",
+        "last_activity",
+        "activity_date_deadline",
+    }
+)
+DATETIME_FIELD_SUFFIXES = ("_date", "_datetime", "_time")
+
+TYPE_SCORES = {
+    "char": 200,
+    "boolean": 180,
+    "selection": 170,
+    "integer": 160,
+    "float": 160,
+    "monetary": 140,
+    "date": 150,
+    "datetime": 150,
+    "many2one": 120,  # Relations useful but not primary
+    "text": 80,
+    "one2many": 40,
+    "many2many": 40,  # Heavy relations
+    "binary": 10,
+    "html": 10,
+    "image": 10,  # Heavy content
+}
+
+BUSINESS_PATTERNS = (
+    "state",
+    "status",
+    "stage",
+    "priority",
+    "company",
+    "currency",
+    "amount",
+    "total",
+    "date",
+    "user",
+    "partner",
+    "email",
+    "phone",
+    "address",
+    "street",
+    "city",
+    "country",
+    "code",
+    "ref",
+    "number",
+)
+
+
+def score_field_importance(field_name: str, field_info: Dict[str, Any]) -> int:
+    """Score field importance for smart default selection.
+
+    Args:
+        field_name: Name of the field
+        field_info: Field metadata from fields_get()
+
+    Returns:
+        Importance score (higher = more important)
+    """
+    # Tier 1: Essential fields (always included)
+    if field_name in ESSENTIAL_FIELDS:
+        return 1000
+
+    # Exclude system/technical fields
+    if field_name.startswith(EXCLUDED_PREFIXES) or field_name in EXCLUDED_FIELDS:
+        return 0
+
+    # Exclude large field types and one2many/many2many fields (can be large)
+    field_type = field_info.get("type", "")
+    if field_type in LARGE_FIELD_TYPES or field_type in ("one2many", "many2many"):
+        return 0
+
+    score = 0
+
+    # Tier 2: Required fields are very important
+    if field_info.get("required"):
+        score += 500
+
+    # Tier 3: Field type importance
+    score += TYPE_SCORES.get(field_type, 50)
+
+    # Tier 4: Storage and searchability bonuses
+    if field_info.get("store", True):
+        score += 80
+    if field_info.get("searchable", True):
+        score += 40
+
+    # Tier 5: Business-relevant field patterns (bonus)
+    lowered = field_name.lower()
+    if any(pattern in lowered for pattern in BUSINESS_PATTERNS):
+        score += 60
+
+    # Cap expensive computed fields (non-stored) at a low score
+    if field_info.get("compute") and not field_info.get("store", True):
+        score = min(score, 30)
+
+    return max(score, 0)
+
+
+def is_datetime_field_name(field_name: str) -> bool:
+    """Check whether a field name suggests a datetime field."""
+    return field_name in DATETIME_FIELD_NAMES or field_name.endswith(DATETIME_FIELD_SUFFIXES)
+
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _parse_format_datetime(value: str) -> str:
+    """Format an Omni datetime string with strptime (reference implementation)."""
+    # Handle Omni's compact datetime format (YYYYMMDDTHH:MM:SS)
+    if len(value) == 17 and "T" in value and "-" not in value:
+        try:
+            dt = datetime.strptime(value, "%Y%m%dT%H:%M:%S")
+            return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        except ValueError:
+            pass
+
+    # Handle standard Omni datetime format (YYYY-MM-DD HH:MM:SS)
+    if " " in value and len(value) == 19:
+        try:
+            dt = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+            return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        except ValueError:
+            pass
+
+    return value
+
+
+def _is_canonical(year: str, month: str, day: str, hour: str, minute: str, second: str) -> bool:
+    """Check zero-padded ASCII components describe a valid datetime."""
+    digits = year + month + day + hour + minute + second
+    if not (digits.isascii() and digits.isdigit()):
+        return False
+    y, m, d = int(year), int(month), int(day)
+    # Years below 1000 are not zero-padded by strftime; leave them to strptime
+    if y < 1000 or not 1 <= m <= 12 or d < 1:
+        return False
+    days = DAYS_IN_MONTH[m]
+    if m == 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
+        days = 29
+    return d <= days and int(hour) < 24 and int(minute) < 60 and int(second) < 60
+
+
+def format_datetime(value: str) -> str:
+    """Format Omni datetime values to ISO 8601 with timezone.
+
+    Canonical values are rewritten by string slicing; anything unusual falls
+    back to strptime so the output is identical either way.
+    """
+    if not value or not isinstance(value, str):
+        return value
+
+    length = len(value)
+    if length == 17:
+        # YYYYMMDDTHH:MM:SS
+        if (
+            value[8] == "T"
+            and value[11] == ":"
+            and value[14] == ":"
+            and _is_canonical(
+                value[0:4], value[4:6], value[6:8], value[9:11], value[12:14], value[15:17]
+            )
+        ):
+            return f"{value[0:4]}-{value[4:6]}-{value[6:8]}T{value[9:17]}+00:00"
+    elif length == 19:
+        # YYYY-MM-DD HH:MM:SS
+        if (
+            value[4] == "-"
+            and value[7] == "-"
+            and value[10] == " "
+            and value[13] == ":"
+            and value[16] == ":"
+            and _is_canonical(
+                value[0:4], value[5:7], value[8:10], value[11:13], value[14:16], value[17:19]
+            )
+        ):
+            return f"{value[0:10]}T{value[11:19]}+00:00"
+    else:
+        return value
+
+    return _parse_format_datetime(value)
+
+
+def normalize_datetimes(
+    records: List[Dict[str, Any]], datetime_fields: Collection[str] = ()
+) -> List[Dict[str, Any]]:
+    """Rewrite Omni datetime strings across a whole result set in place.
+
+    Declared datetime columns are always formatted; other string values are
+    only tried when they have the length of one of the two Omni formats, as
+    datetime-looking values in untyped fields were formatted before too.
+    Repeated timestamps are formatted once per batch.
+
+    Args:
+        records: Records to update in place
+        datetime_fields: Names of the model's datetime columns
+
+    Returns:
+        The same list of records
+    """
+    formatted_values: Dict[str, str] = {}
+    for record in records:
+        for field_name, value in record.items():
+            if not isinstance(value, str):
+                continue
+            if field_name not in datetime_fields and len(value) not in (17, 19):
+                continue
+            formatted = formatted_values.get(value)
+            if formatted is None:
+                formatted = formatted_values[value] = format_datetime(value)
+            if formatted != value:
+                record[field_name] = formatted
+    return records
+
+
+class FieldPlan:
+    """Field selection and formatting decisions for one model, computed once.
+
+    Attributes:
+        fields: The fields_get result the plan was built from
+        ranked_fields: Fields with a positive importance score, best first
+        datetime_fields: Fields typed or named like datetimes
+        safe_fields: Fields safe to read through resources, in definition order
+    """
+
+    def __init__(self, fields: Dict[str, Dict[str, Any]]):
+        """Build a plan from field definitions.
+
+        Args:
+            fields: Field definitions from fields_get()
+        """
+        self.fields = fields
+
+        scores = []
+        datetime_fields = set()
+        safe_fields = []
+        for field_name, field_info in fields.items():
+            field_type = field_info.get("type", "")
+            score = score_field_importance(field_name, field_info)
+            if score > 0:
+                scores.append((field_name, score))
+            if field_type == "datetime" or is_datetime_field_name(field_name):
+                datetime_fields.add(field_name)
+            if field_type not in UNSAFE_FIELD_TYPES and not field_name.startswith("_"):
+                safe_fields.append(field_name)
+
+        # Stable sort keeps definition order between equal scores
+        scores.sort(key=lambda x: x[1], reverse=True)
+        self.ranked_fields: List[str] = [field_name for field_name, _ in scores]
+        self.datetime_fields: FrozenSet[str] = frozenset(datetime_fields)
+        self.safe_fields: List[str] = safe_fields
+        self._smart_defaults: Dict[int, List[str]] = {}
+
+    def smart_default_fields(self, max_fields: int) -> List[str]:
+        """Return the top-ranked fields plus any essential fields.
+
+        Args:
+            max_fields: Maximum number of ranked fields to select
+
+        Returns:
+            List of field names to include by default
+        """
+        selected = self._smart_defaults.get(max_fields)
+        if selected is None:
+            selected = self.ranked_fields[:max_fields]
+            selected += [
+                field
+                for field in ESSENTIAL_FIELDS
+                if field in self.fields and field not in selected
+            ]
+            self._smart_defaults[max_fields] = selected
+        return list(selected)
+
+
+class FieldPlanCache:
+    """Field plans per model, rebuilt whenever the field definitions change.
+
+    Plans are tied to the identity of the cached fields_get result, so a
+    refreshed definition (a new dict) automatically yields a new plan.
+    """
+
+    def __init__(self):
+        """Initialize plan cache."""
+        self._plans: Dict[str, FieldPlan] = {}
+
+    def get(self, model: str, fields: Dict[str, Dict[str, Any]]) -> FieldPlan:
+        """Get the plan for a model's current field definitions.
+
+        Args:
+            model: Model name
+            fields: Field definitions from fields_get()
+
+        Returns:
+            The cached plan, or a freshly built one if the definitions changed
+        """
+        plan = self._plans.get(model)
+        if plan is None or plan.fields is not fields:
+            plan = FieldPlan(fields)
+            self._plans[model] = plan
+        return plan
+
+    def clear(self, model: Optional[str] = None):
+        """Drop cached plans for one model or all models."""
+        if model is None:
+            self._plans.clear()
+        else:
+            self._plans.pop(model, None)
@@ -12,6 +12,9 @@ from .uri_schema import build_record_uri, build_search_uri
 
 logger = logging.getLogger(__name__)
 
+# Related records shown (or expanded) per x2many field
+DEFAULT_MAX_RELATED_ITEMS = 5
+
 
 class RecordFormatter:
     """Formats Omni records for LLM consumption.
@@ -35,7 +38,7 @@ class RecordFormatter:
     # Binary field types
     BINARY_FIELDS = {"binary", "image", "file"}
 
-    def __init__(self, model: str, max_related_items: int = 5):
+    def __init__(self, model: str, max_related_items: int = DEFAULT_MAX_RELATED_ITEMS):
         """Initialize the formatter.
 
         Args:
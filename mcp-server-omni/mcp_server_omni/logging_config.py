@@ -5,22 +5,68 @@ This module provides centralized logging setup with:
 - Log level configuration from environment
 - Request/response logging
 - Performance tracking
+- Lazy, size-limited rendering of hot-path log arguments
+- Optional asynchronous logging through a bounded queue
 """
 
 import json
 import logging
 import logging.handlers
 import os
+import queue
+import random
+import reprlib
 import sys
+import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from .tracing import tracer
 
 # Default log format
 DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 JSON_FORMAT = '{"timestamp": "%(asctime)s", "logger": "%(name)s", "level": "%(levelname)s", "message": "%(message)s"}'
 
+# Maximum length of a rendered LazyRepr log argument
+MAX_LOG_VALUE_LENGTH = 500
+
+_log_repr = reprlib.Repr()
+_log_repr.maxlevel = 4
+_log_repr.maxlist = _log_repr.maxtuple = _log_repr.maxset = 20
+_log_repr.maxdict = 20
+_log_repr.maxstring = 200
+_log_repr.maxother = 200
+
+
+class LazyRepr:
+    """Log argument that is rendered only if the record is emitted.
+
+    Pass it with %-style formatting so disabled levels cost nothing:
+
+        logger.debug("args=%s", LazyRepr(args))
+
+    Large containers and strings are abbreviated (e.g. "[1, 2, ...]") and
+    the result is capped at max_length characters.
+    """
+
+    __slots__ = ("value", "max_length")
+
+    def __init__(self, value: Any, max_length: int = MAX_LOG_VALUE_LENGTH):
+        """Initialize with the value to render."""
+        self.value = value
+        self.max_length = max_length
+
+    def __str__(self) -> str:
+        """Render the abbreviated repr of the value."""
+        text = _log_repr.repr(self.value)
+        if len(text) > self.max_length:
+            text = text[: self.max_length] + "..."
+        return text
+
+    __repr__ = __str__
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs structured JSON logs."""
@@ -54,6 +100,18 @@ class StructuredFormatter(logging.Formatter):
         if hasattr(record, "operation"):
             log_data["operation"] = record.operation
 
+        # Correlate with the trace active when the record was created; an
+        # AsyncLogHandler captures it because formatting runs on its thread
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id is not None:
+            log_data["trace_id"] = trace_id
+            log_data["span_id"] = getattr(record, "span_id", None)
+        else:
+            span = tracer.current_span()
+            if span is not None:
+                log_data["trace_id"] = span.trace_id
+                log_data["span_id"] = span.span_id
+
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
@@ -84,12 +142,28 @@ class RequestLoggingAdapter(logging.LoggerAdapter):
 
 
 class PerformanceLogger:
-    """Logger for tracking operation performance."""
+    """Logger for tracking operation performance.
+
+    Completion logs can be sampled to cut per-call overhead on busy
+    servers; slow operations are always logged.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        sample_rate: float = 1.0,
+        slow_threshold_ms: float = 1000,
+    ):
+        """Initialize performance logger.
 
-    def __init__(self, logger: logging.Logger):
-        """Initialize performance logger."""
+        Args:
+            logger: Logger to write timing records to
+            sample_rate: Fraction (0.0-1.0) of completions to log at INFO
+            slow_threshold_ms: Duration above which a warning is always logged
+        """
         self.logger = logger
-        self._timers: Dict[str, float] = {}
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
 
     @contextmanager
     def track_operation(
@@ -105,36 +179,225 @@ class PerformanceLogger:
                 # Perform operation
                 pass
         """
-        start_time = time.time()
-        timer_id = f"{operation}_{id(start_time)}"
-        self._timers[timer_id] = start_time
+        start_time = time.perf_counter()
 
         try:
-            yield
+            # Also time the operation as a span, the root of a trace for tool calls
+            attributes = {"model": model} if model else {}
+            with tracer.span(operation, **attributes):
+                yield
         finally:
-            duration_ms = (time.time() - start_time) * 1000
-            self._timers.pop(timer_id, None)
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            slow = duration_ms > self.slow_threshold_ms
+            # Nothing is formatted unless a record will actually be emitted
+            log_info = self._sampled() and self.logger.isEnabledFor(logging.INFO)
+            if log_info or (slow and self.logger.isEnabledFor(logging.WARNING)):
+                log_data = {
+                    "operation": operation,
+                    "duration_ms": round(duration_ms, 2),
+                }
+                if model:
+                    log_data["model"] = model
+                if extra:
+                    log_data.update(extra)
+
+                if log_info:
+                    self.logger.info(
+                        f"Operation '{operation}' completed in {duration_ms:.2f}ms",
+                        extra=log_data,
+                    )
+
+                # Log warning for slow operations
+                if slow:
+                    self.logger.warning(
+                        f"Slow operation detected: '{operation}' took {duration_ms:.2f}ms",
+                        extra=log_data,
+                    )
+
+    def _sampled(self) -> bool:
+        """Decide whether this completion is logged."""
+        rate = self.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+class AsyncLogHandler(logging.Handler):
+    """Handler that formats and writes records on a background thread.
+
+    Request threads only snapshot the record (message, trace IDs) and put
+    it on a bounded queue; a writer thread drains the queue in batches and
+    passes them to the wrapped handlers, writing each batch to a stream
+    handler with a single write and flush.
+
+    When the queue is full, records below WARNING are dropped and counted;
+    WARNING and above overflow to a synchronous write so errors are never
+    lost.
+    """
 
-            log_data = {
-                "operation": operation,
-                "duration_ms": round(duration_ms, 2),
-            }
-            if model:
-                log_data["model"] = model
-            if extra:
-                log_data.update(extra)
+    def __init__(
+        self,
+        handlers: List[logging.Handler],
+        queue_size: int = 10000,
+        batch_size: int = 256,
+    ):
+        """Initialize handler and start its writer thread.
 
-            self.logger.info(
-                f"Operation '{operation}' completed in {duration_ms:.2f}ms",
-                extra=log_data,
-            )
+        Args:
+            handlers: Handlers that format and write the records
+            queue_size: Maximum records waiting to be written
+            batch_size: Maximum records written per batch
+        """
+        super().__init__()
+        self.handlers = handlers
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._stats_lock = threading.Lock()
+        self._written = 0
+        self._batches = 0
+        self._dropped = 0
+        self._overflowed = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="omni-mcp-log-writer", daemon=True)
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a record for the writer thread."""
+        try:
+            self._prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno >= logging.WARNING:
+                with self._stats_lock:
+                    self._overflowed += 1
+                self._write_batch([record])
+            else:
+                with self._stats_lock:
+                    self._dropped += 1
+
+    def _prepare(self, record: logging.LogRecord) -> None:
+        """Capture request-thread state before the record changes threads."""
+        # Render the message now: its arguments may be mutated after we return
+        record.msg = record.getMessage()
+        record.args = None
+        if not hasattr(record, "trace_id"):
+            span = tracer.current_span()
+            if span is not None:
+                record.trace_id = span.trace_id
+                record.span_id = span.span_id
+
+    def flush(self) -> None:
+        """Write all queued records."""
+        self.drain()
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """Write all queued records, waiting at most timeout seconds.
+
+        Args:
+            timeout: Seconds to wait for the writer thread
+
+        Returns:
+            True if the queue was drained within the timeout
+        """
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write queued records, stop the writer thread and close handlers."""
+        if not self._closed:
+            self._closed = True
+            if self._thread.is_alive():
+                try:
+                    self._queue.put(None, timeout=timeout)
+                except queue.Full:
+                    pass
+                self._thread.join(timeout)
+            for handler in self.handlers:
+                handler.close()
+        super().close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue and drop counters."""
+        with self._stats_lock:
+            return {
+                "queue_size": self._queue.qsize(),
+                "queue_capacity": self.queue_size,
+                "written": self._written,
+                "batches": self._batches,
+                "dropped": self._dropped,
+                "overflowed": self._overflowed,
+            }
 
-            # Log warning for slow operations
-            if duration_ms > 1000:  # More than 1 second
-                self.logger.warning(
-                    f"Slow operation detected: '{operation}' took {duration_ms:.2f}ms",
-                    extra=log_data,
-                )
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: List[logging.LogRecord] = []
+            markers: List[threading.Event] = []
+            stop = False
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+                with self._stats_lock:
+                    self._written += len(batch)
+                    self._batches += 1
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _write_batch(self, records: List[logging.LogRecord]) -> None:
+        for handler in self.handlers:
+            if isinstance(handler, logging.StreamHandler) and not isinstance(
+                handler, logging.handlers.BaseRotatingHandler
+            ):
+                self._write_stream_batch(handler, records)
+            else:
+                # Rotating handlers check for rollover per record
+                for record in records:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+
+    def _write_stream_batch(
+        self, handler: logging.StreamHandler, records: List[logging.LogRecord]
+    ) -> None:
+        lines = []
+        for record in records:
+            if record.levelno >= handler.level and handler.filter(record):
+                try:
+                    lines.append(handler.format(record) + handler.terminator)
+                except Exception:
+                    handler.handleError(record)
+        if not lines:
+            return
+        with handler.lock:
+            try:
+                handler.stream.write("".join(lines))
+                handler.flush()
+            except Exception:
+                handler.handleError(records[-1])
 
 
 def setup_logging(
@@ -142,6 +405,8 @@ def setup_logging(
     log_format: Optional[str] = None,
     use_json: bool = False,
     log_file: Optional[str] = None,
+    async_logging: bool = False,
+    queue_size: int = 10000,
 ) -> None:
     """Set up structured logging for the MCP server.
 
@@ -150,6 +415,10 @@ def setup_logging(
         log_format: Custom log format string
         use_json: Whether to use JSON formatting
         log_file: Optional log file path
+        async_logging: Whether to format and write records on a background
+            thread through a bounded queue (see AsyncLogHandler)
+        queue_size: Maximum records waiting to be written when async_logging
+            is enabled
     """
     # Get log level from environment or parameter
     if log_level is None:
@@ -165,6 +434,8 @@ def setup_logging(
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        if isinstance(handler, AsyncLogHandler):
+            handler.close()
 
     # Create formatter
     if use_json or os.getenv("OMNI_MCP_LOG_JSON", "").lower() == "true":
@@ -177,7 +448,7 @@ def setup_logging(
     # MCP uses stdout for JSON-RPC communication, so logging must go to stderr
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
 
     # File handler if specified
     if log_file or os.getenv("OMNI_MCP_LOG_FILE"):
@@ -188,7 +459,13 @@ def setup_logging(
             backupCount=5,
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if async_logging:
+        root_logger.addHandler(AsyncLogHandler(handlers, queue_size=queue_size))
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Set specific loggers
     logging.getLogger("mcp_server_omni").setLevel(numeric_level)
@@ -199,6 +476,37 @@ def setup_logging(
     logging.getLogger("asyncio").setLevel(logging.WARNING)
 
 
+def _async_handler() -> Optional[AsyncLogHandler]:
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, AsyncLogHandler):
+            return handler
+    return None
+
+
+def flush_logging(timeout: float = 5.0) -> bool:
+    """Write records still queued by asynchronous logging.
+
+    Args:
+        timeout: Seconds to wait for the writer thread
+
+    Returns:
+        True if everything was written (always True when logging is synchronous)
+    """
+    handler = _async_handler()
+    return handler.drain(timeout) if handler is not None else True
+
+
+def get_logging_stats() -> Optional[Dict[str, Any]]:
+    """Get asynchronous logging queue and drop counters.
+
+    Returns:
+        Counters from AsyncLogHandler.get_stats(), or None when logging is
+        synchronous
+    """
+    handler = _async_handler()
+    return handler.get_stats() if handler is not None else None
+
+
 def get_logger(name: str, request_id: Optional[str] = None) -> logging.Logger:
     """Get a logger instance with optional request context.
 
@@ -296,6 +604,12 @@ class LoggingConfig:
         self.slow_operation_threshold_ms = int(
             os.getenv("OMNI_MCP_SLOW_OPERATION_THRESHOLD_MS", "1000")
         )
+        # Fraction of operation timing logs to keep, clamped to 0.0-1.0
+        self.perf_log_sample_rate = min(
+            max(float(os.getenv("OMNI_MCP_PERF_LOG_SAMPLE_RATE", "1.0")), 0.0), 1.0
+        )
+        self.async_logging = os.getenv("OMNI_MCP_LOG_ASYNC", "false").lower() == "true"
+        self.log_queue_size = max(int(os.getenv("OMNI_MCP_LOG_QUEUE_SIZE", "10000")), 1)
 
     def setup(self):
         """Set up logging with current configuration."""
@@ -304,7 +618,11 @@ class LoggingConfig:
             log_format=self.log_format,
             use_json=self.use_json,
             log_file=self.log_file,
+            async_logging=self.async_logging,
+            queue_size=self.log_queue_size,
         )
+        perf_logger.sample_rate = self.perf_log_sample_rate
+        perf_logger.slow_threshold_ms = self.slow_operation_threshold_ms
 
 
 # Initialize logging configuration
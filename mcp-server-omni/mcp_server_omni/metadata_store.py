@@ -0,0 +1,130 @@
+"""Persistent on-disk store for model field metadata.
+
+fields_get results are large and change only when modules are installed or
+upgraded, so they are kept in a small SQLite file across restarts. Entries
+are keyed by server URL, database, model and server version: a different
+server or an upgraded server never sees another's metadata, and the caller
+revalidates loaded entries in the background to pick up module changes.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+STORE_FILENAME = "fields_cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fields_metadata (
+    server_url TEXT NOT NULL,
+    database TEXT NOT NULL,
+    model TEXT NOT NULL,
+    version TEXT NOT NULL,
+    fields_json TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (server_url, database, model, version)
+)
+"""
+
+
+class FieldsMetadataStore:
+    """SQLite-backed store of fields_get results.
+
+    A single connection is shared between threads and guarded by a lock;
+    reads and writes are single-row primary key operations. Storage errors
+    are logged and treated as misses so a broken cache directory never fails
+    a request.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """Initialize store, creating the cache directory and file if needed.
+
+        Args:
+            cache_dir: Directory holding the store file
+        """
+        path = Path(cache_dir).expanduser()
+        path.mkdir(parents=True, exist_ok=True)
+        self.path = path / STORE_FILENAME
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    def get(
+        self, server_url: str, database: str, model: str, version: str
+    ) -> Optional[Dict[str, Any]]:
+        """Load stored field definitions.
+
+        Args:
+            server_url: Omni server URL
+            database: Database name
+            model: Model name
+            version: Server version the entry was stored for
+
+        Returns:
+            Field definitions, or None if not stored for this version
+        """
+        try:
+            with self._lock:
+                if self._conn is None:
+                    return None
+                row = self._conn.execute(
+                    "SELECT fields_json FROM fields_metadata "
+                    "WHERE server_url = ? AND database = ? AND model = ? AND version = ?",
+                    (server_url, database, model, version),
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Failed to load stored fields for {model}: {e}")
+            return None
+
+    def put(
+        self, server_url: str, database: str, model: str, version: str, fields: Dict[str, Any]
+    ) -> None:
+        """Store field definitions, replacing any entry for the same key.
+
+        Args:
+            server_url: Omni server URL
+            database: Database name
+            model: Model name
+            version: Server version the fields were read from
+            fields: Field definitions
+        """
+        try:
+            fields_json = json.dumps(fields, default=str)
+            with self._lock:
+                if self._conn is None:
+                    return
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO fields_metadata "
+                    "(server_url, database, model, version, fields_json, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (server_url, database, model, version, fields_json, time.time()),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Failed to store fields for {model}: {e}")
+
+    def clear(self) -> None:
+        """Remove all stored entries."""
+        try:
+            with self._lock:
+                if self._conn is not None:
+                    self._conn.execute("DELETE FROM fields_metadata")
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clear stored fields: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
@@ -0,0 +1,247 @@
+"""Prometheus metrics export for Omni MCP Server.
+
+Renders the performance manager's cache, connection pool, request
+coalescing and latency statistics, plus the error handler's counts, in the
+Prometheus text exposition format. The streamable-http transport serves the
+result at /metrics when OMNI_MCP_METRICS_ENABLED is set, so the figures in
+get_health_status() can be scraped without polling JSON.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .error_handling import ErrorHandler
+from .performance import PerformanceManager
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds of the exported latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Monitor operations are named "{operation}_{model}" by the connections
+_MODEL_OPERATION = re.compile(
+    r"^(search_read|search_count|search|read_group|read|fields_get|create|write|unlink)_(.+)$"
+)
+
+
+def split_operation(name: str) -> Tuple[str, str]:
+    """Split a monitor operation name into operation and model.
+
+    Args:
+        name: Operation name such as "search_read_res.partner"
+
+    Returns:
+        Tuple of (operation, model); model is "" for operations that are not
+        tied to a model
+    """
+    match = _MODEL_OPERATION.match(name)
+    if match:
+        return match.group(1), match.group(2)
+    return name, ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+class _MetricWriter:
+    """Accumulates metric families in exposition format."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def family(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+        samples: Iterable[Tuple[Dict[str, str], float]],
+    ) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in samples:
+            self.lines.append(f"{name}{_labels(labels)} {_format_value(value)}")
+
+    def histogram(self, name: str, help_text: str, series: List[Tuple[Dict[str, str], Dict]]):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} histogram")
+        for labels, data in series:
+            for bound, count in data["buckets"]:
+                bucket_labels = dict(labels, le=_format_value(bound))
+                self.lines.append(f"{name}_bucket{_labels(bucket_labels)} {count}")
+            self.lines.append(f"{name}_sum{_labels(labels)} {_format_value(data['sum'])}")
+            self.lines.append(f"{name}_count{_labels(labels)} {data['count']}")
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def _write_caches(writer: _MetricWriter, performance_manager: PerformanceManager) -> None:
+    caches = {
+        "field_cache": performance_manager.field_cache.get_stats(),
+        "record_cache": performance_manager.record_cache.get_stats(),
+        "permission_cache": performance_manager.permission_cache.get_stats(),
+        "query_cache": performance_manager.query_cache.get_stats(),
+    }
+    counters = [
+        ("hits", "Cache lookups answered from the cache"),
+        ("misses", "Cache lookups that found no live entry"),
+        ("stale_hits", "Expired entries served while a refresh ran"),
+        ("evictions", "Entries removed from the cache"),
+    ]
+    for key, help_text in counters:
+        writer.family(
+            f"omni_mcp_cache_{key}_total",
+            "counter",
+            help_text,
+            [({"cache": cache}, stats[key]) for cache, stats in caches.items()],
+        )
+    writer.family(
+        "omni_mcp_cache_entries",
+        "gauge",
+        "Entries currently held in the cache",
+        [({"cache": cache}, stats["total_entries"]) for cache, stats in caches.items()],
+    )
+    writer.family(
+        "omni_mcp_cache_size_bytes",
+        "gauge",
+        "Estimated memory held by cache entries",
+        [({"cache": cache}, stats["total_size_bytes"]) for cache, stats in caches.items()],
+    )
+
+    models = performance_manager.get_query_stats()["models"]
+    writer.family(
+        "omni_mcp_query_cache_hits_total",
+        "counter",
+        "Search results served from the query cache",
+        [({"model": model}, stats["hits"]) for model, stats in models.items()],
+    )
+    writer.family(
+        "omni_mcp_query_cache_misses_total",
+        "counter",
+        "Searches not found in the query cache",
+        [({"model": model}, stats["misses"]) for model, stats in models.items()],
+    )
+
+
+def _write_connection_pool(writer: _MetricWriter, performance_manager: PerformanceManager):
+    stats = performance_manager.connection_pool.get_stats()
+    http = stats["http"]
+    for key, help_text in [
+        ("connections_created", "XML-RPC proxies created"),
+        ("connections_reused", "XML-RPC proxies reused from the pool"),
+        ("connections_closed", "XML-RPC proxies dropped from the pool"),
+    ]:
+        writer.family(f"omni_mcp_pool_{key}_total", "counter", help_text, [({}, stats[key])])
+    writer.family(
+        "omni_mcp_pool_active_connections",
+        "gauge",
+        "XML-RPC proxies held by the pool",
+        [({}, stats["active_connections"])],
+    )
+    for key, help_text in [
+        ("handshakes", "HTTP connections opened"),
+        ("reuses", "HTTP requests sent over a kept-alive connection"),
+        ("checkouts", "HTTP connections checked out of the pool"),
+        ("waits", "Checkouts that waited for a free connection"),
+    ]:
+        writer.family(f"omni_mcp_http_{key}_total", "counter", help_text, [({}, http[key])])
+    writer.family(
+        "omni_mcp_http_connections",
+        "gauge",
+        "HTTP connections by state",
+        [
+            ({"state": "open"}, http["open_connections"]),
+            ({"state": "idle"}, http["idle_connections"]),
+            ({"state": "in_use"}, http["in_use_connections"]),
+        ],
+    )
+
+    coalescing = {
+        "threads": performance_manager.read_flight.get_stats(),
+        "async": performance_manager.async_read_flight.get_stats(),
+    }
+    writer.family(
+        "omni_mcp_coalesced_calls_total",
+        "counter",
+        "Read-only calls that shared another caller's in-flight request",
+        [({"client": client}, stats["shared"]) for client, stats in coalescing.items()],
+    )
+
+
+def _write_operations(writer: _MetricWriter, performance_manager: PerformanceManager):
+    monitor = performance_manager.monitor
+    series = []
+    for name, histogram in sorted(monitor.get_histograms().items()):
+        operation, model = split_operation(name)
+        counts = histogram.cumulative_counts(LATENCY_BUCKETS)
+        buckets = list(zip(LATENCY_BUCKETS, counts, strict=True))
+        buckets.append((float("inf"), histogram.count))
+        series.append(
+            (
+                {"model": model, "operation": operation},
+                {"buckets": buckets, "sum": histogram.total, "count": histogram.count},
+            )
+        )
+    writer.histogram("omni_mcp_operation_duration_seconds", "Duration of Omni operations", series)
+
+    in_flight = []
+    for name, count in sorted(monitor.get_in_flight().items()):
+        operation, model = split_operation(name)
+        in_flight.append(({"model": model, "operation": operation}, count))
+    writer.family(
+        "omni_mcp_operations_in_flight",
+        "gauge",
+        "Omni operations currently running",
+        in_flight,
+    )
+
+
+def _write_errors(writer: _MetricWriter, handler: ErrorHandler) -> None:
+    errors = sorted(
+        dict(handler.metrics.errors_by_operation).items(),
+        key=lambda item: (item[0][0].name, item[0][1], item[0][2]),
+    )
+    writer.family(
+        "omni_mcp_errors_total",
+        "counter",
+        "Errors handled, by category",
+        [
+            ({"category": category.name, "model": model, "operation": operation}, count)
+            for (category, model, operation), count in errors
+        ],
+    )
+
+
+def render_metrics(performance_manager: Optional[PerformanceManager], handler: ErrorHandler) -> str:
+    """Render all metrics in the Prometheus text exposition format.
+
+    Args:
+        performance_manager: Performance manager, or None before the
+            connection is established
+        handler: Error handler whose counts are exported
+
+    Returns:
+        Exposition text
+    """
+    writer = _MetricWriter()
+    if performance_manager is not None:
+        _write_caches(writer, performance_manager)
+        _write_connection_pool(writer, performance_manager)
+        _write_operations(writer, performance_manager)
+    _write_errors(writer, handler)
+    return writer.render()
@@ -4,19 +4,29 @@ This module provides the OmniConnection class for managing connections
 to Omni via XML-RPC using MCP-specific endpoints.
 """
 
+import asyncio
+import contextvars
+import functools
 import json
 import logging
 import socket
+import threading
 import urllib.error
 import urllib.request
 import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from .config import OmniConfig
 from .error_sanitizer import ErrorSanitizer
-from .performance import PerformanceManager
+from .logging_config import LazyRepr
+from .performance import PerformanceManager, clone_result, last_response_bytes
+from .tracing import tracer
+
+if TYPE_CHECKING:
+    from .async_connection import AsyncOmniConnection
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +83,18 @@ class OmniConnection:
         self._database: Optional[str] = None
         self._authenticated = False
         self._auth_method: Optional[str] = None  # 'api_key' or 'password'
+        self._server_version: Optional[str] = None
+
+        # Bounded executor for running blocking XML-RPC calls off the event loop
+        # (created lazily on first async call)
+        self._max_workers = config.max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # Optional asyncio-native client used by the async methods instead of
+        # the executor (created lazily from the authenticated session)
+        self._use_async_client = config.async_client
+        self._async_client: Optional["AsyncOmniConnection"] = None
 
         logger.info(f"Initialized OmniConnection for {self._url_components['host']}")
 
@@ -114,26 +136,6 @@ class OmniConnection:
         except Exception as e:
             raise OmniConnectionError(f"Failed to parse URL: {e}") from e
 
-    def _create_transport(self) -> xmlrpc.client.Transport:
-        """Create XML-RPC transport with timeout support.
-
-        Returns:
-            Configured Transport object
-        """
-
-        class TimeoutTransport(xmlrpc.client.Transport):
-            def __init__(self, timeout, *args, **kwargs):
-                self.timeout = timeout
-                super().__init__(*args, **kwargs)
-
-            def make_connection(self, host):
-                connection = super().make_connection(host)
-                if hasattr(connection, "sock") and connection.sock:
-                    connection.sock.settimeout(self.timeout)
-                return connection
-
-        return TimeoutTransport(self.timeout)
-
     def _build_endpoint_url(self, endpoint: str) -> str:
         """Build full URL for an MCP endpoint.
 
@@ -149,7 +151,8 @@ class OmniConnection:
         """Establish connection to Omni server.
 
         Creates XML-RPC proxies for MCP endpoints but doesn't
-        authenticate yet. Uses connection pooling for better performance.
+        authenticate yet. Proxies share a pool of persistent HTTP
+        connections, so concurrent calls each use their own socket.
 
         Raises:
             OmniConnectionError: If connection fails
@@ -161,13 +164,13 @@ class OmniConnection:
         try:
             # Use connection pool for proxies
             self._db_proxy = self._performance_manager.get_optimized_connection(
-                self.MCP_DB_ENDPOINT
+                self.MCP_DB_ENDPOINT, timeout=self.timeout
             )
             self._common_proxy = self._performance_manager.get_optimized_connection(
-                self.MCP_COMMON_ENDPOINT
+                self.MCP_COMMON_ENDPOINT, timeout=self.timeout
             )
             self._object_proxy = self._performance_manager.get_optimized_connection(
-                self.MCP_OBJECT_ENDPOINT
+                self.MCP_OBJECT_ENDPOINT, timeout=self.timeout
             )
 
             # Test connection by calling server_version
@@ -198,6 +201,7 @@ class OmniConnection:
             logger.debug(f"Server version: {version}")
         except Exception as e:
             raise OmniConnectionError(f"Connection test failed: {e}") from e
+        self._server_version = server_version_key(version)
 
     def disconnect(self, suppress_logging: bool = False) -> None:
         """Close connection and cleanup resources."""
@@ -215,12 +219,17 @@ class OmniConnection:
         self._common_proxy = None
         self._object_proxy = None
 
+        # Release executor threads; a new executor is created on next use
+        self._shutdown_executor()
+        self._close_async_client()
+
         # Clear connection state
         self._connected = False
         self._uid = None
         self._database = None
         self._authenticated = False
         self._auth_method = None
+        self._performance_manager.set_metadata_scope(None, None)
 
         if not suppress_logging:
             try:
@@ -590,6 +599,9 @@ class OmniConnection:
         if not self._connected:
             raise OmniConnectionError("Not connected to Omni")
 
+        # The async client snapshots the session, so rebuild it after re-authenticating
+        self._close_async_client()
+
         # Get database name
         if database:
             db_name = database
@@ -600,6 +612,7 @@ class OmniConnection:
         if self.config.uses_api_key:
             logger.info("Attempting API key authentication")
             if self._authenticate_api_key(db_name):
+                self._performance_manager.set_metadata_scope(db_name, self._server_version)
                 return
             else:
                 logger.info("API key authentication failed, trying username/password")
@@ -608,6 +621,7 @@ class OmniConnection:
         if self.config.uses_credentials:
             logger.info("Attempting username/password authentication")
             if self._authenticate_password(db_name):
+                self._performance_manager.set_metadata_scope(db_name, self._server_version)
                 return
 
         # Authentication failed
@@ -637,6 +651,135 @@ class OmniConnection:
         """Get the performance manager instance."""
         return self._performance_manager
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor used for async calls, creating it if needed."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="omni-rpc"
+                )
+            return self._executor
+
+    def _shutdown_executor(self) -> None:
+        """Shut down the async executor without waiting for running calls."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def run_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking callable on the connection's bounded executor.
+
+        At most ``config.max_workers`` calls run at the same time; further
+        calls wait in the executor queue without blocking the event loop.
+        The callable runs in a copy of the caller's context, so it sees the
+        caller's trace span.
+
+        Args:
+            func: Blocking callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    def _get_async_client(self) -> "AsyncOmniConnection":
+        """Get the asyncio-native client for this session, creating it if needed."""
+        if self._async_client is None:
+            from .async_connection import AsyncOmniConnection
+
+            self._async_client = AsyncOmniConnection.from_connection(
+                self, max_connections=self._max_workers
+            )
+        return self._async_client
+
+    def _close_async_client(self) -> None:
+        """Close the async client's connections; it is recreated on demand."""
+        async_client, self._async_client = self._async_client, None
+        if async_client is not None:
+            async_client.disconnect()
+
+    async def _call_async(self, method: str, *args, **kwargs) -> Any:
+        """Call a model method without blocking the event loop.
+
+        Uses the asyncio-native client when ``config.async_client`` is set,
+        otherwise runs the blocking method on the executor.
+        """
+        if self._use_async_client:
+            return await getattr(self._get_async_client(), method)(*args, **kwargs)
+        return await self.run_async(getattr(self, method), *args, **kwargs)
+
+    async def aexecute_kw(
+        self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        """Async version of execute_kw()."""
+        return await self._call_async("execute_kw", model, method, args, kwargs)
+
+    async def asearch(self, model: str, domain: List[Union[str, List[Any]]], **kwargs) -> List[int]:
+        """Async version of search()."""
+        return await self._call_async("search", model, domain, **kwargs)
+
+    async def aread(
+        self, model: str, ids: List[int], fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Async version of read()."""
+        return await self._call_async("read", model, ids, fields)
+
+    async def asearch_read(
+        self,
+        model: str,
+        domain: List[Union[str, List[Any]]],
+        fields: Optional[List[str]] = None,
+        *,
+        cache: bool = True,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Async version of search_read()."""
+        return await self._call_async("search_read", model, domain, fields, cache=cache, **kwargs)
+
+    async def afields_get(
+        self, model: str, attributes: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async version of fields_get()."""
+        return await self._call_async("fields_get", model, attributes)
+
+    async def asearch_count(self, model: str, domain: List[Union[str, List[Any]]]) -> int:
+        """Async version of search_count()."""
+        return await self._call_async("search_count", model, domain)
+
+    async def aread_group(
+        self,
+        model: str,
+        domain: List[Union[str, List[Any]]],
+        fields: List[str],
+        groupby: List[str],
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Async version of read_group()."""
+        return await self._call_async("read_group", model, domain, fields, groupby, **kwargs)
+
+    async def acreate(self, model: str, values: Dict[str, Any]) -> int:
+        """Async version of create()."""
+        return await self._call_async("create", model, values)
+
+    async def acreate_many(self, model: str, values_list: List[Dict[str, Any]]) -> List[int]:
+        """Async version of create_many()."""
+        return await self._call_async("create_many", model, values_list)
+
+    async def awrite(self, model: str, ids: List[int], values: Dict[str, Any]) -> bool:
+        """Async version of write()."""
+        return await self._call_async("write", model, ids, values)
+
+    async def aunlink(self, model: str, ids: List[int]) -> bool:
+        """Async version of unlink()."""
+        return await self._call_async("unlink", model, ids)
+
     def execute(self, model: str, method: str, *args) -> Any:
         """Execute an operation on an Omni model.
 
@@ -659,6 +802,8 @@ class OmniConnection:
         """Execute an operation on an Omni model with keyword arguments.
 
         This is the main method for interacting with Omni models via XML-RPC.
+        Identical read-only calls already in flight on other threads share
+        their request and result.
 
         Args:
             model: The Omni model name (e.g., 'res.partner')
@@ -678,19 +823,48 @@ class OmniConnection:
         if not self._connected:
             raise OmniConnectionError("Not connected to Omni")
 
+        key = self._performance_manager.request_key(
+            self._database, self._uid, model, method, args, kwargs
+        )
+        if key is None:
+            return self._execute_kw(model, method, args, kwargs)
+
+        def call():
+            result = self._execute_kw(model, method, args, kwargs)
+            return result, last_response_bytes.get()
+
+        (result, response_bytes), shared = self._performance_manager.read_flight.do_shared(
+            key, call
+        )
+        if shared:
+            last_response_bytes.set(response_bytes)
+            result = clone_result(result)
+        return result
+
+    def _execute_kw(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        """Send one execute_kw call to the object endpoint."""
         # Get the appropriate password/token based on auth method
         password_or_token = (
             self.config.api_key if self._auth_method == "api_key" else self.config.password
         )
 
+        last_response_bytes.set(None)
         try:
             # Log the operation
-            logger.debug(f"Executing {method} on {model} with args={args}, kwargs={kwargs}")
+            logger.debug(
+                "Executing %s on %s with args=%s, kwargs=%s",
+                method,
+                model,
+                LazyRepr(args),
+                LazyRepr(kwargs),
+            )
 
             # Execute via object proxy
-            result = self.object_proxy.execute_kw(
-                self._database, self._uid, password_or_token, model, method, args, kwargs
-            )
+            proxy = self.object_proxy
+            with tracer.child_span("xmlrpc.execute_kw", model=model, method=method):
+                result = proxy.execute_kw(
+                    self._database, self._uid, password_or_token, model, method, args, kwargs
+                )
 
             logger.debug("Operation completed successfully")
             return result
@@ -720,7 +894,7 @@ class OmniConnection:
         Returns:
             List of record IDs matching the domain
         """
-        return self.execute_kw(model, "search", [domain], kwargs)
+        return self._cached_query(model, "search", [domain], kwargs)
 
     def read(
         self, model: str, ids: List[int], fields: Optional[List[str]] = None
@@ -735,47 +909,37 @@ class OmniConnection:
         Returns:
             List of dictionaries containing record data
         """
-        # Try to get cached records
-        cached_records = []
-        uncached_ids = []
-
-        for record_id in ids:
-            cached = self._performance_manager.get_cached_record(model, record_id, fields)
-            if cached:
-                cached_records.append(cached)
-            else:
-                uncached_ids.append(record_id)
+        cached, missing_ids, fetch_fields = self._performance_manager.plan_record_read(
+            model, ids, fields
+        )
 
         # If all records are cached, return them
-        if not uncached_ids:
+        if not missing_ids:
             logger.debug(f"All {len(ids)} records retrieved from cache")
-            return cached_records
+            return self._performance_manager.merge_record_read(
+                model, ids, fields, cached, [], fetch_fields
+            )
 
-        # Read uncached records
+        # Read only the missing records, and only the fields not cached yet
         kwargs = {}
-        if fields:
-            kwargs["fields"] = fields
+        if fetch_fields:
+            kwargs["fields"] = fetch_fields
 
         with self._performance_manager.monitor.track_operation(f"read_{model}"):
-            new_records = self.execute_kw(model, "read", [uncached_ids], kwargs)
+            new_records = self.execute_kw(model, "read", [missing_ids], kwargs)
+            response_bytes = last_response_bytes.get()
 
-        # Cache the new records
-        for record in new_records:
-            self._performance_manager.cache_record(model, record, fields)
-
-        # Combine cached and new records in original order
-        all_records = cached_records + new_records
-        # Sort by the original ID order
-        id_order = {id_val: idx for idx, id_val in enumerate(ids)}
-        all_records.sort(key=lambda r: id_order.get(r.get("id", 0), len(ids)))
-
-        return all_records
+        return self._performance_manager.merge_record_read(
+            model, ids, fields, cached, new_records, fetch_fields, response_bytes
+        )
 
     def search_read(
         self,
         model: str,
         domain: List[Union[str, List[Any]]],
         fields: Optional[List[str]] = None,
+        *,
+        cache: bool = True,
         **kwargs,
     ) -> List[Dict[str, Any]]:
         """Search for records and read their data in one operation.
@@ -784,6 +948,8 @@ class OmniConnection:
             model: The Omni model name
             domain: Omni domain filter
             fields: List of field names to read (None for all fields)
+            cache: Use and fill the record and query caches; bulk reads such
+                as exports pass False so they do not evict interactive entries
             **kwargs: Additional parameters (limit, offset, order)
 
         Returns:
@@ -791,7 +957,28 @@ class OmniConnection:
         """
         if fields:
             kwargs["fields"] = fields
-        return self.execute_kw(model, "search_read", [domain], kwargs)
+
+        if not cache:
+            with self._performance_manager.monitor.track_operation(f"search_read_{model}"):
+                return self.execute_kw(model, "search_read", [domain], kwargs)
+
+        cached = self._performance_manager.get_cached_query(model, "search_read", [domain], kwargs)
+        if cached is not None:
+            logger.debug(f"search_read on {model} served from query cache")
+            return cached
+
+        generation = self._performance_manager.query_generation(model)
+        with self._performance_manager.monitor.track_operation(f"search_read_{model}"):
+            records = self.execute_kw(model, "search_read", [domain], kwargs)
+            response_bytes = last_response_bytes.get()
+
+        # Cache the records so follow-up reads of the same page are served locally
+        self._performance_manager.cache_records(model, records, fields, response_bytes)
+        self._performance_manager.cache_query(
+            model, "search_read", [domain], kwargs, records, generation, response_bytes
+        )
+
+        return records
 
     def fields_get(
         self, model: str, attributes: Optional[List[str]] = None
@@ -805,11 +992,15 @@ class OmniConnection:
         Returns:
             Dictionary mapping field names to their definitions
         """
-        # Check cache first
-        cached_fields = self._performance_manager.get_cached_fields(model)
-        if cached_fields and not attributes:  # Only use cache if no specific attributes requested
-            logger.debug(f"Field definitions for {model} retrieved from cache")
-            return cached_fields
+        # Only use cache if no specific attributes requested; stale or
+        # persisted definitions are served while a background refresh runs
+        if not attributes:
+            cached_fields = self._performance_manager.get_cached_fields(
+                model, revalidate=self._schedule_fields_revalidation
+            )
+            if cached_fields:
+                logger.debug(f"Field definitions for {model} retrieved from cache")
+                return cached_fields
 
         # Get fields from server
         kwargs = {}
@@ -818,13 +1009,33 @@ class OmniConnection:
 
         with self._performance_manager.monitor.track_operation(f"fields_get_{model}"):
             fields = self.execute_kw(model, "fields_get", [], kwargs)
+            response_bytes = last_response_bytes.get()
 
         # Cache if we got all attributes
         if not attributes:
-            self._performance_manager.cache_fields(model, fields)
+            self._performance_manager.cache_fields(model, fields, response_bytes)
 
         return fields
 
+    def _schedule_fields_revalidation(self, model: str) -> None:
+        """Refresh cached field definitions for a model on the executor."""
+        try:
+            self._get_executor().submit(self._revalidate_fields, model)
+        except RuntimeError as e:
+            # Executor shut down by a concurrent disconnect
+            self._performance_manager.cancel_fields_refresh(model)
+            logger.debug(f"Skipped field revalidation for {model}: {e}")
+
+    def _revalidate_fields(self, model: str) -> None:
+        """Re-read field definitions from the server and update both caches."""
+        try:
+            fields = self.execute_kw(model, "fields_get", [], {})
+            self._performance_manager.cache_fields(model, fields, last_response_bytes.get())
+            logger.debug(f"Revalidated field definitions for {model}")
+        except Exception as e:
+            self._performance_manager.cancel_fields_refresh(model)
+            logger.warning(f"Failed to revalidate field definitions for {model}: {e}")
+
     def search_count(self, model: str, domain: List[Union[str, List[Any]]]) -> int:
         """Count records matching a domain.
 
@@ -835,7 +1046,64 @@ class OmniConnection:
         Returns:
             Number of records matching the domain
         """
-        return self.execute_kw(model, "search_count", [domain], {})
+        return self._cached_query(model, "search_count", [domain], {})
+
+    def _cached_query(
+        self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        """Run a search-type call through the optional query cache.
+
+        Results are reused until the TTL expires or a create, write or
+        unlink on the model invalidates them.
+        """
+        cached = self._performance_manager.get_cached_query(model, method, args, kwargs)
+        if cached is not None:
+            logger.debug(f"{method} on {model} served from query cache")
+            return cached
+        generation = self._performance_manager.query_generation(model)
+        result = self.execute_kw(model, method, args, kwargs)
+        self._performance_manager.cache_query(
+            model, method, args, kwargs, result, generation, last_response_bytes.get()
+        )
+        return result
+
+    def read_group(
+        self,
+        model: str,
+        domain: List[Union[str, List[Any]]],
+        fields: List[str],
+        groupby: List[str],
+        offset: int = 0,
+        limit: Optional[int] = None,
+        orderby: Optional[str] = None,
+        lazy: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Aggregate records server-side, grouped by one or more fields.
+
+        Args:
+            model: The Omni model name
+            domain: Omni domain filter
+            fields: Aggregate expressions (e.g. 'amount_total:sum')
+            groupby: Fields to group by, optionally with a date granularity
+                (e.g. 'date_order:month')
+            offset: Number of groups to skip
+            limit: Maximum number of groups to return
+            orderby: Sort order of the groups (e.g. 'amount_total desc')
+            lazy: Group by the first groupby field only
+
+        Returns:
+            One dictionary per group with the group values and aggregates
+        """
+        kwargs: Dict[str, Any] = {"lazy": lazy}
+        if offset:
+            kwargs["offset"] = offset
+        if limit is not None:
+            kwargs["limit"] = limit
+        if orderby:
+            kwargs["orderby"] = orderby
+
+        with self._performance_manager.monitor.track_operation(f"read_group_{model}"):
+            return self.execute_kw(model, "read_group", [domain, fields, groupby], kwargs)
 
     def create(self, model: str, values: Dict[str, Any]) -> int:
         """Create a new record.
@@ -861,6 +1129,30 @@ class OmniConnection:
             logger.error(f"Failed to create {model} record: {e}")
             raise
 
+    def create_many(self, model: str, values_list: List[Dict[str, Any]]) -> List[int]:
+        """Create several records with a single create call.
+
+        Args:
+            model: The Omni model name
+            values_list: Field values for each new record
+
+        Returns:
+            IDs of the created records, in the order of values_list
+
+        Raises:
+            OmniConnectionError: If creation fails
+        """
+        try:
+            with self._performance_manager.monitor.track_operation(f"create_{model}"):
+                record_ids = self.execute_kw(model, "create", [values_list], {})
+                # Invalidate cache for this model
+                self._performance_manager.invalidate_record_cache(model)
+                logger.info(f"Created {len(record_ids)} {model} record(s)")
+                return record_ids
+        except Exception as e:
+            logger.error(f"Failed to create {model} records: {e}")
+            raise
+
     def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> bool:
         """Update existing records.
 
@@ -879,8 +1171,7 @@ class OmniConnection:
             with self._performance_manager.monitor.track_operation(f"write_{model}"):
                 result = self.execute_kw(model, "write", [ids, values], {})
                 # Invalidate cache for updated records
-                for record_id in ids:
-                    self._performance_manager.invalidate_record_cache(model, record_id)
+                self._performance_manager.invalidate_records(model, ids)
                 logger.info(f"Updated {len(ids)} {model} record(s)")
                 return result
         except Exception as e:
@@ -904,8 +1195,7 @@ class OmniConnection:
             with self._performance_manager.monitor.track_operation(f"unlink_{model}"):
                 result = self.execute_kw(model, "unlink", [ids], {})
                 # Invalidate cache for deleted records
-                for record_id in ids:
-                    self._performance_manager.invalidate_record_cache(model, record_id)
+                self._performance_manager.invalidate_records(model, ids)
                 logger.info(f"Deleted {len(ids)} {model} record(s)")
                 return result
         except Exception as e:
@@ -922,10 +1212,26 @@ class OmniConnection:
             return None
 
         try:
-            return self.common_proxy.version()
+            version = self.common_proxy.version()
         except Exception as e:
             logger.error(f"Failed to get server version: {e}")
             return None
+        self._server_version = server_version_key(version)
+        return version
+
+
+def server_version_key(version: Any) -> Optional[str]:
+    """Extract the version string used to scope persisted metadata.
+
+    Args:
+        version: Result of the common endpoint's version() call
+
+    Returns:
+        The server_version string, or None if unavailable
+    """
+    if isinstance(version, dict) and version.get("server_version"):
+        return str(version["server_version"])
+    return None
 
 
 @contextmanager
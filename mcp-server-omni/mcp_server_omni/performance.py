@@ -7,42 +7,172 @@ This module provides performance optimizations including:
 - Performance monitoring and metrics
 """
 
+import asyncio
+import http.client
 import json
+import math
+import select
+import socket
+import sqlite3
 import threading
 import time
+import xmlrpc.client
 from collections import OrderedDict, defaultdict
+from concurrent.futures import Future
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
-from xmlrpc.client import SafeTransport, ServerProxy, Transport
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from xmlrpc.client import ServerProxy, Transport
 
 from .config import OmniConfig
 from .logging_config import get_logger
+from .metadata_store import FieldsMetadataStore
+from .tracing import tracer
 
 logger = get_logger(__name__)
 
+# Byte length of the last XML-RPC response body read in the current thread or
+# task, or None when unknown; lets callers size cache entries without
+# re-serializing the decoded values
+last_response_bytes: ContextVar[Optional[int]] = ContextVar("last_response_bytes", default=None)
+
+# Model methods that never modify data; identical concurrent calls to these
+# share one backend request
+READ_ONLY_METHODS = frozenset(
+    {
+        "search",
+        "search_read",
+        "search_count",
+        "read",
+        "read_group",
+        "fields_get",
+        "name_search",
+        "name_get",
+        "default_get",
+    }
+)
+
+
+def json_size(value: Any) -> int:
+    """Size a value as the length of its JSON encoding (exact but slow)."""
+    return len(json.dumps(value, default=str).encode())
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the JSON-encoded size of a value without serializing it.
+
+    Walks dicts, lists and tuples recursively, counting string lengths and a
+    fixed width for scalars. Close to json_size() for XML-RPC data at a
+    fraction of the cost.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return len(value) + 2
+    if value_type is dict:
+        size = 2
+        for k, v in value.items():
+            size += (len(k) if type(k) is str else 8) + 4
+            v_type = type(v)
+            if v_type is str:
+                size += len(v) + 2
+            elif v_type is dict or v_type is list or v_type is tuple:
+                size += estimate_size(v)
+            else:
+                size += 8
+        return size
+    if value_type is list or value_type is tuple:
+        size = 2 + len(value)
+        for v in value:
+            size += estimate_size(v)
+        return size
+    if value is None or value_type is bool or value_type is int or value_type is float:
+        return 8
+    return len(str(value)) + 2
+
+
+class SampledSizer:
+    """Size large containers from an evenly spaced sample of their items.
+
+    Values with more than sample_size items (e.g. fields_get results or long
+    record lists) are sized by measuring sample_size of them and
+    extrapolating; smaller values are measured in full.
+    """
+
+    def __init__(self, sample_size: int = 32, sizer: Callable[[Any], int] = estimate_size):
+        """Initialize sampled sizer.
+
+        Args:
+            sample_size: Number of items to measure in large containers
+            sizer: Sizer applied to the sampled items
+        """
+        self.sample_size = sample_size
+        self.sizer = sizer
+
+    def __call__(self, value: Any) -> int:
+        """Return the estimated size of a value in bytes."""
+        count = len(value) if isinstance(value, (dict, list, tuple)) else 0
+        if count <= self.sample_size:
+            return self.sizer(value)
+
+        step = count / self.sample_size
+        if isinstance(value, dict):
+            keys = list(value)
+            sampled = sum(
+                self.sizer(keys[int(i * step)]) + self.sizer(value[keys[int(i * step)]])
+                for i in range(self.sample_size)
+            )
+        else:
+            sampled = sum(self.sizer(value[int(i * step)]) for i in range(self.sample_size))
+        return int(sampled * count / self.sample_size) + 2
+
 
-@dataclass
 class CacheEntry:
-    """Represents a cached item with metadata."""
+    """A cached value with its expiry deadline on the monotonic clock.
 
-    key: str
-    value: Any
-    created_at: datetime
-    accessed_at: datetime
-    ttl_seconds: int
-    hit_count: int = 0
-    size_bytes: int = 0
+    Uses __slots__ and a single float deadline so that large caches stay
+    small and checking expiry on a hit costs one clock read. Entries put with
+    a stale grace window are kept until ``stale_until`` and can still be
+    served by Cache.get_or_stale() while one caller refreshes them.
+    """
 
-    def is_expired(self) -> bool:
-        """Check if cache entry has expired."""
-        age = datetime.now() - self.created_at
-        return age.total_seconds() > self.ttl_seconds
+    __slots__ = ("value", "expires_at", "stale_until", "refreshing", "hit_count", "size_bytes")
+
+    def __init__(
+        self,
+        value: Any,
+        expires_at: float,
+        size_bytes: int = 0,
+        stale_until: Optional[float] = None,
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = expires_at if stale_until is None else stale_until
+        self.refreshing = False
+        self.hit_count = 0
+        self.size_bytes = size_bytes
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if cache entry has expired.
+
+        Args:
+            now: Current time.monotonic() value, if the caller already has it
+        """
+        return (time.monotonic() if now is None else now) > self.expires_at
 
     def access(self):
         """Update access metadata."""
-        self.accessed_at = datetime.now()
         self.hit_count += 1
 
 
@@ -52,6 +182,8 @@ class CacheStats:
 
     hits: int = 0
     misses: int = 0
+    stale_hits: int = 0
+    refreshes: int = 0
     evictions: int = 0
     expired_evictions: int = 0
     size_evictions: int = 0
@@ -84,84 +216,202 @@ class CacheStats:
 class Cache:
     """Thread-safe LRU cache with TTL support."""
 
-    def __init__(self, max_size: int = 1000, max_memory_mb: int = 100):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_memory_mb: int = 100,
+        sizer: Optional[Callable[[Any], int]] = None,
+        sweep_interval: float = 60.0,
+    ):
         """Initialize cache.
 
         Args:
             max_size: Maximum number of entries
             max_memory_mb: Maximum memory usage in MB
+            sizer: Function estimating a value's size in bytes for the memory
+                limit (defaults to estimate_size; see also json_size and
+                SampledSizer)
+            sweep_interval: Seconds between sweeps that drop expired entries
+                nobody has touched; sweeps piggyback on get() and put()
         """
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = threading.RLock()
         self._max_size = max_size
         self._max_memory_bytes = max_memory_mb * 1024 * 1024
+        self._sizer = sizer or estimate_size
+        self._sweep_interval = sweep_interval
+        self._next_sweep = time.monotonic() + sweep_interval
         self._stats = CacheStats()
+        # Secondary indexes: tag -> keys and key -> tags, for targeted invalidation
+        self._tag_index: Dict[Hashable, Set[str]] = defaultdict(set)
+        self._key_tags: Dict[str, Tuple[Hashable, ...]] = {}
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, is_hit: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
         """Get value from cache.
 
         Args:
             key: Cache key
+            is_hit: Optional check deciding whether a present entry counts as
+                a hit (e.g. a partial record); the value is returned either way
 
         Returns:
             Cached value or None if not found/expired
         """
+        now = time.monotonic()
         with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+
             entry = self._cache.get(key)
             if entry is None:
                 self._stats.record_miss()
                 return None
 
-            if entry.is_expired():
-                self._remove(key, reason="expired")
+            if entry.is_expired(now):
+                # Entries in their stale grace window stay for get_or_stale()
+                if now > entry.stale_until:
+                    self._remove(key, reason="expired")
                 self._stats.record_miss()
                 return None
 
             # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            entry.access()
+            if is_hit is None or is_hit(entry.value):
+                self._stats.record_hit()
+            else:
+                self._stats.record_miss()
+            return entry.value
+
+    def get_or_stale(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Get a value, serving expired entries during their stale grace window.
+
+        The first caller to read a stale entry is told to refresh it; later
+        callers keep getting the stale value until the refresh put()s a new
+        one or cancel_refresh() is called.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value or None, whether the caller should refresh it)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+
+            entry = self._cache.get(key)
+            if entry is None:
+                self._stats.record_miss()
+                return None, False
+
+            if now > entry.stale_until:
+                self._remove(key, reason="expired")
+                self._stats.record_miss()
+                return None, False
+
             self._cache.move_to_end(key)
             entry.access()
             self._stats.record_hit()
+            if not entry.is_expired(now):
+                return entry.value, False
+
+            self._stats.stale_hits += 1
+            refresh = not entry.refreshing
+            if refresh:
+                entry.refreshing = True
+                self._stats.refreshes += 1
+            return entry.value, refresh
+
+    def cancel_refresh(self, key: str):
+        """Let the next stale read retry a refresh that failed.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                entry.refreshing = False
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Get a live value without counting a hit or miss or touching LRU order.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found/expired
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or entry.is_expired():
+                return None
             return entry.value
 
-    def put(self, key: str, value: Any, ttl_seconds: int = 300):
+    def put(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        tags: Iterable[Hashable] = (),
+        size_bytes: Optional[int] = None,
+        stale_seconds: float = 0,
+        expires_at: Optional[float] = None,
+    ):
         """Put value in cache.
 
+        Values larger than the whole memory budget are not cached.
+
         Args:
             key: Cache key
             value: Value to cache
             ttl_seconds: Time to live in seconds
+            tags: Index tags for invalidate_tags() (e.g. ("model", "res.partner"))
+            size_bytes: Known size of the value (e.g. the raw response length);
+                the cache's sizer is used when omitted
+            stale_seconds: Grace window after expiry during which
+                get_or_stale() still serves the value
+            expires_at: Absolute time.monotonic() deadline used instead of
+                ttl_seconds, e.g. to keep an entry's original expiry when
+                rewriting it
         """
-        with self._lock:
-            # Calculate size (rough estimate)
-            size_bytes = len(json.dumps(value, default=str).encode())
-
-            # Check memory limit
-            if self._stats.total_size_bytes + size_bytes > self._max_memory_bytes:
-                self._evict_lru(reason="size")
+        if size_bytes is None:
+            size_bytes = self._sizer(value)
 
-            # Check size limit
-            while len(self._cache) >= self._max_size:
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+
+            # Replacing an entry releases its memory first
+            old_entry = self._cache.pop(key, None)
+            if old_entry is not None:
+                self._stats.total_size_bytes -= old_entry.size_bytes
+
+            if size_bytes > self._max_memory_bytes:
+                self._unindex(key)
+                self._stats.total_entries = len(self._cache)
+                logger.debug(f"Not caching {key}: {size_bytes} bytes exceeds the memory limit")
+                return
+
+            # Evict until both the memory and the size limits are met
+            while self._cache and (
+                self._stats.total_size_bytes + size_bytes > self._max_memory_bytes
+                or len(self._cache) >= self._max_size
+            ):
                 self._evict_lru(reason="size")
 
-            # Add or update entry
-            now = datetime.now()
-            if key in self._cache:
-                old_size = self._cache[key].size_bytes
-                self._stats.total_size_bytes -= old_size
-
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=now,
-                accessed_at=now,
-                ttl_seconds=ttl_seconds,
-                size_bytes=size_bytes,
-            )
-
+            # Add entry
+            if expires_at is None:
+                expires_at = now + ttl_seconds
+            entry = CacheEntry(value, expires_at, size_bytes, expires_at + stale_seconds)
             self._cache[key] = entry
             self._cache.move_to_end(key)
             self._stats.total_entries = len(self._cache)
             self._stats.total_size_bytes += size_bytes
+            self._index(key, tuple(tags))
 
     def invalidate(self, key: str) -> bool:
         """Invalidate a cache entry.
@@ -175,9 +425,33 @@ class Cache:
         with self._lock:
             return self._remove(key, reason="manual")
 
+    def invalidate_tags(self, tags: Iterable[Hashable]) -> int:
+        """Invalidate all entries carrying any of the given tags.
+
+        Uses the tag index, so the cost is proportional to the number of
+        affected entries rather than the size of the cache.
+
+        Args:
+            tags: Tags given to put()
+
+        Returns:
+            Number of entries invalidated
+        """
+        with self._lock:
+            keys: Set[str] = set()
+            for tag in tags:
+                keys.update(self._tag_index.get(tag, ()))
+            count = 0
+            for key in keys:
+                if self._remove(key, reason="manual"):
+                    count += 1
+            return count
+
     def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all entries matching pattern.
 
+        This scans every key; prefer invalidate_tags() for entries put with tags.
+
         Args:
             pattern: Pattern to match (e.g., "model:res.partner:*")
 
@@ -216,10 +490,21 @@ class Cache:
 
             return count
 
+    def purge_expired(self) -> int:
+        """Remove all expired entries now instead of waiting for the next sweep.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._sweep(time.monotonic())
+
     def clear(self):
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._tag_index.clear()
+            self._key_tags.clear()
             self._stats = CacheStats()
 
     def get_stats(self) -> Dict[str, Any]:
@@ -229,25 +514,54 @@ class Cache:
                 "hits": self._stats.hits,
                 "misses": self._stats.misses,
                 "hit_rate": round(self._stats.hit_rate, 3),
+                "stale_hits": self._stats.stale_hits,
+                "refreshes": self._stats.refreshes,
                 "evictions": self._stats.evictions,
                 "expired_evictions": self._stats.expired_evictions,
                 "size_evictions": self._stats.size_evictions,
                 "total_entries": self._stats.total_entries,
                 "total_size_mb": round(self._stats.total_size_bytes / (1024 * 1024), 2),
+                "total_size_bytes": self._stats.total_size_bytes,
                 "max_size": self._max_size,
                 "max_memory_mb": self._max_memory_bytes / (1024 * 1024),
             }
 
+    def _index(self, key: str, tags: Tuple[Hashable, ...]):
+        """Record a key's tags in the secondary indexes, replacing old ones."""
+        self._unindex(key)
+        if tags:
+            self._key_tags[key] = tags
+            for tag in tags:
+                self._tag_index[tag].add(key)
+
+    def _unindex(self, key: str):
+        """Drop a key from the secondary indexes."""
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
     def _remove(self, key: str, reason: str = "manual") -> bool:
         """Remove entry from cache."""
         if key in self._cache:
             entry = self._cache.pop(key)
+            self._unindex(key)
             self._stats.total_size_bytes -= entry.size_bytes
             self._stats.total_entries = len(self._cache)
             self._stats.record_eviction(reason)
             return True
         return False
 
+    def _sweep(self, now: float) -> int:
+        """Drop expired entries and schedule the next sweep."""
+        expired = [key for key, entry in self._cache.items() if now > entry.stale_until]
+        for key in expired:
+            self._remove(key, reason="expired")
+        self._next_sweep = now + self._sweep_interval
+        return len(expired)
+
     def _evict_lru(self, reason: str = "size"):
         """Evict least recently used entry."""
         if self._cache:
@@ -256,26 +570,506 @@ class Cache:
             self._remove(key, reason)
 
 
+def clone_result(value: Any) -> Any:
+    """Copy a decoded XML-RPC result so each caller can mutate its own copy.
+
+    Only lists, tuples and dicts are copied; scalars and other values are
+    immutable or treated as such, which makes this much cheaper than
+    copy.deepcopy() for record lists.
+    """
+    if isinstance(value, list):
+        return [clone_result(item) for item in value]
+    if isinstance(value, dict):
+        return {key: clone_result(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(clone_result(item) for item in value)
+    return value
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for and share its result (or exception) instead of
+    repeating the work.
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._lock = threading.Lock()
+        # key -> [future, number of callers waiting on it]
+        self._calls: Dict[Hashable, List[Any]] = {}
+        self._stats = {"executions": 0, "shared": 0}
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run func unless a call for the same key is already in flight.
+
+        Args:
+            key: Key identifying identical calls
+            func: Callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The callable's return value, possibly from another caller's run
+        """
+        return self.do_shared(key, func, *args, **kwargs)[0]
+
+    def do_shared(
+        self, key: Hashable, func: Callable[..., Any], *args, **kwargs
+    ) -> Tuple[Any, bool]:
+        """Like do(), also telling whether the result object went to other callers.
+
+        A caller that gets ``shared=True`` must not mutate the result in
+        place (see clone_result()).
+
+        Returns:
+            Tuple of (the callable's return value, whether it is shared)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = [Future(), 0]
+                self._stats["executions"] += 1
+            else:
+                call[1] += 1
+                self._stats["shared"] += 1
+
+        future = call[0]
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        # No caller can join once the key is removed, so the count is final
+        return result, call[1] > 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get single-flight statistics."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines on one event loop.
+
+    The shared call runs in its own task, so a waiter being cancelled does
+    not cancel the call for the others.
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        # key -> [task, number of callers waiting on it]
+        self._calls: Dict[Hashable, List[Any]] = {}
+        self._stats = {"executions": 0, "shared": 0}
+
+    async def do_shared(
+        self, key: Hashable, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Tuple[Any, bool]:
+        """Await func unless a call for the same key is already in flight.
+
+        Args:
+            key: Key identifying identical calls
+            func: Coroutine function to run
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Tuple of (the function's result, whether the result object is
+            shared with other callers)
+        """
+        call = self._calls.get(key)
+        leader = call is None or call[0].done()
+        if leader:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            call = self._calls[key] = [task, 0]
+            self._stats["executions"] += 1
+
+            def forget(_task, key=key, call=call):
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+
+            task.add_done_callback(forget)
+        else:
+            call[1] += 1
+            self._stats["shared"] += 1
+
+        result = await asyncio.shield(call[0])
+        # Callers only join while the task is running, so the count is final
+        return result, not leader or call[1] > 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get single-flight statistics."""
+        in_flight = sum(1 for task, _ in self._calls.values() if not task.done())
+        return {**self._stats, "in_flight": in_flight}
+
+
+class HTTPConnectionPool:
+    """Thread-safe pool of persistent HTTP/1.1 connections per host.
+
+    Connections are checked out for exactly one request/response exchange
+    and checked back in afterwards, so concurrent threads never share a
+    socket. Idle connections are reused (most recently used first) until
+    they exceed the idle timeout or fail a liveness check.
+    """
+
+    def __init__(
+        self,
+        scheme: str = "http",
+        max_size: int = 10,
+        idle_timeout: float = 60.0,
+        timeout: float = 30.0,
+    ):
+        """Initialize HTTP connection pool.
+
+        Args:
+            scheme: 'http' or 'https'
+            max_size: Maximum number of open connections per host
+            idle_timeout: Seconds an idle connection is kept before closing
+            timeout: Default socket timeout for pooled connections
+        """
+        self.scheme = scheme
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: Dict[str, List[Tuple[http.client.HTTPConnection, float]]] = defaultdict(list)
+        self._open: Dict[str, int] = defaultdict(int)
+        self._condition = threading.Condition()
+        self._stats = {
+            "handshakes": 0,
+            "reuses": 0,
+            "checkouts": 0,
+            "waits": 0,
+            "closed_idle": 0,
+            "closed_dead": 0,
+            "discarded": 0,
+        }
+
+    def checkout(
+        self, host: str, timeout: Optional[float] = None
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """Check out a connection to a host.
+
+        Blocks while the host already has max_size connections in use.
+
+        Args:
+            host: Host (and optional port) to connect to
+            timeout: Socket timeout for this connection (defaults to pool timeout)
+
+        Returns:
+            Tuple of (connection, reused) where reused is True for kept-alive connections
+
+        Raises:
+            socket.timeout: If no connection became available in time
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            self._stats["checkouts"] += 1
+            while True:
+                conn = self._pop_live_connection(host)
+                if conn is not None:
+                    self._stats["reuses"] += 1
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+
+                if self._open[host] < self.max_size:
+                    # Reserve a slot; the handshake happens outside the lock
+                    self._open[host] += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket.timeout(f"Timed out waiting for a pooled connection to {host}")
+                self._stats["waits"] += 1
+                self._condition.wait(remaining)
+
+        try:
+            conn = self._new_connection(host, timeout)
+            conn.connect()
+        except Exception:
+            with self._condition:
+                self._open[host] -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._stats["handshakes"] += 1
+        logger.debug(f"Opened new HTTP connection to {host}")
+        return conn, False
+
+    def checkin(self, host: str, conn: http.client.HTTPConnection):
+        """Return a connection to the pool for reuse.
+
+        Args:
+            host: Host the connection belongs to
+            conn: Connection whose response has been fully read
+        """
+        with self._condition:
+            self._idle[host].append((conn, time.monotonic()))
+            self._condition.notify()
+
+    def discard(self, host: str, conn: http.client.HTTPConnection):
+        """Close a checked-out connection instead of returning it.
+
+        Args:
+            host: Host the connection belongs to
+            conn: Connection to close
+        """
+        conn.close()
+        with self._condition:
+            self._open[host] -= 1
+            self._stats["discarded"] += 1
+            self._condition.notify()
+
+    def _new_connection(self, host: str, timeout: float) -> http.client.HTTPConnection:
+        """Create an unconnected HTTP(S) connection."""
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(host, timeout=timeout)
+        return http.client.HTTPConnection(host, timeout=timeout)
+
+    def _pop_live_connection(self, host: str) -> Optional[http.client.HTTPConnection]:
+        """Pop the most recently used idle connection that is still alive.
+
+        Must be called with the lock held.
+        """
+        idle = self._idle[host]
+        now = time.monotonic()
+        while idle:
+            conn, last_used = idle.pop()
+            if now - last_used > self.idle_timeout:
+                self._close_idle(host, conn, "closed_idle")
+            elif not self._is_alive(conn):
+                self._close_idle(host, conn, "closed_dead")
+            else:
+                return conn
+        return None
+
+    def _close_idle(self, host: str, conn: http.client.HTTPConnection, reason: str):
+        """Close an idle connection and release its slot (lock held)."""
+        conn.close()
+        self._open[host] -= 1
+        self._stats[reason] += 1
+
+    @staticmethod
+    def _is_alive(conn: http.client.HTTPConnection) -> bool:
+        """Check that an idle connection has not been closed by the server.
+
+        An idle keep-alive socket should have nothing to read; if it is
+        readable, the peer either closed it or sent unexpected data.
+        """
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get HTTP connection pool statistics."""
+        with self._condition:
+            stats = self._stats.copy()
+            idle = sum(len(conns) for conns in self._idle.values())
+            stats["open_connections"] = sum(self._open.values())
+            stats["idle_connections"] = idle
+            stats["in_use_connections"] = stats["open_connections"] - idle
+            return stats
+
+    def clear(self):
+        """Close all idle connections.
+
+        Connections currently checked out are unaffected and return to the
+        pool when their request completes.
+        """
+        with self._condition:
+            for host, conns in self._idle.items():
+                for conn, _ in conns:
+                    self._close_idle(host, conn, "closed_idle")
+                conns.clear()
+            self._condition.notify_all()
+
+
+class PooledTransport(Transport):
+    """XML-RPC transport that sends each request over a pooled connection.
+
+    Unlike the stdlib Transport, which caches a single connection on the
+    instance, this transport holds no per-request state, so one instance
+    (and the ServerProxy objects using it) can be shared across threads.
+    """
+
+    # Errors meaning a kept-alive connection was closed under us
+    STALE_CONNECTION_ERRORS = (
+        http.client.RemoteDisconnected,
+        ConnectionResetError,
+        ConnectionAbortedError,
+        BrokenPipeError,
+    )
+
+    def __init__(self, pool: HTTPConnectionPool, timeout: Optional[float] = None):
+        """Initialize pooled transport.
+
+        Args:
+            pool: HTTP connection pool to draw connections from
+            timeout: Socket timeout for requests (defaults to the pool timeout)
+        """
+        super().__init__(use_builtin_types=False)
+        self.pool = pool
+        self.timeout = timeout
+        # Read by parse_response; per-request verbosity is set on the connection
+        self.verbose = False
+
+    def request(self, host, handler, request_body, verbose=False):
+        """Send an XML-RPC request and return the parsed response."""
+        # ServerProxy marshalled the call between the enclosing execute_kw
+        # span starting and the transport being called
+        span = tracer.current_span()
+        if span is not None and span.name == "xmlrpc.execute_kw":
+            tracer.record_child(
+                "xmlrpc.serialize", span.start_ns, time.time_ns(), request_bytes=len(request_body)
+            )
+
+        # Like the stdlib transport, retry once when a reused connection
+        # turns out to have been closed by the server
+        for attempt in (0, 1):
+            with tracer.child_span("xmlrpc.network", attempt=attempt):
+                conn, reused = self.pool.checkout(host, self.timeout)
+                try:
+                    response = self._send_request(conn, host, handler, request_body, verbose)
+                except self.STALE_CONNECTION_ERRORS:
+                    self.pool.discard(host, conn)
+                    if attempt or not reused:
+                        raise
+                    continue
+                except BaseException:
+                    self.pool.discard(host, conn)
+                    raise
+            with tracer.child_span("xmlrpc.parse"):
+                return self._read_response(conn, host, handler, response)
+
+    def _send_request(self, conn, host, handler, request_body, verbose):
+        """Send the request over a checked-out connection and wait for the response."""
+        _, extra_headers, _ = self.get_host_info(host)
+        headers = list(self._headers)
+        if extra_headers:
+            headers.extend(extra_headers)
+        headers.append(("Content-Type", "text/xml"))
+        headers.append(("User-Agent", self.user_agent))
+
+        conn.set_debuglevel(1 if verbose else 0)
+        conn.putrequest("POST", handler)
+        self.send_headers(conn, headers)
+        self.send_content(conn, request_body)
+        return conn.getresponse()
+
+    def _read_response(self, conn, host, handler, response):
+        """Parse the response and hand the connection back to the pool."""
+        try:
+            if response.status != 200:
+                response.read()
+                raise xmlrpc.client.ProtocolError(
+                    host + handler, response.status, response.reason, dict(response.getheaders())
+                )
+            result = self.parse_response(response)
+        except (xmlrpc.client.Fault, xmlrpc.client.ProtocolError):
+            # The response was read completely, so the connection is reusable
+            self._release(host, conn, response)
+            raise
+        except BaseException:
+            self.pool.discard(host, conn)
+            raise
+        self._release(host, conn, response)
+        return result
+
+    def parse_response(self, response):
+        """Parse a response body, recording its decoded length in last_response_bytes."""
+        if response.getheader("Content-Encoding", "") == "gzip":
+            stream = xmlrpc.client.GzipDecodedResponse(response)
+        else:
+            stream = response
+
+        parser, unmarshaller = self.getparser()
+        size = 0
+        # The body is parsed while it streams in; time spent waiting on the
+        # socket is reported separately from parsing on the parse span
+        read_ns = 0
+        while True:
+            read_start = time.perf_counter_ns()
+            data = stream.read(65536)
+            read_ns += time.perf_counter_ns() - read_start
+            if not data:
+                break
+            size += len(data)
+            parser.feed(data)
+
+        if stream is not response:
+            stream.close()
+        parser.close()
+        last_response_bytes.set(size)
+        span = tracer.current_span()
+        if span is not None and span.name == "xmlrpc.parse":
+            span.set_attribute("response_bytes", size)
+            span.set_attribute("body_read_ms", round(read_ns / 1_000_000, 3))
+        return unmarshaller.close()
+
+    def _release(self, host, conn, response):
+        """Return a connection to the pool, or close it if the server will."""
+        if response.will_close:
+            self.pool.discard(host, conn)
+        else:
+            self.pool.checkin(host, conn)
+
+    def close(self):
+        """No-op: pooled connections are owned by the pool, not the transport."""
+
+
 class ConnectionPool:
-    """Thread-safe connection pool for XML-RPC connections."""
+    """Thread-safe connection pool for XML-RPC connections.
+
+    ServerProxy objects are cached per endpoint and share a PooledTransport,
+    which draws persistent HTTP connections from an HTTPConnectionPool.
+    """
+
+    DEFAULT_TIMEOUT = 30
+    IDLE_TIMEOUT = 60
 
-    def __init__(self, config: OmniConfig, max_connections: int = 10):
+    def __init__(
+        self,
+        config: OmniConfig,
+        max_connections: int = 10,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
         """Initialize connection pool.
 
         Args:
             config: Omni configuration
-            max_connections: Maximum number of connections
+            max_connections: Maximum number of connections (proxies, and open
+                HTTP connections per host)
+            timeout: Default socket timeout in seconds
         """
         self.config = config
         self.max_connections = max_connections
         self._connections: List[Tuple[ServerProxy, float]] = []
-        self._endpoint_map: List[str] = []  # Track endpoints for each connection
+        self._endpoint_map: List[Tuple[str, Optional[float]]] = []  # Endpoint of each connection
         self._lock = threading.RLock()
-        # Use SafeTransport for HTTPS, regular Transport for HTTP
-        if config.url.startswith("https://"):
-            self._transport = SafeTransport()
-        else:
-            self._transport = Transport()
+        self.http_pool = HTTPConnectionPool(
+            scheme="https" if config.url.startswith("https://") else "http",
+            max_size=max_connections,
+            idle_timeout=self.IDLE_TIMEOUT,
+            timeout=timeout,
+        )
         self._last_cleanup = time.time()
         self._stats = {
             "connections_created": 0,
@@ -284,11 +1078,12 @@ class ConnectionPool:
             "active_connections": 0,
         }
 
-    def get_connection(self, endpoint: str) -> ServerProxy:
+    def get_connection(self, endpoint: str, timeout: Optional[float] = None) -> ServerProxy:
         """Get a connection from the pool.
 
         Args:
             endpoint: The endpoint path (e.g., '/xmlrpc/2/common')
+            timeout: Socket timeout for requests made through this proxy
 
         Returns:
             ServerProxy connection
@@ -303,9 +1098,10 @@ class ConnectionPool:
 
             # Try to find an existing connection
             url = f"{self.config.url}{endpoint}"
+            key = (endpoint, timeout)
             for i, (conn, last_used) in enumerate(self._connections):
                 # Store endpoint with connection for matching
-                if i < len(self._endpoint_map) and self._endpoint_map[i] == endpoint:
+                if i < len(self._endpoint_map) and self._endpoint_map[i] == key:
                     # Connection is still fresh (used within last 5 minutes)
                     if now - last_used < 300:
                         self._connections[i] = (conn, now)
@@ -326,9 +1122,10 @@ class ConnectionPool:
                 self._endpoint_map.pop(0)
                 self._stats["connections_closed"] += 1
 
-            conn = ServerProxy(url, transport=self._transport, allow_none=True)
+            transport = PooledTransport(self.http_pool, timeout)
+            conn = ServerProxy(url, transport=transport, allow_none=True)
             self._connections.append((conn, now))
-            self._endpoint_map.append(endpoint)
+            self._endpoint_map.append(key)
             self._stats["connections_created"] += 1
             self._stats["active_connections"] = len(self._connections)
             logger.debug(f"Created new connection for {endpoint}")
@@ -359,7 +1156,9 @@ class ConnectionPool:
     def get_stats(self) -> Dict[str, Any]:
         """Get connection pool statistics."""
         with self._lock:
-            return self._stats.copy()
+            stats = self._stats.copy()
+        stats["http"] = self.http_pool.get_stats()
+        return stats
 
     def clear(self):
         """Clear all connections."""
@@ -368,6 +1167,7 @@ class ConnectionPool:
             self._connections.clear()
             self._endpoint_map.clear()
             self._stats["active_connections"] = 0
+        self.http_pool.clear()
 
 
 class RequestOptimizer:
@@ -462,14 +1262,206 @@ class RequestOptimizer:
             return batch
 
 
+class LatencyHistogram:
+    """Fixed-memory histogram of durations with log-linear buckets.
+
+    Durations are counted in whole microseconds. Values below SUB_BUCKETS
+    get one bucket each; above that every power of two is split into
+    SUB_BUCKETS equal buckets, so a bucket spans at most 1/SUB_BUCKETS of
+    its lower bound (about 12% relative error). Recording is O(1) and the
+    bucket count is bounded by NUM_BUCKETS regardless of how many values
+    are recorded.
+    """
+
+    SUB_BUCKET_BITS = 3
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+    # Durations are clamped to 2**36 us (about 19 hours)
+    MAX_MICROS = (1 << 36) - 1
+    NUM_BUCKETS = SUB_BUCKETS + (36 - SUB_BUCKET_BITS) * SUB_BUCKETS
+
+    __slots__ = ("counts", "count", "total", "min", "max", "last")
+
+    def __init__(self):
+        """Initialize empty histogram."""
+        # Sparse bucket index -> count; latencies cluster in a few buckets
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.last = 0.0
+
+    @classmethod
+    def bucket_index(cls, micros: int) -> int:
+        """Map a duration in microseconds to its bucket."""
+        if micros < cls.SUB_BUCKETS:
+            return max(micros, 0)
+        micros = min(micros, cls.MAX_MICROS)
+        shift = micros.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return cls.SUB_BUCKETS + shift * cls.SUB_BUCKETS + (micros >> shift) - cls.SUB_BUCKETS
+
+    @classmethod
+    def bucket_bounds(cls, index: int) -> Tuple[int, int]:
+        """Get the lowest and highest microsecond values of a bucket."""
+        if index < cls.SUB_BUCKETS:
+            return index, index
+        shift, sub = divmod(index - cls.SUB_BUCKETS, cls.SUB_BUCKETS)
+        lower = (cls.SUB_BUCKETS + sub) << shift
+        return lower, lower + (1 << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record one duration.
+
+        Args:
+            seconds: Duration in seconds
+        """
+        index = self.bucket_index(int(seconds * 1_000_000))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's values to this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Duration in seconds (midpoint of the bucket holding the rank,
+            clamped to the recorded min and max), or 0.0 when empty
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lower, upper = self.bucket_bounds(index)
+                value = (lower + upper) / 2 / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def cumulative_counts(self, bounds: Iterable[float]) -> List[int]:
+        """Count values at or below each bound, for Prometheus-style buckets.
+
+        A bucket is counted under a bound only if its highest value fits, so
+        values near a bound may be attributed to the next one.
+
+        Args:
+            bounds: Ascending upper bounds in seconds
+
+        Returns:
+            Cumulative count for each bound
+        """
+        indexes = sorted(self.counts)
+        counts = []
+        position = seen = 0
+        for bound in bounds:
+            limit = bound * 1_000_000
+            while position < len(indexes) and self.bucket_bounds(indexes[position])[1] <= limit:
+                seen += self.counts[indexes[position]]
+                position += 1
+            counts.append(seen)
+        return counts
+
+    def summary(self) -> Dict[str, Any]:
+        """Get count, average, extremes and percentiles in milliseconds."""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 2),
+            "min_ms": round(self.min * 1000, 2),
+            "max_ms": round(self.max * 1000, 2),
+            "p50_ms": round(self.percentile(50) * 1000, 2),
+            "p90_ms": round(self.percentile(90) * 1000, 2),
+            "p99_ms": round(self.percentile(99) * 1000, 2),
+            "p999_ms": round(self.percentile(99.9) * 1000, 2),
+        }
+
+
+class _OperationMetrics:
+    """Lifetime histogram plus a ring of per-slot histograms for one operation."""
+
+    __slots__ = ("total", "slots", "slot_ids")
+
+    def __init__(self, num_slots: int):
+        self.total = LatencyHistogram()
+        self.slots: List[Optional[LatencyHistogram]] = [None] * num_slots
+        self.slot_ids = [-1] * num_slots
+
+    def record(self, seconds: float, slot_id: int) -> None:
+        self.total.record(seconds)
+        position = slot_id % len(self.slots)
+        histogram = self.slots[position]
+        if histogram is None or self.slot_ids[position] != slot_id:
+            # The ring position still holds an expired slot
+            histogram = self.slots[position] = LatencyHistogram()
+            self.slot_ids[position] = slot_id
+        histogram.record(seconds)
+
+    def window(self, current_slot: int, num_slots: int) -> LatencyHistogram:
+        merged = LatencyHistogram()
+        oldest = current_slot - num_slots
+        for slot_id, histogram in zip(self.slot_ids, self.slots, strict=True):
+            if histogram is not None and oldest < slot_id <= current_slot:
+                merged.merge(histogram)
+        return merged
+
+
 class PerformanceMonitor:
-    """Monitors and tracks performance metrics."""
+    """Monitors and tracks performance metrics.
+
+    Every operation gets a streaming LatencyHistogram for its lifetime and a
+    ring of histograms covering SLOT_SECONDS each, from which percentiles
+    and throughput over the sliding WINDOWS are computed.
+    """
+
+    SLOT_SECONDS = 10
+    # Window name -> length in seconds; the ring spans the longest one
+    WINDOWS = {"1m": 60, "5m": 300}
 
     def __init__(self):
         """Initialize performance monitor."""
-        self._metrics: Dict[str, List[float]] = defaultdict(list)
+        self._num_slots = max(self.WINDOWS.values()) // self.SLOT_SECONDS
+        self._metrics: Dict[str, _OperationMetrics] = {}
+        # Operations currently inside track_operation()
+        self._in_flight: Dict[str, int] = defaultdict(int)
         self._lock = threading.RLock()
         self._start_time = time.time()
+        self._start_monotonic = time.monotonic()
+
+    def _current_slot(self) -> int:
+        return int((time.monotonic() - self._start_monotonic) // self.SLOT_SECONDS)
+
+    def record(self, operation: str, seconds: float) -> None:
+        """Record a duration for an operation.
+
+        Args:
+            operation: Operation name
+            seconds: Duration in seconds
+        """
+        slot_id = self._current_slot()
+        with self._lock:
+            metrics = self._metrics.get(operation)
+            if metrics is None:
+                metrics = self._metrics[operation] = _OperationMetrics(self._num_slots)
+            metrics.record(seconds, slot_id)
 
     @contextmanager
     def track_operation(self, operation: str):
@@ -478,34 +1470,54 @@ class PerformanceMonitor:
         Args:
             operation: Operation name
         """
-        start = time.time()
+        with self._lock:
+            self._in_flight[operation] += 1
+        start = time.perf_counter()
         try:
             yield
         finally:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             with self._lock:
-                self._metrics[operation].append(duration)
-                # Keep only last 1000 measurements
-                if len(self._metrics[operation]) > 1000:
-                    self._metrics[operation] = self._metrics[operation][-1000:]
+                self._in_flight[operation] -= 1
+            self.record(operation, duration)
+
+    def get_in_flight(self) -> Dict[str, int]:
+        """Get the number of running tracked calls per operation."""
+        with self._lock:
+            return dict(self._in_flight)
+
+    def get_histograms(self) -> Dict[str, LatencyHistogram]:
+        """Get a copy of each operation's lifetime histogram."""
+        with self._lock:
+            histograms = {}
+            for operation, metrics in self._metrics.items():
+                histogram = histograms[operation] = LatencyHistogram()
+                histogram.merge(metrics.total)
+            return histograms
 
     def get_stats(self) -> Dict[str, Any]:
         """Get performance statistics."""
+        elapsed = time.monotonic() - self._start_monotonic
+        current_slot = int(elapsed // self.SLOT_SECONDS)
         with self._lock:
             stats: Dict[str, Any] = {
                 "uptime_seconds": int(time.time() - self._start_time),
                 "operations": {},
             }
 
-            for operation, durations in self._metrics.items():
-                if durations:
-                    stats["operations"][operation] = {
-                        "count": len(durations),
-                        "avg_ms": round(sum(durations) / len(durations) * 1000, 2),
-                        "min_ms": round(min(durations) * 1000, 2),
-                        "max_ms": round(max(durations) * 1000, 2),
-                        "last_ms": round(durations[-1] * 1000, 2),
-                    }
+            for operation, metrics in self._metrics.items():
+                op_stats = metrics.total.summary()
+                op_stats["last_ms"] = round(metrics.total.last * 1000, 2)
+                op_stats["in_flight"] = self._in_flight.get(operation, 0)
+                op_stats["windows"] = {}
+                for name, seconds in self.WINDOWS.items():
+                    window = metrics.window(current_slot, seconds // self.SLOT_SECONDS)
+                    window_stats = window.summary()
+                    # The current slot is partial, so divide by the time covered
+                    span = min(float(seconds), max(elapsed, 1.0))
+                    window_stats["throughput_per_sec"] = round(window.count / span, 3)
+                    op_stats["windows"][name] = window_stats
+                stats["operations"][operation] = op_stats
 
             return stats
 
@@ -513,6 +1525,11 @@ class PerformanceMonitor:
 class PerformanceManager:
     """Central manager for all performance optimizations."""
 
+    # Field definitions rarely change: cache for 1 hour, then keep serving
+    # them for a grace window while a background refresh runs
+    FIELDS_TTL = 3600
+    FIELDS_STALE_TTL = 600
+
     def __init__(self, config: OmniConfig):
         """Initialize performance manager.
 
@@ -522,12 +1539,36 @@ class PerformanceManager:
         self.config = config
 
         # Initialize components
-        self.field_cache = Cache(max_size=100, max_memory_mb=10)
+        # fields_get results hold hundreds of fields, so they are sized by sampling
+        self.field_cache = Cache(max_size=100, max_memory_mb=10, sizer=SampledSizer())
         self.record_cache = Cache(max_size=1000, max_memory_mb=50)
         self.permission_cache = Cache(max_size=500, max_memory_mb=5)
+        # Opt-in cache of search/search_count/search_read results, dropped per
+        # model on writes; the TTL bounds staleness from changes made elsewhere
+        self.query_cache_ttl = config.query_cache_ttl
+        self.query_cache = Cache(max_size=500, max_memory_mb=20)
+        self._query_lock = threading.Lock()
+        # Per-model [hits, misses], and a generation bumped by every write so
+        # results fetched across a write are not cached
+        self._query_stats: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        self._query_generations: Dict[str, int] = defaultdict(int)
         self.connection_pool = ConnectionPool(config)
         self.request_optimizer = RequestOptimizer()
         self.monitor = PerformanceMonitor()
+        # Identical in-flight read-only calls, from executor threads and from
+        # the async client respectively
+        self.read_flight = SingleFlight()
+        self.async_read_flight = AsyncSingleFlight()
+
+        # Optional on-disk copy of field_cache, scoped to the authenticated
+        # database and server version once they are known
+        self.metadata_store: Optional[FieldsMetadataStore] = None
+        if config.fields_cache_dir:
+            try:
+                self.metadata_store = FieldsMetadataStore(config.fields_cache_dir)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Field metadata store disabled: {e}")
+        self._metadata_scope: Optional[Tuple[str, str]] = None
 
         logger.info("Performance manager initialized")
 
@@ -550,44 +1591,283 @@ class PerformanceManager:
             key_parts.append(f"{k}:{v}")
         return ":".join(key_parts)
 
-    def get_cached_fields(self, model: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def request_key(
+        database: Optional[str],
+        uid: Optional[int],
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """Build the coalescing key for a read-only execute_kw call.
+
+        Args:
+            database: Database the call runs against
+            uid: User the call runs as
+            model: Model name
+            method: Model method
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            Key for identical calls, or None if the call must not be coalesced
+        """
+        if method not in READ_ONLY_METHODS:
+            return None
+        try:
+            return json.dumps(
+                [database, uid, model, method, args, kwargs], sort_keys=True, separators=(",", ":")
+            )
+        except (TypeError, ValueError):
+            # Arguments that do not serialize cannot be compared reliably
+            return None
+
+    def get_cached_fields(
+        self,
+        model: str,
+        revalidate: Optional[Callable[[str], None]] = None,
+        load_persisted: bool = True,
+    ) -> Optional[Dict[str, Any]]:
         """Get cached field definitions.
 
+        With a ``revalidate`` callback, expired definitions are still
+        returned during their grace window (as are definitions just loaded
+        from the on-disk store), and the callback is called once to refresh
+        them off the request path; it must end in cache_fields() or
+        cancel_fields_refresh().
+
         Args:
             model: Model name
+            revalidate: Schedules a background refresh of the model's fields
+            load_persisted: Fall back to the on-disk store on a miss; callers
+                on an event loop pass False and load it on an executor
 
         Returns:
             Cached fields or None
         """
         key = self.cache_key("fields", model=model)
-        return self.field_cache.get(key)
+        if revalidate is None:
+            return self.field_cache.get(key)
 
-    def cache_fields(self, model: str, fields: Dict[str, Any]):
+        fields, refresh = self.field_cache.get_or_stale(key)
+        if fields is None and load_persisted and self.load_persisted_fields(model) is not None:
+            fields, refresh = self.field_cache.get_or_stale(key)
+        if refresh:
+            revalidate(model)
+        return fields
+
+    def cancel_fields_refresh(self, model: str):
+        """Allow another refresh after a failed background refresh.
+
+        Args:
+            model: Model name
+        """
+        self.field_cache.cancel_refresh(self.cache_key("fields", model=model))
+
+    def cache_fields(
+        self,
+        model: str,
+        fields: Dict[str, Any],
+        size_bytes: Optional[int] = None,
+        persist: bool = True,
+    ):
         """Cache field definitions.
 
         Args:
             model: Model name
             fields: Field definitions
+            size_bytes: Raw response length, if known, used as the entry size
+            persist: Also write them to the on-disk store; callers on an
+                event loop pass False and call persist_fields() on an executor
         """
         key = self.cache_key("fields", model=model)
-        # Fields rarely change, cache for 1 hour
-        self.field_cache.put(key, fields, ttl_seconds=3600)
+        self.field_cache.put(
+            key,
+            fields,
+            ttl_seconds=self.FIELDS_TTL,
+            size_bytes=size_bytes,
+            stale_seconds=self.FIELDS_STALE_TTL,
+        )
+        if persist:
+            self.persist_fields(model, fields)
+
+    @property
+    def persists_fields(self) -> bool:
+        """Whether field definitions are read from and written to the on-disk store."""
+        return self.metadata_store is not None and self._metadata_scope is not None
+
+    def persist_fields(self, model: str, fields: Dict[str, Any]):
+        """Write field definitions to the on-disk store for the current scope.
+
+        Args:
+            model: Model name
+            fields: Field definitions
+        """
+        store, scope = self.metadata_store, self._metadata_scope
+        if store is not None and scope is not None:
+            database, version = scope
+            store.put(self.config.url, database, model, version, fields)
+
+    def set_metadata_scope(self, database: Optional[str], version: Optional[str]):
+        """Scope persisted field metadata to a database and server version.
+
+        Stored entries are only read and written once both are known, so
+        metadata from another database or server version is never served.
+
+        Args:
+            database: Authenticated database name
+            version: Server version string
+        """
+        self._metadata_scope = (database, version) if database and version else None
+
+    def load_persisted_fields(self, model: str) -> Optional[Dict[str, Any]]:
+        """Load field definitions from the on-disk store into field_cache.
+
+        Loaded definitions are cached as already stale, so the next
+        get_cached_fields() with a revalidate callback refreshes them.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Stored fields, or None if not stored for the current scope
+        """
+        if self.metadata_store is None or self._metadata_scope is None:
+            return None
+        database, version = self._metadata_scope
+        fields = self.metadata_store.get(self.config.url, database, model, version)
+        if fields is not None:
+            key = self.cache_key("fields", model=model)
+            self.field_cache.put(key, fields, ttl_seconds=0, stale_seconds=self.FIELDS_TTL)
+        return fields
+
+    def _query_key(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> str:
+        """Cache key for a query; domains and options are JSON-normalized."""
+        return json.dumps(
+            [model, method, args, kwargs], sort_keys=True, separators=(",", ":"), default=str
+        )
+
+    def get_cached_query(
+        self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]
+    ) -> Optional[Any]:
+        """Get a cached query result.
+
+        Args:
+            model: Model name
+            method: search, search_count or search_read
+            args: Positional arguments of the call (the domain)
+            kwargs: Keyword arguments (fields, order, limit, offset)
+
+        Returns:
+            A copy of the cached result, or None (always None when disabled)
+        """
+        if not self.query_cache_ttl:
+            return None
+        result = self.query_cache.get(self._query_key(model, method, args, kwargs))
+        with self._query_lock:
+            self._query_stats[model][0 if result is not None else 1] += 1
+        # Callers format records in place, so every caller gets its own copy
+        return clone_result(result) if result is not None else None
+
+    def query_generation(self, model: str) -> int:
+        """Get the model's write generation, to pass to cache_query().
+
+        Args:
+            model: Model name
+        """
+        with self._query_lock:
+            return self._query_generations[model]
+
+    def cache_query(
+        self,
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        result: Any,
+        generation: int,
+        size_bytes: Optional[int] = None,
+    ):
+        """Cache a query result unless the model was written since it was fetched.
+
+        Args:
+            model: Model name
+            method: search, search_count or search_read
+            args: Positional arguments of the call (the domain)
+            kwargs: Keyword arguments (fields, order, limit, offset)
+            result: Result to cache; a copy is stored
+            generation: query_generation() taken before the call was sent
+            size_bytes: Raw response length, if known
+        """
+        if not self.query_cache_ttl:
+            return
+        key = self._query_key(model, method, args, kwargs)
+        value = clone_result(result)
+        # Check and store under one lock, so a write cannot bump the generation
+        # and drop the model's entries between the two
+        with self._query_lock:
+            if self._query_generations[model] != generation:
+                return
+            self.query_cache.put(
+                key,
+                value,
+                ttl_seconds=self.query_cache_ttl,
+                tags=(("model", model),),
+                size_bytes=size_bytes,
+            )
+
+    def invalidate_queries(self, model: str):
+        """Drop all cached query results of a model.
+
+        Args:
+            model: Model name
+        """
+        with self._query_lock:
+            self._query_generations[model] += 1
+        count = self.query_cache.invalidate_tags([("model", model)])
+        if count > 0:
+            logger.debug(f"Invalidated {count} cached queries for {model}")
+
+    def get_query_stats(self) -> Dict[str, Any]:
+        """Get query cache statistics, including hit rates per model."""
+        with self._query_lock:
+            models = {
+                model: {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                }
+                for model, (hits, misses) in sorted(self._query_stats.items())
+            }
+        return {
+            **self.query_cache.get_stats(),
+            "enabled": bool(self.query_cache_ttl),
+            "ttl_seconds": self.query_cache_ttl,
+            "models": models,
+        }
 
     def get_cached_record(
         self, model: str, record_id: int, fields: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """Get cached record.
 
+        Records are cached per (model, id) with the union of all fields read
+        so far, so this is a hit whenever every requested field is present.
+
         Args:
             model: Model name
             record_id: Record ID
-            fields: Field list (for cache key)
+            fields: Requested fields (None for all fields)
 
         Returns:
-            Cached record or None
+            Cached record with the requested fields or None
         """
-        key = self.cache_key("record", model=model, id=record_id, fields=fields)
-        return self.record_cache.get(key)
+        key = self.cache_key("record", model=model, id=record_id)
+        entry = self.record_cache.get(key, is_hit=lambda e: self._has_fields(e, fields))
+        if entry is None or not self._has_fields(entry, fields):
+            return None
+        return self._project_record(entry["values"], fields)
 
     def cache_record(
         self,
@@ -595,19 +1875,158 @@ class PerformanceManager:
         record: Dict[str, Any],
         fields: Optional[List[str]] = None,
         ttl_seconds: int = 300,
+        size_bytes: Optional[int] = None,
     ):
-        """Cache record data.
+        """Cache record data, merging it with fields cached earlier.
+
+        A merged entry keeps the deadline of the entry it extends, so values
+        cached earlier are never kept longer than their own TTL just because
+        other fields of the record keep being read.
 
         Args:
             model: Model name
             record: Record data
-            fields: Field list (for cache key)
+            fields: Fields the record was read with (None means all fields)
             ttl_seconds: Cache TTL
+            size_bytes: Known size of the record (e.g. its share of the raw
+                response); ignored when merging into an existing entry
         """
         record_id = record.get("id")
-        if record_id is not None:
-            key = self.cache_key("record", model=model, id=record_id, fields=fields)
-            self.record_cache.put(key, record, ttl_seconds=ttl_seconds)
+        if record_id is None:
+            return
+
+        key = self.cache_key("record", model=model, id=record_id)
+        expires_at = time.monotonic() + ttl_seconds
+        if fields:
+            existing = self.record_cache.peek(key)
+            if existing is not None:
+                values = {**existing["values"], **record}
+                expires_at = existing["expires_at"]
+                entry = {"values": values, "complete": existing["complete"]}
+                size_bytes = None
+            else:
+                entry = {"values": dict(record), "complete": False}
+        else:
+            entry = {"values": dict(record), "complete": True}
+        entry["expires_at"] = expires_at
+        self.record_cache.put(
+            key,
+            entry,
+            tags=self._record_tags(model, record_id),
+            size_bytes=size_bytes,
+            expires_at=expires_at,
+        )
+
+    def cache_records(
+        self,
+        model: str,
+        records: List[Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+        response_bytes: Optional[int] = None,
+    ):
+        """Cache records returned by one call.
+
+        Args:
+            model: Model name
+            records: Record data
+            fields: Fields the records were read with (None means all fields)
+            response_bytes: Raw response length, if known; each record is
+                charged an equal share instead of being sized individually
+        """
+        size_bytes = None
+        if response_bytes is not None and records:
+            size_bytes = response_bytes // len(records)
+        for record in records:
+            self.cache_record(model, record, fields, size_bytes=size_bytes)
+
+    def plan_record_read(
+        self, model: str, ids: List[int], fields: Optional[List[str]] = None
+    ) -> Tuple[Dict[int, Dict[str, Any]], List[int], Optional[List[str]]]:
+        """Work out which part of a read has to come from Omni.
+
+        Args:
+            model: Model name
+            ids: Record IDs to read
+            fields: Requested fields (None for all fields)
+
+        Returns:
+            Tuple of (cached values by id, including partially cached records;
+            ids to fetch; fields to fetch for them, None meaning all fields)
+        """
+        cached: Dict[int, Dict[str, Any]] = {}
+        missing_ids: List[int] = []
+        missing_fields = set()
+
+        for record_id in dict.fromkeys(ids):
+            key = self.cache_key("record", model=model, id=record_id)
+            entry = self.record_cache.get(key, is_hit=lambda e: self._has_fields(e, fields))
+            if entry is not None:
+                cached[record_id] = entry["values"]
+                if self._has_fields(entry, fields):
+                    continue
+            missing_ids.append(record_id)
+            if fields:
+                values = entry["values"] if entry is not None else {}
+                missing_fields.update(f for f in fields if f not in values)
+
+        # Keep the requested field order
+        fetch_fields = [f for f in fields if f in missing_fields] if fields else None
+        return cached, missing_ids, fetch_fields
+
+    def merge_record_read(
+        self,
+        model: str,
+        ids: List[int],
+        fields: Optional[List[str]],
+        cached: Dict[int, Dict[str, Any]],
+        fetched: List[Dict[str, Any]],
+        fetch_fields: Optional[List[str]],
+        response_bytes: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Cache freshly read records and combine them with cached values.
+
+        Args:
+            model: Model name
+            ids: Record IDs in requested order
+            fields: Requested fields (None for all fields)
+            cached: Cached values from plan_record_read
+            fetched: Records returned by Omni
+            fetch_fields: Fields the records were fetched with
+            response_bytes: Raw length of the read response, if known
+
+        Returns:
+            Records in requested order, each with the requested fields
+        """
+        self.cache_records(model, fetched, fetch_fields, response_bytes)
+        values_by_id = dict(cached)
+        for record in fetched:
+            record_id = record.get("id")
+            values_by_id[record_id] = {**values_by_id.get(record_id, {}), **record}
+
+        return [
+            self._project_record(values_by_id[record_id], fields)
+            for record_id in ids
+            if record_id in values_by_id
+        ]
+
+    @staticmethod
+    def _has_fields(entry: Dict[str, Any], fields: Optional[List[str]]) -> bool:
+        """Check whether a cached record entry covers the requested fields."""
+        if not fields:
+            return entry["complete"]
+        values = entry["values"]
+        return all(field in values for field in fields)
+
+    @staticmethod
+    def _project_record(values: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        """Return the requested fields of a record, plus its id like Omni does."""
+        if not fields:
+            return dict(values)
+        record = {"id": values["id"]} if "id" in values else {}
+        for field in fields:
+            if field in values:
+                record[field] = values[field]
+        return record
 
     def invalidate_record_cache(self, model: str, record_id: Optional[int] = None):
         """Invalidate record cache.
@@ -616,15 +2035,33 @@ class PerformanceManager:
             model: Model name
             record_id: Specific record ID or None for all model records
         """
-        if record_id:
-            # Use wildcard pattern that will match any fields value
-            pattern = f"record:*id:{record_id}:model:{model}*"
+        self.invalidate_records(model, None if record_id is None else [record_id])
+
+    def invalidate_records(self, model: str, record_ids: Optional[Iterable[int]] = None):
+        """Invalidate cached records of a model.
+
+        Uses the record cache's tag index, so the cost is proportional to the
+        number of affected entries. Cached query results of the model are
+        dropped too, since any change can alter which records match.
+
+        Args:
+            model: Model name
+            record_ids: Record IDs to invalidate, or None for all model records
+        """
+        if record_ids is None:
+            tags = [("model", model)]
         else:
-            pattern = f"record:*model:{model}*"
+            tags = [("record", model, record_id) for record_id in record_ids]
 
-        count = self.record_cache.invalidate_pattern(pattern)
+        count = self.record_cache.invalidate_tags(tags)
         if count > 0:
-            logger.debug(f"Invalidated {count} cache entries for {pattern}")
+            logger.debug(f"Invalidated {count} cache entries for {model}")
+        self.invalidate_queries(model)
+
+    @staticmethod
+    def _record_tags(model: str, record_id: int) -> Tuple[Tuple[Any, ...], ...]:
+        """Index tags for a cached record."""
+        return (("model", model), ("record", model, record_id))
 
     def get_cached_permission(self, model: str, operation: str, user_id: int) -> Optional[bool]:
         """Get cached permission check.
@@ -653,17 +2090,18 @@ class PerformanceManager:
         # Permissions may change, cache for 5 minutes
         self.permission_cache.put(key, allowed, ttl_seconds=300)
 
-    def get_optimized_connection(self, endpoint: str) -> Any:
+    def get_optimized_connection(self, endpoint: str, timeout: Optional[float] = None) -> Any:
         """Get optimized connection from pool.
 
         Args:
             endpoint: Endpoint path
+            timeout: Socket timeout for requests made through the connection
 
         Returns:
             Connection object
         """
         with self.monitor.track_operation("connection_get"):
-            return self.connection_pool.get_connection(endpoint)
+            return self.connection_pool.get_connection(endpoint, timeout)
 
     def optimize_search_fields(
         self, model: str, requested_fields: Optional[List[str]] = None
@@ -688,14 +2126,30 @@ class PerformanceManager:
                 "field_cache": self.field_cache.get_stats(),
                 "record_cache": self.record_cache.get_stats(),
                 "permission_cache": self.permission_cache.get_stats(),
+                "query_cache": self.get_query_stats(),
             },
             "connection_pool": self.connection_pool.get_stats(),
+            "request_coalescing": {
+                "threads": self.read_flight.get_stats(),
+                "async": self.async_read_flight.get_stats(),
+            },
             "performance": self.monitor.get_stats(),
         }
 
+    def close(self):
+        """Close the on-disk field metadata store."""
+        store, self.metadata_store = self.metadata_store, None
+        if store is not None:
+            store.close()
+
     def clear_all_caches(self):
         """Clear all caches."""
         self.field_cache.clear()
         self.record_cache.clear()
         self.permission_cache.clear()
+        self.query_cache.clear()
+        with self._query_lock:
+            self._query_stats.clear()
+        if self.metadata_store is not None:
+            self.metadata_store.clear()
         logger.info("All caches cleared")
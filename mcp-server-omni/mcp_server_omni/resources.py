@@ -4,6 +4,7 @@ This module implements MCP resources for accessing Omni data through
 standardized URIs using FastMCP decorators.
 """
 
+import asyncio
 import json
 from typing import Any, Dict, List, Optional
 from urllib.parse import unquote
@@ -18,6 +19,8 @@ from .error_handling import (
     PermissionError,
     ValidationError,
 )
+from .export import MAX_EXPORT_RECORDS, ExportWriter, iter_record_chunks
+from .field_plan import FieldPlanCache, normalize_datetimes
 from .formatters import DatasetFormatter, RecordFormatter
 from .logging_config import get_logger, perf_logger
 from .omni_connection import OmniConnection, OmniConnectionError
@@ -55,6 +58,7 @@ class OmniResourceHandler:
         self.connection = connection
         self.access_controller = access_controller
         self.config = config
+        self._field_plans = FieldPlanCache()
 
         # Register resources
         self._register_resources()
@@ -106,6 +110,16 @@ class OmniResourceHandler:
             """
             return await self._handle_count(model, None)
 
+        # Register export resource (no parameters due to FastMCP limitations)
+        @self.app.resource("omni://{model}/export")
+        async def export_records(model: str) -> str:
+            """Export records as NDJSON, one JSON object per line.
+
+            Reads up to 10000 records in id-ordered chunks. For filters, CSV
+            output and continuation, use the export_records tool instead.
+            """
+            return await self._handle_export(model)
+
         # Register fields resource
         @self.app.resource("omni://{model}/fields")
         async def get_fields(model: str) -> str:
@@ -163,7 +177,9 @@ class OmniResourceHandler:
 
                 # Check model access permissions
                 try:
-                    self.access_controller.validate_model_access(model, "read")
+                    await self.connection.run_async(
+                        self.access_controller.validate_model_access, model, "read"
+                    )
                 except AccessControlError as e:
                     logger.warning(f"Access denied for {model}.read: {e}")
                     raise PermissionError(f"Access denied: {e}", context=context) from e
@@ -173,7 +189,7 @@ class OmniResourceHandler:
                     raise ValidationError("Not authenticated with Omni", context=context)
 
             # Search for the record to check if it exists
-            record_ids = self.connection.search(model, [("id", "=", record_id_int)])
+            record_ids = await self.connection.asearch(model, [("id", "=", record_id_int)])
 
             if not record_ids:
                 raise NotFoundError(
@@ -183,30 +199,20 @@ class OmniResourceHandler:
             # Read the record with smart field selection to avoid serialization issues
             # Get field metadata to determine which fields to fetch
             try:
-                fields_info = self.connection.fields_get(model)
-                # Filter out fields that might cause serialization issues
-                safe_fields = []
-                for field_name, field_info in fields_info.items():
-                    field_type = field_info.get("type", "")
-                    # Skip fields that commonly cause XML-RPC serialization issues
-                    # Expanded list to include html fields which often contain Markup objects
-                    problematic_types = ["binary", "serialized", "html"]
-                    if (
-                        field_type not in problematic_types
-                        and not field_name.startswith("__")
-                        and not field_name.startswith("_")
-                    ):  # Also skip private fields
-                        safe_fields.append(field_name)
+                fields_info = await self.connection.afields_get(model)
+                # Skip binary/serialized/html and private fields, which commonly
+                # cause XML-RPC serialization issues (precomputed per model)
+                safe_fields = self._field_plans.get(model, fields_info).safe_fields
 
                 if safe_fields:
-                    records = self.connection.read(model, record_ids, safe_fields)
+                    records = await self.connection.aread(model, record_ids, safe_fields)
                 else:
                     # Fallback to all fields if we can't determine safe fields
-                    records = self.connection.read(model, record_ids)
+                    records = await self.connection.aread(model, record_ids)
             except Exception as e:
                 logger.debug(f"Could not get field metadata, reading all fields: {e}")
                 # If we can't get field info, try to read all fields
-                records = self.connection.read(model, record_ids)
+                records = await self.connection.aread(model, record_ids)
 
             if not records:
                 raise ResourceNotFoundError(
@@ -216,7 +222,7 @@ class OmniResourceHandler:
             record = records[0]
 
             # Format the record data
-            formatted_data = self._format_record(model, record)
+            formatted_data = await self._format_record(model, record)
 
             logger.info(f"Successfully retrieved record: {model}/{record_id}")
             return formatted_data
@@ -262,7 +268,9 @@ class OmniResourceHandler:
         try:
             # Check model access permissions
             try:
-                self.access_controller.validate_model_access(model, "read")
+                await self.connection.run_async(
+                    self.access_controller.validate_model_access, model, "read"
+                )
             except AccessControlError as e:
                 logger.warning(f"Access denied for {model}.read: {e}")
                 raise ResourcePermissionError(f"Access denied: {e}") from e
@@ -278,22 +286,22 @@ class OmniResourceHandler:
             offset_value = self._parse_offset(offset)
             order_value = self._parse_order(order)
 
-            # Get total count for pagination
-            total_count = self.connection.search_count(model, parsed_domain)
-
-            # Perform search
-            record_ids = self.connection.search(
-                model, parsed_domain, limit=limit_value, offset=offset_value, order=order_value
+            # Search and read in one round-trip, counting concurrently for pagination
+            records, total_count = await asyncio.gather(
+                self.connection.asearch_read(
+                    model,
+                    parsed_domain,
+                    fields_list,
+                    limit=limit_value,
+                    offset=offset_value,
+                    order=order_value,
+                ),
+                self.connection.asearch_count(model, parsed_domain),
             )
 
-            # Read records if any found
-            records = []
-            if record_ids:
-                records = self.connection.read(model, record_ids, fields_list)
-
             # Get field metadata for formatting
             try:
-                fields_metadata = self.connection.fields_get(model)
+                fields_metadata = await self.connection.afields_get(model)
             except Exception as e:
                 logger.debug(f"Could not retrieve field metadata: {e}")
                 fields_metadata = None
@@ -502,7 +510,9 @@ class OmniResourceHandler:
         try:
             # Check model access permissions
             try:
-                self.access_controller.validate_model_access(model, "read")
+                await self.connection.run_async(
+                    self.access_controller.validate_model_access, model, "read"
+                )
             except AccessControlError as e:
                 logger.warning(f"Access denied for {model}.read: {e}")
                 raise ResourcePermissionError(f"Access denied: {e}") from e
@@ -519,34 +529,24 @@ class OmniResourceHandler:
             # Read records in batch with smart field selection to avoid serialization issues
             # Get field metadata to determine which fields to fetch
             try:
-                fields_info = self.connection.fields_get(model)
-                # Filter out fields that might cause serialization issues
-                safe_fields = []
-                for field_name, field_info in fields_info.items():
-                    field_type = field_info.get("type", "")
-                    # Skip fields that commonly cause XML-RPC serialization issues
-                    # Expanded list to include html fields which often contain Markup objects
-                    problematic_types = ["binary", "serialized", "html"]
-                    if (
-                        field_type not in problematic_types
-                        and not field_name.startswith("__")
-                        and not field_name.startswith("_")
-                    ):  # Also skip private fields
-                        safe_fields.append(field_name)
+                fields_info = await self.connection.afields_get(model)
+                # Skip binary/serialized/html and private fields, which commonly
+                # cause XML-RPC serialization issues (precomputed per model)
+                safe_fields = self._field_plans.get(model, fields_info).safe_fields
 
                 if safe_fields:
-                    records = self.connection.read(model, id_list, safe_fields)
+                    records = await self.connection.aread(model, id_list, safe_fields)
                 else:
                     # Fallback to all fields if we can't determine safe fields
-                    records = self.connection.read(model, id_list)
+                    records = await self.connection.aread(model, id_list)
             except Exception as e:
                 logger.debug(f"Could not get field metadata, reading all fields: {e}")
                 # If we can't get field info, try to read all fields
-                records = self.connection.read(model, id_list)
+                records = await self.connection.aread(model, id_list)
 
             # Get field metadata for formatting
             try:
-                fields_metadata = self.connection.fields_get(model)
+                fields_metadata = await self.connection.afields_get(model)
             except Exception as e:
                 logger.debug(f"Could not retrieve field metadata: {e}")
                 fields_metadata = None
@@ -588,7 +588,9 @@ class OmniResourceHandler:
         try:
             # Check model access permissions
             try:
-                self.access_controller.validate_model_access(model, "read")
+                await self.connection.run_async(
+                    self.access_controller.validate_model_access, model, "read"
+                )
             except AccessControlError as e:
                 logger.warning(f"Access denied for {model}.read: {e}")
                 raise ResourcePermissionError(f"Access denied: {e}") from e
@@ -601,7 +603,7 @@ class OmniResourceHandler:
             parsed_domain = self._parse_domain(domain)
 
             # Get count
-            count = self.connection.search_count(model, parsed_domain)
+            count = await self.connection.asearch_count(model, parsed_domain)
 
             # Format result
             formatted_result = self._format_count_result(model, count, parsed_domain)
@@ -619,6 +621,70 @@ class OmniResourceHandler:
             logger.error(f"Unexpected error counting {model}: {e}")
             raise ResourceError(f"Failed to count records: {e}") from e
 
+    async def _handle_export(self, model: str) -> str:
+        """Handle export request.
+
+        Args:
+            model: The Omni model name
+
+        Returns:
+            NDJSON text with one record per line
+
+        Raises:
+            ResourcePermissionError: If access is denied
+            ResourceError: For other errors
+        """
+        logger.info(f"Exporting {model} records")
+
+        try:
+            # Check model access permissions
+            try:
+                await self.connection.run_async(
+                    self.access_controller.validate_model_access, model, "read"
+                )
+            except AccessControlError as e:
+                logger.warning(f"Access denied for {model}.read: {e}")
+                raise ResourcePermissionError(f"Access denied: {e}") from e
+
+            # Ensure we're connected
+            if not self.connection.is_authenticated:
+                raise ResourceError("Not authenticated with Omni")
+
+            # Only read fields that serialize safely over XML-RPC
+            try:
+                fields_info = await self.connection.afields_get(model)
+                plan = self._field_plans.get(model, fields_info)
+                fields = plan.safe_fields or None
+                datetime_fields = plan.datetime_fields
+            except Exception as e:
+                logger.debug(f"Could not retrieve field metadata: {e}")
+                fields = None
+                datetime_fields = frozenset()
+
+            # Serialize each chunk while the next one is being fetched
+            writer = ExportWriter("ndjson")
+            parts = []
+            count = 0
+            async for records in iter_record_chunks(
+                self.connection, model, [], fields, max_records=MAX_EXPORT_RECORDS
+            ):
+                normalize_datetimes(records, datetime_fields)
+                parts.append(writer.write(records))
+                count += len(records)
+
+            logger.info(f"Export completed: {count} records")
+            return "".join(parts)
+
+        except (ResourcePermissionError, ResourceError):
+            # Re-raise our custom exceptions
+            raise
+        except OmniConnectionError as e:
+            logger.error(f"Connection error exporting {model}: {e}")
+            raise ResourceError(f"Connection error: {e}") from e
+        except Exception as e:
+            logger.error(f"Unexpected error exporting {model}: {e}")
+            raise ResourceError(f"Failed to export records: {e}") from e
+
     async def _handle_fields(self, model: str) -> str:
         """Handle fields request for model introspection.
 
@@ -637,7 +703,9 @@ class OmniResourceHandler:
         try:
             # Check model access permissions
             try:
-                self.access_controller.validate_model_access(model, "read")
+                await self.connection.run_async(
+                    self.access_controller.validate_model_access, model, "read"
+                )
             except AccessControlError as e:
                 logger.warning(f"Access denied for {model}.read: {e}")
                 raise ResourcePermissionError(f"Access denied: {e}") from e
@@ -647,7 +715,7 @@ class OmniResourceHandler:
                 raise ResourceError("Not authenticated with Omni")
 
             # Get field definitions
-            fields = self.connection.fields_get(model)
+            fields = await self.connection.afields_get(model)
 
             # Format result
             formatted_result = self._format_fields_result(model, fields)
@@ -823,7 +891,7 @@ class OmniResourceHandler:
 
         return "\n".join(lines)
 
-    def _format_record(self, model: str, record: Dict[str, Any]) -> str:
+    async def _format_record(self, model: str, record: Dict[str, Any]) -> str:
         """Format a record for MCP consumption.
 
         Args:
@@ -835,7 +903,7 @@ class OmniResourceHandler:
         """
         # Get field metadata if available
         try:
-            fields_metadata = self.connection.fields_get(model)
+            fields_metadata = await self.connection.afields_get(model)
         except Exception as e:
             logger.debug(f"Could not retrieve field metadata: {e}")
             fields_metadata = None
@@ -7,6 +7,8 @@ and functionality through the Model Context Protocol.
 from typing import Any, Dict, Optional
 
 from mcp.server import FastMCP
+from starlette.requests import Request
+from starlette.responses import Response
 
 from .access_control import AccessController
 from .config import OmniConfig, get_config
@@ -15,11 +17,19 @@ from .error_handling import (
     ErrorContext,
     error_handler,
 )
-from .logging_config import get_logger, logging_config, perf_logger
+from .logging_config import (
+    flush_logging,
+    get_logger,
+    get_logging_stats,
+    logging_config,
+    perf_logger,
+)
+from .metrics import CONTENT_TYPE, render_metrics
 from .omni_connection import OmniConnection, OmniConnectionError
 from .performance import PerformanceManager
 from .resources import register_resources
 from .tools import register_tools
+from .tracing import configure_tracing, tracer
 
 # Set up logging
 logger = get_logger(__name__)
@@ -46,8 +56,9 @@ class OmniMCPServer:
         # Load configuration
         self.config = config or get_config()
 
-        # Set up structured logging
+        # Set up structured logging and tracing
         logging_config.setup()
+        configure_tracing(self.config)
 
         # Initialize connection and access controller (will be created on startup)
         self.connection: Optional[OmniConnection] = None
@@ -105,9 +116,17 @@ class OmniMCPServer:
             try:
                 logger.info("Closing Omni connection...")
                 self.connection.disconnect()
+                if self.access_controller:
+                    self.access_controller.close()
             except Exception as e:
                 logger.error(f"Error closing connection: {e}")
             finally:
+                # Release the field metadata store even if disconnect failed
+                if self.performance_manager:
+                    self.performance_manager.close()
+                # Export spans and write queued log records before exiting
+                tracer.flush()
+                flush_logging()
                 # Always clear connection reference
                 self.connection = None
                 self.access_controller = None
@@ -142,6 +161,18 @@ class OmniMCPServer:
             )
             logger.info("Registered MCP tools")
 
+    def _register_metrics_route(self):
+        """Serve Prometheus metrics at /metrics on the HTTP transport."""
+
+        async def metrics(request: Request) -> Response:
+            return Response(
+                render_metrics(self.performance_manager, error_handler),
+                media_type=CONTENT_TYPE,
+            )
+
+        self.app.custom_route("/metrics", methods=["GET"])(metrics)
+        logger.info("Registered /metrics endpoint")
+
     async def run_stdio(self):
         """Run the server using stdio transport.
 
@@ -199,6 +230,8 @@ class OmniMCPServer:
                 # Register resources after connection is established
                 self._register_resources()
                 self._register_tools()
+                if self.config.metrics_enabled:
+                    self._register_metrics_route()
 
             logger.info(f"Starting MCP server with HTTP transport on {host}:{port}...")
 
@@ -267,4 +300,6 @@ class OmniMCPServer:
             "error_metrics": error_handler.get_metrics(),
             "recent_errors": error_handler.get_recent_errors(limit=5),
             "performance": performance_stats,
+            "logging": get_logging_stats(),
+            "tracing": tracer.get_stats(),
         }
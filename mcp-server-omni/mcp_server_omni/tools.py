@@ -5,9 +5,11 @@ Tools are different from resources - they can have side effects and perform
 actions like creating, updating, or deleting records.
 """
 
+import asyncio
 import json
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import re
+import xmlrpc.client
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from mcp.server.fastmcp import FastMCP
 
@@ -18,14 +20,49 @@ from .error_handling import (
     ValidationError,
 )
 from .error_sanitizer import ErrorSanitizer
+from .export import (
+    DEFAULT_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    MAX_CHUNK_SIZE,
+    MAX_EXPORT_RECORDS,
+    ExportWriter,
+    iter_record_chunks,
+)
+from .field_plan import (
+    FieldPlan,
+    FieldPlanCache,
+    format_datetime,
+    normalize_datetimes,
+    score_field_importance,
+)
+from .formatters import DEFAULT_MAX_RELATED_ITEMS
 from .logging_config import get_logger, perf_logger
 from .omni_connection import OmniConnection, OmniConnectionError
+from .tracing import tracer
 
 logger = get_logger(__name__)
 
 # Legacy error type alias for backward compatibility
 ToolError = ValidationError
 
+# Ways search_records can compute the 'total' count
+COUNT_MODES = ("exact", "estimate", "none")
+
+# Field types that can be expanded inline
+RELATIONAL_FIELD_TYPES = ("many2one", "one2many", "many2many")
+
+# Maximum number of items accepted by the batch write tools
+MAX_BATCH_SIZE = 500
+
+# read_group aggregate functions and date groupby granularities
+AGGREGATE_FUNCTIONS = ("sum", "avg", "min", "max", "count", "count_distinct")
+DATE_GRANULARITIES = ("day", "week", "month", "quarter", "year")
+
+# field[:granularity]
+GROUPBY_PATTERN = re.compile(r"^([a-z_][a-z0-9_]*)(?::([a-z]+))?$")
+# field:function or alias:function(field)
+AGGREGATE_PATTERN = re.compile(r"^([a-z_][a-z0-9_]*):([a-z_]+)(?:\(([a-z_][a-z0-9_]*)\))?$")
+
 
 class OmniToolHandler:
     """Handles MCP tool requests for Omni operations."""
@@ -49,103 +86,73 @@ class OmniToolHandler:
         self.connection = connection
         self.access_controller = access_controller
         self.config = config
+        self._field_plans = FieldPlanCache()
 
         # Register tools
         self._register_tools()
 
     def _format_datetime(self, value: str) -> str:
         """Format datetime values to ISO 8601 with timezone."""
-        if not value or not isinstance(value, str):
-            return value
+        return format_datetime(value)
 
-        # Handle Omni's compact datetime format (YYYYMMDDTHH:MM:SS)
-        if len(value) == 17 and "T" in value and "-" not in value:
-            try:
-                dt = datetime.strptime(value, "%Y%m%dT%H:%M:%S")
-                return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            except ValueError:
-                pass
+    async def _check_access(self, model: str, operation: str) -> None:
+        """Validate model access, timed as the access_check phase of the trace.
 
-        # Handle standard Omni datetime format (YYYY-MM-DD HH:MM:SS)
-        if " " in value and len(value) == 19:
-            try:
-                dt = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-                return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            except ValueError:
-                pass
+        The check may make a blocking REST call, so it runs on the
+        connection's executor.
 
-        return value
+        Raises:
+            AccessControlError: If access is denied
+        """
+        with tracer.child_span("access_check", model=model, operation=operation):
+            await self.connection.run_async(
+                self.access_controller.validate_model_access, model, operation
+            )
 
-    def _process_record_dates(self, record: Dict[str, Any], model: str) -> Dict[str, Any]:
-        """Process datetime fields in a record to ensure proper formatting."""
-        # Common datetime field names in Omni
-        known_datetime_fields = {
-            "create_date",
-            "write_date",
-            "date",
-            "datetime",
-            "date_start",
-            "date_end",
-            "date_from",
-            "date_to",
-            "date_order",
-            "date_invoice",
-            "date_due",
-            "last_update",
-            "last_activity",
-            "activity_date_deadline",
-        }
+    async def _load_field_plan(self, model: str) -> FieldPlan:
+        """Fetch field definitions off the event loop and get the model's plan.
 
-        # First try to get field metadata
-        fields_info = None
+        The plan is rebuilt only when the (cached) field definitions change.
+        If the definitions cannot be retrieved, an empty plan is returned:
+        callers then read all fields and detect datetimes by value.
+        """
         try:
-            fields_info = self.connection.fields_get(model)
-        except Exception:
-            # Field metadata unavailable, will use fallback detection
-            pass
-
-        # Process each field in the record
-        for field_name, field_value in record.items():
-            if not isinstance(field_value, str):
-                continue
-
-            should_format = False
-
-            # Check if field is identified as datetime from metadata
-            if fields_info and isinstance(fields_info, dict) and field_name in fields_info:
-                field_type = fields_info[field_name].get("type")
-                if field_type == "datetime":
-                    should_format = True
-
-            # Check if field name suggests it's a datetime field
-            if not should_format and field_name in known_datetime_fields:
-                should_format = True
-
-            # Check if field name ends with common datetime suffixes
-            if not should_format and any(
-                field_name.endswith(suffix) for suffix in ["_date", "_datetime", "_time"]
-            ):
-                should_format = True
-
-            # Pattern-based detection for datetime-like strings
-            if not should_format and (
-                (
-                    len(field_value) == 17 and "T" in field_value and "-" not in field_value
-                )  # 20250607T21:55:52
-                or (
-                    len(field_value) == 19 and " " in field_value and field_value.count("-") == 2
-                )  # 2025-06-07 21:55:52
-            ):
-                should_format = True
-
-            # Apply formatting if needed
-            if should_format:
-                formatted = self._format_datetime(field_value)
-                if formatted != field_value:
-                    record[field_name] = formatted
+            with tracer.child_span("fields_get", model=model):
+                fields_info = await self.connection.afields_get(model)
+        except Exception as e:
+            logger.debug(f"Could not fetch field definitions for {model}: {e}")
+            return FieldPlan({})
+        if not isinstance(fields_info, dict):
+            logger.debug(f"Unexpected field definitions for {model}")
+            return FieldPlan({})
+        return self._field_plans.get(model, fields_info)
+
+    def _process_record_dates(
+        self, record: Dict[str, Any], model: str, plan: FieldPlan
+    ) -> Dict[str, Any]:
+        """Process datetime fields in a record to ensure proper formatting.
 
+        Args:
+            record: Record to update in place
+            model: Model name
+            plan: Field plan for the model
+        """
+        self._process_records_dates([record], model, plan)
         return record
 
+    def _process_records_dates(
+        self, records: List[Dict[str, Any]], model: str, plan: FieldPlan
+    ) -> List[Dict[str, Any]]:
+        """Process datetime fields across a whole result set in one pass.
+
+        Args:
+            records: Records to update in place
+            model: Model name
+            plan: Field plan for the model
+        """
+        with tracer.child_span("process_dates", model=model, records=len(records)):
+            return normalize_datetimes(records, plan.datetime_fields)
+
     def _should_include_field_by_default(self, field_name: str, field_info: Dict[str, Any]) -> bool:
         """Determine if a field should be included in default response.
 
@@ -226,158 +233,33 @@ class OmniToolHandler:
         Returns:
             Importance score (higher = more important)
         """
-        # Tier 1: Essential fields (always included)
-        if field_name in {"id", "name", "display_name", "active"}:
-            return 1000
-
-        # Exclude system/technical fields by prefix
-        exclude_prefixes = ("_", "message_", "activity_", "website_message_")
-        if field_name.startswith(exclude_prefixes):
-            return 0
+        return score_field_importance(field_name, field_info)
 
-        # Exclude specific technical fields
-        exclude_fields = {
-            "write_date",
-            "create_date",
-            "write_uid",
-            "create_uid",
-            "__last_update",
-            "access_token",
-            "access_warning",
-            "access_url",
-        }
-        if field_name in exclude_fields:
-            return 0
-
-        score = 0
-
-        # Tier 2: Required fields are very important
-        if field_info.get("required"):
-            score += 500
-
-        # Tier 3: Field type importance
-        field_type = field_info.get("type", "")
-        type_scores = {
-            "char": 200,
-            "boolean": 180,
-            "selection": 170,
-            "integer": 160,
-            "float": 160,
-            "monetary": 140,
-            "date": 150,
-            "datetime": 150,
-            "many2one": 120,  # Relations useful but not primary
-            "text": 80,
-            "one2many": 40,
-            "many2many": 40,  # Heavy relations
-            "binary": 10,
-            "html": 10,
-            "image": 10,  # Heavy content
-        }
-        score += type_scores.get(field_type, 50)
-
-        # Tier 4: Storage and searchability bonuses
-        if field_info.get("store", True):
-            score += 80
-        if field_info.get("searchable", True):
-            score += 40
-
-        # Tier 5: Business-relevant field patterns (bonus)
-        business_patterns = [
-            "state",
-            "status",
-            "stage",
-            "priority",
-            "company",
-            "currency",
-            "amount",
-            "total",
-            "date",
-            "user",
-            "partner",
-            "email",
-            "phone",
-            "address",
-            "street",
-            "city",
-            "country",
-            "code",
-            "ref",
-            "number",
-        ]
-        if any(pattern in field_name.lower() for pattern in business_patterns):
-            score += 60
-
-        # Exclude expensive computed fields (non-stored)
-        if field_info.get("compute") and not field_info.get("store", True):
-            score = min(score, 30)  # Cap computed fields at low score
-
-        # Exclude large field types completely
-        if field_type in ("binary", "image", "html"):
-            return 0
-
-        # Exclude one2many and many2many fields (can be large)
-        if field_type in ("one2many", "many2many"):
-            return 0
-
-        return max(score, 0)
-
-    def _get_smart_default_fields(self, model: str) -> Optional[List[str]]:
+    def _get_smart_default_fields(self, model: str, plan: FieldPlan) -> Optional[List[str]]:
         """Get smart default fields for a model using field importance scoring.
 
         Args:
             model: The Omni model name
+            plan: Field plan for the model
 
         Returns:
             List of field names to include by default, or None if unable to determine
         """
-        try:
-            # Get all field definitions
-            fields_info = self.connection.fields_get(model)
-
-            # Score all fields by importance
-            field_scores = []
-            for field_name, field_info in fields_info.items():
-                score = self._score_field_importance(field_name, field_info)
-                if score > 0:  # Only include fields with positive scores
-                    field_scores.append((field_name, score))
-
-            # Sort by score (highest first)
-            field_scores.sort(key=lambda x: x[1], reverse=True)
-
-            # Select top N fields based on configuration
-            max_fields = self.config.max_smart_fields
-            selected_fields = [field_name for field_name, _ in field_scores[:max_fields]]
-
-            # Ensure essential fields are always included
-            essential_fields = ["id", "name", "display_name", "active"]
-            for field in essential_fields:
-                if field in fields_info and field not in selected_fields:
-                    selected_fields.append(field)
-
-            # Remove duplicates while preserving order
-            final_fields = []
-            seen = set()
-            for field in selected_fields:
-                if field not in seen:
-                    final_fields.append(field)
-                    seen.add(field)
-
-            # Ensure we have at least essential fields
-            if not final_fields:
-                final_fields = [f for f in essential_fields if f in fields_info]
-
-            logger.debug(
-                f"Smart default fields for {model}: {len(final_fields)} of {len(fields_info)} fields "
-                f"(max configured: {max_fields})"
-            )
-            return final_fields
-
-        except Exception as e:
-            logger.warning(f"Could not determine default fields for {model}: {e}")
+        if not plan.fields:
+            logger.warning(f"Could not determine default fields for {model}")
             # Return None to indicate we should get all fields
             return None
 
+        # Ranked once per field definitions; this only slices the ranking
+        max_fields = self.config.max_smart_fields
+        final_fields = plan.smart_default_fields(max_fields)
+
+        logger.debug(
+            f"Smart default fields for {model}: {len(final_fields)} of {len(plan.fields)} fields "
+            f"(max configured: {max_fields})"
+        )
+        return final_fields
+
     def _register_tools(self):
         """Register all tool handlers with FastMCP."""
 
@@ -389,6 +271,8 @@ class OmniToolHandler:
             limit: int = 10,
             offset: int = 0,
             order: Optional[str] = None,
+            count: str = "exact",
+            expand: Optional[Union[str, List[str]]] = None,
         ) -> Dict[str, Any]:
             """Search for records in an Omni model.
 
@@ -406,17 +290,106 @@ class OmniToolHandler:
                 limit: Maximum number of records to return
                 offset: Number of records to skip
                 order: Sort order (e.g., 'name asc')
+                count: How to compute 'total':
+                    - "exact" (default): Exact count, fetched concurrently with the records
+                    - "estimate": No count query; 'total' is exact on the last page and a
+                      lower bound otherwise ('total_estimated' is set to true)
+                    - "none": Skip counting; 'total' is null
+                expand: Relational fields to inline (e.g. ["partner_id", "order_line"]).
+                    Related records are read with one request per related model for the
+                    whole page; many2one values become the related record and x2many
+                    values become {"count": n, "records": [...]} (first 5 records)
 
             Returns:
                 Dictionary with 'records' list and 'total' count
             """
-            return await self._handle_search_tool(model, domain, fields, limit, offset, order)
+            return await self._handle_search_tool(
+                model, domain, fields, limit, offset, order, count, expand
+            )
+
+        @self.app.tool()
+        async def export_records(
+            model: str,
+            domain: Optional[Union[str, List[Union[str, List[Any]]]]] = None,
+            fields: Optional[Union[str, List[str]]] = None,
+            format: str = "ndjson",
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            after_id: int = 0,
+            max_records: int = MAX_EXPORT_RECORDS,
+        ) -> Dict[str, Any]:
+            """Export large result sets as NDJSON or CSV, beyond the search limit.
+
+            Records are read in id order in chunks of chunk_size, using keyset
+            pagination (id > last id) rather than offsets. Each call returns at
+            most max_records records; pass 'next_after_id' back as after_id to
+            continue until 'done' is true.
+
+            Args:
+                model: The Omni model name (e.g., 'sale.order.line')
+                domain: Omni domain filter (list or JSON string), None for all records
+                fields: Fields to export (list or JSON string); None for smart defaults,
+                    ["__all__"] for all fields. 'id' is always included
+                format: "ndjson" (one JSON object per line) or "csv"
+                chunk_size: Records fetched per request (max 2000)
+                after_id: Only export records with an id greater than this
+                max_records: Maximum records returned by this call (max 10000)
+
+            Returns:
+                Dictionary with 'data' (the serialized records), 'count',
+                'last_id', 'next_after_id' and 'done'
+            """
+            return await self._handle_export_tool(
+                model, domain, fields, format, chunk_size, after_id, max_records
+            )
+
+        @self.app.tool()
+        async def aggregate_records(
+            model: str,
+            groupby: Union[str, List[str]],
+            aggregates: Optional[Union[str, List[str]]] = None,
+            domain: Optional[Union[str, List[Union[str, List[Any]]]]] = None,
+            order: Optional[str] = None,
+            limit: Optional[int] = None,
+        ) -> Dict[str, Any]:
+            """Aggregate records server-side with Omni's read_group.
+
+            Only the grouped rows are transferred, which is far cheaper than
+            searching all records and grouping them client-side.
+
+            Args:
+                model: The Omni model name (e.g., 'sale.order.line')
+                groupby: Fields to group by; date fields accept a granularity
+                    (day, week, month, quarter, year), e.g. ["date_order:month"]
+                aggregates: Aggregate expressions as 'field:function' or
+                    'alias:function(field)', with function one of sum, avg, min,
+                    max, count, count_distinct, e.g. ["product_uom_qty:sum"]
+                domain: Omni domain filter (list or JSON string), None for all records
+                order: Sort order of the groups (e.g. 'product_uom_qty desc')
+                limit: Maximum number of groups to return
+
+            Examples:
+                # Top 10 products by quantity sold
+                aggregate_records("sale.order.line", ["product_id"],
+                                  ["product_uom_qty:sum", "price_subtotal:sum"],
+                                  order="product_uom_qty desc", limit=10)
+
+                # Monthly revenue
+                aggregate_records("sale.order", ["date_order:month"], ["amount_total:sum"])
+
+            Returns:
+                Dictionary with 'groups', one entry per group with the groupby
+                values, the aggregates and '__count' (records in the group)
+            """
+            return await self._handle_aggregate_tool(
+                model, groupby, aggregates, domain, order, limit
+            )
 
         @self.app.tool()
         async def get_record(
             model: str,
             record_id: int,
             fields: Optional[List[str]] = None,
+            expand: Optional[List[str]] = None,
         ) -> Dict[str, Any]:
             """Get a specific record by ID with smart field selection.
 
@@ -430,6 +403,9 @@ class OmniToolHandler:
                     - None (default): Returns smart selection of common fields
                     - ["field1", "field2", ...]: Returns only specified fields
                     - ["__all__"]: Returns ALL fields (warning: can be very large)
+                expand: Relational fields to inline (e.g. ["partner_id", "order_line"]);
+                    many2one values become the related record and x2many values become
+                    {"count": n, "records": [...]} (first 5 records)
 
             Workflow for field discovery:
             1. To see all available fields for a model, use the resource:
@@ -451,7 +427,7 @@ class OmniToolHandler:
                 Dictionary with record data containing requested fields.
                 When using smart defaults, includes _metadata with field statistics.
             """
-            return await self._handle_get_record_tool(model, record_id, fields)
+            return await self._handle_get_record_tool(model, record_id, fields, expand)
 
         @self.app.tool()
         async def list_models() -> Dict[str, List[Dict[str, Any]]]:
@@ -532,6 +508,57 @@ class OmniToolHandler:
             """
             return await self._handle_update_record_tool(model, record_id, values)
 
+        @self.app.tool()
+        async def create_records(
+            model: str,
+            records: List[Dict[str, Any]],
+        ) -> Dict[str, Any]:
+            """Create several records in an Omni model with a single request.
+
+            Args:
+                model: The Omni model name (e.g., 'res.partner')
+                records: Field values for each new record (max 500)
+
+            Returns:
+                Dictionary with 'created'/'failed' counts and per-item 'results',
+                each with 'index', 'success' and either 'record' or 'error'
+            """
+            return await self._handle_create_records_tool(model, records)
+
+        @self.app.tool()
+        async def update_records(
+            model: str,
+            updates: List[Dict[str, Any]],
+        ) -> Dict[str, Any]:
+            """Update several records; items with identical values share one write.
+
+            Args:
+                model: The Omni model name (e.g., 'res.partner')
+                updates: Items of the form {"id": 42, "values": {...}} (max 500)
+
+            Returns:
+                Dictionary with 'updated'/'failed' counts and per-item 'results',
+                each with 'index', 'id', 'success' and either 'record' or 'error'
+            """
+            return await self._handle_update_records_tool(model, updates)
+
+        @self.app.tool()
+        async def delete_records(
+            model: str,
+            record_ids: List[int],
+        ) -> Dict[str, Any]:
+            """Delete several records with a single request.
+
+            Args:
+                model: The Omni model name (e.g., 'res.partner')
+                record_ids: IDs of the records to delete (max 500)
+
+            Returns:
+                Dictionary with 'deleted'/'failed' counts and per-item 'results',
+                each with 'id', 'success' and either 'deleted_name' or 'error'
+            """
+            return await self._handle_delete_records_tool(model, record_ids)
+
         @self.app.tool()
         async def delete_record(
             model: str,
@@ -548,6 +575,192 @@ class OmniToolHandler:
             """
             return await self._handle_delete_record_tool(model, record_id)
 
+    def _parse_domain_argument(
+        self, domain: Optional[Union[str, List[Union[str, List[Any]]]]]
+    ) -> List[Union[str, List[Any]]]:
+        """Parse a tool domain argument given as a list or a JSON/Python string.
+
+        Raises:
+            ValidationError: If the domain cannot be parsed into a list
+        """
+        # Handle domain parameter - can be string or list
+        parsed_domain = []
+        if domain is not None:
+            if isinstance(domain, str):
+                # Parse string to list
+                try:
+                    # First try standard JSON parsing
+                    parsed_domain = json.loads(domain)
+                except json.JSONDecodeError:
+                    # If that fails, try converting single quotes to double quotes
+                    # This handles Python-style domain strings
+                    try:
+                        # Replace single quotes with double quotes for valid JSON
+                        # But be careful not to replace quotes inside string values
+                        json_domain = domain.replace("'", '"')
+                        # Also need to ensure Python True/False are lowercase for JSON
+                        json_domain = json_domain.replace("True", "true").replace("False", "false")
+                        parsed_domain = json.loads(json_domain)
+                    except json.JSONDecodeError as e:
+                        # If both attempts fail, try evaluating as Python literal
+                        try:
+                            import ast
+
+                            parsed_domain = ast.literal_eval(domain)
+                        except (ValueError, SyntaxError):
+                            raise ValidationError(
+                                f"Invalid domain parameter. Expected JSON array or Python list, got: {domain[:100]}..."
+                            ) from e
+
+                if not isinstance(parsed_domain, list):
+                    raise ValidationError(
+                        f"Domain must be a list, got {type(parsed_domain).__name__}"
+                    )
+                logger.debug(f"Parsed domain from string: {parsed_domain}")
+            else:
+                # Already a list
+                parsed_domain = domain
+        return parsed_domain
+
+    def _parse_fields_argument(
+        self, fields: Optional[Union[str, List[str]]]
+    ) -> Optional[List[str]]:
+        """Parse a tool fields argument given as a list or a JSON/Python string.
+
+        Raises:
+            ValidationError: If the fields cannot be parsed into a list
+        """
+        # Handle fields parameter - can be string or list
+        parsed_fields = fields
+        if fields is not None and isinstance(fields, str):
+            # Parse string to list
+            try:
+                parsed_fields = json.loads(fields)
+                if not isinstance(parsed_fields, list):
+                    raise ValidationError(
+                        f"Fields must be a list, got {type(parsed_fields).__name__}"
+                    )
+            except json.JSONDecodeError:
+                # Try Python literal eval as fallback
+                try:
+                    import ast
+
+                    parsed_fields = ast.literal_eval(fields)
+                    if not isinstance(parsed_fields, list):
+                        raise ValidationError(
+                            f"Fields must be a list, got {type(parsed_fields).__name__}"
+                        )
+                except (ValueError, SyntaxError) as e:
+                    raise ValidationError(
+                        f"Invalid fields parameter. Expected JSON array or Python list, got: {fields[:100]}..."
+                    ) from e
+        return parsed_fields
+
+    async def _resolve_expand(
+        self, model: str, expand: Optional[List[str]]
+    ) -> Dict[str, Tuple[str, str]]:
+        """Resolve fields to expand to their related model and field type.
+
+        Raises:
+            ValidationError: If a field is not a relational field of the model
+            AccessControlError: If a related model is not readable
+        """
+        if not expand:
+            return {}
+
+        fields_info = await self.connection.afields_get(model)
+        relations = {}
+        for field_name in expand:
+            field_info = fields_info.get(field_name) if isinstance(field_name, str) else None
+            if (
+                not field_info
+                or field_info.get("type") not in RELATIONAL_FIELD_TYPES
+                or not field_info.get("relation")
+            ):
+                raise ValidationError(
+                    f"Cannot expand '{field_name}': not a relational field of {model}"
+                )
+            relations[field_name] = (field_info["relation"], field_info["type"])
+
+        # Check every related model in one executor call; each check may block on REST
+        related_models = list(dict.fromkeys(relation for relation, _ in relations.values()))
+
+        def check_related_access() -> None:
+            for relation in related_models:
+                self.access_controller.validate_model_access(relation, "read")
+
+        with tracer.child_span("access_check", models=len(related_models), operation="read"):
+            await self.connection.run_async(check_related_access)
+        return relations
+
+    def _with_expand_fields(
+        self, fields: Optional[List[str]], relations: Dict[str, Tuple[str, str]]
+    ) -> Optional[List[str]]:
+        """Make sure expanded fields are part of the main read."""
+        if fields is None or not relations:
+            return fields
+        return fields + [field_name for field_name in relations if field_name not in fields]
+
+    async def _read_related(self, relation: str, ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Read related records of one model in a single call, keyed by ID."""
+        plan = await self._load_field_plan(relation)
+        fields = self._get_smart_default_fields(relation, plan) or ["id", "display_name"]
+        records = await self.connection.aread(relation, ids, fields)
+        self._process_records_dates(records, relation, plan)
+        return {record["id"]: record for record in records}
+
+    async def _expand_relations(
+        self, records: List[Dict[str, Any]], relations: Dict[str, Tuple[str, str]]
+    ) -> None:
+        """Inline related records for the requested relational fields.
+
+        Related IDs are collected across all records first, then read with
+        one request per related model (served from the record cache where
+        possible). x2many fields are limited to the first
+        DEFAULT_MAX_RELATED_ITEMS records.
+        """
+        if not relations or not records:
+            return
+
+        # Collect related IDs per model across the whole page, in first-seen order
+        ids_by_model: Dict[str, Dict[int, None]] = {}
+        for record in records:
+            for field_name, (relation, field_type) in relations.items():
+                value = record.get(field_name)
+                if not value:
+                    continue
+                if field_type == "many2one":
+                    ids = [value[0]] if isinstance(value, (list, tuple)) else [value]
+                else:
+                    ids = value[:DEFAULT_MAX_RELATED_ITEMS]
+                ids_by_model.setdefault(relation, {}).update(dict.fromkeys(ids))
+
+        relation_models = list(ids_by_model)
+        results = await asyncio.gather(
+            *(
+                self._read_related(relation, list(ids_by_model[relation]))
+                for relation in relation_models
+            )
+        )
+        related = dict(zip(relation_models, results, strict=True))
+
+        for record in records:
+            for field_name, (relation, field_type) in relations.items():
+                value = record.get(field_name)
+                by_id = related.get(relation, {})
+                if field_type == "many2one":
+                    if value:
+                        related_id = value[0] if isinstance(value, (list, tuple)) else value
+                        record[field_name] = by_id.get(related_id, {"id": related_id})
+                elif isinstance(value, list):
+                    record[field_name] = {
+                        "count": len(value),
+                        "records": [
+                            by_id.get(related_id, {"id": related_id})
+                            for related_id in value[:DEFAULT_MAX_RELATED_ITEMS]
+                        ],
+                    }
+
     async def _handle_search_tool(
         self,
         model: str,
@@ -556,99 +769,44 @@ class OmniToolHandler:
         limit: int,
         offset: int,
         order: Optional[str],
+        count: str = "exact",
+        expand: Optional[Union[str, List[str]]] = None,
     ) -> Dict[str, Any]:
-        """Handle search tool request."""
+        """Handle search tool request.
+
+        Records are fetched with a single search_read call. The total count is
+        fetched concurrently ("exact"), derived from the page when possible
+        ("estimate"), or skipped ("none").
+        """
         try:
             with perf_logger.track_operation("tool_search", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "read")
+                await self._check_access(model, "read")
 
                 # Ensure we're connected
                 if not self.connection.is_authenticated:
                     raise ValidationError("Not authenticated with Omni")
 
-                # Handle domain parameter - can be string or list
-                parsed_domain = []
-                if domain is not None:
-                    if isinstance(domain, str):
-                        # Parse string to list
-                        try:
-                            # First try standard JSON parsing
-                            parsed_domain = json.loads(domain)
-                        except json.JSONDecodeError:
-                            # If that fails, try converting single quotes to double quotes
-                            # This handles Python-style domain strings
-                            try:
-                                # Replace single quotes with double quotes for valid JSON
-                                # But be careful not to replace quotes inside string values
-                                json_domain = domain.replace("'", '"')
-                                # Also need to ensure Python True/False are lowercase for JSON
-                                json_domain = json_domain.replace("True", "true").replace(
-                                    "False", "false"
-                                )
-                                parsed_domain = json.loads(json_domain)
-                            except json.JSONDecodeError as e:
-                                # If both attempts fail, try evaluating as Python literal
-                                try:
-                                    import ast
-
-                                    parsed_domain = ast.literal_eval(domain)
-                                except (ValueError, SyntaxError):
-                                    raise ValidationError(
-                                        f"Invalid domain parameter. Expected JSON array or Python list, got: {domain[:100]}..."
-                                    ) from e
-
-                        if not isinstance(parsed_domain, list):
-                            raise ValidationError(
-                                f"Domain must be a list, got {type(parsed_domain).__name__}"
-                            )
-                        logger.debug(f"Parsed domain from string: {parsed_domain}")
-                    else:
-                        # Already a list
-                        parsed_domain = domain
-
-                # Handle fields parameter - can be string or list
-                parsed_fields = fields
-                if fields is not None and isinstance(fields, str):
-                    # Parse string to list
-                    try:
-                        parsed_fields = json.loads(fields)
-                        if not isinstance(parsed_fields, list):
-                            raise ValidationError(
-                                f"Fields must be a list, got {type(parsed_fields).__name__}"
-                            )
-                    except json.JSONDecodeError:
-                        # Try Python literal eval as fallback
-                        try:
-                            import ast
+                parsed_domain = self._parse_domain_argument(domain)
+                parsed_fields = self._parse_fields_argument(fields)
+                parsed_expand = self._parse_fields_argument(expand)
 
-                            parsed_fields = ast.literal_eval(fields)
-                            if not isinstance(parsed_fields, list):
-                                raise ValidationError(
-                                    f"Fields must be a list, got {type(parsed_fields).__name__}"
-                                )
-                        except (ValueError, SyntaxError) as e:
-                            raise ValidationError(
-                                f"Invalid fields parameter. Expected JSON array or Python list, got: {fields[:100]}..."
-                            ) from e
+                if count not in COUNT_MODES:
+                    raise ValidationError(
+                        f"Invalid count mode '{count}'. Must be one of: {', '.join(COUNT_MODES)}"
+                    )
 
                 # Set defaults
                 if limit <= 0 or limit > self.config.max_limit:
                     limit = self.config.default_limit
 
-                # Get total count
-                total_count = self.connection.search_count(model, parsed_domain)
-
-                # Search for records
-                record_ids = self.connection.search(
-                    model, parsed_domain, limit=limit, offset=offset, order=order
-                )
+                plan = await self._load_field_plan(model)
 
                 # Determine which fields to fetch
                 fields_to_fetch = parsed_fields
                 if parsed_fields is None:
                     # Use smart field selection to avoid serialization issues
-                    fields_to_fetch = self._get_smart_default_fields(model)
+                    fields_to_fetch = self._get_smart_default_fields(model, plan)
                     logger.debug(
                         f"Using smart defaults for {model} search: {len(fields_to_fetch) if fields_to_fetch else 'all'} fields"
                     )
@@ -657,19 +815,160 @@ class OmniToolHandler:
                     fields_to_fetch = None  # Omni interprets None as all fields
                     logger.debug(f"Fetching all fields for {model} search")
 
-                # Read records
-                records = []
-                if record_ids:
-                    records = self.connection.read(model, record_ids, fields_to_fetch)
-                    # Process datetime fields in each record
-                    records = [self._process_record_dates(record, model) for record in records]
+                relations = await self._resolve_expand(model, parsed_expand)
+                fields_to_fetch = self._with_expand_fields(fields_to_fetch, relations)
+
+                # Search and read records in one round-trip
+                total_estimated = False
+                if count == "exact":
+                    records, total_count = await asyncio.gather(
+                        self.connection.asearch_read(
+                            model,
+                            parsed_domain,
+                            fields_to_fetch,
+                            limit=limit,
+                            offset=offset,
+                            order=order,
+                        ),
+                        self.connection.asearch_count(model, parsed_domain),
+                    )
+                elif count == "estimate":
+                    # Fetch one extra row to learn whether another page exists
+                    records = await self.connection.asearch_read(
+                        model,
+                        parsed_domain,
+                        fields_to_fetch,
+                        limit=limit + 1,
+                        offset=offset,
+                        order=order,
+                    )
+                    if len(records) > limit:
+                        records = records[:limit]
+                        total_count = offset + limit + 1
+                        total_estimated = True
+                    elif records or offset == 0:
+                        total_count = offset + len(records)
+                    else:
+                        # Offset is past the last record, so the page tells us nothing
+                        total_count = await self.connection.asearch_count(model, parsed_domain)
+                else:
+                    records = await self.connection.asearch_read(
+                        model,
+                        parsed_domain,
+                        fields_to_fetch,
+                        limit=limit,
+                        offset=offset,
+                        order=order,
+                    )
+                    total_count = None
+
+                # Process datetime fields across the whole result set
+                records = self._process_records_dates(records, model, plan)
+                await self._expand_relations(records, relations)
+
+                with tracer.child_span("format", records=len(records)):
+                    result = {
+                        "records": records,
+                        "total": total_count,
+                        "limit": limit,
+                        "offset": offset,
+                        "model": model,
+                    }
+                    if total_estimated:
+                        result["total_estimated"] = True
+                return result
+
+        except AccessControlError as e:
+            raise ToolError(f"Access denied: {e}") from e
+        except OmniConnectionError as e:
+            raise ToolError(f"Connection error: {e}") from e
+        except Exception as e:
+            logger.error(f"Error in search_records tool: {e}")
+            sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
+            raise ToolError(f"Search failed: {sanitized_msg}") from e
+
+    async def _handle_export_tool(
+        self,
+        model: str,
+        domain: Optional[Union[str, List[Union[str, List[Any]]]]],
+        fields: Optional[Union[str, List[str]]],
+        format: str = "ndjson",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        after_id: int = 0,
+        max_records: int = MAX_EXPORT_RECORDS,
+    ) -> Dict[str, Any]:
+        """Handle export tool request.
+
+        Chunks are serialized as they arrive while the next chunk is being
+        fetched, so only the serialized output and two chunks of records are
+        held in memory.
+        """
+        try:
+            with perf_logger.track_operation("tool_export", model=model):
+                # Check model access
+                await self._check_access(model, "read")
+
+                # Ensure we're connected
+                if not self.connection.is_authenticated:
+                    raise ValidationError("Not authenticated with Omni")
+
+                parsed_domain = self._parse_domain_argument(domain)
+                parsed_fields = self._parse_fields_argument(fields)
+
+                if format not in EXPORT_FORMATS:
+                    raise ValidationError(
+                        f"Invalid export format '{format}'. "
+                        f"Must be one of: {', '.join(EXPORT_FORMATS)}"
+                    )
+                if after_id < 0:
+                    raise ValidationError("after_id must not be negative")
+
+                # Set defaults
+                if chunk_size <= 0 or chunk_size > MAX_CHUNK_SIZE:
+                    chunk_size = DEFAULT_CHUNK_SIZE
+                if max_records <= 0 or max_records > MAX_EXPORT_RECORDS:
+                    max_records = MAX_EXPORT_RECORDS
+
+                plan = await self._load_field_plan(model)
+
+                # Determine which fields to fetch
+                fields_to_fetch = parsed_fields
+                if parsed_fields is None:
+                    fields_to_fetch = self._get_smart_default_fields(model, plan)
+                elif parsed_fields == ["__all__"]:
+                    fields_to_fetch = None
+
+                writer = ExportWriter(format, fields_to_fetch)
+                parts = []
+                count = 0
+                last_id = after_id
+                async for records in iter_record_chunks(
+                    self.connection,
+                    model,
+                    parsed_domain,
+                    fields_to_fetch,
+                    chunk_size=chunk_size,
+                    after_id=after_id,
+                    max_records=max_records,
+                ):
+                    self._process_records_dates(records, model, plan)
+                    parts.append(writer.write(records))
+                    count += len(records)
+                    last_id = records[-1]["id"]
+
+                # Stopping short of the budget means the domain is exhausted
+                done = count < max_records
+                logger.debug(f"Exported {count} {model} records as {format} (done={done})")
 
                 return {
-                    "records": records,
-                    "total": total_count,
-                    "limit": limit,
-                    "offset": offset,
                     "model": model,
+                    "format": format,
+                    "content_type": writer.media_type,
+                    "data": "".join(parts),
+                    "count": count,
+                    "last_id": last_id,
+                    "next_after_id": None if done else last_id,
+                    "done": done,
                 }
 
         except AccessControlError as e:
@@ -677,26 +976,142 @@ class OmniToolHandler:
         except OmniConnectionError as e:
             raise ToolError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Error in search_records tool: {e}")
+            logger.error(f"Error in export_records tool: {e}")
             sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
-            raise ToolError(f"Search failed: {sanitized_msg}") from e
+            raise ToolError(f"Export failed: {sanitized_msg}") from e
+
+    def _parse_groupby_argument(self, groupby: Union[str, List[str]]) -> List[str]:
+        """Parse and validate read_group groupby specifications.
+
+        Raises:
+            ValidationError: If a groupby is malformed or uses an unknown granularity
+        """
+        if isinstance(groupby, str) and not groupby.lstrip().startswith("["):
+            # A single groupby given as a plain string
+            groupby = [groupby]
+        parsed = self._parse_fields_argument(groupby)
+        if not parsed:
+            raise ValidationError("At least one groupby field is required")
+
+        for spec in parsed:
+            match = GROUPBY_PATTERN.match(spec) if isinstance(spec, str) else None
+            if not match:
+                raise ValidationError(
+                    f"Invalid groupby '{spec}'. Expected 'field' or 'field:granularity'"
+                )
+            if match.group(2) and match.group(2) not in DATE_GRANULARITIES:
+                raise ValidationError(
+                    f"Invalid date granularity '{match.group(2)}'. "
+                    f"Must be one of: {', '.join(DATE_GRANULARITIES)}"
+                )
+        return parsed
+
+    def _parse_aggregates_argument(self, aggregates: Optional[Union[str, List[str]]]) -> List[str]:
+        """Parse and validate read_group aggregate expressions.
+
+        Raises:
+            ValidationError: If an expression is malformed or uses an unknown function
+        """
+        if isinstance(aggregates, str) and not aggregates.lstrip().startswith("["):
+            aggregates = [aggregates]
+        parsed = self._parse_fields_argument(aggregates) or []
+
+        for spec in parsed:
+            match = AGGREGATE_PATTERN.match(spec) if isinstance(spec, str) else None
+            if not match:
+                raise ValidationError(
+                    f"Invalid aggregate '{spec}'. Expected 'field:function' or 'alias:function(field)'"
+                )
+            if match.group(2) not in AGGREGATE_FUNCTIONS:
+                raise ValidationError(
+                    f"Invalid aggregate function '{match.group(2)}'. "
+                    f"Must be one of: {', '.join(AGGREGATE_FUNCTIONS)}"
+                )
+        return parsed
+
+    async def _handle_aggregate_tool(
+        self,
+        model: str,
+        groupby: Union[str, List[str]],
+        aggregates: Optional[Union[str, List[str]]],
+        domain: Optional[Union[str, List[Union[str, List[Any]]]]],
+        order: Optional[str],
+        limit: Optional[int],
+    ) -> Dict[str, Any]:
+        """Handle aggregate tool request.
+
+        Groups are computed by a single non-lazy read_group call, so every
+        groupby level is returned at once with a '__count' per group.
+        """
+        try:
+            with perf_logger.track_operation("tool_aggregate", model=model):
+                # Check model access
+                await self._check_access(model, "read")
+
+                # Ensure we're connected
+                if not self.connection.is_authenticated:
+                    raise ValidationError("Not authenticated with Omni")
+
+                parsed_domain = self._parse_domain_argument(domain)
+                parsed_groupby = self._parse_groupby_argument(groupby)
+                parsed_aggregates = self._parse_aggregates_argument(aggregates)
+
+                # Set defaults
+                if limit is None or limit <= 0 or limit > self.config.max_limit:
+                    limit = self.config.max_limit
+
+                groups = await self.connection.aread_group(
+                    model,
+                    parsed_domain,
+                    parsed_aggregates,
+                    parsed_groupby,
+                    limit=limit,
+                    orderby=order,
+                    lazy=False,
+                )
+
+                # Drop the per-group domain/context read_group adds for drill-down
+                for group in groups:
+                    group.pop("__domain", None)
+                    group.pop("__context", None)
+
+                return {
+                    "model": model,
+                    "groupby": parsed_groupby,
+                    "aggregates": parsed_aggregates,
+                    "groups": groups,
+                    "count": len(groups),
+                    "limit": limit,
+                }
+
+        except AccessControlError as e:
+            raise ToolError(f"Access denied: {e}") from e
+        except OmniConnectionError as e:
+            raise ToolError(f"Connection error: {e}") from e
+        except Exception as e:
+            logger.error(f"Error in aggregate_records tool: {e}")
+            sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
+            raise ToolError(f"Aggregation failed: {sanitized_msg}") from e
 
     async def _handle_get_record_tool(
         self,
         model: str,
         record_id: int,
         fields: Optional[List[str]],
+        expand: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Handle get record tool request."""
         try:
             with perf_logger.track_operation("tool_get_record", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "read")
+                await self._check_access(model, "read")
 
                 # Ensure we're connected
                 if not self.connection.is_authenticated:
                     raise ValidationError("Not authenticated with Omni")
 
+                plan = await self._load_field_plan(model)
+
                 # Determine which fields to fetch
                 fields_to_fetch = fields
                 use_smart_defaults = False
@@ -704,7 +1119,7 @@ class OmniToolHandler:
 
                 if fields is None:
                     # Use smart field selection
-                    fields_to_fetch = self._get_smart_default_fields(model)
+                    fields_to_fetch = self._get_smart_default_fields(model, plan)
                     use_smart_defaults = True
                     logger.debug(
                         f"Using smart defaults for {model}: {len(fields_to_fetch) if fields_to_fetch else 'all'} fields"
@@ -717,20 +1132,24 @@ class OmniToolHandler:
                     # Specific fields requested
                     logger.debug(f"Fetching specific fields for {model}: {fields}")
 
+                relations = await self._resolve_expand(model, self._parse_fields_argument(expand))
+                fields_to_fetch = self._with_expand_fields(fields_to_fetch, relations)
+
                 # Read the record
-                records = self.connection.read(model, [record_id], fields_to_fetch)
+                records = await self.connection.aread(model, [record_id], fields_to_fetch)
 
                 if not records:
                     raise ToolError(f"Record not found: {model} with ID {record_id}")
 
                 # Process datetime fields in the record
-                record = self._process_record_dates(records[0], model)
+                record = self._process_record_dates(records[0], model, plan)
+                await self._expand_relations([record], relations)
 
                 # Add metadata when using smart defaults
                 if use_smart_defaults:
                     try:
                         # Get total field count for metadata
-                        all_fields_info = self.connection.fields_get(model)
+                        all_fields_info = await self.connection.afields_get(model)
                         total_fields = len(all_fields_info)
                     except Exception:
                         pass  # Don't fail if we can't get field count
@@ -767,41 +1186,32 @@ class OmniToolHandler:
         """Handle list models tool request with permissions."""
         try:
             with perf_logger.track_operation("tool_list_models"):
-                # Get basic model list
-                models = self.access_controller.get_enabled_models()
-
-                # Enrich with permissions for each model
+                # The access controller makes blocking HTTP calls; run them
+                # on the connection's executor instead of the event loop.
+                models = await self.connection.run_async(self.access_controller.get_enabled_models)
+
+                # Enrich with permissions, loaded for all models in one batch
+                permissions_by_model = await self.connection.run_async(
+                    self.access_controller.get_permissions,
+                    [model_info["model"] for model_info in models],
+                )
                 enriched_models = []
                 for model_info in models:
                     model_name = model_info["model"]
-                    try:
-                        # Get permissions for this model
-                        permissions = self.access_controller.get_model_permissions(model_name)
-                        enriched_model = {
-                            "model": model_name,
-                            "name": model_info["name"],
-                            "operations": {
-                                "read": permissions.can_read,
-                                "write": permissions.can_write,
-                                "create": permissions.can_create,
-                                "unlink": permissions.can_unlink,
-                            },
-                        }
-                        enriched_models.append(enriched_model)
-                    except Exception as e:
-                        # If we can't get permissions for a model, include it with all operations false
-                        logger.warning(f"Failed to get permissions for {model_name}: {e}")
-                        enriched_model = {
+                    permissions = permissions_by_model.get(model_name)
+                    # Models whose permissions could not be loaded get all operations false
+                    enriched_models.append(
+                        {
                             "model": model_name,
                             "name": model_info["name"],
                             "operations": {
-                                "read": False,
-                                "write": False,
-                                "create": False,
-                                "unlink": False,
+                                "read": bool(permissions and permissions.can_read),
+                                "write": bool(permissions and permissions.can_write),
+                                "create": bool(permissions and permissions.can_create),
+                                "unlink": bool(permissions and permissions.can_unlink),
                             },
                         }
-                        enriched_models.append(enriched_model)
+                    )
 
                 # Return proper JSON structure with enriched models array
                 return {"models": enriched_models}
@@ -816,8 +1226,11 @@ class OmniToolHandler:
     async def _handle_list_resource_templates_tool(self) -> Dict[str, Any]:
         """Handle list resource templates tool request."""
         try:
-            # Get list of enabled models that can be used with resources
-            enabled_models = self.access_controller.get_enabled_models()
+            # Get list of enabled models that can be used with resources; the
+            # lookup may block on REST, so it runs on the executor
+            enabled_models = await self.connection.run_async(
+                self.access_controller.get_enabled_models
+            )
             model_names = [m["model"] for m in enabled_models if m.get("read", True)]
 
             # Define the resource templates
@@ -849,6 +1262,13 @@ class OmniToolHandler:
                     "example": "omni://res.partner/count",
                     "note": "Query parameters are not supported. Use search_records tool for filtered counts.",
                 },
+                {
+                    "uri_template": "omni://{model}/export",
+                    "description": "Export matching records as NDJSON, read in id-ordered chunks",
+                    "parameters": {"model": "Omni model name"},
+                    "example": "omni://sale.order.line/export",
+                    "note": "Returns at most 10000 records. Use export_records tool for filters, CSV and continuation.",
+                },
                 {
                     "uri_template": "omni://{model}/fields",
                     "description": "Get field definitions for a model",
@@ -879,7 +1299,7 @@ class OmniToolHandler:
         try:
             with perf_logger.track_operation("tool_create_record", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "create")
+                await self._check_access(model, "create")
 
                 # Ensure we're connected
                 if not self.connection.is_authenticated:
@@ -890,19 +1310,21 @@ class OmniToolHandler:
                     raise ValidationError("No values provided for record creation")
 
                 # Create the record
-                record_id = self.connection.create(model, values)
+                record_id = await self.connection.acreate(model, values)
 
                 # Return only essential fields to minimize context usage
                 # Users can use get_record if they need more fields
                 essential_fields = ["id", "name", "display_name"]
 
                 # Read only the essential fields
-                records = self.connection.read(model, [record_id], essential_fields)
+                records = await self.connection.aread(model, [record_id], essential_fields)
                 if not records:
                     raise ToolError(f"Failed to read created record: {model} with ID {record_id}")
 
+                plan = await self._load_field_plan(model)
+
                 # Process dates in the minimal record
-                record = self._process_record_dates(records[0], model)
+                record = self._process_record_dates(records[0], model, plan)
 
                 # Generate direct URL to the record in Omni
                 base_url = self.config.url.rstrip("/")
@@ -937,7 +1359,7 @@ class OmniToolHandler:
         try:
             with perf_logger.track_operation("tool_update_record", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "write")
+                await self._check_access(model, "write")
 
                 # Ensure we're connected
                 if not self.connection.is_authenticated:
@@ -948,24 +1370,26 @@ class OmniToolHandler:
                     raise ValidationError("No values provided for record update")
 
                 # Check if record exists (only fetch ID to verify existence)
-                existing = self.connection.read(model, [record_id], ["id"])
+                existing = await self.connection.aread(model, [record_id], ["id"])
                 if not existing:
                     raise NotFoundError(f"Record not found: {model} with ID {record_id}")
 
                 # Update the record
-                success = self.connection.write(model, [record_id], values)
+                success = await self.connection.awrite(model, [record_id], values)
 
                 # Return only essential fields to minimize context usage
                 # Users can use get_record if they need more fields
                 essential_fields = ["id", "name", "display_name"]
 
                 # Read only the essential fields
-                records = self.connection.read(model, [record_id], essential_fields)
+                records = await self.connection.aread(model, [record_id], essential_fields)
                 if not records:
                     raise ToolError(f"Failed to read updated record: {model} with ID {record_id}")
 
+                plan = await self._load_field_plan(model)
+
                 # Process dates in the minimal record
-                record = self._process_record_dates(records[0], model)
+                record = self._process_record_dates(records[0], model, plan)
 
                 # Generate direct URL to the record in Omni
                 base_url = self.config.url.rstrip("/")
@@ -1001,14 +1425,14 @@ class OmniToolHandler:
         try:
             with perf_logger.track_operation("tool_delete_record", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "unlink")
+                await self._check_access(model, "unlink")
 
                 # Ensure we're connected
                 if not self.connection.is_authenticated:
                     raise ValidationError("Not authenticated with Omni")
 
                 # Check if record exists
-                existing = self.connection.read(model, [record_id])
+                existing = await self.connection.aread(model, [record_id])
                 if not existing:
                     raise NotFoundError(f"Record not found: {model} with ID {record_id}")
 
@@ -1018,7 +1442,7 @@ class OmniToolHandler:
                 )
 
                 # Delete the record
-                success = self.connection.unlink(model, [record_id])
+                success = await self.connection.aunlink(model, [record_id])
 
                 return {
                     "success": success,
@@ -1041,6 +1465,361 @@ class OmniToolHandler:
             sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
             raise ToolError(f"Failed to delete record: {sanitized_msg}") from e
 
+    def _validate_batch(self, items: Any, name: str) -> None:
+        """Validate the size and shape of a batch tool argument.
+
+        Raises:
+            ValidationError: If the batch is empty, too large or not a list
+        """
+        if not isinstance(items, list) or not items:
+            raise ValidationError(f"No {name} provided")
+        if len(items) > MAX_BATCH_SIZE:
+            raise ValidationError(f"Too many {name}: {len(items)} (maximum {MAX_BATCH_SIZE})")
+
+    @staticmethod
+    def _is_server_fault(error: OmniConnectionError) -> bool:
+        """Check whether a call was rejected by the server (an XML-RPC fault).
+
+        A fault means the server rolled the call back, so its items can be
+        retried one by one. After a timeout or transport error the call may
+        still have been applied, and retrying could duplicate its effects.
+        """
+        return isinstance(error.__cause__, xmlrpc.client.Fault)
+
+    def _batch_error(self, error: Exception) -> str:
+        """Format a per-item error for batch results."""
+        if isinstance(error, (ValidationError, NotFoundError)):
+            return str(error)
+        return ErrorSanitizer.sanitize_message(str(error))
+
+    async def _read_batch_results(self, model: str, record_ids: List[int]) -> Dict[int, Dict]:
+        """Read the essential fields of written records in one call, keyed by ID."""
+        if not record_ids:
+            return {}
+        records = await self.connection.aread(model, record_ids, ["id", "name", "display_name"])
+        plan = await self._load_field_plan(model)
+        self._process_records_dates(records, model, plan)
+        return {record["id"]: record for record in records}
+
+    async def _handle_create_records_tool(
+        self,
+        model: str,
+        records: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Handle batch create tool request.
+
+        All valid items are sent in one create call. If the server rejects
+        that call, the items are retried one by one so each gets its own
+        result; transport errors are raised instead, as the batch may already
+        have been created.
+        """
+        try:
+            with perf_logger.track_operation("tool_create_records", model=model):
+                # Check model access
+                await self._check_access(model, "create")
+
+                # Ensure we're connected
+                if not self.connection.is_authenticated:
+                    raise ValidationError("Not authenticated with Omni")
+
+                self._validate_batch(records, "records")
+
+                results: List[Dict[str, Any]] = [{} for _ in records]
+                valid = []
+                for index, values in enumerate(records):
+                    if not isinstance(values, dict) or not values:
+                        results[index] = {
+                            "index": index,
+                            "success": False,
+                            "error": "No values provided for record creation",
+                        }
+                    else:
+                        valid.append(index)
+
+                created: Dict[int, int] = {}
+                if valid:
+                    try:
+                        record_ids = await self.connection.acreate_many(
+                            model, [records[i] for i in valid]
+                        )
+                        created = dict(zip(valid, record_ids, strict=True))
+                    except OmniConnectionError as e:
+                        if not self._is_server_fault(e):
+                            raise
+                        # The whole batch was rolled back; isolate the failing items
+                        logger.warning(f"Batch create of {model} failed, retrying per item: {e}")
+                        for index in valid:
+                            try:
+                                created[index] = await self.connection.acreate(
+                                    model, records[index]
+                                )
+                            except OmniConnectionError as item_error:
+                                results[index] = {
+                                    "index": index,
+                                    "success": False,
+                                    "error": self._batch_error(item_error),
+                                }
+
+                read_back = await self._read_batch_results(model, list(created.values()))
+                for index, record_id in created.items():
+                    results[index] = {
+                        "index": index,
+                        "success": True,
+                        "id": record_id,
+                        "record": read_back.get(record_id, {"id": record_id}),
+                    }
+
+                failed = len(records) - len(created)
+                return {
+                    "success": failed == 0,
+                    "created": len(created),
+                    "failed": failed,
+                    "results": results,
+                    "message": f"Created {len(created)} of {len(records)} {model} records",
+                }
+
+        except AccessControlError as e:
+            raise ToolError(f"Access denied: {e}") from e
+        except OmniConnectionError as e:
+            raise ToolError(f"Connection error: {e}") from e
+        except Exception as e:
+            logger.error(f"Error in create_records tool: {e}")
+            sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
+            raise ToolError(f"Failed to create records: {sanitized_msg}") from e
+
+    async def _handle_update_records_tool(
+        self,
+        model: str,
+        updates: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Handle batch update tool request.
+
+        Existence of all IDs is checked with one search, items with identical
+        values are grouped into one write, and all updated records are read
+        back with one read. A record updated by several items is written in
+        item order (one write round per occurrence). If the server rejects a
+        grouped write, its items are retried one by one; after a transport
+        error every item of the group reports that error.
+        """
+        try:
+            with perf_logger.track_operation("tool_update_records", model=model):
+                # Check model access
+                await self._check_access(model, "write")
+
+                # Ensure we're connected
+                if not self.connection.is_authenticated:
+                    raise ValidationError("Not authenticated with Omni")
+
+                self._validate_batch(updates, "updates")
+
+                results: List[Dict[str, Any]] = [{} for _ in updates]
+                valid = []
+                for index, item in enumerate(updates):
+                    record_id = item.get("id") if isinstance(item, dict) else None
+                    values = item.get("values") if isinstance(item, dict) else None
+                    if not isinstance(record_id, int) or isinstance(record_id, bool):
+                        error = "Each update requires an integer 'id'"
+                    elif not isinstance(values, dict) or not values:
+                        error = "No values provided for record update"
+                    else:
+                        valid.append(index)
+                        continue
+                    results[index] = {
+                        "index": index,
+                        "id": record_id,
+                        "success": False,
+                        "error": error,
+                    }
+
+                # One existence check for every ID in the batch
+                requested_ids = sorted({updates[i]["id"] for i in valid})
+                existing_ids = set()
+                if requested_ids:
+                    existing_ids = set(
+                        await self.connection.asearch(model, [["id", "in", requested_ids]])
+                    )
+
+                # Group by (round, values): the n-th update of a record goes in round n
+                groups: Dict[Tuple[int, str], List[int]] = {}
+                occurrences: Dict[int, int] = {}
+                for index in valid:
+                    record_id = updates[index]["id"]
+                    if record_id not in existing_ids:
+                        results[index] = {
+                            "index": index,
+                            "id": record_id,
+                            "success": False,
+                            "error": f"Record not found: {model} with ID {record_id}",
+                        }
+                        continue
+                    write_round = occurrences.get(record_id, 0)
+                    occurrences[record_id] = write_round + 1
+                    key = json.dumps(updates[index]["values"], sort_keys=True, default=str)
+                    groups.setdefault((write_round, key), []).append(index)
+
+                updated = []
+                # Rounds run in order; dict order keeps groups in first-seen order
+                for _group, indexes in sorted(groups.items(), key=lambda group: group[0][0]):
+                    values = updates[indexes[0]]["values"]
+                    ids = [updates[i]["id"] for i in indexes]
+                    try:
+                        await self.connection.awrite(model, ids, values)
+                        updated.extend(indexes)
+                    except OmniConnectionError as e:
+                        if len(indexes) == 1 or not self._is_server_fault(e):
+                            # A single item, or a transport error after which
+                            # the write may have been applied: report the error
+                            failures = [(index, e) for index in indexes]
+                        else:
+                            # Isolate the failing records of the group
+                            logger.warning(
+                                f"Grouped write on {model} failed, retrying per item: {e}"
+                            )
+                            failures = []
+                            for index in indexes:
+                                try:
+                                    await self.connection.awrite(
+                                        model, [updates[index]["id"]], values
+                                    )
+                                    updated.append(index)
+                                except OmniConnectionError as item_error:
+                                    failures.append((index, item_error))
+                        for index, error in failures:
+                            results[index] = {
+                                "index": index,
+                                "id": updates[index]["id"],
+                                "success": False,
+                                "error": self._batch_error(error),
+                            }
+
+                updated_ids = sorted({updates[i]["id"] for i in updated})
+                read_back = await self._read_batch_results(model, updated_ids)
+                for index in updated:
+                    record_id = updates[index]["id"]
+                    results[index] = {
+                        "index": index,
+                        "id": record_id,
+                        "success": True,
+                        "record": read_back.get(record_id, {"id": record_id}),
+                    }
+
+                failed = len(updates) - len(updated)
+                return {
+                    "success": failed == 0,
+                    "updated": len(updated),
+                    "failed": failed,
+                    "results": results,
+                    "message": f"Applied {len(updated)} of {len(updates)} {model} updates",
+                }
+
+        except AccessControlError as e:
+            raise ToolError(f"Access denied: {e}") from e
+        except OmniConnectionError as e:
+            raise ToolError(f"Connection error: {e}") from e
+        except Exception as e:
+            logger.error(f"Error in update_records tool: {e}")
+            sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
+            raise ToolError(f"Failed to update records: {sanitized_msg}") from e
+
+    async def _handle_delete_records_tool(
+        self,
+        model: str,
+        record_ids: List[int],
+    ) -> Dict[str, Any]:
+        """Handle batch delete tool request.
+
+        Existing records and their names are found with one search_read and
+        all of them are deleted with one unlink. If the server rejects the
+        unlink, the records are retried one by one so each gets its own
+        result; transport errors are raised instead.
+        """
+        try:
+            with perf_logger.track_operation("tool_delete_records", model=model):
+                # Check model access
+                await self._check_access(model, "unlink")
+
+                # Ensure we're connected
+                if not self.connection.is_authenticated:
+                    raise ValidationError("Not authenticated with Omni")
+
+                self._validate_batch(record_ids, "record IDs")
+
+                results: Dict[Any, Dict[str, Any]] = {}
+                unique_ids = []
+                for record_id in record_ids:
+                    if not isinstance(record_id, int) or isinstance(record_id, bool):
+                        results[record_id] = {
+                            "id": record_id,
+                            "success": False,
+                            "error": "Record IDs must be integers",
+                        }
+                    elif record_id not in unique_ids:
+                        unique_ids.append(record_id)
+
+                # Find existing records and their names before deletion; unlike
+                # read, a search does not fail on IDs that do not exist
+                existing = {}
+                if unique_ids:
+                    records = await self.connection.asearch_read(
+                        model, [["id", "in", unique_ids]], ["display_name"], cache=False
+                    )
+                    for record in records:
+                        existing[record["id"]] = record.get("display_name") or f"ID {record['id']}"
+
+                to_delete = [record_id for record_id in unique_ids if record_id in existing]
+                for record_id in unique_ids:
+                    if record_id not in existing:
+                        results[record_id] = {
+                            "id": record_id,
+                            "success": False,
+                            "error": f"Record not found: {model} with ID {record_id}",
+                        }
+
+                deleted = []
+                if to_delete:
+                    try:
+                        await self.connection.aunlink(model, to_delete)
+                        deleted = to_delete
+                    except OmniConnectionError as e:
+                        if not self._is_server_fault(e):
+                            raise
+                        logger.warning(f"Batch delete on {model} failed, retrying per item: {e}")
+                        for record_id in to_delete:
+                            try:
+                                await self.connection.aunlink(model, [record_id])
+                                deleted.append(record_id)
+                            except OmniConnectionError as item_error:
+                                results[record_id] = {
+                                    "id": record_id,
+                                    "success": False,
+                                    "error": self._batch_error(item_error),
+                                }
+
+                for record_id in deleted:
+                    results[record_id] = {
+                        "id": record_id,
+                        "success": True,
+                        "deleted_name": existing[record_id],
+                    }
+
+                failed = len(results) - len(deleted)
+                return {
+                    "success": failed == 0,
+                    "deleted": len(deleted),
+                    "failed": failed,
+                    "results": [results[record_id] for record_id in dict.fromkeys(record_ids)],
+                    "message": f"Deleted {len(deleted)} of {len(results)} {model} records",
+                }
+
+        except AccessControlError as e:
+            raise ToolError(f"Access denied: {e}") from e
+        except OmniConnectionError as e:
+            raise ToolError(f"Connection error: {e}") from e
+        except Exception as e:
+            logger.error(f"Error in delete_records tool: {e}")
+            sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
+            raise ToolError(f"Failed to delete records: {sanitized_msg}") from e
+
 
 def register_tools(
     app: FastMCP,
@@ -0,0 +1,444 @@
+"""Request tracing for Omni MCP Server.
+
+Spans time the phases of a request (access check, field metadata, each
+XML-RPC round-trip with its serialize/network/parse sub-phases, date
+post-processing and response formatting). The current span is held in a
+context variable, so children link to their parent across awaits, tasks
+and - via OmniConnection.run_async() - executor threads.
+
+Tracing is off unless OMNI_MCP_TRACE_FILE or OMNI_MCP_TRACE_ENDPOINT is
+set. Finished spans are exported in batches from a background thread,
+either as JSON lines to a file or as OTLP/HTTP JSON to a collector.
+"""
+
+import abc
+import json
+import logging
+import queue
+import random
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Sequence
+
+from .config import OmniConfig
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "mcp-server-omni"
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("omni_mcp_current_span", default=None)
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        """Initialize span, starting it now.
+
+        Args:
+            name: Span name
+            parent: Parent span, or None to start a new trace
+            attributes: Initial attributes
+        """
+        self.name: str = name
+        self.trace_id: str = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id: str = f"{random.getrandbits(64):016x}"
+        self.parent_id: Optional[str] = parent.span_id if parent else None
+        self.start_ns: int = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute on the span."""
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration in milliseconds (up to now while the span is open)."""
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a flat dictionary for the file exporter."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+        }
+
+
+class _SpanContext:
+    """Context manager that makes a span current for its block."""
+
+    __slots__ = ("_tracer", "_span", "_token")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self._tracer = tracer
+        self._span = span
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self._span.error = exc_type.__name__
+        self._tracer.end(self._span)
+        return False
+
+
+class _NoopSpanContext:
+    """Context manager used when there is nothing to trace."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NOOP = _NoopSpanContext()
+
+
+class SpanExporter(abc.ABC):
+    """Base class for span exporters."""
+
+    @abc.abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Export a batch of finished spans."""
+
+    def shutdown(self) -> None:  # noqa: B027 - optional hook, not abstract
+        """Release exporter resources."""
+
+
+class FileSpanExporter(SpanExporter):
+    """Append spans to a file as JSON lines."""
+
+    def __init__(self, path: str):
+        """Initialize exporter.
+
+        Args:
+            path: File to append to
+        """
+        self.path = path
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """Append one JSON object per span."""
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OTLPHttpSpanExporter(SpanExporter):
+    """Send spans to an OTLP/HTTP collector using the JSON encoding."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        """Initialize exporter.
+
+        Args:
+            endpoint: Collector base URL (e.g., http://localhost:4318) or the
+                full /v1/traces URL
+            timeout: Request timeout in seconds
+        """
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self.timeout = timeout
+
+    @staticmethod
+    def encode(spans: Sequence[Span]) -> Dict[str, Any]:
+        """Build an OTLP ExportTraceServiceRequest body."""
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [
+                    {"key": key, "value": _otlp_value(value)}
+                    for key, value in span.attributes.items()
+                ],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": SERVICE_NAME}}
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": "mcp_server_omni"}, "spans": otlp_spans}],
+                }
+            ]
+        }
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """POST the batch to the collector."""
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(self.encode(spans)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class BatchSpanProcessor:
+    """Export finished spans in batches from a background thread.
+
+    Ending a span only enqueues it, so request handlers never wait on file
+    or network I/O. Export errors are logged and the batch is dropped. When
+    the queue is full (e.g. the collector is slow), new spans are dropped
+    and counted.
+    """
+
+    def __init__(
+        self,
+        exporters: List[SpanExporter],
+        max_batch_size: int = 256,
+        schedule_delay: float = 1.0,
+        max_queue_size: int = 2048,
+    ):
+        """Initialize processor and start its worker thread.
+
+        Args:
+            exporters: Exporters each batch is sent to
+            max_batch_size: Maximum spans per export call
+            schedule_delay: Seconds to wait for more spans before exporting
+            max_queue_size: Maximum spans waiting to be exported
+        """
+        self.exporters = exporters
+        self.max_batch_size = max_batch_size
+        self.schedule_delay = schedule_delay
+        self.max_queue_size = max_queue_size
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._stats_lock = threading.Lock()
+        self._exported = 0
+        self._dropped = 0
+        self._thread = threading.Thread(target=self._run, name="omni-mcp-trace-export", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        """Queue a finished span for export, dropping it if the queue is full."""
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            with self._stats_lock:
+                self._dropped += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Export everything queued so far.
+
+        Returns:
+            True if the queue was drained within the timeout
+        """
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Flush queued spans and stop the worker thread."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue and drop counters."""
+        with self._stats_lock:
+            return {
+                "queue_size": self._queue.qsize(),
+                "queue_capacity": self.max_queue_size,
+                "exported": self._exported,
+                "dropped": self._dropped,
+            }
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Span] = []
+            markers: List[threading.Event] = []
+            stop = False
+            try:
+                item = self._queue.get(timeout=self.schedule_delay)
+                while True:
+                    if item is None:
+                        stop = True
+                        break
+                    if isinstance(item, threading.Event):
+                        markers.append(item)
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.max_batch_size:
+                        break
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            if batch:
+                self._export(batch)
+                with self._stats_lock:
+                    self._exported += len(batch)
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _export(self, batch: List[Span]) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(batch)
+            except Exception as e:
+                logger.warning(f"Failed to export {len(batch)} spans: {e}")
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the span processor."""
+
+    def __init__(self):
+        """Initialize a tracer with tracing disabled."""
+        self._processor: Optional[BatchSpanProcessor] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are being recorded."""
+        return self._processor is not None
+
+    def configure(self, exporters: List[SpanExporter]) -> None:
+        """Replace the exporters; an empty list disables tracing.
+
+        Args:
+            exporters: Exporters for finished spans
+        """
+        old, self._processor = self._processor, None
+        if old is not None:
+            old.shutdown()
+        if exporters:
+            self._processor = BatchSpanProcessor(exporters)
+
+    def current_span(self) -> Optional[Span]:
+        """Get the span active in the current context."""
+        return _current_span.get()
+
+    def span(self, name: str, **attributes: Any):
+        """Start a span as a child of the current span, or a new trace.
+
+        Usage:
+            with tracer.span("tool_search", model="res.partner") as span:
+                ...
+
+        Returns:
+            Context manager yielding the Span, or None when disabled
+        """
+        if self._processor is None:
+            return _NOOP
+        return _SpanContext(self, Span(name, _current_span.get(), attributes))
+
+    def child_span(self, name: str, **attributes: Any):
+        """Like span(), but only records inside an existing trace.
+
+        Used below the tool handlers so that background work (cache
+        revalidation, authentication) does not start traces of its own.
+        """
+        parent = _current_span.get()
+        if self._processor is None or parent is None:
+            return _NOOP
+        return _SpanContext(self, Span(name, parent, attributes))
+
+    def record_child(self, name: str, start_ns: int, end_ns: int, **attributes: Any) -> None:
+        """Record an already finished child of the current span.
+
+        Args:
+            name: Span name
+            start_ns: Start time in nanoseconds since the epoch
+            end_ns: End time in nanoseconds since the epoch
+            **attributes: Span attributes
+        """
+        parent = _current_span.get()
+        if self._processor is None or parent is None:
+            return
+        span = Span(name, parent, attributes)
+        span.start_ns = start_ns
+        self.end(span, end_ns)
+
+    def end(self, span: Span, end_ns: Optional[int] = None) -> None:
+        """Finish a span and queue it for export."""
+        span.end_ns = end_ns if end_ns is not None else time.time_ns()
+        processor = self._processor
+        if processor is not None:
+            processor.on_end(span)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Export all finished spans now."""
+        processor = self._processor
+        return processor.flush(timeout) if processor is not None else True
+
+    def get_stats(self) -> Optional[Dict[str, Any]]:
+        """Get export queue and drop counters, or None when tracing is off."""
+        processor = self._processor
+        return processor.get_stats() if processor is not None else None
+
+
+def configure_tracing(config: OmniConfig) -> None:
+    """Configure the global tracer from trace_file and trace_endpoint.
+
+    Args:
+        config: Omni configuration
+    """
+    exporters: List[SpanExporter] = []
+    if config.trace_file:
+        exporters.append(FileSpanExporter(config.trace_file))
+    if config.trace_endpoint:
+        exporters.append(OTLPHttpSpanExporter(config.trace_endpoint))
+    tracer.configure(exporters)
+    if exporters:
+        logger.info(f"Tracing enabled ({', '.join(type(e).__name__ for e in exporters)})")
+
+
+# Global tracer instance
+tracer = Tracer()
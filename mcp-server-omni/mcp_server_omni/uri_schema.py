@@ -10,6 +10,7 @@ Supported operations:
 - browse: Retrieve multiple records by IDs
 - count: Count matching records
 - fields: Get field definitions
+- export: Export matching records as NDJSON
 """
 
 import re
@@ -27,6 +28,7 @@ class OmniOperation(Enum):
     BROWSE = "browse"
     COUNT = "count"
     FIELDS = "fields"
+    EXPORT = "export"
 
 
 @dataclass
@@ -170,7 +172,7 @@ def build_uri(
 
     Args:
         model: Omni model name (e.g., "res.partner")
-        operation: Operation type (record, search, browse, count, fields)
+        operation: Operation type (record, search, browse, count, fields, export)
         record_id: Record ID for record operation
         domain: Omni domain expression (should be URL-encoded if needed)
         fields: List of field names to return
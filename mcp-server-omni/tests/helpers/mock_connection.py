@@ -0,0 +1,46 @@
+"""Helpers for mocking OmniConnection in handler tests."""
+
+from unittest.mock import AsyncMock, Mock
+
+# Async methods on OmniConnection and the sync methods they wrap
+ASYNC_METHODS = {
+    "aexecute_kw": "execute_kw",
+    "asearch": "search",
+    "aread": "read",
+    "asearch_read": "search_read",
+    "afields_get": "fields_get",
+    "asearch_count": "search_count",
+    "aread_group": "read_group",
+    "acreate": "create",
+    "acreate_many": "create_many",
+    "awrite": "write",
+    "aunlink": "unlink",
+}
+
+
+def wire_async_methods(connection: Mock) -> Mock:
+    """Make a mocked connection's async methods delegate to its sync mocks.
+
+    Handlers await ``connection.asearch(...)`` and friends, while tests set up
+    and assert on ``connection.search`` etc. Delegating keeps both in sync, so
+    return values, side effects and call assertions on the sync mocks apply.
+    ``run_async`` calls the blocking callable inline.
+
+    Args:
+        connection: Mock standing in for an OmniConnection
+
+    Returns:
+        The same mock, for use in fixtures
+    """
+    for async_name, sync_name in ASYNC_METHODS.items():
+
+        def delegate(*args, _sync_name=sync_name, **kwargs):
+            return getattr(connection, _sync_name)(*args, **kwargs)
+
+        setattr(connection, async_name, AsyncMock(side_effect=delegate))
+
+    def run_inline(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    connection.run_async = AsyncMock(side_effect=run_inline)
+    return connection
@@ -0,0 +1,143 @@
+"""Local XML-RPC stand-in for the Omni server, for transport tests."""
+
+import json
+import threading
+import time
+from socketserver import ThreadingMixIn
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+
+class KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    """Request handler that keeps HTTP/1.1 connections open between requests."""
+
+    protocol_version = "HTTP/1.1"
+    rpc_paths = ()  # Accept any path, like the /mcp/xmlrpc/* endpoints
+
+    def decode_request_content(self, data):
+        """Record raw request bodies so tests can compare marshalled payloads."""
+        data = super().decode_request_content(data)
+        stand_in = getattr(self.server, "stand_in", None)
+        if stand_in is not None and data is not None:
+            stand_in.bodies.append(data)
+        return data
+
+    def do_GET(self):  # noqa: N802 - BaseHTTPRequestHandler naming
+        """Answer the MCP module's REST endpoints used by AccessController."""
+        stand_in = self.server.stand_in
+        with stand_in._lock:
+            stand_in.gets.append(self.path)
+        if stand_in.latency:
+            time.sleep(stand_in.latency)
+
+        parts = self.path.strip("/").split("/")
+        if parts == ["mcp", "models"]:
+            data = {"models": [{"model": "res.partner", "name": "Contact"}]}
+        elif len(parts) == 4 and parts[:2] == ["mcp", "models"] and parts[3] == "access":
+            data = {"model": parts[2], "enabled": True, "operations": {"read": True}}
+        else:
+            self.send_error(404)
+            return
+
+        body = json.dumps({"success": True, "data": data}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
+
+
+class ThreadedXMLRPCServer(ThreadingMixIn, SimpleXMLRPCServer):
+    """Multi-threaded XML-RPC server."""
+
+    daemon_threads = True
+
+
+class StandInServer:
+    """Run a threaded XML-RPC server on a free localhost port.
+
+    Exposes ``version``, ``list``, ``authenticate``, ``echo``, ``sleep`` and
+    an ``execute_kw`` that answers the ORM methods used by OmniConnection
+    from an in-memory table, plus the MCP REST endpoints ``/mcp/models`` and
+    ``/mcp/models/{model}/access``. Each accepted TCP connection is counted
+    in ``connections``, raw request bodies are kept in ``bodies`` and REST
+    request paths in ``gets``.
+    """
+
+    def __init__(self, handler_class=KeepAliveRequestHandler):
+        self.connections = 0
+        self.calls = []
+        self.bodies = []
+        self.gets = []
+        self.latency = 0.0
+        self._lock = threading.Lock()
+        self.server = ThreadedXMLRPCServer(
+            ("127.0.0.1", 0), requestHandler=handler_class, allow_none=True, logRequests=False
+        )
+        self.server.register_function(lambda: {"server_version": "17.0"}, "version")
+        self.server.register_function(lambda: ["omni"], "list")
+        self.server.register_function(lambda db, login, password, ctx: 2, "authenticate")
+        self.server.register_function(lambda value: value, "echo")
+        self.server.register_function(self._sleep, "sleep")
+        self.server.register_function(self._execute_kw, "execute_kw")
+
+        self.server.stand_in = self
+
+        original_process = self.server.process_request
+
+        def process_request(request, client_address):
+            with self._lock:
+                self.connections += 1
+            original_process(request, client_address)
+
+        self.server.process_request = process_request
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _sleep(self, seconds, value):
+        time.sleep(seconds)
+        return value
+
+    def _execute_kw(self, db, uid, password, model, method, args, kwargs=None):
+        kwargs = kwargs or {}
+        with self._lock:
+            self.calls.append((model, method, args, kwargs))
+        if self.latency:
+            time.sleep(self.latency)
+
+        records = [{"id": i, "name": f"Record {i}"} for i in range(1, 21)]
+        if method == "search":
+            offset = kwargs.get("offset", 0)
+            limit = kwargs.get("limit") or len(records)
+            return [r["id"] for r in records][offset : offset + limit]
+        if method == "search_count":
+            return len(records)
+        if method == "read":
+            wanted = set(args[0])
+            return [r for r in records if r["id"] in wanted]
+        if method == "search_read":
+            offset = kwargs.get("offset", 0)
+            limit = kwargs.get("limit") or len(records)
+            return records[offset : offset + limit]
+        if method == "fields_get":
+            return {"id": {"type": "integer"}, "name": {"type": "char"}}
+        if method == "create":
+            return 21
+        if method in ("write", "unlink"):
+            return True
+        raise ValueError(f"Unsupported method {method}")
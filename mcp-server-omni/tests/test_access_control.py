@@ -7,8 +7,10 @@ the Omni MCP module's REST API endpoints.
 import json
 import os
 import socket
-import urllib.error
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pytest
 
@@ -17,6 +19,7 @@ from mcp_server_omni.access_control import (
     AccessController,
 )
 from mcp_server_omni.config import OmniConfig
+from tests.helpers.xmlrpc_server import StandInServer
 
 
 def is_omni_server_running(host="localhost", port=8069):
@@ -61,15 +64,12 @@ class TestAccessControl:
         with pytest.raises(AccessControlError, match="API key required"):
             AccessController(config)
 
-    @patch("urllib.request.urlopen")
-    def test_make_request_success(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_make_request_success(self, mock_fetch, controller):
         """Test successful REST API request."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {"success": True, "data": {"test": "value"}}
-        ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        body = json.dumps({"success": True, "data": {"test": "value"}}).encode("utf-8")
+        mock_fetch.return_value = (200, "OK", body)
 
         # Make request
         result = controller._make_request("/test/endpoint")
@@ -77,36 +77,48 @@ class TestAccessControl:
         assert result["success"] is True
         assert result["data"]["test"] == "value"
 
-    @patch("urllib.request.urlopen")
-    def test_make_request_api_error(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_make_request_api_error(self, mock_fetch, controller):
         """Test REST API request with API error response."""
         # Mock error response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
-            {"success": False, "error": {"message": "Test error"}}
-        ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        body = json.dumps({"success": False, "error": {"message": "Test error"}}).encode("utf-8")
+        mock_fetch.return_value = (200, "OK", body)
 
         # Should raise error
         with pytest.raises(AccessControlError, match="API error: Test error"):
             controller._make_request("/test/endpoint")
 
-    @patch("urllib.request.urlopen")
-    def test_make_request_http_401(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_make_request_http_401(self, mock_fetch, controller):
         """Test REST API request with 401 error."""
-        mock_urlopen.side_effect = urllib.error.HTTPError(None, 401, "Unauthorized", {}, None)
+        mock_fetch.return_value = (401, "Unauthorized", b"")
 
         with pytest.raises(AccessControlError, match="Invalid API key"):
             controller._make_request("/test/endpoint")
 
-    @patch("urllib.request.urlopen")
-    def test_make_request_http_404(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_make_request_http_404(self, mock_fetch, controller):
         """Test REST API request with 404 error."""
-        mock_urlopen.side_effect = urllib.error.HTTPError(None, 404, "Not Found", {}, None)
+        mock_fetch.return_value = (404, "Not Found", b"")
 
         with pytest.raises(AccessControlError, match="Endpoint not found"):
             controller._make_request("/test/endpoint")
 
+    @patch.object(AccessController, "_fetch")
+    def test_make_request_malformed_body(self, mock_fetch, controller):
+        """Test undecodable or unexpectedly shaped bodies raise AccessControlError."""
+        mock_fetch.return_value = (200, "OK", b"not json")
+        with pytest.raises(AccessControlError, match="Invalid JSON response"):
+            controller._make_request("/test/endpoint")
+
+        mock_fetch.return_value = (200, "OK", b"[1, 2]")
+        with pytest.raises(AccessControlError, match="Request failed"):
+            controller._make_request("/test/endpoint")
+
+        mock_fetch.side_effect = ValueError("bad header")
+        with pytest.raises(AccessControlError, match="Request failed: bad header"):
+            controller._make_request("/test/endpoint")
+
     def test_cache_operations(self, controller):
         """Test cache get/set operations."""
         # Test cache miss
@@ -129,12 +141,54 @@ class TestAccessControl:
         # Should be expired
         assert controller._get_from_cache("test_key") is None
 
-    @patch("urllib.request.urlopen")
-    def test_get_enabled_models(self, mock_urlopen, controller):
+    def test_stale_permissions_refreshed_in_background(self, controller):
+        """Test expired permissions are served while one background refresh runs."""
+        controller._cache.put("permissions_res.partner", "old", ttl_seconds=0, stale_seconds=60)
+        time.sleep(0.01)
+        released = threading.Event()
+
+        def load(model):
+            released.wait(5)
+            return "new"
+
+        with patch.object(controller, "_load_model_permissions", side_effect=load) as mock_load:
+            # Stale reads return at once and share one refresh
+            assert controller.get_model_permissions("res.partner") == "old"
+            assert controller.get_model_permissions("res.partner") == "old"
+            released.set()
+            controller._refresh_executor.shutdown(wait=True)
+
+            assert controller.get_model_permissions("res.partner") == "new"
+
+        mock_load.assert_called_once_with("res.partner")
+        stats = controller.get_stats()["cache"]
+        assert stats["stale_hits"] == 2
+        assert stats["refreshes"] == 1
+        controller.close()
+
+    def test_failed_refresh_keeps_stale_value(self, controller):
+        """Test a failed refresh keeps the stale value and is retried."""
+        controller._cache.put("permissions_res.partner", "old", ttl_seconds=0, stale_seconds=60)
+        time.sleep(0.01)
+
+        with patch.object(
+            controller, "_load_model_permissions", side_effect=AccessControlError("down")
+        ) as mock_load:
+            assert controller.get_model_permissions("res.partner") == "old"
+            controller._refresh_executor.shutdown(wait=True)
+            controller._refresh_executor = None
+            assert controller.get_model_permissions("res.partner") == "old"
+            controller._refresh_executor.shutdown(wait=True)
+
+        assert mock_load.call_count == 2
+        assert controller.get_stats()["cache"]["refreshes"] == 2
+        controller.close()
+
+    @patch.object(AccessController, "_fetch")
+    def test_get_enabled_models(self, mock_fetch, controller):
         """Test getting enabled models list."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
+        body = json.dumps(
             {
                 "success": True,
                 "data": {
@@ -145,7 +199,7 @@ class TestAccessControl:
                 },
             }
         ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_fetch.return_value = (200, "OK", body)
 
         # Get models
         models = controller.get_enabled_models()
@@ -157,14 +211,13 @@ class TestAccessControl:
         # Second call should use cache
         models2 = controller.get_enabled_models()
         assert models2 == models
-        mock_urlopen.assert_called_once()  # Only called once due to cache
+        mock_fetch.assert_called_once()  # Only called once due to cache
 
-    @patch("urllib.request.urlopen")
-    def test_is_model_enabled(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_is_model_enabled(self, mock_fetch, controller):
         """Test checking if model is enabled."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
+        body = json.dumps(
             {
                 "success": True,
                 "data": {
@@ -175,19 +228,18 @@ class TestAccessControl:
                 },
             }
         ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_fetch.return_value = (200, "OK", body)
 
         # Check models
         assert controller.is_model_enabled("res.partner") is True
         assert controller.is_model_enabled("res.users") is True
         assert controller.is_model_enabled("account.move") is False
 
-    @patch("urllib.request.urlopen")
-    def test_get_model_permissions(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_get_model_permissions(self, mock_fetch, controller):
         """Test getting model permissions."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
+        body = json.dumps(
             {
                 "success": True,
                 "data": {
@@ -197,7 +249,7 @@ class TestAccessControl:
                 },
             }
         ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_fetch.return_value = (200, "OK", body)
 
         # Get permissions
         perms = controller.get_model_permissions("res.partner")
@@ -215,12 +267,11 @@ class TestAccessControl:
         assert perms.can_perform("create") is False
         assert perms.can_perform("delete") is False  # Alias for unlink
 
-    @patch("urllib.request.urlopen")
-    def test_check_operation_allowed(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_check_operation_allowed(self, mock_fetch, controller):
         """Test checking if operation is allowed."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
+        body = json.dumps(
             {
                 "success": True,
                 "data": {
@@ -230,7 +281,7 @@ class TestAccessControl:
                 },
             }
         ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_fetch.return_value = (200, "OK", body)
 
         # Check operations
         allowed, msg = controller.check_operation_allowed("res.partner", "read")
@@ -241,44 +292,43 @@ class TestAccessControl:
         assert allowed is False
         assert "Operation 'write' not allowed" in msg
 
-    @patch("urllib.request.urlopen")
-    def test_check_operation_model_disabled(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_check_operation_model_disabled(self, mock_fetch, controller):
         """Test checking operation on disabled model."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
+        body = json.dumps(
             {"success": True, "data": {"model": "res.partner", "enabled": False, "operations": {}}}
         ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_fetch.return_value = (200, "OK", body)
 
         # Check operation
         allowed, msg = controller.check_operation_allowed("res.partner", "read")
         assert allowed is False
         assert "not enabled for MCP access" in msg
 
-    @patch("urllib.request.urlopen")
-    def test_validate_model_access(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_validate_model_access(self, mock_fetch, controller):
         """Test validate_model_access method."""
         # Mock allowed response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
+        body = json.dumps(
             {
                 "success": True,
                 "data": {"model": "res.partner", "enabled": True, "operations": {"read": True}},
             }
         ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_fetch.return_value = (200, "OK", body)
 
         # Should not raise for allowed operation
         controller.validate_model_access("res.partner", "read")
 
         # Mock denied response
-        mock_response.read.return_value = json.dumps(
+        body = json.dumps(
             {
                 "success": True,
                 "data": {"model": "res.partner", "enabled": True, "operations": {"read": False}},
             }
         ).encode("utf-8")
+        mock_fetch.return_value = (200, "OK", body)
 
         # Clear cache to force new request
         controller.clear_cache()
@@ -287,12 +337,11 @@ class TestAccessControl:
         with pytest.raises(AccessControlError):
             controller.validate_model_access("res.partner", "read")
 
-    @patch("urllib.request.urlopen")
-    def test_filter_enabled_models(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_filter_enabled_models(self, mock_fetch, controller):
         """Test filtering enabled models."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(
+        body = json.dumps(
             {
                 "success": True,
                 "data": {
@@ -303,7 +352,7 @@ class TestAccessControl:
                 },
             }
         ).encode("utf-8")
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_fetch.return_value = (200, "OK", body)
 
         # Filter models
         models = ["res.partner", "account.move", "res.users", "stock.picking"]
@@ -311,12 +360,11 @@ class TestAccessControl:
 
         assert filtered == ["res.partner", "res.users"]
 
-    @patch("urllib.request.urlopen")
-    def test_get_all_permissions(self, mock_urlopen, controller):
+    @patch.object(AccessController, "_fetch")
+    def test_get_all_permissions(self, mock_fetch, controller):
         """Test getting permissions for all models."""
         # Mock models list response
-        models_response = MagicMock()
-        models_response.read.return_value = json.dumps(
+        models_body = json.dumps(
             {
                 "success": True,
                 "data": {
@@ -329,8 +377,7 @@ class TestAccessControl:
         ).encode("utf-8")
 
         # Mock permissions responses
-        partner_response = MagicMock()
-        partner_response.read.return_value = json.dumps(
+        partner_body = json.dumps(
             {
                 "success": True,
                 "data": {
@@ -341,8 +388,7 @@ class TestAccessControl:
             }
         ).encode("utf-8")
 
-        users_response = MagicMock()
-        users_response.read.return_value = json.dumps(
+        users_body = json.dumps(
             {
                 "success": True,
                 "data": {
@@ -353,12 +399,13 @@ class TestAccessControl:
             }
         ).encode("utf-8")
 
-        # Configure mock to return different responses
-        mock_urlopen.return_value.__enter__.side_effect = [
-            models_response,
-            partner_response,
-            users_response,
-        ]
+        # Permissions are fetched concurrently, so respond by endpoint rather than call order
+        bodies = {
+            "/mcp/models": models_body,
+            "/mcp/models/res.partner/access": partner_body,
+            "/mcp/models/res.users/access": users_body,
+        }
+        mock_fetch.side_effect = lambda endpoint, timeout: (200, "OK", bodies[endpoint])
 
         # Get all permissions
         all_perms = controller.get_all_permissions()
@@ -367,6 +414,95 @@ class TestAccessControl:
         assert all_perms["res.partner"].can_write is True
         assert all_perms["res.users"].can_write is False
 
+    def test_get_permissions_bounded_fan_out(self, controller):
+        """Uncached permissions are fetched concurrently, at most prefetch_concurrency at once."""
+        controller.prefetch_concurrency = 3
+        models = [f"x_model_{i}" for i in range(12)]
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def make_request(endpoint, timeout=30):
+            with lock:
+                active.append(endpoint)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(endpoint)
+            if endpoint.endswith("x_model_5/access"):
+                raise AccessControlError("HTTP error 500: boom")
+            model = endpoint.split("/")[3]
+            return {"success": True, "data": {"model": model, "enabled": True}}
+
+        with patch.object(controller, "_make_request", side_effect=make_request) as mock_request:
+            permissions = controller.get_permissions(models)
+
+            assert list(permissions) == [m for m in models if m != "x_model_5"]
+            assert max(peak) == 3
+            assert mock_request.call_count == 12
+
+            # Loaded permissions are cached; only the failed model is retried
+            controller.get_permissions(models)
+            assert mock_request.call_count == 13
+
+        # Batches share one executor, which close() shuts down
+        executor = controller._prefetch_executor
+        assert executor is not None
+        controller.close()
+        assert controller._prefetch_executor is None
+        assert executor._shutdown
+
+
+class TestAccessControlTransport:
+    """Test AccessController against a local stand-in of the MCP REST API."""
+
+    @pytest.fixture
+    def server(self):
+        """Run a local keep-alive server."""
+        stand_in = StandInServer().start()
+        yield stand_in
+        stand_in.stop()
+
+    @pytest.fixture
+    def controller(self, server):
+        """AccessController pointing at the stand-in server."""
+        controller = AccessController(OmniConfig(url=server.url, api_key="test_api_key"))
+        yield controller
+        controller.close()
+
+    def test_requests_reuse_keep_alive_connection(self, server, controller):
+        """Lookups share one persistent connection instead of reconnecting."""
+        controller.get_enabled_models()
+        for model in ("res.partner", "res.users", "sale.order"):
+            assert controller.get_model_permissions(model).can_read is True
+
+        assert len(server.gets) == 4
+        assert server.connections == 1
+        assert controller.get_stats()["http"]["reuses"] == 3
+
+    def test_concurrent_cold_lookups_share_one_request(self, server, controller):
+        """20 concurrent lookups of an uncached model trigger one /access request."""
+        server.latency = 0.05
+        barrier = threading.Barrier(20)
+
+        def lookup():
+            barrier.wait()
+            return controller.get_model_permissions("res.partner")
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            results = list(executor.map(lambda _: lookup(), range(20)))
+
+        assert server.gets == ["/mcp/models/res.partner/access"]
+        assert all(result is results[0] for result in results)
+        assert controller.get_stats()["single_flight"]["executions"] == 1
+
+    def test_connection_error(self, server, controller):
+        """An unreachable server is reported as a connection error."""
+        server.stop()
+
+        with pytest.raises(AccessControlError, match="Connection error"):
+            controller.get_enabled_models()
+
 
 @pytest.mark.skipif(
     not is_omni_server_running(), reason="Omni server not running at localhost:8069"
@@ -17,6 +17,7 @@ from mcp_server_omni.error_handling import (
 )
 from mcp_server_omni.omni_connection import OmniConnection
 from mcp_server_omni.resources import OmniResourceHandler
+from tests.helpers.mock_connection import wire_async_methods
 
 # Import skip_on_rate_limit decorator
 from .test_xmlrpc_operations import skip_on_rate_limit
@@ -34,7 +35,7 @@ def mock_config():
 @pytest.fixture
 def mock_connection():
     """Create a mock Omni connection."""
-    conn = Mock(spec=OmniConnection)
+    conn = wire_async_methods(Mock(spec=OmniConnection))
     conn.is_authenticated = True
     return conn
 
@@ -0,0 +1,128 @@
+"""Tests for the aggregate_records tool."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_server_omni.access_control import AccessControlError
+from mcp_server_omni.error_handling import ValidationError
+from mcp_server_omni.tools import OmniToolHandler
+from tests.helpers.mock_connection import wire_async_methods
+
+
+@pytest.fixture
+def handler():
+    """Create a tool handler with a mocked connection."""
+    connection = wire_async_methods(Mock())
+    connection.is_authenticated = True
+    connection.read_group.return_value = [
+        {
+            "product_id": [7, "Premium Widget"],
+            "product_uom_qty": 42.0,
+            "price_subtotal": 4158.0,
+            "__count": 12,
+            "__domain": [["product_id", "=", 7]],
+        },
+        {
+            "product_id": [3, "Basic Widget"],
+            "product_uom_qty": 30.0,
+            "price_subtotal": 900.0,
+            "__count": 20,
+            "__domain": [["product_id", "=", 3]],
+        },
+    ]
+    config = Mock()
+    config.max_limit = 100
+    return OmniToolHandler(Mock(), connection, Mock(), config)
+
+
+class TestAggregateTool:
+    """Test read_group-backed aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_top_products(self, handler):
+        """Test ranking products by quantity with a single read_group call."""
+        result = await handler._handle_aggregate_tool(
+            "sale.order.line",
+            ["product_id"],
+            ["product_uom_qty:sum", "price_subtotal:sum"],
+            [["state", "in", ["sale", "done"]]],
+            "product_uom_qty desc",
+            10,
+        )
+
+        handler.connection.read_group.assert_called_once_with(
+            "sale.order.line",
+            [["state", "in", ["sale", "done"]]],
+            ["product_uom_qty:sum", "price_subtotal:sum"],
+            ["product_id"],
+            limit=10,
+            orderby="product_uom_qty desc",
+            lazy=False,
+        )
+        handler.connection.search_read.assert_not_called()
+        assert result["count"] == 2
+        assert result["groups"][0] == {
+            "product_id": [7, "Premium Widget"],
+            "product_uom_qty": 42.0,
+            "price_subtotal": 4158.0,
+            "__count": 12,
+        }
+
+    @pytest.mark.asyncio
+    async def test_date_granularity_and_string_arguments(self, handler):
+        """Test JSON string arguments and date granularities."""
+        await handler._handle_aggregate_tool(
+            "sale.order",
+            '["date_order:month", "user_id"]',
+            '["total:sum(amount_total)"]',
+            "[['state', '=', 'sale']]",
+            None,
+            None,
+        )
+
+        args, kwargs = handler.connection.read_group.call_args
+        assert args[1:] == (
+            [["state", "=", "sale"]],
+            ["total:sum(amount_total)"],
+            ["date_order:month", "user_id"],
+        )
+        # Unbounded requests are capped at the configured maximum
+        assert kwargs["limit"] == 100
+
+    @pytest.mark.asyncio
+    async def test_count_only(self, handler):
+        """Test grouping without aggregates returns counts only."""
+        await handler._handle_aggregate_tool("res.partner", "country_id", None, None, None, 5)
+
+        args, _ = handler.connection.read_group.call_args
+        assert args[2] == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "groupby, aggregates, message",
+        [
+            ([], None, "At least one groupby"),
+            (["date_order:hour"], None, "Invalid date granularity"),
+            (["product_id; drop"], None, "Invalid groupby"),
+            (["product_id"], ["price:median"], "Invalid aggregate function"),
+            (["product_id"], ["sum(price)"], "Invalid aggregate"),
+        ],
+    )
+    async def test_invalid_arguments(self, handler, groupby, aggregates, message):
+        """Test malformed groupby and aggregate expressions are rejected."""
+        with pytest.raises(ValidationError, match=message):
+            await handler._handle_aggregate_tool(
+                "sale.order.line", groupby, aggregates, None, None, None
+            )
+        handler.connection.read_group.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_access_denied(self, handler):
+        """Test access control is enforced."""
+        handler.access_controller.validate_model_access.side_effect = AccessControlError("no")
+
+        with pytest.raises(ValidationError, match="Access denied"):
+            await handler._handle_aggregate_tool(
+                "sale.order.line", ["product_id"], None, None, None, None
+            )
@@ -0,0 +1,313 @@
+"""Tests for the asyncio-native XML-RPC client."""
+
+import asyncio
+import xmlrpc.client
+
+import pytest
+
+from mcp_server_omni.async_connection import (
+    AsyncHTTPConnectionPool,
+    AsyncOmniConnection,
+    AsyncXMLRPCClient,
+)
+from mcp_server_omni.config import OmniConfig
+from mcp_server_omni.omni_connection import OmniConnection, OmniConnectionError
+from mcp_server_omni.performance import PerformanceManager
+from tests.helpers.xmlrpc_server import KeepAliveRequestHandler, StandInServer
+
+
+class HTTP10RequestHandler(KeepAliveRequestHandler):
+    """Handler that closes the connection after every response."""
+
+    protocol_version = "HTTP/1.0"
+
+
+@pytest.fixture
+def server():
+    """Run a local keep-alive XML-RPC server."""
+    stand_in = StandInServer().start()
+    yield stand_in
+    stand_in.stop()
+
+
+@pytest.fixture
+def config(server):
+    """Configuration pointing at the stand-in server."""
+    return OmniConfig(
+        url=server.url, username="admin", password="secret", database="omni", max_workers=4
+    )
+
+
+@pytest.fixture
+async def async_conn(config):
+    """Authenticated async connection."""
+    conn = AsyncOmniConnection(config, timeout=5)
+    await conn.connect()
+    await conn.authenticate()
+    yield conn
+    conn.disconnect()
+
+
+async def run_model_calls(conn):
+    """Run each model method once, awaiting coroutine results."""
+    calls = [
+        lambda: conn.search("res.partner", [["is_company", "=", True]], limit=3, order="name"),
+        lambda: conn.search_read("res.partner", [], ["name"], limit=5, offset=0),
+        lambda: conn.read("res.partner", [7, 8], ["name"]),
+        lambda: conn.fields_get("res.partner"),
+        lambda: conn.search_count("res.partner", []),
+        lambda: conn.create("res.partner", {"name": "Ünïcödé & <Co>", "active": None}),
+        lambda: conn.write("res.partner", [1, 2], {"email": "a@example.com"}),
+        lambda: conn.unlink("res.partner", [3]),
+    ]
+    results = []
+    for call in calls:
+        result = call()
+        if asyncio.iscoroutine(result):
+            result = await result
+        results.append(result)
+    return results
+
+
+class TestAsyncOmniConnection:
+    """Test AsyncOmniConnection against the stand-in server."""
+
+    async def test_connect_and_authenticate(self, async_conn):
+        """Password authentication establishes a session."""
+        assert async_conn.is_connected
+        assert async_conn.is_authenticated()
+        assert async_conn.uid == 2
+        assert async_conn.database == "omni"
+
+    async def test_select_database_when_not_configured(self, server):
+        """Without OMNI_DB the single available database is used."""
+        conn = AsyncOmniConnection(OmniConfig(url=server.url, username="admin", password="x"))
+        await conn.connect()
+        await conn.authenticate()
+
+        assert conn.database == "omni"
+        conn.disconnect()
+
+    async def test_same_payloads_and_results_as_sync_connection(self, server, config):
+        """The async client sends byte-identical execute_kw payloads."""
+        sync_conn = OmniConnection(config, performance_manager=PerformanceManager(config))
+        sync_conn.connect()
+        sync_conn.authenticate()
+        server.bodies.clear()
+        sync_results = await run_model_calls(sync_conn)
+        sync_bodies = list(server.bodies)
+        sync_conn.disconnect()
+
+        async_conn = AsyncOmniConnection(config, performance_manager=PerformanceManager(config))
+        await async_conn.connect()
+        await async_conn.authenticate()
+        server.bodies.clear()
+        async_results = await run_model_calls(async_conn)
+        async_conn.disconnect()
+
+        assert len(sync_bodies) == 8
+        assert server.bodies == sync_bodies
+        assert async_results == sync_results
+
+    def test_marshal_matches_server_proxy(self):
+        """Marshalling matches xmlrpc.client.dumps as used by ServerProxy."""
+        params = ("db", 2, "key", "res.partner", "read", [[1]], {"fields": ["name"]})
+        expected = xmlrpc.client.dumps(params, "execute_kw", allow_none=True).encode("utf-8")
+
+        assert AsyncXMLRPCClient.marshal("execute_kw", params) == expected
+
+    async def test_read_uses_record_cache(self, server, async_conn):
+        """Records from search_read are served from the shared cache."""
+        await async_conn.search_read("res.partner", [], ["name"], limit=2)
+        server.bodies.clear()
+
+        records = await async_conn.read("res.partner", [2, 1], ["name"])
+
+        assert [r["id"] for r in records] == [2, 1]
+        assert server.bodies == []
+
+    async def test_fault_raises_connection_error(self, async_conn):
+        """Server faults are sanitized into OmniConnectionError."""
+        with pytest.raises(OmniConnectionError, match="Operation failed"):
+            await async_conn.execute_kw("res.partner", "bogus", [], {})
+
+    async def test_timeout_raises_connection_error(self, server, config):
+        """Slow responses are reported as timeouts."""
+        conn = AsyncOmniConnection(config, timeout=0.05)
+        await conn.connect()
+        await conn.authenticate()
+        server.latency = 0.3
+
+        with pytest.raises(OmniConnectionError, match="Operation timeout"):
+            await conn.search_count("res.partner", [])
+
+        assert conn.get_pool_stats()["open_connections"] == 0
+        conn.disconnect()
+
+    async def test_requires_authentication(self, config):
+        """Model calls fail before authentication."""
+        conn = AsyncOmniConnection(config)
+
+        with pytest.raises(OmniConnectionError, match="Not authenticated"):
+            await conn.search("res.partner", [])
+
+
+class TestAsyncConnectionPool:
+    """Test connection reuse."""
+
+    async def test_concurrent_calls_reuse_bounded_connections(self, server, async_conn):
+        """Many concurrent calls share at most max_connections sockets."""
+        server.latency = 0.01
+        async_conn._pool.max_size = 4
+
+        results = await asyncio.gather(
+            *(async_conn.search("res.partner", [], offset=i, limit=1) for i in range(20))
+        )
+
+        assert results == [[i + 1] for i in range(20)]
+        stats = async_conn.get_pool_stats()
+        assert stats["handshakes"] <= 4
+        assert server.connections <= 4
+        assert stats["in_flight_requests"] == 0
+
+    async def test_one_request_per_connection(self, server, config):
+        """Concurrent requests on one connection each read their own response."""
+        conn = AsyncOmniConnection(config, max_connections=1)
+        await conn.connect()
+        await conn.authenticate()
+        server.latency = 0.02
+
+        results = await asyncio.gather(
+            *(conn.search("res.partner", [], offset=i, limit=1) for i in range(8))
+        )
+
+        assert results == [[i + 1] for i in range(8)]
+        stats = conn.get_pool_stats()
+        assert stats["handshakes"] == 1
+        assert stats["waits"] >= 7
+        assert server.connections == 1
+        conn.disconnect()
+
+    async def test_cancelled_request_discards_connection(self, server):
+        """A response left unread by a cancelled caller is never read by the next one."""
+        pool = AsyncHTTPConnectionPool(max_size=1, timeout=5)
+        client = AsyncXMLRPCClient(server.url, pool)
+        assert await client.call("/mcp/xmlrpc/common", "echo", 0) == 0
+
+        first = asyncio.ensure_future(client.call("/mcp/xmlrpc/common", "sleep", 0.1, 1))
+        second = asyncio.ensure_future(client.call("/mcp/xmlrpc/common", "echo", 2))
+        await asyncio.sleep(0.02)
+        first.cancel()
+
+        assert await second == 2
+        stats = pool.get_stats()
+        assert stats["discarded"] == 1
+        assert stats["handshakes"] == 2
+        pool.clear()
+
+    async def test_failed_open_wakes_waiter(self, server):
+        """A task waiting for a full pool gets the slot of a failed connect."""
+        pool = AsyncHTTPConnectionPool(max_size=1, timeout=5)
+        client = AsyncXMLRPCClient(server.url, pool)
+        open_connection = pool._open
+        attempts = 0
+
+        async def flaky_open(host, now):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await asyncio.sleep(0.05)
+                raise OSError("connection refused")
+            return await open_connection(host, now)
+
+        pool._open = flaky_open
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first = asyncio.ensure_future(client.call("/mcp/xmlrpc/common", "echo", 1))
+        second = asyncio.ensure_future(client.call("/mcp/xmlrpc/common", "echo", 2))
+
+        with pytest.raises(OSError):
+            await first
+        assert await second == 2
+        # Woken as soon as the slot was freed, not at the checkout timeout
+        assert loop.time() - started < 2
+        assert pool.get_stats()["waits"] == 1
+        pool.clear()
+
+    async def test_server_closing_connections(self):
+        """Responses with Connection: close are not reused."""
+        stand_in = StandInServer(handler_class=HTTP10RequestHandler).start()
+        try:
+            pool = AsyncHTTPConnectionPool(timeout=5)
+            client = AsyncXMLRPCClient(stand_in.url, pool)
+
+            assert await client.call("/mcp/xmlrpc/common", "echo", 1) == 1
+            assert await client.call("/mcp/xmlrpc/common", "echo", 2) == 2
+
+            stats = pool.get_stats()
+            assert stats["handshakes"] == 2
+            assert stats["open_connections"] == 0
+        finally:
+            stand_in.stop()
+
+    async def test_dead_connection_is_replaced(self, server):
+        """Idle connections closed underneath the pool are not reused."""
+        pool = AsyncHTTPConnectionPool(timeout=5)
+        client = AsyncXMLRPCClient(server.url, pool)
+        await client.call("/mcp/xmlrpc/common", "echo", 1)
+
+        stream = pool._streams[client.host][0]
+        stream.writer.transport.abort()
+        await asyncio.sleep(0)
+
+        assert await client.call("/mcp/xmlrpc/common", "echo", 2) == 2
+        stats = pool.get_stats()
+        assert stats["closed_dead"] == 1
+        assert stats["handshakes"] == 2
+
+    def test_pool_survives_event_loop_change(self, config):
+        """Connections opened on a finished loop are dropped, not reused."""
+        conn = AsyncOmniConnection(config)
+
+        async def call():
+            await conn.connect()
+            await conn.authenticate()
+            return await conn.search_count("res.partner", [])
+
+        assert asyncio.run(call()) == 20
+        assert asyncio.run(call()) == 20
+        assert conn.get_pool_stats()["handshakes"] == 2
+
+
+class TestOmniConnectionAsyncClient:
+    """Test OmniConnection's opt-in use of the async client."""
+
+    async def test_async_methods_use_native_client(self, server, config):
+        """With async_client enabled, no executor threads are used."""
+        config.async_client = True
+        conn = OmniConnection(config)
+        conn.connect()
+        conn.authenticate()
+
+        records = await conn.asearch_read("res.partner", [], ["name"], limit=3)
+        count = await conn.asearch_count("res.partner", [])
+
+        assert [r["id"] for r in records] == [1, 2, 3]
+        assert count == 20
+        assert conn._executor is None
+        assert conn._async_client.performance_manager is conn.performance_manager
+
+        conn.disconnect()
+        assert conn._async_client is None
+
+    async def test_executor_used_by_default(self, server, config):
+        """Without async_client, calls still run on the executor."""
+        conn = OmniConnection(config)
+        conn.connect()
+        conn.authenticate()
+
+        assert await conn.asearch_count("res.partner", []) == 20
+        assert conn._executor is not None
+        assert conn._async_client is None
+
+        conn.disconnect()
@@ -0,0 +1,177 @@
+"""Tests for running OmniConnection calls off the asyncio event loop."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from mcp_server_omni.access_control import AccessController
+from mcp_server_omni.config import OmniConfig
+from mcp_server_omni.omni_connection import OmniConnection, OmniConnectionError
+from mcp_server_omni.tools import OmniToolHandler
+
+BACKEND_LATENCY = 0.2
+
+
+class SlowObjectProxy:
+    """Fake object endpoint that sleeps like a slow Omni server."""
+
+    def __init__(self, latency: float = BACKEND_LATENCY):
+        self.latency = latency
+        self.calls = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def execute_kw(self, db, uid, password, model, method, args, kwargs):
+        with self._lock:
+            self.calls.append(method)
+            self.threads.add(threading.current_thread().name)
+
+        if method == "fields_get":
+            return {"name": {"type": "char"}}
+
+        time.sleep(self.latency)
+        if method == "search_count":
+            return 100
+        if method == "search":
+            offset = kwargs.get("offset", 0)
+            return list(range(offset + 1, offset + kwargs.get("limit", 10) + 1))
+        if method == "search_read":
+            offset = kwargs.get("offset", 0)
+            return [
+                {"id": record_id, "name": f"Record {record_id}"}
+                for record_id in range(offset + 1, offset + kwargs.get("limit", 10) + 1)
+            ]
+        if method == "read":
+            return [{"id": record_id, "name": f"Record {record_id}"} for record_id in args[0]]
+        return True
+
+
+@pytest.fixture
+def config():
+    """Create test configuration."""
+    return OmniConfig(
+        url="http://localhost:8069",
+        api_key="test_api_key",
+        database="test_db",
+        max_workers=16,
+    )
+
+
+@pytest.fixture
+def connection(config):
+    """Create an authenticated connection backed by a slow fake proxy."""
+    conn = OmniConnection(config)
+    conn._connected = True
+    conn._authenticated = True
+    conn._uid = 2
+    conn._database = "test_db"
+    conn._auth_method = "api_key"
+    conn._object_proxy = SlowObjectProxy()
+    yield conn
+    conn.disconnect(suppress_logging=True)
+
+
+class TestAsyncConnectionMethods:
+    """Test the async execution layer on OmniConnection."""
+
+    @pytest.mark.asyncio
+    async def test_async_methods_match_sync_results(self, connection):
+        """Async wrappers return the same results as the sync methods."""
+        connection._object_proxy.latency = 0
+
+        assert await connection.asearch("res.partner", [], limit=3) == [1, 2, 3]
+        assert await connection.asearch_count("res.partner", []) == 100
+        assert await connection.aread("res.partner", [5], ["name"]) == [
+            {"id": 5, "name": "Record 5"}
+        ]
+        assert await connection.afields_get("res.partner") == {"name": {"type": "char"}}
+        assert await connection.aexecute_kw("res.partner", "write", [[1], {}], {}) is True
+
+    @pytest.mark.asyncio
+    async def test_calls_run_on_executor_threads(self, connection):
+        """Blocking XML-RPC calls never run on the event loop thread."""
+        connection._object_proxy.latency = 0
+
+        await connection.asearch("res.partner", [])
+
+        assert threading.current_thread().name not in connection._object_proxy.threads
+        assert all(name.startswith("omni-rpc") for name in connection._object_proxy.threads)
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, connection):
+        """Exceptions raised in the executor surface to the awaiting caller."""
+        connection._object_proxy = Mock()
+        connection._object_proxy.execute_kw.side_effect = Exception("boom")
+
+        with pytest.raises(OmniConnectionError, match="Operation failed"):
+            await connection.asearch("res.partner", [])
+
+    @pytest.mark.asyncio
+    async def test_executor_is_bounded(self, config):
+        """No more than max_workers calls run at the same time."""
+        config.max_workers = 2
+        conn = OmniConnection(config)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def blocking_call():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(conn.run_async(blocking_call) for _ in range(6)))
+
+        assert peak == 2
+        conn._shutdown_executor()
+
+    def test_disconnect_shuts_down_executor(self, connection):
+        """Disconnecting releases the executor; it is recreated on demand."""
+        executor = connection._get_executor()
+
+        connection.disconnect(suppress_logging=True)
+
+        assert connection._executor is None
+        assert executor._shutdown
+
+
+class TestConcurrentToolCalls:
+    """Load test: concurrent tool calls overlap their Omni round-trips."""
+
+    @pytest.fixture
+    def handler(self, connection, config):
+        """Create a tool handler around the slow connection."""
+        app = MagicMock(spec=FastMCP)
+        access_controller = MagicMock(spec=AccessController)
+        return OmniToolHandler(app, connection, access_controller, config)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_search_records_overlap(self, handler):
+        """N concurrent search_records finish in about one call's latency, not N."""
+        concurrency = 8
+
+        start = time.perf_counter()
+        await handler._handle_search_tool("res.partner", [], ["name"], 10, 1000, None)
+        single_call = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                handler._handle_search_tool("res.partner", [], ["name"], 10, i * 10, None)
+                for i in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+        assert [len(r["records"]) for r in results] == [10] * concurrency
+        assert results[3]["records"][0]["id"] == 31
+        # Serial execution would take concurrency * single_call
+        assert elapsed < single_call * 2
@@ -16,6 +16,7 @@ from mcp_server_omni.error_handling import (
 )
 from mcp_server_omni.omni_connection import OmniConnection, OmniConnectionError
 from mcp_server_omni.resources import OmniResourceHandler, register_resources
+from tests.helpers.mock_connection import wire_async_methods
 
 
 @pytest.fixture
@@ -39,7 +40,7 @@ def mock_config():
 @pytest.fixture
 def mock_connection():
     """Create mock OmniConnection."""
-    conn = Mock(spec=OmniConnection)
+    conn = wire_async_methods(Mock(spec=OmniConnection))
     conn.is_authenticated = True
     conn.search = Mock()
     conn.read = Mock()
@@ -114,6 +115,10 @@ class TestOmniResourceHandler:
 
         # Verify calls
         mock_access_controller.validate_model_access.assert_called_once_with("res.partner", "read")
+        # The access check may block on REST, so it runs on the executor
+        mock_connection.run_async.assert_any_call(
+            mock_access_controller.validate_model_access, "res.partner", "read"
+        )
         mock_connection.search.assert_called_once_with("res.partner", [("id", "=", 1)])
         mock_connection.read.assert_called_once_with("res.partner", [1])
 
@@ -0,0 +1,297 @@
+"""Tests for batch write tools."""
+
+import xmlrpc.client
+from unittest.mock import Mock, call
+
+import pytest
+
+from mcp_server_omni.omni_connection import OmniConnectionError
+from mcp_server_omni.tools import MAX_BATCH_SIZE, OmniToolHandler, ToolError, register_tools
+from tests.helpers.mock_connection import wire_async_methods
+
+
+def read_names(model, ids, fields=None):
+    """Fake read returning a name for every requested ID."""
+    return [{"id": i, "name": f"Record {i}", "display_name": f"Record {i}"} for i in ids]
+
+
+def server_fault(message):
+    """Build the error a connection raises for an XML-RPC fault."""
+    error = OmniConnectionError(f"Operation failed: {message}")
+    error.__cause__ = xmlrpc.client.Fault(1, message)
+    return error
+
+
+@pytest.fixture
+def connection():
+    """Create a mocked connection."""
+    conn = wire_async_methods(Mock())
+    conn.is_authenticated = True
+    conn.read.side_effect = read_names
+    conn.fields_get.return_value = {}
+    return conn
+
+
+@pytest.fixture
+def handler(connection):
+    """Create a tool handler."""
+    config = Mock()
+    config.url = "http://localhost:8069"
+    return OmniToolHandler(Mock(), connection, Mock(), config)
+
+
+class TestCreateRecords:
+    """Test the create_records tool."""
+
+    @pytest.mark.asyncio
+    async def test_single_create_and_read(self, handler, connection):
+        """Test all items are created with one create and read back with one read."""
+        connection.create_many.return_value = [11, 12, 13]
+
+        result = await handler._handle_create_records_tool(
+            "res.partner", [{"name": "A"}, {"name": "B"}, {"name": "C"}]
+        )
+
+        connection.create_many.assert_called_once_with(
+            "res.partner", [{"name": "A"}, {"name": "B"}, {"name": "C"}]
+        )
+        connection.create.assert_not_called()
+        assert connection.read.call_count == 1
+        assert result["created"] == 3
+        assert result["success"] is True
+        assert [r["id"] for r in result["results"]] == [11, 12, 13]
+        assert result["results"][1]["record"]["name"] == "Record 12"
+
+    @pytest.mark.asyncio
+    async def test_invalid_items_reported(self, handler, connection):
+        """Test empty items get their own error without failing the batch."""
+        connection.create_many.return_value = [21]
+
+        result = await handler._handle_create_records_tool("res.partner", [{}, {"name": "B"}])
+
+        connection.create_many.assert_called_once_with("res.partner", [{"name": "B"}])
+        assert result["results"][0] == {
+            "index": 0,
+            "success": False,
+            "error": "No values provided for record creation",
+        }
+        assert result["results"][1]["id"] == 21
+        assert result["failed"] == 1
+        assert result["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retried_per_item(self, handler, connection):
+        """Test a rejected batch is isolated to the failing items."""
+        connection.create_many.side_effect = server_fault("Invalid field 'bogus'")
+        connection.create.side_effect = [31, server_fault("Invalid field 'bogus'")]
+
+        result = await handler._handle_create_records_tool(
+            "res.partner", [{"name": "A"}, {"bogus": 1}]
+        )
+
+        assert connection.create.call_count == 2
+        assert result["results"][0]["success"] is True
+        assert result["results"][1]["success"] is False
+        assert "bogus" in result["results"][1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_transport_error_not_retried(self, handler, connection):
+        """Test a batch that may have been applied is not created again."""
+        connection.create_many.side_effect = OmniConnectionError("Operation timeout")
+
+        with pytest.raises(ToolError, match="Operation timeout"):
+            await handler._handle_create_records_tool("res.partner", [{"name": "A"}])
+
+        connection.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_too_large(self, handler):
+        """Test oversized batches are rejected."""
+        with pytest.raises(ToolError, match="Too many records"):
+            await handler._handle_create_records_tool(
+                "res.partner", [{"name": "A"}] * (MAX_BATCH_SIZE + 1)
+            )
+
+
+class TestUpdateRecords:
+    """Test the update_records tool."""
+
+    @pytest.mark.asyncio
+    async def test_identical_values_grouped(self, handler, connection):
+        """Test identical values share one write and results are read once."""
+        connection.search.return_value = [1, 2, 3]
+
+        result = await handler._handle_update_records_tool(
+            "res.partner",
+            [
+                {"id": 1, "values": {"active": False}},
+                {"id": 2, "values": {"phone": "123"}},
+                {"id": 3, "values": {"active": False}},
+            ],
+        )
+
+        connection.search.assert_called_once_with("res.partner", [["id", "in", [1, 2, 3]]])
+        assert connection.write.call_args_list == [
+            call("res.partner", [1, 3], {"active": False}),
+            call("res.partner", [2], {"phone": "123"}),
+        ]
+        connection.read.assert_called_once()
+        assert result["updated"] == 3
+        assert [r["id"] for r in result["results"]] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_missing_and_invalid_items(self, handler, connection):
+        """Test missing records and malformed items get their own errors."""
+        connection.search.return_value = [1]
+
+        result = await handler._handle_update_records_tool(
+            "res.partner",
+            [
+                {"id": 1, "values": {"name": "X"}},
+                {"id": 999, "values": {"name": "X"}},
+                {"id": 2, "values": {}},
+                {"values": {"name": "X"}},
+            ],
+        )
+
+        connection.write.assert_called_once_with("res.partner", [1], {"name": "X"})
+        errors = [r.get("error") for r in result["results"]]
+        assert errors[0] is None
+        assert errors[1] == "Record not found: res.partner with ID 999"
+        assert errors[2] == "No values provided for record update"
+        assert errors[3] == "Each update requires an integer 'id'"
+        assert result["failed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_repeated_record_written_in_order(self, handler, connection):
+        """Test a record updated twice gets its writes in item order."""
+        connection.search.return_value = [1, 2]
+
+        await handler._handle_update_records_tool(
+            "res.partner",
+            [
+                {"id": 1, "values": {"name": "First"}},
+                {"id": 1, "values": {"name": "Second"}},
+                {"id": 2, "values": {"name": "First"}},
+            ],
+        )
+
+        assert connection.write.call_args_list == [
+            call("res.partner", [1, 2], {"name": "First"}),
+            call("res.partner", [1], {"name": "Second"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_group_retried_per_item(self, handler, connection):
+        """Test a rejected grouped write is isolated to the failing record."""
+        connection.search.return_value = [1, 2]
+
+        def write(model, ids, values):
+            if 2 in ids:
+                raise server_fault("Record is locked")
+            return True
+
+        connection.write.side_effect = write
+
+        result = await handler._handle_update_records_tool(
+            "res.partner",
+            [{"id": 1, "values": {"name": "X"}}, {"id": 2, "values": {"name": "X"}}],
+        )
+
+        assert result["results"][0]["success"] is True
+        assert result["results"][1]["success"] is False
+        assert "locked" in result["results"][1]["error"]
+        connection.read.assert_called_once_with("res.partner", [1], ["id", "name", "display_name"])
+
+    @pytest.mark.asyncio
+    async def test_transport_error_not_retried(self, handler, connection):
+        """Test a timed-out grouped write is reported for every item, not repeated."""
+        connection.search.return_value = [1, 2]
+        connection.write.side_effect = OmniConnectionError("Operation timeout")
+
+        result = await handler._handle_update_records_tool(
+            "res.partner",
+            [{"id": 1, "values": {"name": "X"}}, {"id": 2, "values": {"name": "X"}}],
+        )
+
+        connection.write.assert_called_once_with("res.partner", [1, 2], {"name": "X"})
+        assert result["updated"] == 0
+        assert [r["success"] for r in result["results"]] == [False, False]
+        assert all("timeout" in r["error"] for r in result["results"])
+
+
+class TestDeleteRecords:
+    """Test the delete_records tool."""
+
+    @pytest.mark.asyncio
+    async def test_single_search_and_unlink(self, handler, connection):
+        """Test existing records are deleted with one unlink."""
+        connection.search_read.side_effect = lambda model, domain, fields, cache: read_names(
+            model, [i for i in domain[0][2] if i != 404]
+        )
+
+        result = await handler._handle_delete_records_tool("res.partner", [5, 404, 6, 5])
+
+        connection.search_read.assert_called_once_with(
+            "res.partner", [["id", "in", [5, 404, 6]]], ["display_name"], cache=False
+        )
+        connection.read.assert_not_called()
+        connection.unlink.assert_called_once_with("res.partner", [5, 6])
+        assert result["deleted"] == 2
+        assert result["failed"] == 1
+        assert [r["id"] for r in result["results"]] == [5, 404, 6]
+        assert result["results"][0]["deleted_name"] == "Record 5"
+        assert result["results"][1]["error"] == "Record not found: res.partner with ID 404"
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retried_per_item(self, handler, connection):
+        """Test a rejected unlink is isolated to the failing record."""
+
+        def unlink(model, ids):
+            if 6 in ids:
+                raise server_fault("Cannot delete a posted entry")
+            return True
+
+        connection.search_read.return_value = read_names("account.move", [5, 6])
+        connection.unlink.side_effect = unlink
+
+        result = await handler._handle_delete_records_tool("account.move", [5, 6])
+
+        assert result["results"][0]["success"] is True
+        assert result["results"][1]["success"] is False
+        assert result["deleted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_error_not_retried(self, handler, connection):
+        """Test records are not deleted one by one after a timed-out unlink."""
+        connection.search_read.return_value = read_names("res.partner", [5, 6])
+        connection.unlink.side_effect = OmniConnectionError("Operation timeout")
+
+        with pytest.raises(ToolError, match="Operation timeout"):
+            await handler._handle_delete_records_tool("res.partner", [5, 6])
+
+        connection.unlink.assert_called_once_with("res.partner", [5, 6])
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, handler):
+        """Test an empty batch is rejected."""
+        with pytest.raises(ToolError, match="No record IDs provided"):
+            await handler._handle_delete_records_tool("res.partner", [])
+
+
+def test_batch_tools_registered(connection):
+    """Test that batch write tools are registered."""
+    decorated_functions = []
+
+    def tool_decorator():
+        def decorator(func):
+            decorated_functions.append(func.__name__)
+            return func
+
+        return decorator
+
+    app = Mock()
+    app.tool = tool_decorator
+    register_tools(app, connection, Mock(), Mock())
+
+    assert {"create_records", "update_records", "delete_records"} <= set(decorated_functions)
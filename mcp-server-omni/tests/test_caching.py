@@ -8,7 +8,7 @@ import pytest
 
 from mcp_server_omni.config import OmniConfig, load_config
 from mcp_server_omni.omni_connection import OmniConnection
-from mcp_server_omni.performance import PerformanceManager
+from mcp_server_omni.performance import PerformanceManager, last_response_bytes
 
 # Import skip_on_rate_limit decorator
 from .test_xmlrpc_operations import skip_on_rate_limit
@@ -22,6 +22,8 @@ class TestOmniConnectionCaching:
         """Create mock config."""
         config = Mock(spec=OmniConfig)
         config.url = os.getenv("OMNI_URL", "http://localhost:8069")
+        config.fields_cache_dir = None
+        config.query_cache_ttl = 0
         config.db = "test"
         config.username = "test"
         config.password = "test"
@@ -170,6 +172,86 @@ class TestOmniConnectionCaching:
             assert records[0]["name"] == "Updated"
             mock_execute.assert_called_once()
 
+    @pytest.fixture
+    def connected(self, mock_config, mock_performance_manager):
+        """Create an authenticated connection backed by the real performance manager."""
+        conn = OmniConnection(mock_config, performance_manager=mock_performance_manager)
+        conn._connected = True
+        conn._authenticated = True
+        conn._uid = 2
+        conn._database = "test"
+        return conn
+
+    def test_read_fetches_only_missing_fields(self, connected):
+        """A wider read after a narrow one fetches only the new fields."""
+        with patch.object(connected, "execute_kw") as mock_execute:
+            mock_execute.return_value = [{"id": 7, "name": "Partner 7"}]
+            connected.read("res.partner", [7], fields=["name"])
+
+            mock_execute.return_value = [{"id": 7, "email": "p7@example.com"}]
+            records = connected.read("res.partner", [7], fields=["name", "email"])
+
+            assert records == [{"id": 7, "name": "Partner 7", "email": "p7@example.com"}]
+            mock_execute.assert_called_with("res.partner", "read", [[7]], {"fields": ["email"]})
+
+            # Every field is now cached, in any combination
+            assert connected.read("res.partner", [7], fields=["email"]) == [
+                {"id": 7, "email": "p7@example.com"}
+            ]
+            assert mock_execute.call_count == 2
+
+    def test_read_fetches_only_missing_ids(self, connected):
+        """Records already cached are not requested again."""
+        with patch.object(connected, "execute_kw") as mock_execute:
+            mock_execute.return_value = [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+            connected.read("res.partner", [1, 2], fields=["name"])
+
+            mock_execute.return_value = [{"id": 3, "name": "C"}]
+            records = connected.read("res.partner", [3, 1, 2], fields=["name"])
+
+            assert [r["id"] for r in records] == [3, 1, 2]
+            mock_execute.assert_called_with("res.partner", "read", [[3]], {"fields": ["name"]})
+
+    def test_full_read_serves_field_subsets(self, connected, mock_performance_manager):
+        """A read of all fields answers later reads of any field subset."""
+        full_record = {"id": 5, "name": "Five", "email": "five@example.com", "phone": "555"}
+        with patch.object(connected, "execute_kw", return_value=[full_record]) as mock_execute:
+            connected.read("res.partner", [5])
+            subset = connected.read("res.partner", [5], fields=["name", "phone"])
+            everything = connected.read("res.partner", [5])
+
+        assert subset == [{"id": 5, "name": "Five", "phone": "555"}]
+        assert everything == [full_record]
+        mock_execute.assert_called_once()
+
+        stats = mock_performance_manager.record_cache.get_stats()
+        assert stats["total_entries"] == 1
+        assert stats["hits"] == 2
+
+    def test_partial_entry_does_not_answer_full_read(self, connected):
+        """Reading all fields is a miss until a full read has been cached."""
+        with patch.object(connected, "execute_kw") as mock_execute:
+            mock_execute.return_value = [{"id": 5, "name": "Five"}]
+            connected.read("res.partner", [5], fields=["name"])
+
+            mock_execute.return_value = [{"id": 5, "name": "Five", "email": "five@example.com"}]
+            connected.read("res.partner", [5])
+
+            mock_execute.assert_called_with("res.partner", "read", [[5]], {})
+
+    def test_records_sized_from_response_length(self, connected, mock_performance_manager):
+        """Records are charged a share of the raw response instead of being re-encoded."""
+        records = [{"id": i, "name": f"Partner {i}"} for i in range(1, 4)]
+
+        def execute(*args):
+            last_response_bytes.set(3000)
+            return records
+
+        with patch.object(connected, "execute_kw", side_effect=execute):
+            connected.search_read("res.partner", [], ["name"])
+
+        assert mock_performance_manager.record_cache._stats.total_size_bytes == 3000
+
 
 class TestCachingIntegration:
     """Integration tests for caching with real Omni connection."""
@@ -194,6 +194,75 @@ class TestLoadConfig:
         with pytest.raises(ValueError, match="must be a valid integer"):
             load_config()
 
+    def test_load_config_async_client_flag(self, monkeypatch):
+        """Test parsing the boolean OMNI_MCP_ASYNC_CLIENT setting."""
+        monkeypatch.setenv("OMNI_URL", "http://localhost:8069")
+        monkeypatch.setenv("OMNI_API_KEY", "test-key")
+
+        monkeypatch.delenv("OMNI_MCP_ASYNC_CLIENT", raising=False)
+        assert load_config().async_client is False
+
+        monkeypatch.setenv("OMNI_MCP_ASYNC_CLIENT", "true")
+        assert load_config().async_client is True
+
+        monkeypatch.setenv("OMNI_MCP_ASYNC_CLIENT", "maybe")
+        with pytest.raises(ValueError, match="must be a boolean"):
+            load_config()
+
+    def test_load_config_fields_cache_dir(self, monkeypatch):
+        """Test the optional OMNI_MCP_FIELDS_CACHE_DIR setting."""
+        monkeypatch.setenv("OMNI_URL", "http://localhost:8069")
+        monkeypatch.setenv("OMNI_API_KEY", "test-key")
+
+        monkeypatch.delenv("OMNI_MCP_FIELDS_CACHE_DIR", raising=False)
+        assert load_config().fields_cache_dir is None
+
+        monkeypatch.setenv("OMNI_MCP_FIELDS_CACHE_DIR", " /tmp/omni-cache ")
+        assert load_config().fields_cache_dir == "/tmp/omni-cache"
+
+    def test_load_config_query_cache_ttl(self, monkeypatch):
+        """Test the opt-in OMNI_MCP_QUERY_CACHE_TTL setting."""
+        monkeypatch.setenv("OMNI_URL", "http://localhost:8069")
+        monkeypatch.setenv("OMNI_API_KEY", "test-key")
+
+        monkeypatch.delenv("OMNI_MCP_QUERY_CACHE_TTL", raising=False)
+        assert load_config().query_cache_ttl == 0
+
+        monkeypatch.setenv("OMNI_MCP_QUERY_CACHE_TTL", "30")
+        assert load_config().query_cache_ttl == 30
+
+        monkeypatch.setenv("OMNI_MCP_QUERY_CACHE_TTL", "-1")
+        with pytest.raises(ValueError, match="cannot be negative"):
+            load_config()
+
+    def test_load_config_tracing(self, monkeypatch):
+        """Test the opt-in trace exporter settings."""
+        monkeypatch.setenv("OMNI_URL", "http://localhost:8069")
+        monkeypatch.setenv("OMNI_API_KEY", "test-key")
+
+        monkeypatch.delenv("OMNI_MCP_TRACE_FILE", raising=False)
+        monkeypatch.delenv("OMNI_MCP_TRACE_ENDPOINT", raising=False)
+        config = load_config()
+        assert config.trace_file is None
+        assert config.trace_endpoint is None
+
+        monkeypatch.setenv("OMNI_MCP_TRACE_FILE", " /tmp/traces.jsonl ")
+        monkeypatch.setenv("OMNI_MCP_TRACE_ENDPOINT", "http://localhost:4318")
+        config = load_config()
+        assert config.trace_file == "/tmp/traces.jsonl"
+        assert config.trace_endpoint == "http://localhost:4318"
+
+    def test_load_config_metrics_enabled(self, monkeypatch):
+        """Test the opt-in OMNI_MCP_METRICS_ENABLED setting."""
+        monkeypatch.setenv("OMNI_URL", "http://localhost:8069")
+        monkeypatch.setenv("OMNI_API_KEY", "test-key")
+
+        monkeypatch.delenv("OMNI_MCP_METRICS_ENABLED", raising=False)
+        assert load_config().metrics_enabled is False
+
+        monkeypatch.setenv("OMNI_MCP_METRICS_ENABLED", "true")
+        assert load_config().metrics_enabled is True
+
 
 class TestConfigSingleton:
     """Test the singleton configuration management."""
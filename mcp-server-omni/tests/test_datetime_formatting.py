@@ -1,10 +1,16 @@
 """Test datetime formatting in tools."""
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from mcp_server_omni.field_plan import (
+    _parse_format_datetime,
+    format_datetime,
+    normalize_datetimes,
+)
 from mcp_server_omni.tools import OmniToolHandler
+from tests.helpers.mock_connection import wire_async_methods
 
 
 class TestDateTimeFormatting:
@@ -14,11 +20,12 @@ class TestDateTimeFormatting:
     def tool_handler(self):
         """Create a tool handler with mocked dependencies."""
         app = Mock()
-        connection = Mock()
+        connection = wire_async_methods(Mock())
         access_controller = Mock()
         config = Mock()
         config.default_limit = 10
         config.max_limit = 100
+        config.max_smart_fields = 15
 
         return OmniToolHandler(app, connection, access_controller, config)
 
@@ -52,7 +59,7 @@ class TestDateTimeFormatting:
         assert tool_handler._format_datetime(None) is None
         assert tool_handler._format_datetime(False) is False
 
-    def test_process_record_dates_with_metadata(self, tool_handler):
+    async def test_process_record_dates_with_metadata(self, tool_handler):
         """Test processing dates in a record with field metadata."""
         # Mock fields_get to return field metadata
         tool_handler.connection.fields_get.return_value = {
@@ -70,14 +77,15 @@ class TestDateTimeFormatting:
             "date_field": "2025-06-06",
         }
 
-        result = tool_handler._process_record_dates(record, "res.partner")
+        plan = await tool_handler._load_field_plan("res.partner")
+        result = tool_handler._process_record_dates(record, "res.partner", plan)
 
         assert result["create_date"] == "2025-06-06T13:50:23+00:00"
         assert result["write_date"] == "2025-06-06T14:30:00+00:00"
         assert result["date_field"] == "2025-06-06"  # Date fields unchanged
         assert result["name"] == "Test Record"  # Non-date fields unchanged
 
-    def test_process_record_dates_without_metadata(self, tool_handler):
+    async def test_process_record_dates_without_metadata(self, tool_handler):
         """Test processing dates in a record without field metadata (fallback)."""
         # Mock fields_get to raise an exception
         tool_handler.connection.fields_get.side_effect = Exception("Cannot get fields")
@@ -90,7 +98,8 @@ class TestDateTimeFormatting:
             "not_a_date": "some text",
         }
 
-        result = tool_handler._process_record_dates(record, "res.partner")
+        plan = await tool_handler._load_field_plan("res.partner")
+        result = tool_handler._process_record_dates(record, "res.partner", plan)
 
         # Should detect datetime patterns and format them
         assert result["some_datetime"] == "2025-06-06T13:50:23+00:00"
@@ -103,8 +112,7 @@ class TestDateTimeFormatting:
         # Setup mocks
         tool_handler.connection.is_authenticated = True
         tool_handler.connection.search_count.return_value = 1
-        tool_handler.connection.search.return_value = [1]
-        tool_handler.connection.read.return_value = [
+        tool_handler.connection.search_read.return_value = [
             {
                 "id": 1,
                 "name": "Test Partner",
@@ -123,6 +131,22 @@ class TestDateTimeFormatting:
 
         assert result["records"][0]["create_date"] == "2025-06-06T13:50:23+00:00"
 
+    async def test_search_records_without_metadata_does_not_block(self, tool_handler):
+        """Test a failed async fields_get is not retried on the event loop."""
+        tool_handler.connection.is_authenticated = True
+        tool_handler.connection.search_count.return_value = 1
+        tool_handler.connection.search_read.return_value = [
+            {"id": 1, "create_date": "20250606T13:50:23"}
+        ]
+        tool_handler.connection.afields_get = AsyncMock(side_effect=Exception("timeout"))
+
+        result = await tool_handler._handle_search_tool("res.partner", [], None, 10, 0, None)
+
+        # All fields are read and datetimes are detected by value
+        assert result["records"][0]["create_date"] == "2025-06-06T13:50:23+00:00"
+        assert tool_handler.connection.search_read.call_args[0][2] is None
+        tool_handler.connection.fields_get.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_record_formats_dates(self, tool_handler):
         """Test that get_record formats datetime fields."""
@@ -149,3 +173,80 @@ class TestDateTimeFormatting:
 
         assert result["create_date"] == "2025-06-06T13:50:23+00:00"
         assert result["write_date"] == "2025-06-06T14:30:00+00:00"
+
+
+class TestBatchDatetimeNormalization:
+    """Test the slicing fast path and the batch normalizer."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "20250606T13:50:23",
+            "2025-06-06 13:50:23",
+            "2024-02-29 00:00:00",  # Leap day
+            "2023-02-29 00:00:00",  # Invalid leap day
+            "1900-02-29 00:00:00",  # Century, not a leap year
+            "2025-06-06 13:50:60",  # Leap second accepted by strptime
+            "2025-13-06 13:50:23",
+            "0999-06-06 13:50:23",  # Year below 1000
+            "2025-6-6  13:50:23",  # Unpadded fields
+            "2025-06-06 1:50:23 ",
+            "2025٠6-06 13:50:23",  # Non-ASCII digit
+            "2025-06-06T13:50:2",
+            "2025-06-06T13:50:23+00:00",
+            "20250606T13:50:2x",
+            "some text of 17ch",
+        ],
+    )
+    def test_fast_path_matches_strptime(self, value):
+        """Test slicing output is identical to the strptime implementation."""
+        assert format_datetime(value) == _parse_format_datetime(value)
+
+    def test_normalize_datetimes(self):
+        """Test declared columns and datetime-looking values are rewritten."""
+        records = [
+            {
+                "id": 1,
+                "create_date": "20250606T13:50:23",
+                "note": "2025-06-06 14:30:00",
+                "name": "Test",
+                "active": False,
+            },
+            {"id": 2, "create_date": False, "note": "", "name": "2025-06-06"},
+        ]
+
+        result = normalize_datetimes(records, {"create_date"})
+
+        assert result is records
+        assert records[0]["create_date"] == "2025-06-06T13:50:23+00:00"
+        assert records[0]["note"] == "2025-06-06T14:30:00+00:00"
+        assert records[0]["name"] == "Test"
+        assert records[1] == {"id": 2, "create_date": False, "note": "", "name": "2025-06-06"}
+
+    def test_batch_normalization_matches_strptime(self):
+        """Test batch normalization gives the same result as per-value strptime."""
+        count = 1000
+
+        def make_records():
+            return [
+                {
+                    "id": i,
+                    "name": f"Record {i}",
+                    "create_date": f"2025-06-{i % 28 + 1:02d} 13:{i % 60:02d}:23",
+                    "write_date": f"202506{i % 28 + 1:02d}T14:{i % 60:02d}:00",
+                    "date_deadline": f"2025-07-{i % 28 + 1:02d} {i % 24:02d}:00:00",
+                    "description": "A plain text value",
+                }
+                for i in range(count)
+            ]
+
+        reference = make_records()
+        for record in reference:
+            for field_name, value in record.items():
+                if isinstance(value, str):
+                    record[field_name] = _parse_format_datetime(value)
+
+        records = make_records()
+        normalize_datetimes(records, {"create_date", "write_date", "date_deadline"})
+
+        assert records == reference
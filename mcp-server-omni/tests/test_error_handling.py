@@ -1,5 +1,6 @@
 """Tests for error handling and logging system."""
 
+import io
 import json
 import logging
 import os
@@ -28,16 +29,21 @@ from mcp_server_omni.error_handling import (
     handle_omni_error,
 )
 from mcp_server_omni.logging_config import (
+    AsyncLogHandler,
+    LazyRepr,
     LoggingConfig,
     PerformanceLogger,
     RequestLoggingAdapter,
     StructuredFormatter,
+    flush_logging,
+    get_logging_stats,
     log_request,
     log_response,
     logging_config,
     perf_logger,
     setup_logging,
 )
+from mcp_server_omni.tracing import SpanExporter, tracer
 
 
 class TestMCPError:
@@ -407,6 +413,70 @@ class TestLoggingConfiguration:
         assert call_args[1]["extra"]["model"] == "res.partner"
         assert call_args[1]["extra"]["duration_ms"] > 0
 
+    def test_performance_logger_sampling(self):
+        """Test sampled-out completions are not logged but slow ones are."""
+        logger = MagicMock()
+        perf = PerformanceLogger(logger, sample_rate=0.0)
+
+        with perf.track_operation("fast_op"):
+            pass
+        logger.info.assert_not_called()
+        logger.warning.assert_not_called()
+
+        perf.slow_threshold_ms = 0
+        with perf.track_operation("slow_op", model="res.partner"):
+            time.sleep(0.001)
+        logger.info.assert_not_called()
+        assert "slow_op" in logger.warning.call_args[0][0]
+        assert logger.warning.call_args[1]["extra"]["model"] == "res.partner"
+
+    def test_performance_logger_sampling_benchmark(self):
+        """Benchmark per-call overhead with timing logs sampled out."""
+        logger = logging.getLogger("test.perf_benchmark")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        handler = logging.StreamHandler(io.StringIO())
+        handler.setFormatter(StructuredFormatter())
+        logger.addHandler(handler)
+
+        def per_call(sample_rate, calls=2000):
+            perf = PerformanceLogger(logger, sample_rate=sample_rate)
+            start = time.perf_counter()
+            for _ in range(calls):
+                with perf.track_operation("tool_search", model="res.partner"):
+                    pass
+            return (time.perf_counter() - start) / calls
+
+        try:
+            logged = per_call(1.0)
+            sampled = per_call(0.0)
+        finally:
+            logger.removeHandler(handler)
+
+        assert handler.stream.getvalue().count("\n") == 2000
+        # Skipping the JSON record and stream write is several times cheaper
+        assert sampled < logged / 2
+
+    def test_lazy_repr(self):
+        """Test log arguments are abbreviated and only rendered when emitted."""
+        rendered = []
+
+        class Payload:
+            def __repr__(self):
+                rendered.append(True)
+                return "Payload()"
+
+        logger = logging.getLogger("test.lazy_repr")
+        logger.setLevel(logging.INFO)
+        logger.debug("args=%s", LazyRepr(Payload()))
+        assert rendered == []
+
+        text = str(LazyRepr([list(range(500))]))
+        assert text.startswith("[[0, 1, 2,")
+        assert text.endswith("...]]")
+        assert len(text) < 100
+        assert len(str(LazyRepr("x" * 5000, max_length=50))) == 53
+
     def test_setup_logging(self):
         """Test logging setup."""
         with tempfile.NamedTemporaryFile(delete=False) as tmp:
@@ -444,6 +514,11 @@ class TestLoggingConfiguration:
             assert config.log_file == "/tmp/test.log"
             assert config.slow_operation_threshold_ms == 500
 
+        with patch.dict(os.environ, {"OMNI_MCP_PERF_LOG_SAMPLE_RATE": "0.25"}):
+            assert LoggingConfig().perf_log_sample_rate == 0.25
+        with patch.dict(os.environ, {"OMNI_MCP_PERF_LOG_SAMPLE_RATE": "5"}):
+            assert LoggingConfig().perf_log_sample_rate == 1.0
+
     def test_log_request_response(self):
         """Test request/response logging helpers."""
         logger = MagicMock()
@@ -491,6 +566,171 @@ class TestLoggingConfiguration:
         assert "Internal server error" in call_args[0][0]
 
 
+class CountingStream(io.StringIO):
+    """String stream that counts write calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestAsyncLogging:
+    """Test queue-based asynchronous logging."""
+
+    @pytest.fixture
+    def stream_handler(self):
+        """JSON stream handler wrapped by the async handler."""
+        handler = logging.StreamHandler(CountingStream())
+        handler.setFormatter(StructuredFormatter())
+        return handler
+
+    def make_logger(self, name, handler):
+        """Create an isolated logger writing to handler."""
+        logger = logging.getLogger(name)
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.handlers = [handler]
+        return logger
+
+    def wait_until_taken(self, handler):
+        """Wait until the writer thread has taken everything off the queue."""
+        deadline = time.monotonic() + 5
+        while handler.get_stats()["queue_size"] and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test_records_written_in_batches(self, stream_handler):
+        """Test records are formatted off-thread and written in batches."""
+        handler = AsyncLogHandler([stream_handler])
+        logger = self.make_logger("test.async_batches", handler)
+        try:
+            # Hold the stream so queued records pile up behind the first
+            with stream_handler.lock:
+                logger.info("first")
+                self.wait_until_taken(handler)
+                for i in range(50):
+                    logger.info("record %d", i)
+            assert handler.drain()
+            stats = handler.get_stats()
+        finally:
+            handler.close()
+
+        lines = [json.loads(line) for line in stream_handler.stream.getvalue().splitlines()]
+        assert [line["message"] for line in lines[:2]] == ["first", "record 0"]
+        assert len(lines) == 51
+        assert stats["written"] == 51
+        assert stats["batches"] == 2
+        assert stream_handler.stream.writes == 2
+
+    def test_message_and_trace_captured_on_emit(self, stream_handler):
+        """Test arguments and the active span are snapshotted by the caller."""
+
+        class Collector(SpanExporter):
+            def export(self, spans):
+                pass
+
+        handler = AsyncLogHandler([stream_handler])
+        logger = self.make_logger("test.async_trace", handler)
+        values = ["before"]
+        tracer.configure([Collector()])
+        try:
+            with stream_handler.lock:
+                with tracer.span("tool_search") as span:
+                    logger.info("values=%s", values)
+                values.append("after")
+            handler.flush()
+        finally:
+            tracer.configure([])
+            handler.close()
+
+        line = json.loads(stream_handler.stream.getvalue())
+        assert line["message"] == "values=['before']"
+        assert line["trace_id"] == span.trace_id
+        assert line["span_id"] == span.span_id
+
+    def test_full_queue_drops_and_overflows(self, stream_handler):
+        """Test a full queue drops INFO records and writes WARNING inline."""
+        handler = AsyncLogHandler([stream_handler], queue_size=2)
+        logger = self.make_logger("test.async_overflow", handler)
+        try:
+            with stream_handler.lock:
+                logger.info("taken by writer")
+                self.wait_until_taken(handler)
+                logger.info("queued 1")
+                logger.info("queued 2")
+                for _ in range(3):
+                    logger.info("dropped")
+                logger.warning("overflow")
+            handler.flush()
+            stats = handler.get_stats()
+        finally:
+            handler.close()
+
+        messages = [
+            json.loads(line)["message"] for line in stream_handler.stream.getvalue().splitlines()
+        ]
+        assert messages == ["overflow", "taken by writer", "queued 1", "queued 2"]
+        assert stats["dropped"] == 3
+        assert stats["overflowed"] == 1
+        assert stats["written"] == 3
+
+    def test_close_flushes_and_stops_writer(self, stream_handler):
+        """Test closing writes queued records and stops the thread."""
+        handler = AsyncLogHandler([stream_handler])
+        logger = self.make_logger("test.async_close", handler)
+        logger.info("last words")
+
+        handler.close()
+
+        assert "last words" in stream_handler.stream.getvalue()
+        assert not handler._thread.is_alive()
+        assert handler.drain()
+        # logging.Handler.flush() contract: blocks until written, returns None
+        assert handler.flush() is None
+
+    def test_setup_logging_async(self):
+        """Test setup_logging installs the async handler and reports stats."""
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        try:
+            setup_logging(log_level="INFO", async_logging=True, queue_size=100)
+            handler = root.handlers[0]
+            assert isinstance(handler, AsyncLogHandler)
+            assert isinstance(handler.handlers[0], logging.StreamHandler)
+
+            logging.getLogger("test.async_setup").info("hello")
+            assert flush_logging()
+            stats = get_logging_stats()
+            assert stats["queue_capacity"] == 100
+            assert stats["written"] >= 1
+
+            # Reconfiguring closes the previous writer
+            setup_logging(log_level="INFO")
+            assert not handler._thread.is_alive()
+            assert get_logging_stats() is None
+            assert flush_logging()
+        finally:
+            root.handlers = saved_handlers
+            root.setLevel(saved_level)
+
+    def test_logging_config_async_from_env(self):
+        """Test the async logging settings are read from the environment."""
+        with patch.dict(
+            os.environ, {"OMNI_MCP_LOG_ASYNC": "true", "OMNI_MCP_LOG_QUEUE_SIZE": "500"}
+        ):
+            config = LoggingConfig()
+        assert config.async_logging is True
+        assert config.log_queue_size == 500
+
+        with patch("mcp_server_omni.logging_config.setup_logging") as mock_setup:
+            config.setup()
+        assert mock_setup.call_args[1]["async_logging"] is True
+        assert mock_setup.call_args[1]["queue_size"] == 500
+
+
 class TestGlobalInstances:
     """Test global error handler and logging instances."""
 
@@ -9,6 +9,7 @@ from mcp_server_omni.error_handling import ValidationError as ToolError
 from mcp_server_omni.omni_connection import OmniConnectionError
 from mcp_server_omni.resources import OmniResourceHandler
 from mcp_server_omni.tools import OmniToolHandler
+from tests.helpers.mock_connection import wire_async_methods
 
 
 class TestErrorSanitizationIntegration:
@@ -18,7 +19,7 @@ class TestErrorSanitizationIntegration:
     def tool_handler(self):
         """Create a tool handler with mocked dependencies."""
         app = Mock()
-        connection = Mock()
+        connection = wire_async_methods(Mock())
         access_controller = Mock()
         config = Mock()
         config.default_limit = 10
@@ -30,7 +31,7 @@ class TestErrorSanitizationIntegration:
     def resource_handler(self):
         """Create a resource handler with mocked dependencies."""
         app = Mock()
-        connection = Mock()
+        connection = wire_async_methods(Mock())
         access_controller = Mock()
         config = Mock()
         config.default_limit = 10
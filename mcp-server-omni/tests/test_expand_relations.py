@@ -0,0 +1,157 @@
+"""Tests for inline expansion of relational fields."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_server_omni.access_control import AccessControlError
+from mcp_server_omni.error_handling import ValidationError
+from mcp_server_omni.tools import OmniToolHandler
+from tests.helpers.mock_connection import wire_async_methods
+
+FIELDS = {
+    "sale.order": {
+        "name": {"type": "char", "required": True},
+        "partner_id": {"type": "many2one", "relation": "res.partner"},
+        "partner_invoice_id": {"type": "many2one", "relation": "res.partner"},
+        "order_line": {"type": "one2many", "relation": "sale.order.line"},
+        "amount_total": {"type": "monetary"},
+    },
+    "res.partner": {
+        "name": {"type": "char"},
+        "email": {"type": "char"},
+    },
+    "sale.order.line": {
+        "name": {"type": "char"},
+        "product_uom_qty": {"type": "float"},
+    },
+}
+
+ORDERS = [
+    {
+        "id": 1,
+        "name": "SO001",
+        "partner_id": [10, "Acme"],
+        "partner_invoice_id": [11, "Acme Billing"],
+        "order_line": [100, 101],
+    },
+    {
+        "id": 2,
+        "name": "SO002",
+        "partner_id": [10, "Acme"],
+        "partner_invoice_id": False,
+        "order_line": list(range(200, 208)),
+    },
+]
+
+
+def fake_read(model, ids, fields=None):
+    """Return a record for every requested ID of a related model."""
+    return [{"id": i, "name": f"{model} {i}", "display_name": f"{model} {i}"} for i in ids]
+
+
+@pytest.fixture
+def handler():
+    """Create a tool handler with related models."""
+    connection = wire_async_methods(Mock())
+    connection.is_authenticated = True
+    connection.fields_get.side_effect = lambda model, *args: FIELDS[model]
+    connection.search_read.return_value = [dict(order) for order in ORDERS]
+    connection.search_count.return_value = 2
+    connection.read.side_effect = fake_read
+    config = Mock()
+    config.max_limit = 100
+    config.default_limit = 10
+    config.max_smart_fields = 15
+    return OmniToolHandler(Mock(), connection, Mock(), config)
+
+
+class TestExpandRelations:
+    """Test expand on search_records and get_record."""
+
+    @pytest.mark.asyncio
+    async def test_one_read_per_related_model(self, handler):
+        """Test related IDs are collected across the page and read once per model."""
+        result = await handler._handle_search_tool(
+            "sale.order",
+            None,
+            ["name"],
+            10,
+            0,
+            None,
+            expand=["partner_id", "partner_invoice_id", "order_line"],
+        )
+
+        read_calls = handler.connection.read.call_args_list
+        assert sorted(c[0][0] for c in read_calls) == ["res.partner", "sale.order.line"]
+        partner_call = next(c for c in read_calls if c[0][0] == "res.partner")
+        assert partner_call[0][1] == [10, 11]
+        line_call = next(c for c in read_calls if c[0][0] == "sale.order.line")
+        # x2many fields are limited to the first 5 related records per record
+        assert line_call[0][1] == [100, 101, 200, 201, 202, 203, 204]
+
+        # Expanded fields are added to the main read
+        search_fields = handler.connection.search_read.call_args[0][2]
+        assert search_fields == ["name", "partner_id", "partner_invoice_id", "order_line"]
+
+        first, second = result["records"]
+        assert first["partner_id"]["name"] == "res.partner 10"
+        assert first["partner_invoice_id"]["id"] == 11
+        assert first["order_line"]["count"] == 2
+        assert [line["id"] for line in first["order_line"]["records"]] == [100, 101]
+        assert second["partner_invoice_id"] is False
+        assert second["order_line"]["count"] == 8
+        assert len(second["order_line"]["records"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_get_record_expand(self, handler):
+        """Test expand on a single record."""
+        handler.connection.read.side_effect = lambda model, ids, fields=None: (
+            [dict(ORDERS[0])] if model == "sale.order" else fake_read(model, ids, fields)
+        )
+
+        record = await handler._handle_get_record_tool(
+            "sale.order", 1, ["name"], expand=["partner_id"]
+        )
+
+        assert record["partner_id"] == {
+            "id": 10,
+            "name": "res.partner 10",
+            "display_name": "res.partner 10",
+        }
+        assert record["order_line"] == [100, 101]
+
+    @pytest.mark.asyncio
+    async def test_no_expand_leaves_values(self, handler):
+        """Test relational values are untouched without expand."""
+        result = await handler._handle_search_tool("sale.order", None, ["name"], 10, 0, None)
+
+        assert result["records"][0]["partner_id"] == [10, "Acme"]
+        handler.connection.read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_relational_field_rejected(self, handler):
+        """Test expanding a non-relational field fails validation."""
+        with pytest.raises(ValidationError, match="Cannot expand 'amount_total'"):
+            await handler._handle_search_tool(
+                "sale.order", None, None, 10, 0, None, expand=["amount_total"]
+            )
+
+    @pytest.mark.asyncio
+    async def test_related_model_access_checked(self, handler):
+        """Test related models must be readable."""
+
+        def validate(model, operation):
+            if model == "res.partner":
+                raise AccessControlError("Model res.partner is not enabled")
+
+        handler.access_controller.validate_model_access.side_effect = validate
+
+        with pytest.raises(ValidationError, match="Access denied"):
+            await handler._handle_search_tool(
+                "sale.order", None, None, 10, 0, None, expand=["partner_id"]
+            )
+
+        # The main model and the related models are each checked off the event loop
+        assert handler.connection.run_async.call_count == 2
+        handler.access_controller.validate_model_access.assert_called_with("res.partner", "read")
@@ -0,0 +1,274 @@
+"""Tests for chunked record export."""
+
+import csv
+import io
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_server_omni.access_control import AccessControlError
+from mcp_server_omni.error_handling import ValidationError
+from mcp_server_omni.export import ExportWriter, iter_record_chunks
+from mcp_server_omni.resources import OmniResourceHandler, ResourcePermissionError
+from mcp_server_omni.tools import OmniToolHandler
+from tests.helpers.mock_connection import wire_async_methods
+
+
+def make_lines(count):
+    """Build sale.order.line-like records with ids 1..count."""
+    return [
+        {
+            "id": i,
+            "name": f"Line {i}",
+            "product_id": [i % 7 + 1, f"Product {i % 7 + 1}"],
+            "product_uom_qty": float(i),
+            "create_date": "2025-06-06 13:50:23",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+ID_OPERATORS = {">": lambda a, b: a > b, "<=": lambda a, b: a <= b}
+
+
+def keyset_search_read(records, calls=None):
+    """Fake search_read that honours id clauses, limit and id order."""
+
+    def search_read(model, domain, fields=None, limit=None, offset=0, order=None, cache=True):
+        assert order == "id asc"
+        assert cache is False
+        if calls is not None:
+            calls.append({"domain": domain, "fields": fields, "limit": limit})
+        matching = records
+        for _field, operator, value in (c for c in domain if c[0] == "id"):
+            matching = [r for r in matching if ID_OPERATORS[operator](r["id"], value)]
+        matching = matching[:limit]
+        if fields is not None:
+            matching = [{f: r[f] for f in fields if f in r} for r in matching]
+        return [dict(r) for r in matching]
+
+    return search_read
+
+
+@pytest.fixture
+def connection():
+    """Create a mocked connection serving 1050 records."""
+    conn = wire_async_methods(Mock())
+    conn.is_authenticated = True
+    conn.search_read.side_effect = keyset_search_read(make_lines(1050))
+    conn.fields_get.return_value = {
+        "name": {"type": "char"},
+        "product_id": {"type": "many2one"},
+        "product_uom_qty": {"type": "float"},
+        "create_date": {"type": "datetime"},
+        "image": {"type": "binary"},
+    }
+    return conn
+
+
+class TestRecordChunks:
+    """Test keyset pagination and prefetching."""
+
+    @pytest.mark.asyncio
+    async def test_keyset_pagination(self, connection):
+        """Test chunks walk the domain by id without offsets."""
+        calls = []
+        connection.search_read.side_effect = keyset_search_read(make_lines(1050), calls)
+
+        chunks = [
+            chunk
+            async for chunk in iter_record_chunks(
+                connection, "sale.order.line", [["state", "=", "sale"]], ["name"], chunk_size=500
+            )
+        ]
+
+        assert [len(c) for c in chunks] == [500, 500, 50]
+        assert [c["domain"][-1] for c in calls] == [
+            ["id", ">", 0],
+            ["id", ">", 500],
+            ["id", ">", 1000],
+        ]
+        assert all(c["domain"][0] == ["state", "=", "sale"] for c in calls)
+        # id is always read so the next chunk can be requested
+        assert calls[0]["fields"] == ["id", "name"]
+
+    @pytest.mark.asyncio
+    async def test_max_records_and_after_id(self, connection):
+        """Test the record budget and the starting id."""
+        calls = []
+        connection.search_read.side_effect = keyset_search_read(make_lines(1050), calls)
+
+        chunks = [
+            chunk
+            async for chunk in iter_record_chunks(
+                connection, "sale.order.line", [], chunk_size=300, after_id=100, max_records=700
+            )
+        ]
+
+        assert [len(c) for c in chunks] == [300, 300, 100]
+        assert chunks[0][0]["id"] == 101
+        assert chunks[-1][-1]["id"] == 800
+        assert [c["limit"] for c in calls] == [300, 300, 100]
+
+    @pytest.mark.asyncio
+    async def test_next_chunk_prefetched(self, connection):
+        """Test the next chunk is requested before the current one is consumed."""
+        chunks = iter_record_chunks(connection, "sale.order.line", [], chunk_size=500)
+
+        first = await chunks.__anext__()
+
+        assert len(first) == 500
+        assert connection.search_read.call_count == 2
+        await chunks.aclose()
+
+    @pytest.mark.asyncio
+    async def test_empty_domain_result(self, connection):
+        """Test an empty result yields no chunks."""
+        connection.search_read.side_effect = keyset_search_read([])
+
+        chunks = [c async for c in iter_record_chunks(connection, "sale.order.line", [])]
+
+        assert chunks == []
+        assert connection.search_read.call_count == 1
+
+
+class TestExportWriter:
+    """Test NDJSON and CSV serialization."""
+
+    def test_ndjson(self):
+        """Test one JSON object per line."""
+        writer = ExportWriter("ndjson")
+        text = writer.write(make_lines(2)) + writer.write(make_lines(3)[2:])
+
+        lines = text.splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[2])["id"] == 3
+        assert writer.media_type == "application/x-ndjson"
+
+    def test_csv_header_once(self):
+        """Test CSV header is written with the first chunk only."""
+        writer = ExportWriter("csv", ["name", "product_id", "note"])
+        records = make_lines(3)
+        records[0]["note"] = False
+        text = writer.write(records[:2]) + writer.write(records[2:])
+
+        rows = list(csv.reader(io.StringIO(text)))
+        assert rows[0] == ["id", "name", "product_id", "note"]
+        assert rows[1] == ["1", "Line 1", "Product 2", ""]
+        assert len(rows) == 4
+
+    def test_invalid_format(self):
+        """Test unsupported formats are rejected."""
+        with pytest.raises(ValueError, match="Invalid export format"):
+            ExportWriter("xml")
+
+
+class TestExportTool:
+    """Test the export_records tool handler."""
+
+    @pytest.fixture
+    def handler(self, connection):
+        """Create a tool handler."""
+        config = Mock()
+        config.max_smart_fields = 15
+        return OmniToolHandler(Mock(), connection, Mock(), config)
+
+    @pytest.mark.asyncio
+    async def test_export_ndjson_with_continuation(self, handler):
+        """Test exports continue from next_after_id until done."""
+        first = await handler._handle_export_tool(
+            "sale.order.line", None, ["name", "create_date"], max_records=600
+        )
+
+        assert first["count"] == 600
+        assert first["done"] is False
+        assert first["next_after_id"] == 600
+        record = json.loads(first["data"].splitlines()[0])
+        assert record == {"id": 1, "name": "Line 1", "create_date": "2025-06-06T13:50:23+00:00"}
+
+        second = await handler._handle_export_tool(
+            "sale.order.line",
+            None,
+            ["name", "create_date"],
+            after_id=first["next_after_id"],
+            max_records=600,
+        )
+
+        assert second["count"] == 450
+        assert second["done"] is True
+        assert second["next_after_id"] is None
+        assert json.loads(second["data"].splitlines()[0])["id"] == 601
+
+    @pytest.mark.asyncio
+    async def test_export_csv(self, handler):
+        """Test CSV export with a domain given as a string."""
+        result = await handler._handle_export_tool(
+            "sale.order.line", "[['id', '<=', 3]]", '["name", "product_id"]', format="csv"
+        )
+
+        rows = list(csv.reader(io.StringIO(result["data"])))
+        assert result["content_type"] == "text/csv"
+        assert rows[0] == ["id", "name", "product_id"]
+        assert rows[1:] == [
+            ["1", "Line 1", "Product 2"],
+            ["2", "Line 2", "Product 3"],
+            ["3", "Line 3", "Product 4"],
+        ]
+        assert result["count"] == 3
+        assert result["done"] is True
+
+    @pytest.mark.asyncio
+    async def test_invalid_format(self, handler):
+        """Test invalid formats raise a validation error."""
+        with pytest.raises(ValidationError, match="Invalid export format"):
+            await handler._handle_export_tool("sale.order.line", None, None, format="xml")
+
+    @pytest.mark.asyncio
+    async def test_access_denied(self, handler):
+        """Test access control is enforced."""
+        handler.access_controller.validate_model_access.side_effect = AccessControlError("no")
+
+        with pytest.raises(ValidationError, match="Access denied"):
+            await handler._handle_export_tool("sale.order.line", None, None)
+
+
+class TestExportResource:
+    """Test the omni://{model}/export resource."""
+
+    @pytest.mark.asyncio
+    async def test_export_resource(self, connection):
+        """Test the resource exports safe fields as NDJSON."""
+        app = Mock()
+        app.resource = Mock(return_value=lambda func: func)
+        access_controller = Mock()
+        handler = OmniResourceHandler(app, connection, access_controller, Mock())
+
+        text = await handler._handle_export("sale.order.line")
+
+        # The access check runs on the executor, not on the event loop
+        connection.run_async.assert_any_call(
+            access_controller.validate_model_access, "sale.order.line", "read"
+        )
+
+        lines = text.splitlines()
+        assert len(lines) == 1050
+        record = json.loads(lines[0])
+        assert "image" not in record
+        assert record["create_date"] == "2025-06-06T13:50:23+00:00"
+        fields = connection.search_read.call_args_list[0][0][2]
+        assert "image" not in fields
+
+    @pytest.mark.asyncio
+    async def test_export_resource_access_denied(self, connection):
+        """Test the resource rejects models the user cannot read."""
+        app = Mock()
+        app.resource = Mock(return_value=lambda func: func)
+        access_controller = Mock()
+        access_controller.validate_model_access.side_effect = AccessControlError("no")
+        handler = OmniResourceHandler(app, connection, access_controller, Mock())
+
+        with pytest.raises(ResourcePermissionError, match="Access denied"):
+            await handler._handle_export("sale.order.line")
+
+        connection.search_read.assert_not_called()
@@ -0,0 +1,182 @@
+"""Tests for precompiled per-model field plans."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_server_omni.field_plan import FieldPlan, FieldPlanCache, score_field_importance
+from mcp_server_omni.tools import OmniToolHandler
+from tests.helpers.mock_connection import wire_async_methods
+
+PARTNER_FIELDS = {
+    "id": {"type": "integer"},
+    "name": {"type": "char", "required": True},
+    "email": {"type": "char"},
+    "is_company": {"type": "boolean"},
+    "image_1920": {"type": "binary"},
+    "comment": {"type": "html"},
+    "properties": {"type": "serialized"},
+    "child_ids": {"type": "one2many"},
+    "create_date": {"type": "datetime"},
+    "date": {"type": "date"},
+    "last_seen": {"type": "datetime"},
+    "_private": {"type": "char"},
+}
+
+
+class TestFieldPlan:
+    """Test plan contents derived from field definitions."""
+
+    def test_ranked_fields_exclude_zero_scores(self):
+        """Test that ranking keeps only positively scored fields, best first."""
+        plan = FieldPlan(PARTNER_FIELDS)
+
+        assert plan.ranked_fields[0] == "id"
+        assert "name" in plan.ranked_fields[:2]
+        for field in ("image_1920", "comment", "child_ids", "create_date", "_private"):
+            assert field not in plan.ranked_fields
+
+    def test_smart_default_fields(self):
+        """Test smart defaults are the top fields plus essentials."""
+        plan = FieldPlan(PARTNER_FIELDS)
+
+        fields = plan.smart_default_fields(3)
+        assert fields[:2] == ["id", "name"]
+        assert len(fields) == 3
+
+        # Callers may mutate the result without affecting the plan
+        fields.append("extra")
+        assert plan.smart_default_fields(3) == fields[:3]
+
+    def test_datetime_fields(self):
+        """Test datetime detection by type and by name."""
+        plan = FieldPlan(PARTNER_FIELDS)
+
+        assert plan.datetime_fields == {"create_date", "date", "last_seen"}
+
+    def test_safe_fields(self):
+        """Test heavy and private fields are not resource-safe."""
+        plan = FieldPlan(PARTNER_FIELDS)
+
+        assert "image_1920" not in plan.safe_fields
+        assert "comment" not in plan.safe_fields
+        assert "properties" not in plan.safe_fields
+        assert "_private" not in plan.safe_fields
+        assert plan.safe_fields[:4] == ["id", "name", "email", "is_company"]
+
+    def test_score_matches_handler(self):
+        """Test the handler delegates scoring to the plan module."""
+        handler = OmniToolHandler(Mock(), Mock(), Mock(), Mock())
+        for name, info in PARTNER_FIELDS.items():
+            assert handler._score_field_importance(name, info) == score_field_importance(name, info)
+
+
+class TestFieldPlanCache:
+    """Test per-model plan caching."""
+
+    def test_plan_reused_for_same_definitions(self):
+        """Test a plan is built once per fields_get result."""
+        cache = FieldPlanCache()
+
+        plan = cache.get("res.partner", PARTNER_FIELDS)
+        assert cache.get("res.partner", PARTNER_FIELDS) is plan
+
+    def test_plan_rebuilt_when_definitions_change(self):
+        """Test a refreshed fields_get result yields a new plan."""
+        cache = FieldPlanCache()
+        plan = cache.get("res.partner", PARTNER_FIELDS)
+
+        refreshed = dict(PARTNER_FIELDS, phone={"type": "char"})
+        new_plan = cache.get("res.partner", refreshed)
+
+        assert new_plan is not plan
+        assert "phone" in new_plan.safe_fields
+
+    def test_clear(self):
+        """Test clearing plans for one model or all models."""
+        cache = FieldPlanCache()
+        partner_plan = cache.get("res.partner", PARTNER_FIELDS)
+        user_plan = cache.get("res.users", PARTNER_FIELDS)
+
+        cache.clear("res.partner")
+        assert cache.get("res.partner", PARTNER_FIELDS) is not partner_plan
+        assert cache.get("res.users", PARTNER_FIELDS) is user_plan
+
+        cache.clear()
+        assert cache.get("res.users", PARTNER_FIELDS) is not user_plan
+
+
+class TestHandlerFieldPlans:
+    """Test the tool handler's use of field plans."""
+
+    @pytest.fixture
+    def tool_handler(self):
+        """Create a tool handler with mocked dependencies."""
+        connection = wire_async_methods(Mock())
+        connection.fields_get.return_value = PARTNER_FIELDS
+        config = Mock()
+        config.max_smart_fields = 15
+        return OmniToolHandler(Mock(), connection, Mock(), config)
+
+    async def test_smart_defaults_reuse_plan(self, tool_handler, monkeypatch):
+        """Test repeated smart default lookups do not re-score fields."""
+        calls = []
+        original_init = FieldPlan.__init__
+
+        def counting_init(self, fields):
+            calls.append(fields)
+            original_init(self, fields)
+
+        monkeypatch.setattr(FieldPlan, "__init__", counting_init)
+
+        first = tool_handler._get_smart_default_fields(
+            "res.partner", await tool_handler._load_field_plan("res.partner")
+        )
+        second = tool_handler._get_smart_default_fields(
+            "res.partner", await tool_handler._load_field_plan("res.partner")
+        )
+
+        assert first == second
+        assert len(calls) == 1
+
+    async def test_process_record_dates_with_plan(self, tool_handler):
+        """Test dates are formatted from a shared plan without fields_get."""
+        plan = await tool_handler._load_field_plan("res.partner")
+        tool_handler.connection.fields_get.reset_mock()
+
+        record = {
+            "last_seen": "20250607T21:55:52",
+            "create_date": "2025-06-07 21:55:52",
+            "email": "a@example.com",
+        }
+        result = tool_handler._process_record_dates(record, "res.partner", plan)
+
+        assert result["last_seen"] == "2025-06-07T21:55:52+00:00"
+        assert result["create_date"] == "2025-06-07T21:55:52+00:00"
+        assert result["email"] == "a@example.com"
+        tool_handler.connection.fields_get.assert_not_called()
+
+    async def test_date_processing_overhead_benchmark(self, tool_handler):
+        """Benchmark date processing for 100 records of a 300-field model."""
+        fields = {f"x_field_{i}": {"type": "char"} for i in range(290)}
+        fields.update({f"x_date_{i}": {"type": "datetime"} for i in range(10)})
+        tool_handler.connection.fields_get.return_value = fields
+
+        def make_records():
+            return [
+                {name: ("2025-06-07 21:55:52" if "date" in name else "value") for name in fields}
+                for _ in range(100)
+            ]
+
+        plan = await tool_handler._load_field_plan("res.partner")
+        records = make_records()
+        start = time.perf_counter()
+        for record in records:
+            tool_handler._process_record_dates(record, "res.partner", plan)
+        duration = time.perf_counter() - start
+
+        assert records[0]["x_date_0"] == "2025-06-07T21:55:52+00:00"
+        assert records[0]["x_field_0"] == "value"
+        # 30,000 values should take milliseconds, not a per-record fields_get scan
+        assert duration < 1.0
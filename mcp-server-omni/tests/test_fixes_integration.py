@@ -5,6 +5,7 @@ from unittest.mock import Mock
 import pytest
 
 from mcp_server_omni.tools import OmniToolHandler
+from tests.helpers.mock_connection import wire_async_methods
 
 
 class TestFixesIntegration:
@@ -14,11 +15,12 @@ class TestFixesIntegration:
     def tool_handler(self):
         """Create a tool handler with mocked dependencies."""
         app = Mock()
-        connection = Mock()
+        connection = wire_async_methods(Mock())
         access_controller = Mock()
         config = Mock()
         config.default_limit = 10
         config.max_limit = 100
+        config.max_smart_fields = 15
 
         return OmniToolHandler(app, connection, access_controller, config)
 
@@ -86,8 +88,7 @@ class TestFixesIntegration:
 
         # Test 3: search_records with datetime formatting
         tool_handler.connection.search_count.return_value = 2
-        tool_handler.connection.search.return_value = [1, 2]
-        tool_handler.connection.read.return_value = [
+        tool_handler.connection.search_read.return_value = [
             {
                 "id": 1,
                 "name": "Partner 1",
@@ -0,0 +1,235 @@
+"""Tests for the persistent HTTP connection pool behind the XML-RPC proxies."""
+
+import http.client
+import socket
+import threading
+import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_server_omni.config import OmniConfig
+from mcp_server_omni.performance import (
+    ConnectionPool,
+    HTTPConnectionPool,
+    PerformanceManager,
+    PooledTransport,
+    last_response_bytes,
+)
+from tests.helpers.xmlrpc_server import StandInServer
+
+
+@pytest.fixture
+def server():
+    """Run a local keep-alive XML-RPC server."""
+    stand_in = StandInServer().start()
+    yield stand_in
+    stand_in.stop()
+
+
+def make_proxy(server, pool, path="/mcp/xmlrpc/common"):
+    """Create a ServerProxy that sends requests through the pool."""
+    return xmlrpc.client.ServerProxy(
+        f"{server.url}{path}", transport=PooledTransport(pool), allow_none=True
+    )
+
+
+class TestHTTPConnectionPool:
+    """Test HTTPConnectionPool checkout/checkin behaviour."""
+
+    def test_sequential_calls_reuse_one_connection(self, server):
+        """Keep-alive connections are reused instead of re-handshaking."""
+        pool = HTTPConnectionPool(max_size=4)
+        proxy = make_proxy(server, pool)
+
+        for i in range(5):
+            assert proxy.echo(i) == i
+
+        stats = pool.get_stats()
+        assert stats["handshakes"] == 1
+        assert stats["reuses"] == 4
+        assert stats["idle_connections"] == 1
+        assert stats["in_use_connections"] == 0
+        assert server.connections == 1
+
+    def test_concurrent_threads_use_separate_sockets(self, server):
+        """Concurrent requests never share or corrupt a socket."""
+        pool = HTTPConnectionPool(max_size=8)
+        proxy = make_proxy(server, pool)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: proxy.sleep(0.05, i), range(32)))
+
+        assert results == list(range(32))
+        stats = pool.get_stats()
+        assert stats["handshakes"] <= 8
+        assert stats["handshakes"] + stats["reuses"] == 32
+        assert stats["in_use_connections"] == 0
+
+    def test_max_size_blocks_until_checkin(self, server):
+        """Checkouts beyond max_size wait for a connection to be returned."""
+        pool = HTTPConnectionPool(max_size=1)
+        proxy = make_proxy(server, pool)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda i: proxy.sleep(0.05, i), range(3)))
+
+        assert results == [0, 1, 2]
+        stats = pool.get_stats()
+        assert stats["handshakes"] == 1
+        assert stats["waits"] >= 1
+        assert server.connections == 1
+
+    def test_checkout_times_out_when_pool_exhausted(self, server):
+        """Waiting for a connection is bounded by the timeout."""
+        pool = HTTPConnectionPool(max_size=1)
+        host = server.url.removeprefix("http://")
+        conn, _ = pool.checkout(host)
+
+        with pytest.raises(socket.timeout):
+            pool.checkout(host, timeout=0.05)
+
+        pool.discard(host, conn)
+
+    def test_idle_timeout_closes_connection(self, server):
+        """Connections idle longer than idle_timeout are not reused."""
+        pool = HTTPConnectionPool(max_size=2, idle_timeout=0)
+        proxy = make_proxy(server, pool)
+
+        proxy.echo(1)
+        proxy.echo(2)
+
+        stats = pool.get_stats()
+        assert stats["handshakes"] == 2
+        assert stats["reuses"] == 0
+        assert stats["closed_idle"] == 1
+
+    def test_dead_connection_fails_liveness_check(self):
+        """Idle connections closed by the peer are detected and replaced."""
+        pool = HTTPConnectionPool()
+        conn = http.client.HTTPConnection("example.invalid")
+        conn.sock, peer = socket.socketpair()
+        pool._open["example.invalid"] = 1
+        pool.checkin("example.invalid", conn)
+        peer.close()
+
+        with pool._condition:
+            assert pool._pop_live_connection("example.invalid") is None
+
+        stats = pool.get_stats()
+        assert stats["closed_dead"] == 1
+        assert stats["open_connections"] == 0
+
+    def test_per_connection_socket_timeout(self, server):
+        """Checked-out sockets use the requested timeout."""
+        pool = HTTPConnectionPool(timeout=5)
+        host = server.url.removeprefix("http://")
+
+        conn, reused = pool.checkout(host, timeout=1.5)
+        assert not reused
+        assert conn.sock.gettimeout() == 1.5
+        pool.checkin(host, conn)
+
+        conn, reused = pool.checkout(host, timeout=3)
+        assert reused
+        assert conn.sock.gettimeout() == 3
+        pool.checkin(host, conn)
+
+    def test_slow_response_raises_timeout(self, server):
+        """A response slower than the socket timeout raises and is discarded."""
+        pool = HTTPConnectionPool()
+        proxy = xmlrpc.client.ServerProxy(
+            f"{server.url}/", transport=PooledTransport(pool, timeout=0.05)
+        )
+
+        with pytest.raises(socket.timeout):
+            proxy.sleep(0.5, "late")
+
+        stats = pool.get_stats()
+        assert stats["discarded"] == 1
+        assert stats["open_connections"] == 0
+
+    def test_fault_keeps_connection(self, server):
+        """XML-RPC faults are complete responses, so the connection is reused."""
+        pool = HTTPConnectionPool()
+        proxy = make_proxy(server, pool, "/mcp/xmlrpc/object")
+
+        with pytest.raises(xmlrpc.client.Fault):
+            proxy.execute_kw("db", 2, "key", "res.partner", "bogus", [], {})
+        assert proxy.echo("ok") == "ok"
+
+        stats = pool.get_stats()
+        assert stats["handshakes"] == 1
+        assert stats["reuses"] == 1
+
+    def test_records_decoded_response_length(self, server):
+        """The decoded body length is published for cache size accounting."""
+        pool = HTTPConnectionPool()
+        proxy = make_proxy(server, pool)
+        payload = "x" * 5000
+
+        # Large responses are gzip-encoded by the server
+        assert proxy.echo(payload) == payload
+        expected = len(xmlrpc.client.dumps((payload,), methodresponse=True).encode())
+        assert last_response_bytes.get() == expected
+
+    def test_stale_connection_is_retried(self, server):
+        """A kept-alive connection dropped by the server is retried once."""
+        pool = HTTPConnectionPool()
+        proxy = make_proxy(server, pool)
+        proxy.echo(1)
+
+        # Simulate a server-side close that the liveness check cannot see
+        pool._is_alive = Mock(return_value=True)
+        with pool._condition:
+            conn, _ = pool._idle[server.url.removeprefix("http://")][0]
+        conn.sock.shutdown(socket.SHUT_RDWR)
+
+        assert proxy.echo(2) == 2
+        assert pool.get_stats()["handshakes"] == 2
+
+
+class TestConnectionPoolStats:
+    """Test pool statistics surfaced through PerformanceManager."""
+
+    def test_proxies_share_http_pool(self, server):
+        """Proxies for different endpoints draw from one HTTP pool."""
+        config = OmniConfig(url=server.url, api_key="test")
+        pool = ConnectionPool(config)
+
+        common = pool.get_connection("/mcp/xmlrpc/common")
+        obj = pool.get_connection("/mcp/xmlrpc/object")
+        common.version()
+        obj.execute_kw("db", 2, "key", "res.partner", "search_count", [[]], {})
+
+        assert pool.get_stats()["http"]["handshakes"] == 1
+        assert pool.get_stats()["http"]["reuses"] == 1
+
+    def test_performance_manager_reports_reuse_and_handshakes(self, server):
+        """get_stats() exposes handshake and reuse counts."""
+        manager = PerformanceManager(OmniConfig(url=server.url, api_key="test"))
+        proxy = manager.get_optimized_connection("/mcp/xmlrpc/common", timeout=5)
+
+        threads = [threading.Thread(target=proxy.version) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        proxy.version()
+
+        http_stats = manager.get_stats()["connection_pool"]["http"]
+        assert http_stats["handshakes"] >= 1
+        assert http_stats["handshakes"] + http_stats["reuses"] == 5
+        assert http_stats["handshakes"] == server.connections
+
+    def test_clear_closes_idle_connections(self, server):
+        """Clearing the pool closes idle HTTP connections."""
+        pool = ConnectionPool(OmniConfig(url=server.url, api_key="test"))
+        pool.get_connection("/mcp/xmlrpc/common").version()
+
+        pool.clear()
+
+        http_stats = pool.get_stats()["http"]
+        assert http_stats["open_connections"] == 0
+        assert http_stats["idle_connections"] == 0
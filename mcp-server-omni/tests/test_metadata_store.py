@@ -0,0 +1,240 @@
+"""Tests for the persistent field metadata store."""
+
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mcp_server_omni.async_connection import AsyncOmniConnection
+from mcp_server_omni.config import OmniConfig
+from mcp_server_omni.metadata_store import FieldsMetadataStore
+from mcp_server_omni.omni_connection import OmniConnection, server_version_key
+from mcp_server_omni.performance import PerformanceManager
+
+URL = "http://localhost:8069"
+
+STORED_FIELDS = {
+    "name": {"type": "char", "string": "Name", "required": True},
+    "email": {"type": "char", "string": "Email"},
+}
+SERVER_FIELDS = dict(STORED_FIELDS, phone={"type": "char", "string": "Phone"})
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a configuration with a field metadata cache directory."""
+    return OmniConfig(url=URL, api_key="test_api_key", fields_cache_dir=str(tmp_path))
+
+
+def make_connection(config, version="17.0"):
+    """Create an authenticated connection whose object proxy is mocked."""
+    conn = OmniConnection(config)
+    conn._connected = True
+    conn._authenticated = True
+    conn._uid = 2
+    conn._database = "db"
+    conn._auth_method = "api_key"
+    conn._server_version = version
+    conn.performance_manager.set_metadata_scope("db", version)
+    conn._object_proxy = Mock()
+    return conn
+
+
+def persist_fields(config, version="17.0"):
+    """Store field definitions the way a previous server process would have."""
+    manager = PerformanceManager(config)
+    manager.set_metadata_scope("db", version)
+    manager.cache_fields("res.partner", STORED_FIELDS)
+    manager.close()
+
+
+class TestFieldsMetadataStore:
+    """Test the SQLite store."""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        """Test stored fields survive reopening the store."""
+        store = FieldsMetadataStore(tmp_path)
+        store.put(URL, "db", "res.partner", "17.0", STORED_FIELDS)
+        store.close()
+
+        reopened = FieldsMetadataStore(tmp_path)
+        assert reopened.get(URL, "db", "res.partner", "17.0") == STORED_FIELDS
+        reopened.close()
+
+    def test_key_scoping(self, tmp_path):
+        """Test entries for another server, database or version are misses."""
+        store = FieldsMetadataStore(tmp_path)
+        store.put(URL, "db", "res.partner", "17.0", STORED_FIELDS)
+
+        assert store.get(URL, "db", "res.partner", "18.0") is None
+        assert store.get(URL, "other", "res.partner", "17.0") is None
+        assert store.get("http://other:8069", "db", "res.partner", "17.0") is None
+        assert store.get(URL, "db", "res.users", "17.0") is None
+
+    def test_clear_and_close(self, tmp_path):
+        """Test clearing entries and using a closed store."""
+        store = FieldsMetadataStore(tmp_path)
+        store.put(URL, "db", "res.partner", "17.0", STORED_FIELDS)
+        store.clear()
+        assert store.get(URL, "db", "res.partner", "17.0") is None
+
+        store.close()
+        store.put(URL, "db", "res.partner", "17.0", STORED_FIELDS)
+        assert store.get(URL, "db", "res.partner", "17.0") is None
+
+    def test_server_version_key(self):
+        """Test the version string is taken from the version() result."""
+        assert server_version_key({"server_version": "17.0+e"}) == "17.0+e"
+        assert server_version_key({}) is None
+        assert server_version_key(None) is None
+
+
+class TestPerformanceManagerPersistence:
+    """Test field_cache persistence through the performance manager."""
+
+    def test_disabled_without_cache_dir(self):
+        """Test no store is created unless configured."""
+        manager = PerformanceManager(OmniConfig(url=URL, api_key="key"))
+        assert manager.metadata_store is None
+        assert manager.load_persisted_fields("res.partner") is None
+
+    def test_unscoped_fields_not_persisted(self, config):
+        """Test nothing is written before the database and version are known."""
+        manager = PerformanceManager(config)
+        manager.cache_fields("res.partner", STORED_FIELDS)
+
+        manager.set_metadata_scope("db", "17.0")
+        assert manager.load_persisted_fields("res.partner") is None
+
+    def test_load_fills_field_cache(self, config):
+        """Test fields persisted by one process are served to the next."""
+        first = PerformanceManager(config)
+        first.set_metadata_scope("db", "17.0")
+        first.cache_fields("res.partner", STORED_FIELDS)
+
+        second = PerformanceManager(config)
+        second.set_metadata_scope("db", "17.0")
+        assert second.load_persisted_fields("res.partner") == STORED_FIELDS
+        # Persisted definitions are only served while they get revalidated
+        assert second.get_cached_fields("res.partner") is None
+        revalidate = Mock()
+        assert second.get_cached_fields("res.partner", revalidate) == STORED_FIELDS
+        revalidate.assert_called_once_with("res.partner")
+
+        # A server upgrade invalidates the stored entry
+        second.field_cache.clear()
+        second.set_metadata_scope("db", "18.0")
+        assert second.load_persisted_fields("res.partner") is None
+
+    def test_persisted_fields_loaded_on_miss(self, config):
+        """Test a field_cache miss falls back to the store and revalidates once."""
+        persist_fields(config)
+        manager = PerformanceManager(config)
+        manager.set_metadata_scope("db", "17.0")
+        revalidate = Mock()
+
+        assert manager.get_cached_fields("res.partner", revalidate) == STORED_FIELDS
+        assert manager.get_cached_fields("res.partner", revalidate) == STORED_FIELDS
+        revalidate.assert_called_once_with("res.partner")
+        assert manager.get_cached_fields("res.users", revalidate) is None
+
+    def test_close_releases_store(self, config):
+        """Test close() closes the store and stops persisting."""
+        manager = PerformanceManager(config)
+        manager.set_metadata_scope("db", "17.0")
+        store = manager.metadata_store
+
+        with patch.object(store, "close", wraps=store.close) as close:
+            manager.close()
+            manager.close()
+        close.assert_called_once()
+        assert manager.metadata_store is None
+        assert not manager.persists_fields
+        manager.cache_fields("res.partner", STORED_FIELDS)
+
+
+class TestConnectionColdStart:
+    """Test fields_get after a restart."""
+
+    def test_served_from_store_and_revalidated(self, config):
+        """Test the persisted copy is returned at once and refreshed in the background."""
+        persist_fields(config)
+
+        conn = make_connection(config)
+        conn._object_proxy.execute_kw.return_value = SERVER_FIELDS
+
+        assert conn.fields_get("res.partner") == STORED_FIELDS
+
+        # Wait for the background refresh
+        conn._get_executor().shutdown(wait=True)
+        conn._object_proxy.execute_kw.assert_called_once_with(
+            "db", 2, "test_api_key", "res.partner", "fields_get", [], {}
+        )
+        # The refreshed definitions replace both the in-memory and on-disk copies
+        assert conn.fields_get("res.partner") == SERVER_FIELDS
+        assert make_connection(config).fields_get("res.partner") == SERVER_FIELDS
+
+    def test_version_mismatch_fetches_from_server(self, config):
+        """Test an upgraded server is never served stale metadata."""
+        persist_fields(config)
+
+        conn = make_connection(config, version="18.0")
+        conn._object_proxy.execute_kw.return_value = SERVER_FIELDS
+
+        assert conn.fields_get("res.partner") == SERVER_FIELDS
+        conn._object_proxy.execute_kw.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_client_served_from_store(self, config):
+        """Test the async client serves persisted fields and refreshes them."""
+        persist_fields(config)
+
+        conn = make_connection(config)
+        async_conn = AsyncOmniConnection.from_connection(conn)
+        calls = []
+
+        async def execute_kw(model, method, args, kwargs):
+            calls.append((model, method))
+            return SERVER_FIELDS
+
+        async_conn.execute_kw = execute_kw
+
+        assert await async_conn.fields_get("res.partner") == STORED_FIELDS
+        await asyncio.gather(*async_conn._background_tasks)
+
+        assert calls == [("res.partner", "fields_get")]
+        assert await async_conn.fields_get("res.partner") == SERVER_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_async_client_store_io_off_loop(self, config):
+        """Test the async client reads and writes the store on worker threads."""
+        persist_fields(config)
+
+        conn = make_connection(config)
+        async_conn = AsyncOmniConnection.from_connection(conn)
+        store = conn.performance_manager.metadata_store
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def record(method):
+            def wrapper(*args, **kwargs):
+                threads.append((method.__name__, threading.get_ident()))
+                return method(*args, **kwargs)
+
+            return wrapper
+
+        async def execute_kw(model, method, args, kwargs):
+            return SERVER_FIELDS
+
+        async_conn.execute_kw = execute_kw
+
+        with (
+            patch.object(store, "get", record(store.get)),
+            patch.object(store, "put", record(store.put)),
+        ):
+            assert await async_conn.fields_get("res.partner") == STORED_FIELDS
+            await asyncio.gather(*async_conn._background_tasks)
+
+        assert [name for name, _ in threads] == ["get", "put"]
+        assert all(thread != loop_thread for _, thread in threads)
@@ -0,0 +1,162 @@
+"""Tests for the Prometheus metrics endpoint."""
+
+from unittest.mock import patch
+
+import pytest
+from starlette.testclient import TestClient
+
+from mcp_server_omni.config import OmniConfig
+from mcp_server_omni.error_handling import ErrorContext, ErrorHandler, ValidationError
+from mcp_server_omni.metrics import CONTENT_TYPE, render_metrics, split_operation
+from mcp_server_omni.performance import PerformanceManager
+from mcp_server_omni.server import OmniMCPServer
+
+
+@pytest.fixture
+def config():
+    """Configuration with the metrics endpoint enabled."""
+    return OmniConfig(url="http://localhost:8069", api_key="key", metrics_enabled=True)
+
+
+@pytest.fixture
+def manager(config):
+    """Performance manager with some recorded activity."""
+    manager = PerformanceManager(config)
+    manager.record_cache.put("record:res.partner:1", {"id": 1})
+    manager.record_cache.get("record:res.partner:1")
+    manager.record_cache.get("record:res.partner:2")
+    for seconds in (0.003, 0.02, 0.02, 0.4):
+        manager.monitor.record("search_read_res.partner", seconds)
+    manager.monitor.record("connection_get", 0.001)
+    return manager
+
+
+def samples(text):
+    """Parse exposition text into {series: value}."""
+    result = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            series, value = line.rsplit(" ", 1)
+            result[series] = float(value)
+    return result
+
+
+class TestRenderMetrics:
+    """Test rendering metrics in exposition format."""
+
+    def test_split_operation(self):
+        """Test monitor names are split into operation and model labels."""
+        assert split_operation("search_read_res.partner") == ("search_read", "res.partner")
+        assert split_operation("read_group_account.move.line") == (
+            "read_group",
+            "account.move.line",
+        )
+        assert split_operation("connection_get") == ("connection_get", "")
+
+    def test_cache_and_pool_metrics(self, manager):
+        """Test cache counters and pool stats are exported."""
+        result = samples(render_metrics(manager, ErrorHandler()))
+
+        assert result['omni_mcp_cache_hits_total{cache="record_cache"}'] == 1
+        assert result['omni_mcp_cache_misses_total{cache="record_cache"}'] == 1
+        assert result['omni_mcp_cache_entries{cache="record_cache"}'] == 1
+        assert result['omni_mcp_cache_evictions_total{cache="field_cache"}'] == 0
+        assert result["omni_mcp_pool_connections_created_total"] == 0
+        assert result['omni_mcp_http_connections{state="open"}'] == 0
+        assert result['omni_mcp_coalesced_calls_total{client="async"}'] == 0
+
+    def test_latency_histogram(self, manager):
+        """Test operation latencies are exported as cumulative buckets."""
+        result = samples(render_metrics(manager, ErrorHandler()))
+
+        series = 'model="res.partner",operation="search_read"'
+        buckets = {
+            le: result[f'omni_mcp_operation_duration_seconds_bucket{{{series},le="{le}"}}']
+            for le in ("0.005", "0.025", "0.25", "0.5", "+Inf")
+        }
+        assert buckets == {"0.005": 1, "0.025": 3, "0.25": 3, "0.5": 4, "+Inf": 4}
+        assert result["omni_mcp_operation_duration_seconds_count{" + series + "}"] == 4
+        assert result["omni_mcp_operation_duration_seconds_sum{" + series + "}"] == pytest.approx(
+            0.443
+        )
+        assert (
+            result['omni_mcp_operation_duration_seconds_count{model="",operation="connection_get"}']
+            == 1
+        )
+
+    def test_in_flight_gauge(self, manager):
+        """Test running operations are reported while tracked."""
+        with manager.monitor.track_operation("write_res.partner"):
+            during = samples(render_metrics(manager, ErrorHandler()))
+        after = samples(render_metrics(manager, ErrorHandler()))
+
+        series = 'omni_mcp_operations_in_flight{model="res.partner",operation="write"}'
+        assert during[series] == 1
+        assert after[series] == 0
+
+    def test_error_counts(self):
+        """Test errors are counted by category, model and operation."""
+        handler = ErrorHandler()
+        context = ErrorContext(model="res.partner", operation="create_record")
+        for _ in range(2):
+            handler.handle_error(ValidationError("bad value"), context=context, reraise=False)
+        handler.handle_error(ValueError("boom"), reraise=False)
+
+        result = samples(render_metrics(None, handler))
+
+        assert (
+            result[
+                'omni_mcp_errors_total{category="VALIDATION",model="res.partner",'
+                'operation="create_record"}'
+            ]
+            == 2
+        )
+        assert sum(v for k, v in result.items() if k.startswith("omni_mcp_errors_total")) == 3
+        # Nothing but errors is known before the connection is set up
+        assert all(k.startswith("omni_mcp_errors_total") for k in result)
+
+    def test_label_escaping(self, manager):
+        """Test label values are escaped."""
+        manager.monitor.record('read_x."y', 0.01)
+
+        text = render_metrics(manager, ErrorHandler())
+
+        assert 'model="x.\\"y"' in text
+
+
+class TestMetricsEndpoint:
+    """Test the /metrics route on the HTTP app."""
+
+    def make_server(self, config, manager):
+        """Create a server with the metrics route registered."""
+        with patch("mcp_server_omni.server.logging_config.setup"):
+            server = OmniMCPServer(config)
+        server.performance_manager = manager
+        server._register_metrics_route()
+        return server
+
+    def test_metrics_served(self, config, manager):
+        """Test the endpoint serves exposition text."""
+        server = self.make_server(config, manager)
+
+        with TestClient(server.app.streamable_http_app()) as client:
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert "# TYPE omni_mcp_operation_duration_seconds histogram" in response.text
+
+    async def test_registered_only_when_enabled(self, config):
+        """Test run_http adds the route only when metrics are enabled."""
+        for enabled in (True, False):
+            config.metrics_enabled = enabled
+            with patch("mcp_server_omni.server.logging_config.setup"):
+                server = OmniMCPServer(config)
+            with (
+                patch.object(server, "_ensure_connection"),
+                patch.object(server.app, "run_streamable_http_async"),
+            ):
+                await server.run_http()
+
+            paths = [route.path for route in server.app._custom_starlette_routes]
+            assert ("/metrics" in paths) is enabled
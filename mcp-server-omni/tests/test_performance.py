@@ -2,21 +2,30 @@
 
 import asyncio
 import os
+import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 
 from mcp_server_omni.config import OmniConfig
 from mcp_server_omni.performance import (
+    AsyncSingleFlight,
     Cache,
     CacheEntry,
     ConnectionPool,
+    LatencyHistogram,
     PerformanceManager,
     PerformanceMonitor,
     RequestOptimizer,
+    SampledSizer,
+    SingleFlight,
+    clone_result,
+    estimate_size,
+    json_size,
 )
+from mcp_server_omni.server import OmniMCPServer
 
 
 class TestCacheEntry:
@@ -24,56 +33,34 @@ class TestCacheEntry:
 
     def test_cache_entry_creation(self):
         """Test creating a cache entry."""
-        now = datetime.now()
-        entry = CacheEntry(
-            key="test_key",
-            value={"data": "test"},
-            created_at=now,
-            accessed_at=now,
-            ttl_seconds=300,
-            hit_count=0,
-            size_bytes=100,
-        )
+        entry = CacheEntry({"data": "test"}, time.monotonic() + 300, size_bytes=100)
 
-        assert entry.key == "test_key"
         assert entry.value == {"data": "test"}
-        assert entry.ttl_seconds == 300
+        assert entry.size_bytes == 100
         assert entry.hit_count == 0
         assert not entry.is_expired()
 
     def test_cache_entry_expiration(self):
         """Test cache entry expiration."""
-        # Create an entry that's already expired
-        old_time = datetime.now() - timedelta(seconds=600)
-        entry = CacheEntry(
-            key="test_key",
-            value="test_value",
-            created_at=old_time,
-            accessed_at=old_time,
-            ttl_seconds=300,
-        )
+        # Create an entry whose deadline has already passed
+        entry = CacheEntry("test_value", time.monotonic() - 1)
 
         assert entry.is_expired()
+        assert not entry.is_expired(now=entry.expires_at)
 
     def test_cache_entry_access(self):
         """Test accessing a cache entry."""
-        entry = CacheEntry(
-            key="test_key",
-            value="test_value",
-            created_at=datetime.now(),
-            accessed_at=datetime.now(),
-            ttl_seconds=300,
-        )
+        entry = CacheEntry("test_value", time.monotonic() + 300)
 
-        original_access_time = entry.accessed_at
-        original_hit_count = entry.hit_count
-
-        # Access the entry
-        time.sleep(0.01)  # Small delay to ensure time difference
         entry.access()
 
-        assert entry.hit_count == original_hit_count + 1
-        assert entry.accessed_at > original_access_time
+        assert entry.hit_count == 1
+
+    def test_cache_entry_is_compact(self):
+        """Entries use __slots__ instead of a per-instance dict."""
+        entry = CacheEntry("test_value", time.monotonic() + 300)
+
+        assert not hasattr(entry, "__dict__")
 
 
 class TestCache:
@@ -123,6 +110,73 @@ class TestCache:
         stats = cache.get_stats()
         assert stats["expired_evictions"] == 1
 
+    def test_cache_sweeps_untouched_expired_entries(self):
+        """Expired entries are dropped by the periodic sweep without a get."""
+        cache = Cache(sweep_interval=0.05)
+        cache.put("short1", "value", ttl_seconds=0)
+        cache.put("short2", "value", ttl_seconds=0)
+        cache.put("long", "value", ttl_seconds=300)
+
+        time.sleep(0.06)
+        cache.put("other", "value")
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["expired_evictions"] == 2
+        assert stats["misses"] == 0
+
+    def test_cache_purge_expired(self):
+        """purge_expired() removes expired entries immediately."""
+        cache = Cache()
+        cache.put("short", "value", ttl_seconds=0)
+        cache.put("long", "value", ttl_seconds=300)
+        time.sleep(0.01)
+
+        assert cache.purge_expired() == 1
+        assert cache.get_stats()["total_entries"] == 1
+
+    def test_get_or_stale_serves_expired_entry_once_refreshed(self):
+        """Expired entries are served in their grace window with one refresh claim."""
+        cache = Cache()
+        cache.put("key", "old", ttl_seconds=0, stale_seconds=300)
+        time.sleep(0.01)
+
+        # Plain reads treat the entry as expired but keep it
+        assert cache.get("key") is None
+        assert cache.get_or_stale("key") == ("old", True)
+        assert cache.get_or_stale("key") == ("old", False)
+
+        cache.put("key", "new", ttl_seconds=300, stale_seconds=300)
+        assert cache.get_or_stale("key") == ("new", False)
+
+        stats = cache.get_stats()
+        assert stats["stale_hits"] == 2
+        assert stats["refreshes"] == 1
+
+    def test_get_or_stale_cancel_refresh(self):
+        """A cancelled refresh is claimed again by the next stale read."""
+        cache = Cache()
+        cache.put("key", "old", ttl_seconds=0, stale_seconds=300)
+        time.sleep(0.01)
+
+        assert cache.get_or_stale("key") == ("old", True)
+        cache.cancel_refresh("key")
+        assert cache.get_or_stale("key") == ("old", True)
+        assert cache.get_stats()["refreshes"] == 2
+
+    def test_get_or_stale_after_grace_window(self):
+        """Entries past their grace window are misses and are swept."""
+        cache = Cache()
+        cache.put("gone", "value", ttl_seconds=0)
+        cache.put("stale", "value", ttl_seconds=0, stale_seconds=300)
+        time.sleep(0.01)
+
+        assert cache.get_or_stale("gone") == (None, False)
+        assert cache.purge_expired() == 0
+        assert cache.get_stats()["total_entries"] == 1
+        # Live-only reads ignore stale entries
+        assert cache.peek("stale") is None
+
     def test_cache_lru_eviction(self):
         """Test LRU eviction when cache is full."""
         cache = Cache(max_size=3)
@@ -180,6 +234,82 @@ class TestCache:
         assert cache.get("model:res.users:1") == "user1"
         assert cache.get("other:key") == "other_value"
 
+    def test_cache_invalidate_tags(self):
+        """Test tag-indexed cache invalidation."""
+        cache = Cache()
+
+        cache.put("a", 1, tags=[("model", "res.partner"), ("record", "res.partner", 1)])
+        cache.put("b", 2, tags=[("model", "res.partner"), ("record", "res.partner", 2)])
+        cache.put("c", 3, tags=[("model", "res.partner.category")])
+        cache.put("d", 4)
+
+        assert cache.invalidate_tags([("record", "res.partner", 2)]) == 1
+        assert cache.get("b") is None
+
+        # Model tags match exactly, unlike substring patterns
+        assert cache.invalidate_tags([("model", "res.partner")]) == 1
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+        assert cache.get("d") == 4
+
+        # Removed and overwritten keys leave no stale index entries
+        cache.put("c", 5)
+        assert cache.invalidate_tags([("model", "res.partner.category")]) == 0
+        assert cache._tag_index == {}
+
+    def test_cache_memory_limit_evicts_until_under_budget(self):
+        """A large put evicts as many LRU entries as needed."""
+        cache = Cache(max_size=100, max_memory_mb=1, sizer=len)
+
+        for i in range(10):
+            cache.put(f"key{i}", "x" * 100_000)
+        cache.put("big", "y" * 600_000)
+
+        stats = cache.get_stats()
+        assert stats["total_size_mb"] <= 1
+        assert stats["size_evictions"] == 6
+        assert cache.get("big") is not None
+        assert cache.get("key9") is not None
+        assert cache.get("key5") is None
+
+        # Values larger than the whole budget are not cached
+        cache.put("huge", "z" * 2_000_000)
+        assert cache.get("huge") is None
+        assert cache.get("big") is not None
+
+    def test_cache_sizing(self):
+        """Entries are sized by the pluggable sizer unless a size is given."""
+        sizer = Mock(return_value=10)
+        cache = Cache(max_memory_mb=1, sizer=sizer)
+
+        cache.put("a", {"name": "A"})
+        cache.put("b", {"name": "B"}, size_bytes=1024 * 1024 // 2)
+        cache.put("a", {"name": "A2"})
+
+        assert sizer.call_count == 2
+        assert cache._stats.total_size_bytes == 10 + 1024 * 1024 // 2
+
+    def test_size_estimators(self):
+        """The fast and sampled estimators stay close to the JSON size."""
+        record = {
+            "id": 7,
+            "name": "Azure Interior",
+            "active": True,
+            "email": False,
+            "credit_limit": 1500.5,
+            "country_id": [233, "United States"],
+            "category_id": [1, 2, 3],
+            "comment": "<p>Long standing customer</p>" * 10,
+        }
+        exact = json_size(record)
+        assert abs(estimate_size(record) - exact) / exact < 0.25
+
+        fields = {f"field_{i}": {"type": "char", "string": f"Field {i}"} for i in range(500)}
+        sizer = Mock(wraps=estimate_size)
+        sampled = SampledSizer(sample_size=32, sizer=sizer)(fields)
+        assert abs(sampled - json_size(fields)) / json_size(fields) < 0.25
+        assert sizer.call_count == 64  # 32 keys and 32 values
+
     def test_cache_clear(self):
         """Test clearing the cache."""
         cache = Cache()
@@ -199,6 +329,113 @@ class TestCache:
         assert stats["misses"] == 2
 
 
+class TestSingleFlight:
+    """Test SingleFlight request coalescing."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Callers arriving while a call is in flight share its result."""
+        group = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        func = Mock(side_effect=lambda: (started.set(), release.wait(), "result")[2])
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(group.do, "key", func)
+            started.wait()
+            followers = [executor.submit(group.do, "key", func) for _ in range(4)]
+            while group.get_stats()["shared"] < 4:
+                time.sleep(0.001)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == ["result"] * 5
+        assert func.call_count == 1
+        assert group.get_stats() == {"executions": 1, "shared": 4, "in_flight": 0}
+
+        # Once finished, the next call runs again
+        assert group.do("key", lambda: "fresh") == "fresh"
+
+    def test_exception_is_shared_and_not_cached(self):
+        """A failing call raises for its caller and the key is released."""
+        group = SingleFlight()
+
+        with pytest.raises(ValueError):
+            group.do("key", Mock(side_effect=ValueError("boom")))
+
+        assert group.do("key", lambda: 42) == 42
+
+    def test_do_shared_reports_sharing(self):
+        """The leader learns whether its result object went to other callers."""
+        group = SingleFlight()
+        assert group.do_shared("key", lambda: [1]) == ([1], False)
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait()
+            return [2]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(group.do_shared, "key", slow)
+            started.wait()
+            follower = executor.submit(group.do_shared, "key", slow)
+            while group.get_stats()["shared"] < 1:
+                time.sleep(0.001)
+            release.set()
+            leader_result, leader_shared = leader.result()
+            follower_result, follower_shared = follower.result()
+
+        assert leader_result is follower_result
+        assert leader_shared is True
+        assert follower_shared is True
+
+    async def test_async_single_flight(self):
+        """Concurrent coroutines share one awaited call."""
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        results = await asyncio.gather(*(group.do_shared("key", fetch) for _ in range(3)))
+
+        assert len(calls) == 1
+        assert [shared for _, shared in results] == [True] * 3
+        assert group.get_stats() == {"executions": 1, "shared": 2, "in_flight": 0}
+        assert await group.do_shared("key", fetch) == ({"value": 1}, False)
+
+    def test_clone_result(self):
+        """Results are copied down to scalars."""
+        result = [{"id": 1, "partner_id": [3, "Acme"], "tags": ({"id": 4},)}]
+        clone = clone_result(result)
+
+        assert clone == result
+        assert clone[0] is not result[0]
+        assert clone[0]["partner_id"] is not result[0]["partner_id"]
+        assert clone[0]["tags"][0] is not result[0]["tags"][0]
+
+    def test_request_key(self):
+        """Only read-only calls get a key, independent of kwargs order."""
+        key = PerformanceManager.request_key(
+            "db", 2, "res.partner", "search_read", [[]], {"limit": 5, "fields": ["name"]}
+        )
+        assert key == PerformanceManager.request_key(
+            "db", 2, "res.partner", "search_read", [[]], {"fields": ["name"], "limit": 5}
+        )
+        assert key != PerformanceManager.request_key(
+            "db", 3, "res.partner", "search_read", [[]], {"fields": ["name"], "limit": 5}
+        )
+        assert PerformanceManager.request_key("db", 2, "res.partner", "write", [[1]], {}) is None
+        assert (
+            PerformanceManager.request_key("db", 2, "res.partner", "read", [[1]], {"x": object()})
+            is None
+        )
+
+
 class TestConnectionPool:
     """Test ConnectionPool functionality."""
 
@@ -207,6 +444,8 @@ class TestConnectionPool:
         """Create mock config."""
         config = Mock(spec=OmniConfig)
         config.url = os.getenv("OMNI_URL", "http://localhost:8069")
+        config.fields_cache_dir = None
+        config.query_cache_ttl = 0
         return config
 
     def test_connection_pool_creation(self, mock_config):
@@ -367,6 +606,89 @@ class TestPerformanceMonitor:
         assert stats["operations"]["op2"]["count"] == 3
         assert stats["operations"]["op2"]["avg_ms"] > stats["operations"]["op1"]["avg_ms"]
 
+    def test_percentiles_and_windows(self):
+        """Test percentiles and windowed throughput are reported."""
+        monitor = PerformanceMonitor()
+        for ms in range(1, 1001):
+            monitor.record("read_res.partner", ms / 1000)
+
+        stats = monitor.get_stats()["operations"]["read_res.partner"]
+        assert stats["count"] == 1000
+        assert stats["last_ms"] == 1000.0
+        # Buckets are within 1/8 of their value
+        assert stats["p50_ms"] == pytest.approx(500, rel=0.125)
+        assert stats["p90_ms"] == pytest.approx(900, rel=0.125)
+        assert stats["p99_ms"] == pytest.approx(990, rel=0.125)
+        assert stats["p999_ms"] == pytest.approx(999, rel=0.125)
+        window = stats["windows"]["1m"]
+        assert window["count"] == 1000
+        assert window["throughput_per_sec"] > 0
+        assert stats["windows"]["5m"]["count"] == 1000
+
+    def test_window_slides(self):
+        """Test durations leave the window once their slot has expired."""
+        monitor = PerformanceMonitor()
+        with patch("mcp_server_omni.performance.time.monotonic") as monotonic:
+            monotonic.return_value = monitor._start_monotonic
+            monitor.record("search", 0.01)
+            monotonic.return_value += 120
+            monitor.record("search", 0.02)
+            stats = monitor.get_stats()["operations"]["search"]
+
+        assert stats["count"] == 2
+        assert stats["windows"]["1m"]["count"] == 1
+        assert stats["windows"]["1m"]["p50_ms"] == pytest.approx(20, rel=0.125)
+        assert stats["windows"]["1m"]["throughput_per_sec"] == pytest.approx(1 / 60, abs=1e-3)
+        assert stats["windows"]["5m"]["count"] == 2
+
+    def test_percentiles_in_health_status(self):
+        """Test latency percentiles are reported by the server health status."""
+        config = OmniConfig(url="http://localhost:8069", api_key="key")
+        with patch("mcp_server_omni.server.logging_config.setup"):
+            server = OmniMCPServer(config)
+        server.performance_manager = PerformanceManager(config)
+        server.performance_manager.monitor.record("search_read_res.partner", 0.05)
+
+        health = server.get_health_status()
+        stats = health["performance"]["performance"]["operations"]["search_read_res.partner"]
+        assert stats["p99_ms"] == pytest.approx(50, rel=0.125)
+        assert stats["windows"]["1m"]["count"] == 1
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram functionality."""
+
+    def test_bucket_bounds_contain_values(self):
+        """Test every value falls inside its bucket within the error bound."""
+        for micros in [0, 1, 7, 8, 15, 16, 1000, 123_456, 10**9]:
+            index = LatencyHistogram.bucket_index(micros)
+            lower, upper = LatencyHistogram.bucket_bounds(index)
+            assert lower <= micros <= upper
+            assert upper - lower <= max(lower, 1) / LatencyHistogram.SUB_BUCKETS
+
+    def test_memory_is_bounded(self):
+        """Test the number of buckets does not grow with recorded values."""
+        histogram = LatencyHistogram()
+        for i in range(20000):
+            histogram.record(i * 0.0037)
+        histogram.record(10**6)
+
+        assert histogram.count == 20001
+        assert len(histogram.counts) <= LatencyHistogram.NUM_BUCKETS
+        assert max(histogram.counts) < LatencyHistogram.NUM_BUCKETS
+
+    def test_merge_and_empty(self):
+        """Test merging histograms and summarizing an empty one."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.001)
+        second.record(0.1)
+        first.merge(second)
+
+        assert first.count == 2
+        assert first.summary()["max_ms"] == 100.0
+        assert LatencyHistogram().summary() == {"count": 0}
+        assert LatencyHistogram().percentile(99) == 0.0
+
 
 class TestPerformanceManager:
     """Test PerformanceManager functionality."""
@@ -376,6 +698,8 @@ class TestPerformanceManager:
         """Create mock config."""
         config = Mock(spec=OmniConfig)
         config.url = os.getenv("OMNI_URL", "http://localhost:8069")
+        config.fields_cache_dir = None
+        config.query_cache_ttl = 0
         return config
 
     def test_performance_manager_creation(self, mock_config):
@@ -428,6 +752,37 @@ class TestPerformanceManager:
         cached = manager.get_cached_fields("res.partner")
         assert cached == fields
 
+    def test_stale_fields_revalidated_once(self, mock_config):
+        """Expired field definitions are served while one refresh is scheduled."""
+        manager = PerformanceManager(mock_config)
+        fields = {"name": {"type": "char"}}
+        manager.field_cache.put(
+            manager.cache_key("fields", model="res.partner"),
+            fields,
+            ttl_seconds=0,
+            stale_seconds=manager.FIELDS_STALE_TTL,
+        )
+        time.sleep(0.01)
+        revalidate = Mock()
+
+        # Without a revalidate callback an expired entry is a miss
+        assert manager.get_cached_fields("res.partner") is None
+        assert manager.get_cached_fields("res.partner", revalidate) == fields
+        assert manager.get_cached_fields("res.partner", revalidate) == fields
+        revalidate.assert_called_once_with("res.partner")
+
+        # A failed refresh can be retried by the next reader
+        manager.cancel_fields_refresh("res.partner")
+        manager.get_cached_fields("res.partner", revalidate)
+        assert revalidate.call_count == 2
+
+        manager.cache_fields("res.partner", {"email": {"type": "char"}})
+        assert manager.get_cached_fields("res.partner", revalidate) == {"email": {"type": "char"}}
+        assert revalidate.call_count == 2
+        stats = manager.get_stats()["caches"]["field_cache"]
+        assert stats["stale_hits"] == 3
+        assert stats["refreshes"] == 2
+
     def test_record_caching(self, mock_config):
         """Test record caching."""
         manager = PerformanceManager(mock_config)
@@ -441,6 +796,61 @@ class TestPerformanceManager:
         cached = manager.get_cached_record("res.partner", 1, fields=["name", "email"])
         assert cached == record
 
+    def test_record_cache_merges_partial_reads(self, mock_config):
+        """Test partial reads of one record share a single cache entry."""
+        manager = PerformanceManager(mock_config)
+
+        manager.cache_record("res.partner", {"id": 7, "name": "Seven"}, fields=["name"])
+        manager.cache_record("res.partner", {"id": 7, "email": "7@example.com"}, fields=["email"])
+
+        assert manager.get_cached_record("res.partner", 7, fields=["email", "name"]) == {
+            "id": 7,
+            "email": "7@example.com",
+            "name": "Seven",
+        }
+        assert manager.get_cached_record("res.partner", 7, fields=["phone"]) is None
+        # Partial entries never answer a read of all fields
+        assert manager.get_cached_record("res.partner", 7, fields=None) is None
+        assert manager.record_cache.get_stats()["total_entries"] == 1
+
+    def test_record_cache_merge_keeps_deadline(self, mock_config):
+        """Test merging fields into an entry does not extend its TTL."""
+        manager = PerformanceManager(mock_config)
+
+        with patch("mcp_server_omni.performance.time.monotonic") as monotonic:
+            monotonic.return_value = 1000.0
+            manager.cache_record("res.partner", {"id": 7, "name": "Seven"}, ["name"], 60)
+            monotonic.return_value = 1050.0
+            manager.cache_record("res.partner", {"id": 7, "email": "7@x"}, ["email"], 60)
+            assert manager.get_cached_record("res.partner", 7, fields=["name", "email"])
+
+            monotonic.return_value = 1061.0
+            assert manager.get_cached_record("res.partner", 7, fields=["name"]) is None
+
+    def test_plan_record_read(self, mock_config):
+        """Test splitting a read into cached values and what to fetch."""
+        manager = PerformanceManager(mock_config)
+        manager.cache_record("res.partner", {"id": 1, "name": "One"}, fields=["name"])
+        manager.cache_record("res.partner", {"id": 2, "name": "Two", "email": "2@x"}, fields=None)
+
+        cached, missing_ids, fetch_fields = manager.plan_record_read(
+            "res.partner", [1, 2, 3], ["name", "email"]
+        )
+
+        assert set(cached) == {1, 2}
+        assert missing_ids == [1, 3]
+        assert fetch_fields == ["name", "email"]
+
+        records = manager.merge_record_read(
+            "res.partner",
+            [1, 2, 3],
+            ["name", "email"],
+            cached,
+            [{"id": 1, "name": "One", "email": "1@x"}, {"id": 3, "name": "Three", "email": "3@x"}],
+            fetch_fields,
+        )
+        assert [r["email"] for r in records] == ["1@x", "2@x", "3@x"]
+
     def test_record_cache_invalidation(self, mock_config):
         """Test record cache invalidation."""
         manager = PerformanceManager(mock_config)
@@ -464,6 +874,21 @@ class TestPerformanceManager:
         assert manager.get_cached_record("res.partner", 2, fields=None) is None
         assert manager.get_cached_record("res.users", 1, fields=None) is not None
 
+    def test_invalidate_records_batch(self, mock_config):
+        """Test invalidating a batch of records and a whole model."""
+        manager = PerformanceManager(mock_config)
+        for i in range(1, 6):
+            manager.cache_record("res.partner", {"id": i, "name": f"P{i}"}, fields=None)
+        manager.cache_record("res.partner.category", {"id": 1, "name": "C1"}, fields=None)
+
+        manager.invalidate_records("res.partner", [2, 4, 99])
+        remaining = [i for i in range(1, 6) if manager.get_cached_record("res.partner", i)]
+        assert remaining == [1, 3, 5]
+
+        manager.invalidate_record_cache("res.partner")
+        assert manager.record_cache.get_stats()["total_entries"] == 1
+        assert manager.get_cached_record("res.partner.category", 1) is not None
+
     def test_permission_caching(self, mock_config):
         """Test permission caching."""
         manager = PerformanceManager(mock_config)
@@ -523,6 +948,8 @@ class TestPerformanceIntegration:
         """Create mock config."""
         config = Mock(spec=OmniConfig)
         config.url = os.getenv("OMNI_URL", "http://localhost:8069")
+        config.fields_cache_dir = None
+        config.query_cache_ttl = 0
         return config
 
     @pytest.mark.asyncio
@@ -577,3 +1004,25 @@ class TestPerformanceIntegration:
         # Check cache is working
         stats = manager.record_cache.get_stats()
         assert stats["hit_rate"] > 0.8  # Good hit rate
+
+    def test_targeted_invalidation_uses_tag_index(self, mock_config):
+        """Test invalidating records looks up their keys instead of scanning.
+
+        Writing 500 records against a full 1000-entry record cache used to
+        run one substring scan over all keys per record id.
+        """
+        manager = PerformanceManager(mock_config)
+        for i in range(1, 1001):
+            manager.cache_record("res.partner", {"id": i, "name": f"Partner {i}"})
+
+        with patch.object(
+            manager.record_cache, "invalidate_pattern", side_effect=AssertionError("scanned")
+        ):
+            manager.invalidate_records("res.partner", range(1, 501))
+
+        assert manager.record_cache.get_stats()["total_entries"] == 500
+        assert manager.get_cached_record("res.partner", 500) is None
+        assert manager.get_cached_record("res.partner", 501) == {"id": 501, "name": "Partner 501"}
+        # Only the invalidated records' tags are left out of the index
+        assert ("record", "res.partner", 500) not in manager.record_cache._tag_index
+        assert ("record", "res.partner", 501) in manager.record_cache._tag_index
@@ -0,0 +1,238 @@
+"""Tests for the opt-in search result cache."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from mcp_server_omni.config import OmniConfig
+from mcp_server_omni.omni_connection import OmniConnection
+from mcp_server_omni.performance import PerformanceManager
+from mcp_server_omni.server import OmniMCPServer
+from tests.helpers.xmlrpc_server import StandInServer
+
+DOMAIN = [["is_company", "=", True]]
+
+
+@pytest.fixture
+def manager():
+    """Performance manager with a 30 second query cache."""
+    return PerformanceManager(
+        OmniConfig(url="http://localhost:8069", api_key="key", query_cache_ttl=30)
+    )
+
+
+class TestQueryCache:
+    """Test query caching in the performance manager."""
+
+    def test_disabled_by_default(self):
+        """Test nothing is cached or counted without a TTL."""
+        manager = PerformanceManager(OmniConfig(url="http://localhost:8069", api_key="key"))
+        manager.cache_query("res.partner", "search", [DOMAIN], {}, [1, 2], 0)
+
+        assert manager.get_cached_query("res.partner", "search", [DOMAIN], {}) is None
+        stats = manager.get_query_stats()
+        assert stats["enabled"] is False
+        assert stats["models"] == {}
+
+    def test_hit_returns_copy(self, manager):
+        """Test hits are keyed on normalized options and return fresh copies."""
+        records = [{"id": 1, "name": "Acme"}]
+        manager.cache_query(
+            "res.partner", "search_read", [DOMAIN], {"limit": 5, "fields": ["name"]}, records, 0
+        )
+        records[0]["name"] = "Mutated by caller"
+
+        hit = manager.get_cached_query(
+            "res.partner", "search_read", [DOMAIN], {"fields": ["name"], "limit": 5}
+        )
+        assert hit == [{"id": 1, "name": "Acme"}]
+        hit[0]["name"] = "Mutated again"
+        assert manager.get_cached_query(
+            "res.partner", "search_read", [DOMAIN], {"fields": ["name"], "limit": 5}
+        ) == [{"id": 1, "name": "Acme"}]
+
+        # Different paging is a different query
+        assert (
+            manager.get_cached_query(
+                "res.partner",
+                "search_read",
+                [DOMAIN],
+                {"fields": ["name"], "limit": 5, "offset": 5},
+            )
+            is None
+        )
+
+    def test_write_invalidates_model(self, manager):
+        """Test record invalidation drops the model's queries only."""
+        manager.cache_query("res.partner", "search_count", [DOMAIN], {}, 3, 0)
+        manager.cache_query("res.users", "search_count", [[]], {}, 7, 0)
+
+        manager.invalidate_records("res.partner", [1])
+
+        assert manager.get_cached_query("res.partner", "search_count", [DOMAIN], {}) is None
+        assert manager.get_cached_query("res.users", "search_count", [[]], {}) == 7
+
+    def test_result_fetched_across_write_not_cached(self, manager):
+        """Test a result whose request overlapped a write is discarded."""
+        generation = manager.query_generation("res.partner")
+        manager.invalidate_record_cache("res.partner")
+        manager.cache_query("res.partner", "search", [DOMAIN], {}, [1], generation)
+
+        assert manager.get_cached_query("res.partner", "search", [DOMAIN], {}) is None
+
+    def test_write_during_store_not_lost(self, manager):
+        """Test a write cannot slip between the generation check and the store."""
+        storing, release = threading.Event(), threading.Event()
+        put = manager.query_cache.put
+
+        def slow_put(*args, **kwargs):
+            storing.set()
+            release.wait(5)
+            put(*args, **kwargs)
+
+        with patch.object(manager.query_cache, "put", side_effect=slow_put):
+            store = threading.Thread(
+                target=manager.cache_query,
+                args=("res.partner", "search", [DOMAIN], {}, [1], 0),
+            )
+            store.start()
+            storing.wait(5)
+            write = threading.Thread(target=manager.invalidate_queries, args=("res.partner",))
+            write.start()
+            write.join(0.05)
+            assert write.is_alive()
+            release.set()
+            store.join()
+            write.join()
+
+        assert manager.get_cached_query("res.partner", "search", [DOMAIN], {}) is None
+
+    def test_per_model_hit_rates(self, manager):
+        """Test hits and misses are counted per model."""
+        manager.cache_query("res.partner", "search", [DOMAIN], {}, [1], 0)
+        for _ in range(3):
+            manager.get_cached_query("res.partner", "search", [DOMAIN], {})
+        manager.get_cached_query("res.partner", "search", [[]], {})
+        manager.get_cached_query("res.users", "search", [[]], {})
+
+        models = manager.get_stats()["caches"]["query_cache"]["models"]
+        assert models["res.partner"] == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+        assert models["res.users"] == {"hits": 0, "misses": 1, "hit_rate": 0.0}
+
+
+class TestConnectionQueryCache:
+    """Test search calls through a connection with the query cache enabled."""
+
+    @pytest.fixture
+    def server(self):
+        """Run a local XML-RPC server."""
+        stand_in = StandInServer().start()
+        yield stand_in
+        stand_in.stop()
+
+    @pytest.fixture
+    def config(self, server):
+        """Configuration with the query cache enabled."""
+        return OmniConfig(
+            url=server.url,
+            username="admin",
+            password="secret",
+            database="omni",
+            query_cache_ttl=30,
+        )
+
+    @pytest.fixture
+    def connection(self, config):
+        """Connected and authenticated connection."""
+        conn = OmniConnection(config, timeout=5)
+        conn.connect()
+        conn.authenticate()
+        yield conn
+        conn.disconnect()
+
+    def backend_calls(self, server, method):
+        """Count execute_kw calls the server received for a method."""
+        return sum(1 for call in server.calls if call[1] == method)
+
+    def test_repeated_queries_served_from_cache(self, server, connection):
+        """Test paging back and forth only hits the server once per page."""
+        first = connection.search_read("res.partner", DOMAIN, ["name"], limit=5, offset=0)
+        connection.search_read("res.partner", DOMAIN, ["name"], limit=5, offset=5)
+        again = connection.search_read("res.partner", DOMAIN, ["name"], limit=5, offset=0)
+        assert connection.search_count("res.partner", DOMAIN) == 20
+        assert connection.search_count("res.partner", DOMAIN) == 20
+        assert connection.search("res.partner", DOMAIN, limit=2) == [1, 2]
+        assert connection.search("res.partner", DOMAIN, limit=2) == [1, 2]
+
+        assert again == first
+        assert self.backend_calls(server, "search_read") == 2
+        assert self.backend_calls(server, "search_count") == 1
+        assert self.backend_calls(server, "search") == 1
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda conn: conn.create("res.partner", {"name": "New"}),
+            lambda conn: conn.write("res.partner", [1], {"name": "Renamed"}),
+            lambda conn: conn.unlink("res.partner", [2]),
+        ],
+        ids=["create", "write", "unlink"],
+    )
+    def test_writes_invalidate_model(self, server, connection, write):
+        """Test create, write and unlink drop the model's cached results."""
+        connection.search_count("res.partner", DOMAIN)
+        connection.search_count("res.users", [])
+
+        write(connection)
+        connection.search_count("res.partner", DOMAIN)
+        connection.search_count("res.users", [])
+
+        assert self.backend_calls(server, "search_count") == 3
+
+    async def test_async_client_uses_query_cache(self, server, config):
+        """Test the async client shares the query cache."""
+        config.async_client = True
+        conn = OmniConnection(config, timeout=5)
+        conn.connect()
+        conn.authenticate()
+
+        await conn.asearch_read("res.partner", DOMAIN, ["name"], limit=3)
+        await conn.asearch_read("res.partner", DOMAIN, ["name"], limit=3)
+        await conn.awrite("res.partner", [1], {"name": "Renamed"})
+        await conn.asearch_read("res.partner", DOMAIN, ["name"], limit=3)
+
+        assert self.backend_calls(server, "search_read") == 2
+        conn.disconnect()
+
+    @pytest.mark.parametrize("async_client", [False, True], ids=["executor", "async_client"])
+    async def test_uncached_search_read(self, server, config, async_client):
+        """Test cache=False neither serves nor fills the record and query caches."""
+        config.async_client = async_client
+        conn = OmniConnection(config, timeout=5)
+        conn.connect()
+        conn.authenticate()
+
+        for _ in range(2):
+            await conn.asearch_read("res.partner", DOMAIN, ["name"], limit=3, cache=False)
+
+        assert self.backend_calls(server, "search_read") == 2
+        caches = conn.performance_manager
+        assert caches.record_cache.get_stats()["total_entries"] == 0
+        assert caches.query_cache.get_stats()["total_entries"] == 0
+        conn.disconnect()
+
+    def test_hit_rates_in_health_status(self, config, connection):
+        """Test per-model hit rates are reported by the server health status."""
+        connection.search_count("res.partner", DOMAIN)
+        connection.search_count("res.partner", DOMAIN)
+
+        with patch("mcp_server_omni.server.logging_config.setup"):
+            server = OmniMCPServer(config)
+        server.connection = connection
+        server.performance_manager = connection.performance_manager
+
+        health = server.get_health_status()
+        query_cache = health["performance"]["caches"]["query_cache"]
+        assert query_cache["enabled"] is True
+        assert query_cache["models"]["res.partner"]["hit_rate"] == 0.5
@@ -0,0 +1,121 @@
+"""Tests for coalescing identical concurrent read-only Omni calls."""
+
+import asyncio
+
+import pytest
+
+from mcp_server_omni.async_connection import AsyncOmniConnection
+from mcp_server_omni.config import OmniConfig
+from mcp_server_omni.omni_connection import OmniConnection
+from tests.helpers.xmlrpc_server import StandInServer
+
+
+@pytest.fixture
+def server():
+    """Run a local XML-RPC server that answers slowly."""
+    stand_in = StandInServer().start()
+    stand_in.latency = 0.2
+    yield stand_in
+    stand_in.stop()
+
+
+@pytest.fixture
+def config(server):
+    """Configuration pointing at the stand-in server."""
+    return OmniConfig(
+        url=server.url, username="admin", password="secret", database="omni", max_workers=8
+    )
+
+
+@pytest.fixture
+def connection(config):
+    """Connected and authenticated connection using the executor."""
+    conn = OmniConnection(config, timeout=5)
+    conn.connect()
+    conn.authenticate()
+    yield conn
+    conn.disconnect()
+
+
+def backend_calls(server, method):
+    """Count execute_kw calls the server received for a method."""
+    return sum(1 for call in server.calls if call[1] == method)
+
+
+class TestExecutorCoalescing:
+    """Test coalescing across executor threads."""
+
+    async def test_identical_reads_share_one_request(self, server, connection):
+        """Test concurrent identical search_read calls send one request."""
+        results = await asyncio.gather(
+            *(
+                connection.asearch_read("res.partner", [["id", ">", 0]], ["name"], limit=5)
+                for _ in range(8)
+            )
+        )
+
+        assert backend_calls(server, "search_read") == 1
+        assert all(result == results[0] for result in results)
+        # Every caller gets its own copy to mutate
+        results[0][0]["name"] = "Changed"
+        assert results[1][0]["name"] == "Record 1"
+
+        stats = connection.performance_manager.get_stats()["request_coalescing"]["threads"]
+        assert stats["executions"] == 1
+        assert stats["shared"] == 7
+
+    async def test_different_arguments_not_coalesced(self, server, connection):
+        """Test calls with different arguments each reach the server."""
+        await asyncio.gather(
+            *(connection.asearch("res.partner", [], offset=i, limit=1) for i in range(4))
+        )
+
+        assert backend_calls(server, "search") == 4
+
+    async def test_writes_never_coalesced(self, server, connection):
+        """Test identical concurrent writes are all sent."""
+        results = await asyncio.gather(
+            *(connection.awrite("res.partner", [1], {"name": "Same"}) for _ in range(4))
+        )
+
+        assert results == [True] * 4
+        assert backend_calls(server, "write") == 4
+
+
+class TestAsyncClientCoalescing:
+    """Test coalescing in the asyncio-native client."""
+
+    async def test_identical_reads_share_one_request(self, server, config):
+        """Test concurrent identical calls on one event loop send one request."""
+        conn = AsyncOmniConnection(config, timeout=5)
+        await conn.connect()
+        await conn.authenticate()
+
+        counts = await asyncio.gather(*(conn.search_count("res.partner", []) for _ in range(5)))
+        creates = await asyncio.gather(
+            *(conn.create("res.partner", {"name": "A"}) for _ in range(2))
+        )
+
+        assert counts == [20] * 5
+        assert backend_calls(server, "search_count") == 1
+        assert creates == [21, 21]
+        assert backend_calls(server, "create") == 2
+        stats = conn.performance_manager.get_stats()["request_coalescing"]["async"]
+        assert stats == {"executions": 1, "shared": 4, "in_flight": 0}
+        conn.disconnect()
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self, server, config):
+        """Test one caller giving up leaves the shared request running."""
+        conn = AsyncOmniConnection(config, timeout=5)
+        await conn.connect()
+        await conn.authenticate()
+
+        first = asyncio.ensure_future(conn.search("res.partner", [], limit=2))
+        second = asyncio.ensure_future(conn.search("res.partner", [], limit=2))
+        await asyncio.sleep(0.05)
+        first.cancel()
+
+        assert await second == [1, 2]
+        assert first.cancelled()
+        assert backend_calls(server, "search") == 1
+        conn.disconnect()
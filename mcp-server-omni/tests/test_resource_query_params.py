@@ -5,7 +5,7 @@ resource URIs with query parameters were failing with "Unknown operation" errors
 """
 
 import json
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 from urllib.parse import quote
 
 import pytest
@@ -15,6 +15,7 @@ from mcp_server_omni.access_control import AccessController
 from mcp_server_omni.config import OmniConfig
 from mcp_server_omni.omni_connection import OmniConnection
 from mcp_server_omni.resources import OmniResourceHandler
+from tests.helpers.mock_connection import wire_async_methods
 
 
 @pytest.fixture
@@ -29,7 +30,7 @@ def mock_config():
 @pytest.fixture
 def mock_connection():
     """Create a mock Omni connection."""
-    conn = Mock(spec=OmniConnection)
+    conn = wire_async_methods(Mock(spec=OmniConnection))
     conn.is_authenticated = True
     return conn
 
@@ -62,8 +63,7 @@ class TestResourceQueryParameterHandling:
         """Test search resource with only limit parameter (issue #4 case)."""
         # Setup mocks
         mock_connection.search_count.return_value = 10
-        mock_connection.search.return_value = [1, 2]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Record 1"},
             {"id": 2, "name": "Record 2"},
         ]
@@ -73,8 +73,8 @@ class TestResourceQueryParameterHandling:
         result = await resource_handler._handle_search("res.partner", None, None, 2, None, None)
 
         # Verify the search was called with correct limit
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=2, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ANY, limit=2, offset=0, order=None
         )
 
         # Verify result contains the records
@@ -91,8 +91,7 @@ class TestResourceQueryParameterHandling:
 
         # Setup mocks
         mock_connection.search_count.return_value = 3
-        mock_connection.search.return_value = [1, 2, 3]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Company A"},
             {"id": 2, "name": "Company B"},
             {"id": 3, "name": "Company C"},
@@ -106,8 +105,8 @@ class TestResourceQueryParameterHandling:
 
         # Verify domain was parsed and used
         mock_connection.search_count.assert_called_once_with("res.partner", domain)
-        mock_connection.search.assert_called_once_with(
-            "res.partner", domain, limit=10, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", domain, ANY, limit=10, offset=0, order=None
         )
 
         assert "Company A" in result
@@ -120,8 +119,7 @@ class TestResourceQueryParameterHandling:
 
         # Setup mocks
         mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [1]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Test Partner", "email": "test@example.com"}
         ]
         mock_connection.fields_get.return_value = {}
@@ -132,7 +130,9 @@ class TestResourceQueryParameterHandling:
         )
 
         # Verify fields were parsed and used
-        mock_connection.read.assert_called_once_with("res.partner", [1], ["name", "email"])
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ["name", "email"], limit=10, offset=0, order=None
+        )
 
         assert "Fields: name, email" in result
         assert "Test Partner" in result
@@ -143,8 +143,7 @@ class TestResourceQueryParameterHandling:
         """Test search resource with limit and offset parameters."""
         # Setup mocks
         mock_connection.search_count.return_value = 100
-        mock_connection.search.return_value = [21, 22, 23, 24, 25]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": i, "name": f"Record {i}"} for i in range(21, 26)
         ]
         mock_connection.fields_get.return_value = {}
@@ -153,8 +152,8 @@ class TestResourceQueryParameterHandling:
         result = await resource_handler._handle_search("res.partner", None, None, 5, 20, None)
 
         # Verify pagination
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=5, offset=20, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ANY, limit=5, offset=20, order=None
         )
 
         assert "Page 5 of 20" in result  # offset 20, limit 5 = page 5
@@ -170,8 +169,7 @@ class TestResourceQueryParameterHandling:
 
         # Setup mocks
         mock_connection.search_count.return_value = 50
-        mock_connection.search.return_value = [1, 2, 3]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": i, "name": f"Active Record {i}"} for i in range(1, 4)
         ]
         mock_connection.fields_get.return_value = {}
@@ -183,8 +181,8 @@ class TestResourceQueryParameterHandling:
 
         # Verify both domain and limit were used
         mock_connection.search_count.assert_called_once_with("res.partner", domain)
-        mock_connection.search.assert_called_once_with(
-            "res.partner", domain, limit=3, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", domain, ANY, limit=3, offset=0, order=None
         )
 
         assert "active = True" in result
@@ -1,7 +1,7 @@
 """Tests for search resource functionality."""
 
 import json
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 from urllib.parse import quote
 
 import pytest
@@ -17,6 +17,7 @@ from mcp_server_omni.error_handling import (
 )
 from mcp_server_omni.omni_connection import OmniConnection, OmniConnectionError
 from mcp_server_omni.resources import OmniResourceHandler
+from tests.helpers.mock_connection import wire_async_methods
 
 
 @pytest.fixture
@@ -31,7 +32,7 @@ def mock_config():
 @pytest.fixture
 def mock_connection():
     """Create a mock Omni connection."""
-    conn = Mock(spec=OmniConnection)
+    conn = wire_async_methods(Mock(spec=OmniConnection))
     conn.is_authenticated = True
     return conn
 
@@ -90,8 +91,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 5
-        mock_connection.search.return_value = [1, 2, 3, 4, 5]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Partner 1", "email": "p1@example.com"},
             {"id": 2, "name": "Partner 2", "email": "p2@example.com"},
             {"id": 3, "name": "Partner 3", "email": "p3@example.com"},
@@ -109,10 +109,12 @@ class TestSearchResource:
         # Verify calls
         mock_access_controller.validate_model_access.assert_called_once_with("res.partner", "read")
         mock_connection.search_count.assert_called_once_with("res.partner", [])
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=10, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ANY, limit=10, offset=0, order=None
+        )
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], None, limit=10, offset=0, order=None
         )
-        mock_connection.read.assert_called_once_with("res.partner", [1, 2, 3, 4, 5], None)
 
         # Check result format
         assert "Search Results: res.partner" in result
@@ -132,8 +134,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 2
-        mock_connection.search.return_value = [1, 3]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Company A", "is_company": True},
             {"id": 3, "name": "Company B", "is_company": True},
         ]
@@ -146,8 +147,8 @@ class TestSearchResource:
 
         # Verify domain was parsed and used
         mock_connection.search_count.assert_called_once_with("res.partner", domain)
-        mock_connection.search.assert_called_once_with(
-            "res.partner", domain, limit=10, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", domain, ANY, limit=10, offset=0, order=None
         )
 
         # Check result contains domain info
@@ -165,8 +166,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [1]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Test Partner", "email": "test@example.com", "phone": "+1234567890"}
         ]
         mock_connection.fields_get.return_value = {}
@@ -177,7 +177,9 @@ class TestSearchResource:
         )
 
         # Verify fields were parsed and used
-        mock_connection.read.assert_called_once_with("res.partner", [1], ["name", "email", "phone"])
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ["name", "email", "phone"], limit=10, offset=0, order=None
+        )
 
         # Check result shows fields
         assert "Fields: name, email, phone" in result
@@ -192,8 +194,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 50  # Total records
-        mock_connection.search.return_value = [11, 12, 13, 14, 15]  # Page 2 results
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": i, "name": f"Partner {i}"} for i in range(11, 16)
         ]
         mock_connection.fields_get.return_value = {}
@@ -209,8 +210,8 @@ class TestSearchResource:
         )
 
         # Verify pagination in calls
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=5, offset=10, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ANY, limit=5, offset=10, order=None
         )
 
         # Check pagination info in result
@@ -229,8 +230,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 3
-        mock_connection.search.return_value = [3, 1, 2]  # Ordered IDs
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 3, "name": "Zebra Corp"},
             {"id": 1, "name": "Alpha Inc"},
             {"id": 2, "name": "Beta LLC"},
@@ -241,8 +241,8 @@ class TestSearchResource:
         result = await resource_handler._handle_search("res.partner", None, None, None, None, order)
 
         # Verify order was used
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=10, offset=0, order="name desc, id asc"
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ANY, limit=10, offset=0, order="name desc, id asc"
         )
 
         # Results should show in order
@@ -256,7 +256,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 0
-        mock_connection.search.return_value = []
+        mock_connection.search_read.return_value = []
         mock_connection.fields_get.return_value = {}
 
         # Execute search
@@ -306,19 +306,20 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 10
-        mock_connection.search.return_value = list(range(1, 11))
-        mock_connection.read.return_value = [{"id": i} for i in range(1, 11)]
+        mock_connection.search_read.return_value = [{"id": i} for i in range(1, 11)]
         mock_connection.fields_get.return_value = {}
 
         # Test with negative limit (should use default)
         await resource_handler._handle_search("res.partner", None, None, -5, None, None)
-        mock_connection.search.assert_called_with("res.partner", [], limit=10, offset=0, order=None)
+        mock_connection.search_read.assert_called_with(
+            "res.partner", [], ANY, limit=10, offset=0, order=None
+        )
 
         # Test with limit over max (should cap at max)
-        mock_connection.search.reset_mock()
+        mock_connection.search_read.reset_mock()
         await resource_handler._handle_search("res.partner", None, None, 200, None, None)
-        mock_connection.search.assert_called_with(
-            "res.partner", [], limit=100, offset=0, order=None
+        mock_connection.search_read.assert_called_with(
+            "res.partner", [], ANY, limit=100, offset=0, order=None
         )
 
     @pytest.mark.asyncio
@@ -332,8 +333,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 5
-        mock_connection.search.return_value = [1, 2, 3, 4, 5]
-        mock_connection.read.return_value = [{"id": i} for i in range(1, 6)]
+        mock_connection.search_read.return_value = [{"id": i} for i in range(1, 6)]
         mock_connection.fields_get.return_value = {}
 
         # Should handle gracefully and use empty domain
@@ -341,8 +341,8 @@ class TestSearchResource:
 
         # Should use empty domain
         mock_connection.search_count.assert_called_once_with("res.partner", [])
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=10, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ANY, limit=10, offset=0, order=None
         )
 
     @pytest.mark.asyncio
@@ -353,8 +353,7 @@ class TestSearchResource:
         # Setup mocks for large dataset
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 500  # Large dataset
-        mock_connection.search.return_value = list(range(1, 11))
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": i, "name": f"Partner {i}"} for i in range(1, 11)
         ]
         mock_connection.fields_get.return_value = {}
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 import pytest
 
 from mcp_server_omni.tools import OmniToolHandler
+from tests.helpers.mock_connection import wire_async_methods
 
 
 class TestSearchSmartDefaults:
@@ -14,7 +15,7 @@ class TestSearchSmartDefaults:
     def tool_handler(self):
         """Create a tool handler with mocked dependencies."""
         app = Mock()
-        connection = Mock()
+        connection = wire_async_methods(Mock())
         access_controller = Mock()
         config = Mock()
         config.default_limit = 10
@@ -29,7 +30,6 @@ class TestSearchSmartDefaults:
         # Setup mocks
         tool_handler.connection.is_authenticated = True
         tool_handler.connection.search_count.return_value = 2
-        tool_handler.connection.search.return_value = [1, 2]
 
         # Mock fields_get to return field metadata
         tool_handler.connection.fields_get.return_value = {
@@ -43,8 +43,8 @@ class TestSearchSmartDefaults:
             "image_1920": {"type": "binary"},  # Should be excluded (binary)
         }
 
-        # Mock read to return records with only smart default fields
-        tool_handler.connection.read.return_value = [
+        # Mock search_read to return records with only smart default fields
+        tool_handler.connection.search_read.return_value = [
             {
                 "id": 1,
                 "name": "Test 1",
@@ -64,9 +64,9 @@ class TestSearchSmartDefaults:
         await handler("res.partner", [], None, 10, 0, None)
 
         # Verify smart defaults were used
-        # The read call should have been made with specific fields, not None
-        tool_handler.connection.read.assert_called_once()
-        call_args = tool_handler.connection.read.call_args
+        # The search_read call should have been made with specific fields, not None
+        tool_handler.connection.search_read.assert_called_once()
+        call_args = tool_handler.connection.search_read.call_args
         fields_arg = call_args[0][2]  # Third positional argument
 
         # Should have selected smart default fields
@@ -87,8 +87,7 @@ class TestSearchSmartDefaults:
         # Setup mocks
         tool_handler.connection.is_authenticated = True
         tool_handler.connection.search_count.return_value = 1
-        tool_handler.connection.search.return_value = [1]
-        tool_handler.connection.read.return_value = [
+        tool_handler.connection.search_read.return_value = [
             {"id": 1, "name": "Test", "phone": "+1234567890"}
         ]
 
@@ -98,7 +97,9 @@ class TestSearchSmartDefaults:
         await handler("res.partner", [], fields, 10, 0, None)
 
         # Verify specified fields were used
-        tool_handler.connection.read.assert_called_once_with("res.partner", [1], fields)
+        tool_handler.connection.search_read.assert_called_once_with(
+            "res.partner", [], fields, limit=10, offset=0, order=None
+        )
 
     @pytest.mark.asyncio
     async def test_search_with_all_fields(self, tool_handler):
@@ -106,8 +107,7 @@ class TestSearchSmartDefaults:
         # Setup mocks
         tool_handler.connection.is_authenticated = True
         tool_handler.connection.search_count.return_value = 1
-        tool_handler.connection.search.return_value = [1]
-        tool_handler.connection.read.return_value = [
+        tool_handler.connection.search_read.return_value = [
             {
                 "id": 1,
                 "name": "Test",
@@ -125,8 +125,10 @@ class TestSearchSmartDefaults:
         handler = tool_handler._handle_search_tool
         await handler("res.partner", [], ["__all__"], 10, 0, None)
 
-        # Verify None was passed to read (which means all fields)
-        tool_handler.connection.read.assert_called_once_with("res.partner", [1], None)
+        # Verify None was passed to search_read (which means all fields)
+        tool_handler.connection.search_read.assert_called_once_with(
+            "res.partner", [], None, limit=10, offset=0, order=None
+        )
 
     @pytest.mark.asyncio
     async def test_search_smart_defaults_with_datetime_formatting(self, tool_handler):
@@ -134,7 +136,6 @@ class TestSearchSmartDefaults:
         # Setup mocks
         tool_handler.connection.is_authenticated = True
         tool_handler.connection.search_count.return_value = 1
-        tool_handler.connection.search.return_value = [1]
 
         # Mock fields_get
         tool_handler.connection.fields_get.return_value = {
@@ -143,8 +144,8 @@ class TestSearchSmartDefaults:
             "create_date": {"type": "datetime"},
         }
 
-        # Mock read with datetime that needs formatting
-        tool_handler.connection.read.return_value = [
+        # Mock search_read with datetime that needs formatting
+        tool_handler.connection.search_read.return_value = [
             {"id": 1, "name": "Test", "create_date": "20250607T10:00:00"}
         ]
 
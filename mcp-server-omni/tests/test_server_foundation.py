@@ -123,14 +123,26 @@ class TestServerFoundation:
         assert server.connection is not None
 
         # Clean up
-        server._cleanup_connection()
+        with patch.object(server.performance_manager, "close") as mock_close:
+            server._cleanup_connection()
 
         # Verify connection was closed
         server._mock_connection.disconnect.assert_called_once()
+        mock_close.assert_called_once()
         assert server.connection is None
         assert server.access_controller is None
         assert server.resource_handler is None
 
+    def test_cleanup_connection_flushes_logs(self, server_with_mock_connection):
+        """Test cleanup writes records queued by asynchronous logging."""
+        server = server_with_mock_connection
+        server._ensure_connection()
+
+        with patch("mcp_server_omni.server.flush_logging") as mock_flush:
+            server._cleanup_connection()
+
+        mock_flush.assert_called_once()
+
     def test_cleanup_connection_without_connection(self, server_with_mock_connection):
         """Test cleanup when no connection exists."""
         server = server_with_mock_connection
@@ -152,7 +164,8 @@ class TestServerFoundation:
         server._mock_connection.disconnect.side_effect = Exception("Disconnect failed")
 
         # Should not raise an error (error is logged)
-        server._cleanup_connection()
+        with patch.object(server.performance_manager, "close") as mock_close:
+            server._cleanup_connection()
 
         # Verify disconnect was attempted
         server._mock_connection.disconnect.assert_called_once()
@@ -160,6 +173,8 @@ class TestServerFoundation:
         assert server.connection is None
         assert server.access_controller is None
         assert server.resource_handler is None
+        # The field metadata store is still released
+        mock_close.assert_called_once()
 
     def test_get_capabilities(self, valid_config):
         """Test get_capabilities method."""
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 import pytest
 
 from mcp_server_omni.tools import OmniToolHandler
+from tests.helpers.mock_connection import wire_async_methods
 
 
 class TestSmartFieldSelection:
@@ -14,7 +15,7 @@ class TestSmartFieldSelection:
     def tool_handler(self):
         """Create a tool handler with mocked dependencies."""
         app = Mock()
-        connection = Mock()
+        connection = wire_async_methods(Mock())
         access_controller = Mock()
         config = Mock()
         config.default_limit = 10
@@ -107,7 +108,7 @@ class TestSmartFieldSelection:
         )
         assert score < searchable_score  # Should be lower than searchable equivalent
 
-    def test_get_smart_default_fields_success(self, tool_handler):
+    async def test_get_smart_default_fields_success(self, tool_handler):
         """Test successful smart field selection."""
         # Mock fields_get response
         mock_fields = {
@@ -127,7 +128,8 @@ class TestSmartFieldSelection:
 
         tool_handler.connection.fields_get.return_value = mock_fields
 
-        result = tool_handler._get_smart_default_fields("res.partner")
+        plan = await tool_handler._load_field_plan("res.partner")
+        result = tool_handler._get_smart_default_fields("res.partner", plan)
 
         # Should include smart selection
         assert "id" in result
@@ -144,16 +146,17 @@ class TestSmartFieldSelection:
         assert "write_date" not in result
         assert "access_token" not in result
 
-    def test_get_smart_default_fields_error_handling(self, tool_handler):
+    async def test_get_smart_default_fields_error_handling(self, tool_handler):
         """Test error handling in smart field selection."""
         # Mock fields_get to raise an exception
         tool_handler.connection.fields_get.side_effect = Exception("Connection error")
 
         # Should return None to indicate fallback to all fields
-        result = tool_handler._get_smart_default_fields("res.partner")
+        plan = await tool_handler._load_field_plan("res.partner")
+        result = tool_handler._get_smart_default_fields("res.partner", plan)
         assert result is None
 
-    def test_get_smart_default_fields_empty_result(self, tool_handler):
+    async def test_get_smart_default_fields_empty_result(self, tool_handler):
         """Test handling of models with some essential fields but mostly excluded fields."""
         # Mock fields_get with essential fields + zero-score fields
         mock_fields = {
@@ -167,7 +170,8 @@ class TestSmartFieldSelection:
 
         tool_handler.connection.fields_get.return_value = mock_fields
 
-        result = tool_handler._get_smart_default_fields("weird.model")
+        plan = await tool_handler._load_field_plan("weird.model")
+        result = tool_handler._get_smart_default_fields("weird.model", plan)
 
         # Should return essential fields only (since others score 0)
         # Expected order by score: name (1000+500+200+80+40=1820), display_name (1000+200+80+40=1320), id (1000+160+80+40=1280)
@@ -268,7 +272,7 @@ class TestSmartFieldSelection:
         # Should have called read with specific fields
         tool_handler.connection.read.assert_called_once_with("res.partner", [1], fields)
 
-    def test_field_sorting(self, tool_handler):
+    async def test_field_sorting(self, tool_handler):
         """Test that fields are sorted correctly."""
         # Mock fields_get response
         mock_fields = {
@@ -283,7 +287,8 @@ class TestSmartFieldSelection:
 
         tool_handler.connection.fields_get.return_value = mock_fields
 
-        result = tool_handler._get_smart_default_fields("res.partner")
+        plan = await tool_handler._load_field_plan("res.partner")
+        result = tool_handler._get_smart_default_fields("res.partner", plan)
 
         # All fields should be returned since we have only 7 fields (less than limit of 15)
         assert len(result) == 7
@@ -1,6 +1,6 @@
 """Test suite for MCP tools functionality."""
 
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 from mcp.server.fastmcp import FastMCP
@@ -12,6 +12,7 @@ from mcp_server_omni.error_handling import (
 )
 from mcp_server_omni.omni_connection import OmniConnection, OmniConnectionError
 from mcp_server_omni.tools import OmniToolHandler, register_tools
+from tests.helpers.mock_connection import wire_async_methods
 
 
 class TestOmniToolHandler:
@@ -38,7 +39,7 @@ class TestOmniToolHandler:
     @pytest.fixture
     def mock_connection(self):
         """Create a mock OmniConnection."""
-        connection = MagicMock(spec=OmniConnection)
+        connection = wire_async_methods(MagicMock(spec=OmniConnection))
         connection.is_authenticated = True
         return connection
 
@@ -86,8 +87,7 @@ class TestOmniToolHandler:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 5
-        mock_connection.search.return_value = [1, 2, 3]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Record 1"},
             {"id": 2, "name": "Record 2"},
             {"id": 3, "name": "Record 3"},
@@ -118,9 +118,16 @@ class TestOmniToolHandler:
         mock_connection.search_count.assert_called_once_with(
             "res.partner", [["is_company", "=", True]]
         )
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [["is_company", "=", True]], limit=3, offset=0, order="name asc"
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner",
+            [["is_company", "=", True]],
+            ["name", "email"],
+            limit=3,
+            offset=0,
+            order="name asc",
         )
+        mock_connection.search.assert_not_called()
+        mock_connection.read.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_search_records_access_denied(
@@ -183,8 +190,7 @@ class TestOmniToolHandler:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 10
-        mock_connection.search.return_value = [1, 2, 3]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Partner 1", "state_id": [13, "California"]},
             {"id": 2, "name": "Partner 2", "state_id": [13, "California"]},
             {"id": 3, "name": "Partner 3", "state_id": [14, "CA"]},
@@ -212,8 +218,8 @@ class TestOmniToolHandler:
 
         # Verify the domain was passed correctly
         mock_connection.search_count.assert_called_with("res.partner", domain_with_or)
-        mock_connection.search.assert_called_with(
-            "res.partner", domain_with_or, limit=10, offset=0, order=None
+        mock_connection.search_read.assert_called_with(
+            "res.partner", domain_with_or, ["name", "state_id"], limit=10, offset=0, order=None
         )
 
     @pytest.mark.asyncio
@@ -224,8 +230,7 @@ class TestOmniToolHandler:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [15]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 15, "name": "Azure Interior", "is_company": True},
         ]
 
@@ -246,8 +251,8 @@ class TestOmniToolHandler:
         # Verify the domain was parsed and passed correctly as a list
         expected_domain = [["is_company", "=", True], ["name", "ilike", "azure interior"]]
         mock_connection.search_count.assert_called_with("res.partner", expected_domain)
-        mock_connection.search.assert_called_with(
-            "res.partner", expected_domain, limit=5, offset=0, order=None
+        mock_connection.search_read.assert_called_with(
+            "res.partner", expected_domain, ANY, limit=5, offset=0, order=None
         )
 
     @pytest.mark.asyncio
@@ -258,8 +263,7 @@ class TestOmniToolHandler:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [15]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 15, "name": "Azure Interior", "is_company": True},
         ]
 
@@ -309,8 +313,7 @@ class TestOmniToolHandler:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [15]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 15, "name": "Azure Interior", "is_company": True},
         ]
 
@@ -329,7 +332,14 @@ class TestOmniToolHandler:
         assert result["total"] == 1
 
         # Verify fields were parsed correctly
-        mock_connection.read.assert_called_with("res.partner", [15], ["name", "is_company", "id"])
+        mock_connection.search_read.assert_called_with(
+            "res.partner",
+            [["is_company", "=", True]],
+            ["name", "is_company", "id"],
+            limit=5,
+            offset=0,
+            order=None,
+        )
 
     @pytest.mark.asyncio
     async def test_search_records_with_complex_domain(
@@ -339,8 +349,7 @@ class TestOmniToolHandler:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 5
-        mock_connection.search.return_value = [1, 2]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Company A", "is_company": True},
             {"id": 2, "name": "Company B", "is_company": True},
         ]
@@ -361,10 +370,93 @@ class TestOmniToolHandler:
 
         # Verify the domain was passed correctly
         mock_connection.search_count.assert_called_with("res.partner", complex_domain)
-        mock_connection.search.assert_called_with(
-            "res.partner", complex_domain, limit=5, offset=0, order=None
+        mock_connection.search_read.assert_called_with(
+            "res.partner", complex_domain, ANY, limit=5, offset=0, order=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_records_count_estimate(
+        self, handler, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test search_records estimates total from an extra row instead of counting."""
+        mock_connection.search_read.return_value = [
+            {"id": 1, "name": "Record 1"},
+            {"id": 2, "name": "Record 2"},
+            {"id": 3, "name": "Record 3"},
+        ]
+
+        search_records = mock_app._tools["search_records"]
+        result = await search_records(
+            model="res.partner", fields=["name"], limit=2, offset=4, count="estimate"
+        )
+
+        # One extra row was requested and trimmed from the page
+        assert len(result["records"]) == 2
+        assert result["total"] == 7
+        assert result["total_estimated"] is True
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ["name"], limit=3, offset=4, order=None
+        )
+        mock_connection.search_count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_records_count_estimate_last_page(
+        self, handler, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test estimated total is exact when the page is the last one."""
+        mock_connection.search_read.return_value = [{"id": 5, "name": "Record 5"}]
+
+        search_records = mock_app._tools["search_records"]
+        result = await search_records(
+            model="res.partner", fields=["name"], limit=2, offset=4, count="estimate"
         )
 
+        assert result["total"] == 5
+        assert "total_estimated" not in result
+        mock_connection.search_count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_records_count_estimate_past_end(
+        self, handler, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test estimate falls back to counting when the offset is past the end."""
+        mock_connection.search_read.return_value = []
+        mock_connection.search_count.return_value = 3
+
+        search_records = mock_app._tools["search_records"]
+        result = await search_records(
+            model="res.partner", fields=["name"], limit=2, offset=10, count="estimate"
+        )
+
+        assert result["total"] == 3
+        mock_connection.search_count.assert_called_once_with("res.partner", [])
+
+    @pytest.mark.asyncio
+    async def test_search_records_count_none(
+        self, handler, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test search_records skips counting entirely with count='none'."""
+        mock_connection.search_read.return_value = [{"id": 1, "name": "Record 1"}]
+
+        search_records = mock_app._tools["search_records"]
+        result = await search_records(model="res.partner", fields=["name"], count="none")
+
+        assert result["total"] is None
+        assert len(result["records"]) == 1
+        mock_connection.search_count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_records_invalid_count_mode(
+        self, handler, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test search_records rejects unknown count modes."""
+        search_records = mock_app._tools["search_records"]
+
+        with pytest.raises(ValidationError) as exc_info:
+            await search_records(model="res.partner", count="approximate")
+
+        assert "Invalid count mode" in str(exc_info.value)
+
     @pytest.mark.asyncio
     async def test_get_record_success(
         self, handler, mock_connection, mock_access_controller, mock_app
@@ -493,16 +585,10 @@ class TestOmniToolHandler:
             can_unlink=False,
         )
 
-        # Configure side_effect to return different permissions based on model
-        def get_perms(model):
-            if model == "res.partner":
-                return partner_perms
-            elif model == "sale.order":
-                return order_perms
-            else:
-                raise Exception(f"Unknown model: {model}")
-
-        mock_access_controller.get_model_permissions.side_effect = get_perms
+        mock_access_controller.get_permissions.return_value = {
+            "res.partner": partner_perms,
+            "sale.order": order_perms,
+        }
 
         # Get the registered list_models function
         list_models = mock_app._tools["list_models"]
@@ -535,8 +621,44 @@ class TestOmniToolHandler:
         assert order["operations"]["unlink"] is False
 
         # Verify calls
+        # Permissions are loaded in one batch instead of once per model
         mock_access_controller.get_enabled_models.assert_called_once()
-        assert mock_access_controller.get_model_permissions.call_count == 2
+        mock_access_controller.get_permissions.assert_called_once()
+        requested = mock_access_controller.get_permissions.call_args[0][0]
+        assert list(requested) == ["res.partner", "sale.order"]
+        mock_access_controller.get_model_permissions.assert_not_called()
+        # The blocking access-control calls run off the event loop
+        run_targets = [call.args[0] for call in mock_connection.run_async.call_args_list]
+        assert run_targets == [
+            mock_access_controller.get_enabled_models,
+            mock_access_controller.get_permissions,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_resource_templates_loads_models_on_executor(
+        self, handler, mock_connection, mock_access_controller
+    ):
+        """Test the enabled-model lookup does not block the event loop."""
+        mock_access_controller.get_enabled_models.return_value = [
+            {"model": "res.partner", "name": "Contact"},
+        ]
+
+        result = await handler._handle_list_resource_templates_tool()
+
+        assert result["enabled_models"] == ["res.partner"]
+        mock_connection.run_async.assert_called_once_with(mock_access_controller.get_enabled_models)
+
+    @pytest.mark.asyncio
+    async def test_check_access_runs_on_executor(
+        self, handler, mock_connection, mock_access_controller
+    ):
+        """Test the access check does not block the event loop."""
+        await handler._check_access("res.partner", "write")
+
+        mock_connection.run_async.assert_called_once_with(
+            mock_access_controller.validate_model_access, "res.partner", "write"
+        )
+        mock_access_controller.validate_model_access.assert_called_once_with("res.partner", "write")
 
     @pytest.mark.asyncio
     async def test_list_models_with_permission_failures(
@@ -550,7 +672,7 @@ class TestOmniToolHandler:
         ]
 
         # Setup mocks for get_model_permissions
-        from mcp_server_omni.access_control import AccessControlError, ModelPermissions
+        from mcp_server_omni.access_control import ModelPermissions
 
         partner_perms = ModelPermissions(
             model="res.partner",
@@ -561,14 +683,8 @@ class TestOmniToolHandler:
             can_unlink=False,
         )
 
-        # Configure side_effect to fail for unknown model
-        def get_perms(model):
-            if model == "res.partner":
-                return partner_perms
-            else:
-                raise AccessControlError(f"Model {model} not found")
-
-        mock_access_controller.get_model_permissions.side_effect = get_perms
+        # Models whose permissions failed to load are left out of the batch result
+        mock_access_controller.get_permissions.return_value = {"res.partner": partner_perms}
 
         # Get the registered list_models function
         list_models = mock_app._tools["list_models"]
@@ -620,8 +736,7 @@ class TestOmniToolHandler:
         """Test search_records with default values."""
         # Setup mocks
         mock_connection.search_count.return_value = 0
-        mock_connection.search.return_value = []
-        mock_connection.read.return_value = []
+        mock_connection.search_read.return_value = []
 
         # Get the registered search_records function
         search_records = mock_app._tools["search_records"]
@@ -645,8 +760,7 @@ class TestOmniToolHandler:
         """Test search_records limit validation."""
         # Setup mocks
         mock_connection.search_count.return_value = 100
-        mock_connection.search.return_value = []
-        mock_connection.read.return_value = []
+        mock_connection.search_read.return_value = []
 
         # Get the registered search_records function
         search_records = mock_app._tools["search_records"]
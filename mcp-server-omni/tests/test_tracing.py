@@ -0,0 +1,275 @@
+"""Tests for request tracing spans."""
+
+import asyncio
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_server_omni.config import OmniConfig
+from mcp_server_omni.logging_config import StructuredFormatter, perf_logger
+from mcp_server_omni.omni_connection import OmniConnection
+from mcp_server_omni.tools import OmniToolHandler
+from mcp_server_omni.tracing import (
+    BatchSpanProcessor,
+    OTLPHttpSpanExporter,
+    Span,
+    SpanExporter,
+    configure_tracing,
+    tracer,
+)
+from tests.helpers.xmlrpc_server import StandInServer
+
+
+class CollectingExporter(SpanExporter):
+    """Keep exported spans in memory."""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def exporter():
+    """Enable tracing into an in-memory exporter for one test."""
+    collector = CollectingExporter()
+    tracer.configure([collector])
+    yield collector
+    tracer.configure([])
+
+
+def spans_by_name(exporter):
+    """Flush and index exported spans by name."""
+    tracer.flush()
+    result = {}
+    for span in exporter.spans:
+        result.setdefault(span.name, []).append(span)
+    return result
+
+
+class TestTracer:
+    """Test span creation and propagation."""
+
+    def test_disabled_by_default(self):
+        """Test nothing is recorded without exporters."""
+        assert tracer.enabled is False
+        with tracer.span("request") as span:
+            assert span is None
+            assert tracer.current_span() is None
+
+    def test_parent_child_and_errors(self, exporter):
+        """Test children share the trace and failures are marked."""
+        with tracer.span("request", model="res.partner") as root:
+            with tracer.child_span("access_check"):
+                pass
+            with pytest.raises(ValueError):
+                with tracer.child_span("format"):
+                    raise ValueError("boom")
+        # Outside a trace, child spans are not recorded
+        with tracer.child_span("orphan") as orphan:
+            assert orphan is None
+
+        spans = spans_by_name(exporter)
+        assert set(spans) == {"request", "access_check", "format"}
+        child = spans["access_check"][0]
+        assert child.trace_id == root.trace_id
+        assert child.parent_id == root.span_id
+        assert root.parent_id is None
+        assert root.attributes == {"model": "res.partner"}
+        assert spans["format"][0].error == "ValueError"
+        assert root.error is None
+
+    async def test_propagates_across_tasks(self, exporter):
+        """Test concurrent tasks link to the span that started them."""
+
+        async def work(name):
+            with tracer.child_span(name):
+                await asyncio.sleep(0)
+
+        with tracer.span("request") as root:
+            await asyncio.gather(work("first"), work("second"))
+
+        spans = spans_by_name(exporter)
+        assert spans["first"][0].parent_id == root.span_id
+        assert spans["second"][0].parent_id == root.span_id
+
+    def test_perf_logger_starts_trace(self, exporter):
+        """Test tracked operations are spans and logs carry the trace ID."""
+        formatter = StructuredFormatter()
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+
+        with perf_logger.track_operation("tool_search", model="res.partner"):
+            log_data = json.loads(formatter.format(record))
+            span = tracer.current_span()
+
+        assert log_data["trace_id"] == span.trace_id
+        assert log_data["span_id"] == span.span_id
+        assert spans_by_name(exporter)["tool_search"][0].attributes == {"model": "res.partner"}
+
+
+class TestExporters:
+    """Test exporting to a file and an OTLP collector."""
+
+    def test_file_exporter(self, tmp_path):
+        """Test spans are appended as JSON lines."""
+        path = tmp_path / "traces.jsonl"
+        configure_tracing(
+            OmniConfig(url="http://localhost:8069", api_key="key", trace_file=str(path))
+        )
+        try:
+            with tracer.span("request"):
+                with tracer.child_span("process_dates", records=3):
+                    pass
+            tracer.flush()
+        finally:
+            tracer.configure([])
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["process_dates", "request"]
+        assert lines[0]["parent_span_id"] == lines[1]["span_id"]
+        assert lines[0]["attributes"] == {"records": 3}
+        assert lines[1]["duration_ms"] >= lines[0]["duration_ms"]
+
+    def test_otlp_exporter(self):
+        """Test spans are posted to a collector as OTLP/HTTP JSON."""
+        received = []
+
+        class Collector(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802 - BaseHTTPRequestHandler naming
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                received.append((self.path, json.loads(body)))
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Collector)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            host, port = server.server_address
+            tracer.configure([OTLPHttpSpanExporter(f"http://{host}:{port}")])
+            with tracer.span("request", limit=5):
+                with pytest.raises(KeyError):
+                    with tracer.child_span("xmlrpc.execute_kw", model="res.partner"):
+                        raise KeyError("missing")
+            tracer.flush()
+        finally:
+            tracer.configure([])
+            server.shutdown()
+            server.server_close()
+
+        path, body = received[0]
+        assert path == "/v1/traces"
+        resource_spans = body["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"]["stringValue"] == (
+            "mcp-server-omni"
+        )
+        child, root = resource_spans["scopeSpans"][0]["spans"]
+        assert child["parentSpanId"] == root["spanId"]
+        assert child["status"] == {"code": 2, "message": "KeyError"}
+        assert child["attributes"] == [{"key": "model", "value": {"stringValue": "res.partner"}}]
+        assert root["attributes"] == [{"key": "limit", "value": {"intValue": "5"}}]
+
+    def test_export_failure_is_logged(self, caplog):
+        """Test an unreachable collector does not raise."""
+        tracer.configure([OTLPHttpSpanExporter("http://127.0.0.1:1", timeout=0.5)])
+        try:
+            with tracer.span("request"):
+                pass
+            assert tracer.flush()
+        finally:
+            tracer.configure([])
+
+        assert "Failed to export 1 spans" in caplog.text
+
+    def test_exporter_requires_export(self):
+        """Test exporters must implement export()."""
+        with pytest.raises(TypeError):
+            SpanExporter()
+
+    def test_full_queue_drops_spans(self):
+        """Test spans beyond the queue capacity are dropped and counted."""
+        release = threading.Event()
+
+        class BlockedExporter(CollectingExporter):
+            def export(self, spans):
+                release.wait(5)
+                super().export(spans)
+
+        exporter = BlockedExporter()
+        processor = BatchSpanProcessor([exporter], max_batch_size=1, max_queue_size=2)
+        try:
+            for i in range(6):
+                processor.on_end(Span(f"span{i}", None, {}))
+            stats = processor.get_stats()
+            # One span is held by the blocked exporter, two wait in the queue
+            assert stats["dropped"] >= 3
+            assert stats["queue_capacity"] == 2
+            release.set()
+            assert processor.flush()
+        finally:
+            release.set()
+            processor.shutdown()
+
+        assert len(exporter.spans) + processor.get_stats()["dropped"] == 6
+        assert processor.get_stats()["exported"] == len(exporter.spans)
+
+
+class TestRequestPhases:
+    """Test the phases of a search_records call are traced end to end."""
+
+    @pytest.fixture
+    def server(self):
+        """Run a local XML-RPC server."""
+        stand_in = StandInServer().start()
+        yield stand_in
+        stand_in.stop()
+
+    def make_handler(self, server, async_client):
+        """Create a tool handler on a connection to the stand-in server."""
+        config = OmniConfig(
+            url=server.url,
+            username="admin",
+            password="secret",
+            database="omni",
+            async_client=async_client,
+        )
+        conn = OmniConnection(config, timeout=5)
+        conn.connect()
+        conn.authenticate()
+        return OmniToolHandler(Mock(), conn, Mock(), config)
+
+    @pytest.mark.parametrize("async_client", [False, True], ids=["executor", "async_client"])
+    async def test_search_records_phases(self, server, exporter, async_client):
+        """Test each phase and XML-RPC sub-phase is a span of the tool trace."""
+        handler = self.make_handler(server, async_client)
+
+        result = await handler._handle_search_tool("res.partner", None, None, 5, 0, None)
+        handler.connection.disconnect()
+
+        assert len(result["records"]) == 5
+        spans = spans_by_name(exporter)
+        root = spans["tool_search"][0]
+        assert root.parent_id is None
+        for name in ("access_check", "fields_get", "process_dates", "format"):
+            assert spans[name][0].parent_id == root.span_id, name
+
+        calls = {span.attributes["method"]: span for span in spans["xmlrpc.execute_kw"]}
+        assert set(calls) == {"fields_get", "search_read", "search_count"}
+        assert calls["fields_get"].parent_id == spans["fields_get"][0].span_id
+        assert calls["search_read"].parent_id == root.span_id
+        assert all(span.trace_id == root.trace_id for span in exporter.spans)
+
+        # Every round-trip is split into serialize, network and parse
+        for phase in ("xmlrpc.serialize", "xmlrpc.network", "xmlrpc.parse"):
+            parents = sorted(span.parent_id for span in spans[phase])
+            assert parents == sorted(span.span_id for span in calls.values()), phase
+        assert all(span.attributes["response_bytes"] > 0 for span in spans["xmlrpc.parse"])
@@ -91,6 +91,13 @@ class TestURIParsing:
         assert parsed.model == "product.template"
         assert parsed.operation == OmniOperation.FIELDS
 
+    def test_parse_export_uri(self):
+        """Test parsing export URIs."""
+        parsed = parse_uri("omni://sale.order.line/export")
+
+        assert parsed.model == "sale.order.line"
+        assert parsed.operation == OmniOperation.EXPORT
+
     def test_parse_uri_with_url_encoded_domain(self):
         """Test parsing URIs with URL-encoded domain."""
         uri = "omni://res.partner/search?domain=%5B%28%27is_company%27%2C%27%3D%27%2CTrue%29%5D"
@@ -35,6 +35,7 @@ class TestWriteOperations:
         cm.__exit__ = Mock(return_value=None)
         manager.monitor.track_operation.return_value = cm
         manager.invalidate_record_cache = Mock()
+        manager.invalidate_records = Mock()
         return manager
 
     @pytest.fixture
@@ -83,10 +84,8 @@ class TestWriteOperations:
 
             assert result is True
             mock_execute.assert_called_once_with(model, "write", [ids, values], {})
-            # Should invalidate cache for each record
-            assert connection._performance_manager.invalidate_record_cache.call_count == 2
-            connection._performance_manager.invalidate_record_cache.assert_any_call(model, 123)
-            connection._performance_manager.invalidate_record_cache.assert_any_call(model, 124)
+            # Should invalidate cache for all records in one call
+            connection._performance_manager.invalidate_records.assert_called_once_with(model, ids)
 
     def test_write_single_record(self, connection):
         """Test updating a single record."""
@@ -98,9 +97,7 @@ class TestWriteOperations:
             result = connection.write(model, ids, values)
 
             assert result is True
-            connection._performance_manager.invalidate_record_cache.assert_called_once_with(
-                model, 123
-            )
+            connection._performance_manager.invalidate_records.assert_called_once_with(model, [123])
 
     def test_write_records_error(self, connection):
         """Test write records with error."""
@@ -124,11 +121,8 @@ class TestWriteOperations:
 
             assert result is True
             mock_execute.assert_called_once_with(model, "unlink", [ids], {})
-            # Should invalidate cache for each record
-            assert connection._performance_manager.invalidate_record_cache.call_count == 3
-            connection._performance_manager.invalidate_record_cache.assert_any_call(model, 123)
-            connection._performance_manager.invalidate_record_cache.assert_any_call(model, 124)
-            connection._performance_manager.invalidate_record_cache.assert_any_call(model, 125)
+            # Should invalidate cache for all records in one call
+            connection._performance_manager.invalidate_records.assert_called_once_with(model, ids)
 
     def test_unlink_single_record(self, connection):
         """Test deleting a single record."""
@@ -139,9 +133,7 @@ class TestWriteOperations:
             result = connection.unlink(model, ids)
 
             assert result is True
-            connection._performance_manager.invalidate_record_cache.assert_called_once_with(
-                model, 123
-            )
+            connection._performance_manager.invalidate_records.assert_called_once_with(model, [123])
 
     def test_unlink_records_error(self, connection):
         """Test unlink records with error."""
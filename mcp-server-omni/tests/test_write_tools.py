@@ -7,6 +7,7 @@ import pytest
 from mcp_server_omni.access_control import AccessControlError
 from mcp_server_omni.omni_connection import OmniConnectionError
 from mcp_server_omni.tools import OmniToolHandler, ToolError, register_tools
+from tests.helpers.mock_connection import wire_async_methods
 
 
 class TestWriteTools:
@@ -22,7 +23,7 @@ class TestWriteTools:
     @pytest.fixture
     def mock_connection(self):
         """Create mock OmniConnection."""
-        conn = Mock()
+        conn = wire_async_methods(Mock())
         conn.is_authenticated = True
         return conn
 
@@ -4,6 +4,7 @@ This module tests the XML-RPC communication layer including execute methods
 and core Omni operations.
 """
 
+import logging
 import os
 import socket
 from functools import wraps
@@ -109,6 +110,22 @@ class TestXMLRPCOperations:
             {"limit": 10},
         )
 
+    def test_execute_kw_logs_lazily(self, authenticated_connection, caplog):
+        """Test call arguments are only rendered, abbreviated, at DEBUG."""
+        authenticated_connection._object_proxy = Mock()
+        ids = list(range(500))
+
+        with caplog.at_level(logging.INFO, logger="mcp_server_omni.omni_connection"):
+            authenticated_connection.execute_kw("res.partner", "read", [ids], {})
+        assert caplog.records == []
+
+        with caplog.at_level(logging.DEBUG, logger="mcp_server_omni.omni_connection"):
+            authenticated_connection.execute_kw("res.partner", "read", [ids], {"fields": ["name"]})
+        message = caplog.records[0].getMessage()
+        assert message.startswith("Executing read on res.partner with args=[[0, 1, 2,")
+        assert "499" not in message
+        assert message.endswith("kwargs={'fields': ['name']}")
+
     def test_execute_simple(self, authenticated_connection):
         """Test simple execute method."""
         # Mock object proxy
@@ -276,6 +293,53 @@ class TestXMLRPCOperations:
             {},
         )
 
+    def test_create_many_operation(self, authenticated_connection):
+        """Test create_many sends all values in one create call."""
+        mock_proxy = Mock()
+        mock_proxy.execute_kw.return_value = [7, 8]
+        authenticated_connection._object_proxy = mock_proxy
+
+        result = authenticated_connection.create_many("res.partner", [{"name": "A"}, {"name": "B"}])
+
+        assert result == [7, 8]
+        mock_proxy.execute_kw.assert_called_once_with(
+            os.getenv("OMNI_DB", "db"),
+            2,
+            "test_api_key",
+            "res.partner",
+            "create",
+            [[{"name": "A"}, {"name": "B"}]],
+            {},
+        )
+
+    def test_read_group_operation(self, authenticated_connection):
+        """Test read_group sends a single non-lazy aggregation call."""
+        mock_proxy = Mock()
+        mock_proxy.execute_kw.return_value = [
+            {"product_id": [1, "Widget"], "product_uom_qty": 12.0, "__count": 3}
+        ]
+        authenticated_connection._object_proxy = mock_proxy
+
+        result = authenticated_connection.read_group(
+            "sale.order.line",
+            [],
+            ["product_uom_qty:sum"],
+            ["product_id"],
+            limit=5,
+            orderby="product_uom_qty desc",
+        )
+
+        assert result[0]["__count"] == 3
+        mock_proxy.execute_kw.assert_called_once_with(
+            os.getenv("OMNI_DB", "db"),
+            2,
+            "test_api_key",
+            "sale.order.line",
+            "read_group",
+            [[], ["product_uom_qty:sum"], ["product_id"]],
+            {"lazy": False, "limit": 5, "orderby": "product_uom_qty desc"},
+        )
+
     def test_password_auth_uses_password(self, config):
         """Test that password auth uses password for execute_kw."""
         config = OmniConfig(